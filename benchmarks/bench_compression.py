@@ -0,0 +1,104 @@
+# Copyright 2026 Firefly Software Solutions Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Micro-benchmark: CompressionFilter bytes on the wire and event-loop stalls.
+
+Run with::
+
+    python benchmarks/bench_compression.py [--items N] [--number N]
+
+Each run serves ``--number`` large JSON list responses through the filter
+chain while a ticker task measures how late the event loop wakes it up.
+``inline`` compresses every chunk on the loop; ``offload`` is the default
+filter, which hands chunks of 256 KB or more to a worker thread.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from typing import Any
+
+import httpx
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+from pyfly.web.adapters.starlette.filter_chain import WebFilterChainMiddleware
+from pyfly.web.adapters.starlette.filters import CompressionFilter
+
+
+def make_app(body: bytes, filters: list[Any]) -> Starlette:
+    async def orders(request: Request) -> Response:
+        return Response(body, media_type="application/json")
+
+    return Starlette(
+        routes=[Route("/orders", orders)],
+        middleware=[Middleware(WebFilterChainMiddleware, filters=filters)],
+    )
+
+
+async def measure(app: Starlette, number: int) -> tuple[int, float, float]:
+    """Return (wire bytes per response, ms per response, worst loop stall in ms)."""
+    stall = 0.0
+    done = False
+
+    async def ticker() -> None:
+        nonlocal stall
+        while not done:
+            start = time.perf_counter()
+            await asyncio.sleep(0.001)
+            stall = max(stall, time.perf_counter() - start - 0.001)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        task = asyncio.create_task(ticker())
+        start = time.perf_counter()
+        wire = 0
+        for _ in range(number):
+            async with client.stream("GET", "/orders", headers={"Accept-Encoding": "gzip"}) as response:
+                wire = len(b"".join([chunk async for chunk in response.aiter_raw()]))
+        elapsed = time.perf_counter() - start
+        done = True
+        await task
+    return wire, elapsed / number * 1e3, stall * 1e3
+
+
+def main(items: int, number: int) -> None:
+    # Rendered once, so the loop stalls measured are the compression's own
+    body = JSONResponse(
+        [{"id": i, "customer": f"customer-{i}", "status": "shipped", "total": i * 1.5} for i in range(items)]
+    ).body
+    apps = {
+        "identity": make_app(body, []),
+        "inline": make_app(body, [CompressionFilter(offload_threshold=1 << 62)]),
+        "offload": make_app(body, [CompressionFilter()]),
+    }
+    print(f"{items} items per response, {number} responses per run (best of 5)")
+    for name, app in apps.items():
+        runs = [asyncio.run(measure(app, number)) for _ in range(5)]
+        wire = runs[0][0]
+        millis = min(run[1] for run in runs)
+        stall = min(run[2] for run in runs)
+        print(f"  {name:<9} {wire:>10,} bytes  {millis:8.2f} ms/response  worst loop stall {stall:6.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=50_000)
+    parser.add_argument("--number", type=int, default=10)
+    args = parser.parse_args()
+    main(args.items, args.number)
@@ -0,0 +1,98 @@
+# Copyright 2026 Firefly Software Solutions Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Micro-benchmark: direct-to-bytes JSON encoding vs. model_dump + json.dumps.
+
+Run with::
+
+    python benchmarks/bench_json_response.py [--items N] [--number N]
+
+``dump+dumps`` reproduces the response path as it was before the encoders:
+each model is turned into a dict with ``model_dump(mode="json")`` and
+Starlette's ``JSONResponse`` re-serializes the result with ``json.dumps``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import uuid
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel
+from starlette.responses import JSONResponse, Response
+
+from pyfly.web.adapters.starlette.response import handle_return_value, json_encoder_for
+
+
+class OrderLine(BaseModel):
+    sku: str
+    quantity: int
+    price: float
+
+
+class Order(BaseModel):
+    id: uuid.UUID
+    customer: str
+    created_at: datetime
+    status: str
+    lines: list[OrderLine]
+
+
+async def list_orders() -> list[Order]: ...
+
+
+def dump_then_dumps(result: Any) -> Response:
+    if isinstance(result, list) and result and isinstance(result[0], BaseModel):
+        result = [item.model_dump(mode="json") for item in result]
+    return JSONResponse(result)
+
+
+def measure(render: Callable[[Any], Response], payload: Any, number: int) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        render(payload)
+    return (time.perf_counter() - start) / number * 1e6
+
+
+def main(items: int, number: int) -> None:
+    orders = [
+        Order(
+            id=uuid.uuid4(),
+            customer=f"customer-{i}",
+            created_at=datetime(2026, 1, 1),
+            status="shipped",
+            lines=[OrderLine(sku=f"SKU-{j}", quantity=j, price=9.99) for j in range(3)],
+        )
+        for i in range(items)
+    ]
+    encoder = json_encoder_for(list_orders)
+    renderers: dict[str, Callable[[Any], Response]] = {
+        "dump+dumps": dump_then_dumps,
+        "encode_json": handle_return_value,
+        "typed list": lambda result: handle_return_value(result, encoder=encoder),
+    }
+    print(f"{items} orders per response, {number} responses per run (best of 5)")
+    results = {name: min(measure(render, orders, number) for _ in range(5)) for name, render in renderers.items()}
+    for name, micros in results.items():
+        print(f"  {name:<12} {micros:9.2f} us/response  {results['dump+dumps'] / micros:5.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--number", type=int, default=500)
+    args = parser.parse_args()
+    main(args.items, args.number)
@@ -0,0 +1,95 @@
+# Copyright 2026 Firefly Software Solutions Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Micro-benchmark: radix-tree route matching vs. Starlette's linear scan.
+
+Run with::
+
+    python benchmarks/bench_router.py [--number N]
+
+Each route table models REST controllers with five routes per resource
+(``/api/v1/<resource>``, ``/{id:int}``, ``/{id:int}/items``,
+``/{id:int}/items/{item_id}`` and ``/search``).  Lookups are spread evenly
+over the whole table, so the linear scan pays its average, not best, case.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Any
+
+from starlette.responses import Response
+from starlette.routing import BaseRoute, Match, Route, Router
+
+from pyfly.web.adapters.starlette.routing import RadixRouter
+
+
+async def endpoint(request: Any) -> Response:
+    return Response()
+
+
+def build_routes(count: int) -> list[BaseRoute]:
+    routes: list[BaseRoute] = []
+    for n in range(count // 5):
+        base = f"/api/v1/resource{n}"
+        routes += [
+            Route(base, endpoint, methods=["GET", "POST"]),
+            Route(base + "/search", endpoint, methods=["GET"]),
+            Route(base + "/{id:int}", endpoint, methods=["GET", "PUT", "DELETE"]),
+            Route(base + "/{id:int}/items", endpoint, methods=["GET"]),
+            Route(base + "/{id:int}/items/{item_id}", endpoint, methods=["GET"]),
+        ]
+    return routes
+
+
+def build_scopes(count: int) -> list[dict[str, Any]]:
+    paths = []
+    for n in range(count // 5):
+        base = f"/api/v1/resource{n}"
+        paths += [base, base + "/search", base + "/42", base + "/42/items", base + "/42/items/abc"]
+    return [{"type": "http", "method": "GET", "path": path, "root_path": ""} for path in paths]
+
+
+def linear_match(router: Router, scope: dict[str, Any]) -> Any:
+    """The loop ``Router.app`` runs for every request."""
+    for route in router.routes:
+        match, child_scope = route.matches(scope)
+        if match is Match.FULL:
+            return route
+    return None
+
+
+def measure(match: Any, router: Router, scopes: list[dict[str, Any]], number: int) -> float:
+    start = time.perf_counter()
+    for i in range(number):
+        match(router, scopes[i % len(scopes)])
+    return (time.perf_counter() - start) / number * 1e6
+
+
+def main(number: int) -> None:
+    print(f"{number} lookups per run (best of 5)")
+    print(f"{'routes':>7} {'starlette':>12} {'radix':>12} {'speedup':>8}")
+    for count in (10, 50, 100, 300, 600, 1200):
+        routes, scopes = build_routes(count), build_scopes(count)
+        linear, radix = Router(routes), RadixRouter(routes)
+        assert all(linear_match(linear, s) is radix.match(s)[0] for s in scopes)
+        linear_us = min(measure(linear_match, linear, scopes, number) for _ in range(5))
+        radix_us = min(measure(RadixRouter.match, radix, scopes, number) for _ in range(5))
+        print(f"{count:>7} {linear_us:9.2f} us {radix_us:9.2f} us {linear_us / radix_us:7.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20_000)
+    main(parser.parse_args().number)
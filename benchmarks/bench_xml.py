@@ -0,0 +1,116 @@
+# Copyright 2026 Firefly Software Solutions Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Micro-benchmark: streaming XML writer and expat parser vs. an ElementTree round trip.
+
+Run with::
+
+    python benchmarks/bench_xml.py [--items N] [--number N]
+
+``ElementTree`` reproduces the converters as they were before: responses
+built as an element tree and serialized with ``ET.tostring``, request
+bodies parsed with ``ET.fromstring`` and walked recursively.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import xml.etree.ElementTree as ET
+from collections.abc import Callable
+from typing import Any
+
+from pyfly.web.converters import dict_to_xml, xml_to_dict
+
+
+def _build_element(parent: ET.Element, key: str, value: Any) -> None:
+    if isinstance(value, dict):
+        child = ET.SubElement(parent, key)
+        for k, v in value.items():
+            _build_element(child, k, v)
+    elif isinstance(value, list):
+        for item in value:
+            _build_element(parent, key, item)
+    else:
+        child = ET.SubElement(parent, key)
+        if value is not None:
+            child.text = str(value)
+
+
+def tree_to_xml(data: list[Any]) -> str:
+    root = ET.Element("response")
+    for item in data:
+        _build_element(root, "item", item)
+    return ET.tostring(root, encoding="unicode", xml_declaration=True)
+
+
+def _element_to_dict(element: ET.Element) -> Any:
+    children = list(element)
+    if not children:
+        return element.text
+    result: dict[str, Any] = {}
+    for child in children:
+        value = _element_to_dict(child)
+        if child.tag not in result:
+            result[child.tag] = value
+        elif isinstance(result[child.tag], list):
+            result[child.tag].append(value)
+        else:
+            result[child.tag] = [result[child.tag], value]
+    return result
+
+
+def tree_to_dict(xml: str) -> dict[str, Any]:
+    root = ET.fromstring(xml)
+    return {root.tag: _element_to_dict(root)}
+
+
+def measure(func: Callable[[Any], Any], payload: Any, number: int) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        func(payload)
+    return (time.perf_counter() - start) / number * 1e3
+
+
+def main(items: int, number: int) -> None:
+    orders = [
+        {
+            "id": str(i),
+            "customer": f"customer-{i}",
+            "status": "shipped",
+            "lines": [{"sku": f"SKU-{j}", "quantity": j, "price": 9.99} for j in range(3)],
+        }
+        for i in range(items)
+    ]
+    document = dict_to_xml(orders)
+    assert tree_to_xml(orders) == document and tree_to_dict(document) == xml_to_dict(document)
+
+    print(f"{items} orders per document, {number} documents per run (best of 5)")
+    cases: dict[str, dict[str, tuple[Callable[[Any], Any], Any]]] = {
+        "write": {"ElementTree": (tree_to_xml, orders), "dict_to_xml": (dict_to_xml, orders)},
+        "parse": {"ElementTree": (tree_to_dict, document), "xml_to_dict": (xml_to_dict, document)},
+    }
+    for case, funcs in cases.items():
+        results = {
+            name: min(measure(func, payload, number) for _ in range(5)) for name, (func, payload) in funcs.items()
+        }
+        for name, millis in results.items():
+            print(f"  {case} {name:<12} {millis:8.2f} ms/document  {results['ElementTree'] / millis:5.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+    main(args.items, args.number)
@@ -14,19 +14,23 @@
 """Built-in actuator endpoint implementations."""
 
 from pyfly.actuator.endpoints.beans_endpoint import BeansEndpoint
+from pyfly.actuator.endpoints.concurrency_endpoint import ConcurrencyEndpoint
 from pyfly.actuator.endpoints.env_endpoint import EnvEndpoint
 from pyfly.actuator.endpoints.health_endpoint import HealthEndpoint
 from pyfly.actuator.endpoints.info_endpoint import InfoEndpoint
 from pyfly.actuator.endpoints.loggers_endpoint import LoggersEndpoint
 from pyfly.actuator.endpoints.metrics_endpoint import MetricsEndpoint
 from pyfly.actuator.endpoints.prometheus_endpoint import PrometheusEndpoint
+from pyfly.actuator.endpoints.startup_endpoint import StartupEndpoint
 
 __all__ = [
     "BeansEndpoint",
+    "ConcurrencyEndpoint",
     "EnvEndpoint",
     "HealthEndpoint",
     "InfoEndpoint",
     "LoggersEndpoint",
     "MetricsEndpoint",
     "PrometheusEndpoint",
+    "StartupEndpoint",
 ]
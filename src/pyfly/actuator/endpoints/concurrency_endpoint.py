@@ -0,0 +1,43 @@
+# Copyright 2026 Firefly Software Solutions Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Concurrency actuator endpoint — adaptive concurrency limits per route group."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pyfly.web.adapters.starlette.filters.concurrency_limit_filter import AdaptiveConcurrencyFilter
+
+
+class ConcurrencyEndpoint:
+    """Exposes an ``AdaptiveConcurrencyFilter``'s state at ``/actuator/concurrency``.
+
+    Registered when the filter is part of the web filter chain.
+    """
+
+    def __init__(self, concurrency_filter: AdaptiveConcurrencyFilter) -> None:
+        self._filter = concurrency_filter
+
+    @property
+    def endpoint_id(self) -> str:
+        return "concurrency"
+
+    @property
+    def enabled(self) -> bool:
+        return True
+
+    async def handle(self, context: Any = None) -> dict[str, Any]:
+        groups = self._filter.get_stats()
+        return {"groups": groups, "rejected": sum(stats["rejected"] for stats in groups.values())}
@@ -0,0 +1,45 @@
+# Copyright 2026 Firefly Software Solutions Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Startup actuator endpoint — exposes the recorded startup timeline."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pyfly.context.application_context import ApplicationContext
+
+
+class StartupEndpoint:
+    """Exposes the startup recorder's spans at ``/actuator/startup``.
+
+    Enabled only when ``pyfly.context.startup-recorder.enabled`` is set.
+    """
+
+    def __init__(self, context: ApplicationContext) -> None:
+        self._context = context
+
+    @property
+    def endpoint_id(self) -> str:
+        return "startup"
+
+    @property
+    def enabled(self) -> bool:
+        return self._context.startup_recorder is not None
+
+    async def handle(self, context: Any = None) -> dict[str, Any]:
+        recorder = self._context.startup_recorder
+        if recorder is None:
+            return {"enabled": False}
+        return {"enabled": True, "phases_ms": self._context.startup_phase_timings, **recorder.to_dict()}
@@ -21,12 +21,14 @@ from typing import Any
 
 from pyfly.aop.registry import AspectRegistry
 from pyfly.aop.types import JoinPoint
+from pyfly.container.method_index import public_methods
 
 
 def weave_bean(bean: Any, qualified_prefix: str, registry: AspectRegistry) -> None:
     """Weave advice into public methods of *bean*.
 
-    For each public method (name not starting with ``_``), build a qualified
+    For each public method (name not starting with ``_``) defined on the
+    bean's class or assigned to the instance, build a qualified
     name ``f"{qualified_prefix}.{method_name}"`` and ask the *registry* for
     matching bindings.  If any bindings match, replace the method on the
     instance with a wrapper that executes the advice chain.
@@ -35,10 +37,7 @@ def weave_bean(bean: Any, qualified_prefix: str, registry: AspectRegistry) -> No
     Sync methods support ``@before``, ``@after_returning``, ``@after_throwing``,
     and ``@after`` (no ``@around``).
     """
-    for attr_name in dir(bean):
-        if attr_name.startswith("_"):
-            continue
-
+    for attr_name in public_methods(bean):
         attr = getattr(bean, attr_name, None)
         if attr is None or not callable(attr):
             continue
@@ -25,10 +25,14 @@ class InMemoryCache:
 
     Suitable for development, testing, and single-process applications.
     Also serves as the default fallback in CacheManager.
+
+    With *max_size* set, the cache holds at most that many entries and
+    evicts the least recently used one to make room.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, max_size: int | None = None) -> None:
         self._store: dict[str, tuple[Any, float | None]] = {}
+        self._max_size = max_size
 
     async def get(self, key: str) -> Any | None:
         """Get a value by key. Returns None if missing or expired."""
@@ -41,6 +45,10 @@ class InMemoryCache:
             del self._store[key]
             return None
 
+        if self._max_size is not None:
+            # Dict order is the recency order: move the entry to the end
+            del self._store[key]
+            self._store[key] = entry
         return value
 
     async def put(self, key: str, value: Any, ttl: timedelta | None = None) -> None:
@@ -48,6 +56,10 @@ class InMemoryCache:
         expires_at = None
         if ttl is not None:
             expires_at = time.monotonic() + ttl.total_seconds()
+        if self._max_size is not None:
+            self._store.pop(key, None)
+            while len(self._store) >= self._max_size:
+                del self._store[next(iter(self._store))]
         self._store[key] = (value, expires_at)
 
     async def evict(self, key: str) -> bool:
@@ -72,7 +84,7 @@ class InMemoryCache:
         """Return cache statistics, excluding expired entries."""
         now = time.monotonic()
         active = sum(1 for _, (_, exp) in self._store.items() if exp is None or exp > now)
-        return {"size": active, "type": "memory", "max_size": None}
+        return {"size": active, "type": "memory", "max_size": self._max_size}
 
     def get_keys(self) -> list[str]:
         """Return keys of non-expired entries."""
@@ -20,11 +20,19 @@ from pyfly.config.auto import AutoConfiguration
 from pyfly.container.bean import bean
 from pyfly.context.conditions import (
     auto_configuration,
+    conditional_on_class,
     conditional_on_missing_bean,
     conditional_on_property,
 )
 from pyfly.core.config import Config
 
+try:
+    from pyfly.web.ports.filter import WebFilter
+except ImportError:
+    WebFilter = object  # type: ignore[misc,assignment]
+
+DEFAULT_RESPONSE_CACHE_ENTRIES = 1000
+
 
 @auto_configuration
 @conditional_on_property("pyfly.cache.enabled", having_value="true")
@@ -56,3 +64,21 @@ class CacheAutoConfiguration:
         from pyfly.cache.adapters.memory import InMemoryCache
 
         return InMemoryCache()
+
+    @bean
+    @conditional_on_class("starlette")
+    def response_cache_filter(self, cache_adapter: CacheAdapter, config: Config) -> WebFilter:
+        """Serve ``@cache_response`` routes from the cache adapter.
+
+        In memory, responses go to a separate store bounded to
+        ``pyfly.cache.response.max-entries`` (least recently used entries are
+        dropped), since cache keys include the client-controlled query string.
+        A shared cache is used as-is and bounded by its own eviction policy.
+        """
+        from pyfly.cache.adapters.memory import InMemoryCache
+        from pyfly.web.adapters.starlette.filters.response_cache_filter import ResponseCacheFilter
+
+        if isinstance(cache_adapter, InMemoryCache):
+            max_entries = int(config.get("pyfly.cache.response.max-entries", DEFAULT_RESPONSE_CACHE_ENTRIES))
+            return ResponseCacheFilter(InMemoryCache(max_size=max_entries))
+        return ResponseCacheFilter(cache_adapter)
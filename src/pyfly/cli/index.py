@@ -0,0 +1,50 @@
+# Copyright 2026 Firefly Software Solutions Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""'pyfly index' — Build the component index used instead of package scanning."""
+
+from __future__ import annotations
+
+import click
+
+from pyfly.cli.console import console
+from pyfly.context.component_index import INDEX_FILENAME, build_component_index
+
+
+@click.command()
+@click.argument("packages", nargs=-1, required=True)
+@click.option(
+    "-o",
+    "--output",
+    default=INDEX_FILENAME,
+    show_default=True,
+    type=click.Path(dir_okay=False),
+    help="File to write the index to.",
+)
+def index_command(packages: tuple[str, ...], output: str) -> None:
+    """Scan PACKAGES once and write their component metadata to an index file."""
+    from pyfly.cli.run import _ensure_src_on_path
+
+    _ensure_src_on_path()
+
+    try:
+        index = build_component_index(list(packages))
+    except ImportError as exc:
+        console.print(f"[error]Cannot import package:[/error] {exc}")
+        raise SystemExit(1) from None
+
+    index.save(output)
+    console.print(
+        f"[success]Indexed {len(index.components)} component(s) and "
+        f"{len(index.auto_configurations)} auto-configuration(s)[/success] → {output}"
+    )
@@ -37,9 +37,11 @@ def cli() -> None:
 # Import and register commands (lazy to avoid heavy imports)
 from pyfly.cli.db import db_group  # noqa: E402
 from pyfly.cli.doctor import doctor_command  # noqa: E402
+from pyfly.cli.index import index_command  # noqa: E402
 from pyfly.cli.info import info_command  # noqa: E402
 from pyfly.cli.license import license_command  # noqa: E402
 from pyfly.cli.new import new_command  # noqa: E402
+from pyfly.cli.openapi import openapi_command  # noqa: E402
 from pyfly.cli.run import run_command  # noqa: E402
 from pyfly.cli.sbom import sbom_command  # noqa: E402
 
@@ -50,3 +52,5 @@ cli.add_command(run_command, name="run")
 cli.add_command(doctor_command, name="doctor")
 cli.add_command(license_command, name="license")
 cli.add_command(sbom_command, name="sbom")
+cli.add_command(index_command, name="index")
+cli.add_command(openapi_command, name="openapi")
@@ -0,0 +1,75 @@
+# Copyright 2026 Firefly Software Solutions Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""'pyfly openapi' — Write the application's OpenAPI document to a file at build time."""
+
+from __future__ import annotations
+
+import importlib
+
+import click
+
+from pyfly.cli.console import console
+
+
+@click.command()
+@click.option("--app", "app_path", default=None, help="Application import path (e.g. 'myapp.main:app').")
+@click.option(
+    "-o",
+    "--output",
+    default="openapi.json",
+    show_default=True,
+    type=click.Path(dir_okay=False),
+    help="File to write the document to.",
+)
+def openapi_command(app_path: str | None, output: str) -> None:
+    """Generate the OpenAPI document of the application and write it to a file.
+
+    Point ``pyfly.web.docs.openapi-file`` at the file to serve it in
+    production without introspecting the routes at startup.
+    """
+    from pyfly.cli.run import _discover_app, _ensure_src_on_path
+    from pyfly.web.openapi import OpenAPIDocument, OpenAPIGenerator
+
+    _ensure_src_on_path()
+
+    if app_path is None:
+        app_path = _discover_app()
+        if app_path is None:
+            console.print("[error]No application found.[/error]")
+            console.print("[dim]Provide --app flag or create a pyfly.yaml in the current directory.[/dim]")
+            raise SystemExit(1)
+
+    module_name, _, attr = app_path.partition(":")
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError as exc:
+        console.print(f"[error]Cannot import application:[/error] {exc}")
+        raise SystemExit(1) from None
+    app = getattr(module, attr or "app", None)
+
+    # Always generate from the routes: the served document may be the previously written file
+    state = getattr(app, "state", None)
+    generator = getattr(state, "pyfly_openapi_generator", None)
+    generate = getattr(app, "openapi", None)
+    if isinstance(generator, OpenAPIGenerator):
+        document = OpenAPIDocument(generator.generate(getattr(state, "pyfly_route_metadata", None) or None))
+    elif callable(generate):
+        # FastAPI generates its own spec
+        document = OpenAPIDocument(generate())
+    else:
+        console.print(f"[error]'{app_path}' has no OpenAPI document (are the API docs enabled?).[/error]")
+        raise SystemExit(1)
+
+    document.write(output)
+    console.print(f"[success]Wrote OpenAPI document[/success] ({len(document.body)} bytes) → {output}")
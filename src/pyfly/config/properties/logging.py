@@ -28,3 +28,4 @@ class LoggingProperties:
 
     level: dict[str, Any] = field(default_factory=lambda: {"root": "INFO"})
     format: str = "console"
+    queue: dict[str, Any] = field(default_factory=lambda: {"enabled": False, "capacity": 10000, "overflow": "drop"})
@@ -30,5 +30,9 @@ class WebProperties:
     port: int = 8000
     host: str = "0.0.0.0"
     debug: bool = False
-    docs: dict[str, Any] = field(default_factory=lambda: {"enabled": True})
+    router: str = "starlette"
+    compression: dict[str, Any] = field(default_factory=lambda: {"enabled": False, "level": 6, "min-size": 1024})
+    coalescing: dict[str, Any] = field(default_factory=lambda: {"enabled": True})
+    concurrency: dict[str, Any] = field(default_factory=lambda: {"enabled": False, "algorithm": "aimd"})
+    docs: dict[str, Any] = field(default_factory=lambda: {"enabled": True, "openapi-file": ""})
     actuator: dict[str, Any] = field(default_factory=lambda: {"enabled": False})
@@ -22,7 +22,8 @@ from pyfly.container.exceptions import (
     NoSuchBeanError,
     NoUniqueBeanError,
 )
-from pyfly.container.ordering import HIGHEST_PRECEDENCE, LOWEST_PRECEDENCE, order
+from pyfly.container.lazy import LazyProxy, lazy
+from pyfly.container.ordering import HIGHEST_PRECEDENCE, LOWEST_PRECEDENCE, depends_on, order
 from pyfly.container.stereotypes import (
     component,
     configuration,
@@ -40,6 +41,7 @@ __all__ = [
     "BeanCurrentlyInCreationError",
     "Container",
     "HIGHEST_PRECEDENCE",
+    "LazyProxy",
     "LOWEST_PRECEDENCE",
     "NoSuchBeanError",
     "NoUniqueBeanError",
@@ -50,6 +52,8 @@ __all__ = [
     "configuration",
     "controller",
     "controller_advice",
+    "depends_on",
+    "lazy",
     "order",
     "primary",
     "repository",
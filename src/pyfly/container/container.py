@@ -15,26 +15,28 @@
 
 from __future__ import annotations
 
+import dataclasses
 import difflib
-import inspect
-import logging
+import functools
 import threading
 import time
-import types
-import typing
-from typing import Annotated, Any, TypeVar, Union, cast, get_args, get_origin
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, TypeVar, cast
 
-from pyfly.container.autowired import Autowired
-from pyfly.container.bean import Qualifier
 from pyfly.container.exceptions import (
     BeanCurrentlyInCreationError,
     NoSuchBeanError,
     NoUniqueBeanError,
 )
-from pyfly.container.metrics import BeanMetrics
+from pyfly.container.injection_plan import compile_injection_plan, compile_param_resolver
+from pyfly.container.lazy import LazyProxy
+from pyfly.container.metrics import BeanMetrics, MetricsMode
 from pyfly.container.registry import Registration
 from pyfly.container.types import Scope
 
+if TYPE_CHECKING:
+    from pyfly.context.startup_recorder import StartupRecorder
+
 T = TypeVar("T")
 
 
@@ -44,8 +46,8 @@ class Container:
     Supports constructor injection via type hints, field injection via
     ``Autowired``, scoped lifecycles, interface-to-implementation binding,
     named beans, @primary resolution, Qualifier-based disambiguation,
-    ``Optional[T]`` and ``list[T]`` parameter types, and circular dependency
-    detection.
+    ``Optional[T]`` and ``list[T]`` parameter types, lazy singletons,
+    child containers, and circular dependency detection.
     """
 
     def __init__(self) -> None:
@@ -53,8 +55,22 @@ class Container:
         self._named: dict[str, Registration] = {}
         self._bindings: dict[type, list[type]] = {}
         self._resolving: dict[type, None] = {}  # insertion-ordered, O(1) lookup
-        self._metrics: dict[type, BeanMetrics] = {}
+        self._metrics_mode = MetricsMode.FULL
+        self._sample_interval = 1
+        self._sample_countdown = 1
         self._lock = threading.RLock()
+        # Requested type -> final Registration (resolve) / all Registrations (resolve_all).
+        # Built lazily, dropped whenever registrations or bindings change.
+        self._resolution_cache: dict[type, Registration] = {}
+        self._resolve_all_cache: dict[type, tuple[Registration, ...]] = {}
+        self._sealed = False
+        # Called with each lazy singleton right after it is materialized; returns the
+        # (possibly post-processed) instance.  Installed by ApplicationContext.
+        self._lazy_initializer: Callable[[Registration], Any] | None = None
+        # Records a span per bean creation while the startup recorder is active.
+        self._startup_recorder: StartupRecorder | None = None
+        # Set on containers returned by create_child()
+        self._parent: Container | None = None
 
     def register(
         self,
@@ -71,10 +87,20 @@ class Container:
             scope=bean_scope,
             condition=condition,
             name=bean_name,
+            lazy=bool(getattr(cls, "__pyfly_lazy__", False)),
         )
         self._registrations[cls] = reg
         if bean_name:
             self._named[bean_name] = reg
+        self._invalidate_resolution_cache()
+
+    def unregister(self, cls: type) -> Registration:
+        """Remove the registration for *cls* (and its named entry) and return it."""
+        reg = self._registrations.pop(cls)
+        if reg.name and reg.name in self._named:
+            del self._named[reg.name]
+        self._invalidate_resolution_cache()
+        return reg
 
     def bind(self, interface: type, implementation: type) -> None:
         """Bind an interface/base class to a concrete implementation."""
@@ -82,32 +108,86 @@ class Container:
             self._bindings[interface] = []
         if implementation not in self._bindings[interface]:
             self._bindings[interface].append(implementation)
+            self._invalidate_resolution_cache()
+
+    def create_child(self) -> Container:
+        """Return a child container layered over this one.
+
+        The child starts from shallow copies of this container's tables, so
+        creating one costs a few dict copies instead of a full registration
+        and startup pass.  Registrations whose singleton already exists are
+        shared: the child resolves the very same instances.  Registrations
+        without an instance are cloned, so beans the child creates stay in
+        the child and are built against its overrides.
+
+        ``register``/``bind``/``unregister`` on the child only touch the
+        child's tables (copy-on-write); the parent never sees them.
+        Singletons the parent had already created keep the dependencies they
+        were built with.
+        """
+        child = Container()
+        child._parent = self
+        child._metrics_mode = self._metrics_mode
+        child._sample_interval = self._sample_interval
+        child._sample_countdown = self._sample_interval
+        child._lazy_initializer = self._lazy_initializer
+        with self._lock:
+            clones: dict[int, Registration] = {}
+            for cls, reg in self._registrations.items():
+                if reg.instance is None:
+                    reg = clones[id(reg)] = dataclasses.replace(reg, metrics=BeanMetrics())
+                child._registrations[cls] = reg
+            child._named = {name: clones.get(id(reg), reg) for name, reg in self._named.items()}
+            child._bindings = {interface: list(impls) for interface, impls in self._bindings.items()}
+        if Container in child._registrations:
+            child.register(Container, scope=Scope.SINGLETON)
+            child._registrations[Container].instance = child
+        return child
+
+    @property
+    def parent(self) -> Container | None:
+        """The container this one was created from by :meth:`create_child`, if any."""
+        return self._parent
+
+    def is_inherited(self, cls: type) -> bool:
+        """Whether *cls* resolves to a registration shared with the parent container."""
+        if self._parent is None:
+            return False
+        reg = self._registrations.get(cls)
+        return reg is not None and self._parent._registrations.get(cls) is reg
+
+    @property
+    def sealed(self) -> bool:
+        """Whether the resolution table has been frozen by :meth:`seal`."""
+        return self._sealed
+
+    def seal(self) -> None:
+        """Precompute the resolution table for every registered and bound type.
+
+        Called by ``ApplicationContext`` once startup completes, so that
+        ``resolve`` and ``resolve_all`` become a single dict lookup.  Any later
+        ``register``/``bind``/``unregister`` unseals the container and the
+        table is rebuilt lazily again.
+        """
+        with self._lock:
+            for cls in [*self._registrations, *self._bindings]:
+                try:
+                    self._lookup_registration(cls)
+                except (NoSuchBeanError, NoUniqueBeanError, KeyError):
+                    continue
+            for interface in self._bindings:
+                try:
+                    self._lookup_all_registrations(interface)
+                except KeyError:
+                    continue
+            self._sealed = True
 
     def resolve(self, cls: type[T]) -> T:
         """Resolve an instance of the given type."""
-        # Direct registration
-        if cls in self._registrations:
-            return cast(T, self._resolve_registration(self._registrations[cls]))
-
-        # Follow binding(s)
-        impls = self._bindings.get(cls, [])
-        if not impls:
-            raise NoSuchBeanError(
-                bean_type=cls,
-                suggestions=self._get_similar_type_names(
-                    getattr(cls, "__name__", ""),
-                ),
-            )
-
-        if len(impls) == 1:
-            return cast(T, self._resolve_registration(self._registrations[impls[0]]))
-
-        # Multiple impls: pick @primary
-        for impl in impls:
-            if getattr(impl, "__pyfly_primary__", False):
-                return cast(T, self._resolve_registration(self._registrations[impl]))
-
-        raise NoUniqueBeanError(bean_type=cls, candidates=impls)
+        reg = self._resolution_cache.get(cls)
+        if reg is None:
+            reg = self._lookup_registration(cls)
+        return cast(T, self._resolve_registration(reg))
 
     def resolve_by_name(self, name: str) -> Any:
         """Resolve a bean by its registered name."""
@@ -120,8 +200,49 @@ class Container:
 
     def resolve_all(self, cls: type[T]) -> list[T]:
         """Resolve all implementations bound to an interface."""
-        impls = self._bindings.get(cls, [])
-        return [self._resolve_registration(self._registrations[impl]) for impl in impls]
+        regs = self._resolve_all_cache.get(cls)
+        if regs is None:
+            regs = self._lookup_all_registrations(cls)
+        return [self._resolve_registration(reg) for reg in regs]
+
+    def _lookup_registration(self, cls: type) -> Registration:
+        """Find the registration that satisfies *cls* and memoize it."""
+        # Direct registration
+        reg = self._registrations.get(cls)
+        if reg is None:
+            # Follow binding(s)
+            impls = self._bindings.get(cls, [])
+            if not impls:
+                raise NoSuchBeanError(
+                    bean_type=cls,
+                    suggestions=self._get_similar_type_names(
+                        getattr(cls, "__name__", ""),
+                    ),
+                )
+
+            if len(impls) == 1:
+                reg = self._registrations[impls[0]]
+            else:
+                # Multiple impls: pick @primary
+                primary = next((impl for impl in impls if getattr(impl, "__pyfly_primary__", False)), None)
+                if primary is None:
+                    raise NoUniqueBeanError(bean_type=cls, candidates=impls)
+                reg = self._registrations[primary]
+
+        self._resolution_cache[cls] = reg
+        return reg
+
+    def _lookup_all_registrations(self, cls: type) -> tuple[Registration, ...]:
+        """Collect the registrations bound to *cls* and memoize them."""
+        regs = tuple(self._registrations[impl] for impl in self._bindings.get(cls, []))
+        self._resolve_all_cache[cls] = regs
+        return regs
+
+    def _invalidate_resolution_cache(self) -> None:
+        """Drop memoized lookups after registrations or bindings change."""
+        self._resolution_cache.clear()
+        self._resolve_all_cache.clear()
+        self._sealed = False
 
     def contains(self, name: str) -> bool:
         """Check if a named bean exists."""
@@ -130,27 +251,47 @@ class Container:
     def _resolve_registration(self, reg: Registration) -> Any:
         """Resolve a single registration, handling scope."""
         if reg.scope == Scope.SINGLETON:
-            if reg.instance is not None:
-                self._ensure_metrics(reg.impl_type).resolution_count += 1
-                return reg.instance
-            with self._lock:
-                # Double-check after acquiring lock
-                if reg.instance is not None:
-                    self._ensure_metrics(reg.impl_type).resolution_count += 1
-                    return reg.instance
-                instance = self._create_instance(reg)
-                reg.instance = instance
-                self._ensure_metrics(reg.impl_type).resolution_count += 1
-                return instance
+            if reg.instance is None and reg.lazy and self._resolving:
+                # Injected into another bean: hand out a proxy, create on first use
+                return LazyProxy(reg.impl_type, functools.partial(self._resolve_singleton, reg))
+            return self._resolve_singleton(reg)
+
+        instance = self._resolve_request_scoped(reg) if reg.scope == Scope.REQUEST else self._create_instance(reg)
+        if self._metrics_mode is not MetricsMode.OFF:
+            self._record_resolution(reg)
+        return instance
 
-        if reg.scope == Scope.REQUEST:
-            instance = self._resolve_request_scoped(reg)
-            self._ensure_metrics(reg.impl_type).resolution_count += 1
+    def _resolve_singleton(self, reg: Registration) -> Any:
+        """Return the singleton instance for *reg*, creating it on first use."""
+        instance = reg.instance
+        if instance is not None:
+            # Hot path: FULL mode is a single slotted-attribute increment
+            if self._metrics_mode is MetricsMode.FULL:
+                reg.metrics.resolution_count += 1
+            elif self._metrics_mode is MetricsMode.SAMPLED:
+                self._record_resolution(reg)
             return instance
-
-        instance = self._create_instance(reg)
-        self._ensure_metrics(reg.impl_type).resolution_count += 1
-        return instance
+        with self._lock:
+            # Double-check after acquiring lock
+            if reg.instance is None:
+                instance = self._create_instance(reg)
+                reg.instance = instance
+                # Child containers create beans after their context started: initialize them too
+                if (reg.lazy or self._parent is not None) and self._lazy_initializer is not None:
+                    reg.instance = self._lazy_initializer(reg)
+            if self._metrics_mode is not MetricsMode.OFF:
+                self._record_resolution(reg)
+            return reg.instance
+
+    def _record_resolution(self, reg: Registration) -> None:
+        """Count one resolution of *reg* according to the metrics mode."""
+        if self._metrics_mode is MetricsMode.FULL:
+            reg.metrics.resolution_count += 1
+            return
+        self._sample_countdown -= 1
+        if self._sample_countdown <= 0:
+            self._sample_countdown = self._sample_interval
+            reg.metrics.resolution_count += self._sample_interval
 
     def _resolve_request_scoped(self, reg: Registration) -> Any:
         """Resolve a REQUEST-scoped bean from the active RequestContext."""
@@ -163,165 +304,107 @@ class Container:
                 f"{reg.impl_type.__name__}. Ensure a RequestContextFilter is active."
             )
 
-        # Store request-scoped instances in the context's attributes
-        cache_key = f"__pyfly_bean_{reg.impl_type.__qualname__}"
-        existing = ctx.get(cache_key)
-        if existing is not None:
-            return existing
-
-        instance = self._create_instance(reg)
-        ctx.set(cache_key, instance)
+        instance = ctx.get_bean(reg.impl_type)
+        if instance is None:
+            instance = self._create_instance(reg)
+            ctx.set_bean(reg.impl_type, instance)
         return instance
 
     def _create_instance(self, reg: Registration) -> Any:
-        """Create an instance, resolving constructor and field dependencies."""
+        """Create an instance by replaying the registration's injection plan."""
         if reg.impl_type in self._resolving:
             chain = list(self._resolving.keys())
             raise BeanCurrentlyInCreationError(chain=chain, current=reg.impl_type)
         self._resolving[reg.impl_type] = None
+        recorder = self._startup_recorder
+        span = None
+        if recorder is not None:
+            span = recorder.begin(
+                reg.name or reg.impl_type.__qualname__, "bean", module=reg.impl_type.__module__, scope=reg.scope.name
+            )
         try:
             start = time.perf_counter_ns()
 
-            init = reg.impl_type.__init__  # type: ignore[misc]
-            if init is object.__init__:
+            plan = reg.plan
+            if plan is None:
+                plan = reg.plan = compile_injection_plan(reg.impl_type)
+
+            if plan.default_constructor:
+                ctor_start = time.perf_counter_ns()
                 instance = reg.impl_type()
+                ctor_ns = time.perf_counter_ns() - ctor_start
             else:
-                hints = typing.get_type_hints(init, include_extras=True)
-                hints.pop("return", None)
-                sig = inspect.signature(init)
-
                 kwargs: dict[str, Any] = {}
-                for param_name, param_type in hints.items():
-                    param = sig.parameters.get(param_name)
-                    has_default = param is not None and param.default is not inspect.Parameter.empty
+                for param in plan.params:
                     try:
-                        kwargs[param_name] = self._resolve_param(param_type)
+                        kwargs[param.name] = param.resolve(self)
                     except (NoSuchBeanError, NoUniqueBeanError):
-                        if has_default:
+                        if param.has_default:
                             continue
+                        param_type = param.param_type
                         raise NoSuchBeanError(
                             bean_type=param_type if isinstance(param_type, type) else None,
                             required_by=f"{reg.impl_type.__qualname__}.__init__()",
-                            parameter=f"{param_name}: {getattr(param_type, '__name__', repr(param_type))}",
+                            parameter=f"{param.name}: {getattr(param_type, '__name__', repr(param_type))}",
                             suggestions=self._get_similar_type_names(
                                 getattr(param_type, "__name__", ""),
                             ),
                         ) from None
 
+                ctor_start = time.perf_counter_ns()
                 instance = reg.impl_type(**kwargs)
+                ctor_ns = time.perf_counter_ns() - ctor_start
 
-            self._inject_autowired_fields(instance)
+            for field_injection in plan.fields:
+                setattr(instance, field_injection.name, field_injection.resolve(self))
 
             elapsed = time.perf_counter_ns() - start
-            metrics = self._ensure_metrics(reg.impl_type)
-            metrics.creation_time_ns = elapsed
-            metrics.created_at = time.time()
-
+            if self._metrics_mode is not MetricsMode.OFF:
+                metrics = reg.metrics
+                metrics.creation_time_ns = elapsed
+                metrics.created_at = time.time()
+
+            if span is not None:
+                span.args["constructor_ms"] = round(ctor_ns / 1_000_000, 3)
+                span.args["dependencies_ms"] = round((elapsed - ctor_ns) / 1_000_000, 3)
             return instance
         finally:
+            if recorder is not None and span is not None:
+                recorder.end(span)
             self._resolving.pop(reg.impl_type, None)
 
     def _resolve_param(self, param_type: type) -> Any:
         """Resolve a single parameter, handling Annotated, Optional, and list."""
-        # Handle Annotated[T, Qualifier("name")]
-        if get_origin(param_type) is Annotated:
-            args = get_args(param_type)
-            base_type = args[0]
-            for metadata in args[1:]:
-                if isinstance(metadata, Qualifier):
-                    return self.resolve_by_name(metadata.name)
-            return self._resolve_param(base_type)
-
-        # Handle Optional[T] (Union[T, None] or T | None via PEP 604)
-        if get_origin(param_type) is Union or isinstance(param_type, types.UnionType):
-            args = get_args(param_type)
-            non_none = [a for a in args if a is not type(None)]
-            if len(non_none) == 1:
-                try:
-                    return self.resolve(non_none[0])
-                except (NoSuchBeanError, NoUniqueBeanError):
-                    return None
-
-        # Handle list[T]
-        if get_origin(param_type) is list:
-            args = get_args(param_type)
-            if args:
-                return self.resolve_all(args[0])
-
-        # Handle type[T] or bare `type` — class references cannot be auto-resolved
-        if param_type is type or get_origin(param_type) is type:
-            raise NoSuchBeanError(
-                bean_type=param_type if isinstance(param_type, type) else None,
-            )
-
-        return self.resolve(param_type)
-
-    def _inject_autowired_fields(self, instance: Any) -> None:
-        """Inject dependencies into fields marked with Autowired() or Value()."""
-        from pyfly.core.value import Value
-
-        try:
-            hints = typing.get_type_hints(type(instance), include_extras=True)
-        except NameError:
-            logging.getLogger(__name__).warning(
-                "Could not resolve type hints for %s — Autowired fields will not be injected. "
-                "Check for unresolved forward references.",
-                type(instance).__qualname__,
-            )
-            return
-
-        for attr_name, attr_type in hints.items():
-            default = getattr(type(instance), attr_name, None)
-
-            # Handle @Value("${key}") field descriptors
-            if isinstance(default, Value):
-                from pyfly.core.config import Config
-
-                config_reg = self._registrations.get(Config)
-                if config_reg is None or config_reg.instance is None:
-                    raise RuntimeError(
-                        f"Cannot resolve @Value for {type(instance).__qualname__}.{attr_name}: "
-                        f"Config bean not registered"
-                    )
-                resolved = default.resolve(config_reg.instance)
-                setattr(instance, attr_name, resolved)
-                continue
-
-            if not isinstance(default, Autowired):
-                continue
-
-            if default.qualifier:
-                value = self.resolve_by_name(default.qualifier)
-            elif get_origin(attr_type) is Annotated:
-                value = self._resolve_param(attr_type)
-            else:
-                try:
-                    value = self.resolve(attr_type)
-                except (NoSuchBeanError, NoUniqueBeanError):
-                    if not default.required:
-                        value = None
-                    else:
-                        raise NoSuchBeanError(
-                            bean_type=attr_type if isinstance(attr_type, type) else None,
-                            required_by=f"{type(instance).__qualname__}.{attr_name}",
-                            parameter=f"{attr_name}: {getattr(attr_type, '__name__', repr(attr_type))} = Autowired()",
-                        ) from None
-
-            setattr(instance, attr_name, value)
-
-    def _ensure_metrics(self, cls: type) -> BeanMetrics:
-        """Return the metrics for *cls*, creating a new entry if needed."""
-        if cls not in self._metrics:
-            self._metrics[cls] = BeanMetrics()
-        return self._metrics[cls]
+        return compile_param_resolver(param_type)(self)
+
+    @property
+    def metrics_mode(self) -> MetricsMode:
+        """How bean resolutions are recorded (see :class:`MetricsMode`)."""
+        return self._metrics_mode
+
+    def configure_metrics(self, mode: MetricsMode, sample_interval: int = 100) -> None:
+        """Switch the metrics mode.
+
+        Args:
+            mode: ``OFF``, ``SAMPLED`` or ``FULL``.
+            sample_interval: In ``SAMPLED`` mode, count one resolve in this many.
+        """
+        if sample_interval < 1:
+            raise ValueError(f"sample_interval must be >= 1, got {sample_interval}")
+        self._metrics_mode = mode
+        self._sample_interval = sample_interval if mode is MetricsMode.SAMPLED else 1
+        self._sample_countdown = self._sample_interval
 
     def get_bean_metrics(self, cls: type) -> BeanMetrics | None:
         """Return collected metrics for a single bean, or ``None`` if never resolved."""
-        return self._metrics.get(cls)
+        reg = self._registrations.get(cls)
+        if reg is None or not _has_metrics(reg.metrics):
+            return None
+        return reg.metrics
 
     def get_all_metrics(self) -> dict[type, BeanMetrics]:
         """Return a snapshot of metrics for every resolved bean."""
-        return dict(self._metrics)
+        return {cls: reg.metrics for cls, reg in self._registrations.items() if _has_metrics(reg.metrics)}
 
     def _get_similar_type_names(self, name: str) -> list[str]:
         """Return registered type names similar to *name* using fuzzy matching."""
@@ -329,3 +412,7 @@ class Container:
             return []
         registered_names = [getattr(cls, "__name__", repr(cls)) for cls in self._registrations]
         return difflib.get_close_matches(name, registered_names, n=5, cutoff=0.4)
+
+
+def _has_metrics(metrics: BeanMetrics) -> bool:
+    return metrics.resolution_count > 0 or metrics.created_at is not None
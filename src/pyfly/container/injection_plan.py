@@ -0,0 +1,215 @@
+# Copyright 2026 Firefly Software Solutions Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Precompiled injection plans for constructor and field injection.
+
+Reflecting over a bean class (``typing.get_type_hints``, ``inspect.signature``
+and ``get_origin``/``get_args`` dispatch) happens once per registration.  The
+resulting :class:`InjectionPlan` is a flat tuple of resolvers that the
+container replays on every instantiation, which keeps TRANSIENT and
+REQUEST-scoped beans cheap to create.
+
+Plans are purely structural: resolvers receive the container as an argument
+and look up their targets at call time, so the same plan stays valid when
+bindings change.
+"""
+
+from __future__ import annotations
+
+import inspect
+import logging
+import types
+import typing
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Annotated, Any, Union, get_args, get_origin
+
+from pyfly.container.autowired import Autowired
+from pyfly.container.bean import Qualifier
+from pyfly.container.exceptions import NoSuchBeanError, NoUniqueBeanError
+
+if TYPE_CHECKING:
+    from pyfly.container.container import Container
+
+logger = logging.getLogger(__name__)
+
+Resolver = Callable[["Container"], Any]
+
+
+@dataclass(frozen=True, slots=True)
+class ParamInjection:
+    """A single constructor parameter and its precompiled resolver."""
+
+    name: str
+    param_type: Any
+    resolve: Resolver
+    has_default: bool
+
+
+@dataclass(frozen=True, slots=True)
+class FieldInjection:
+    """A single ``Autowired()`` / ``Value()`` field and its precompiled resolver.
+
+    ``field_type`` is the declared bean type for ``Autowired()`` fields and
+    ``None`` for ``Value()`` fields, which depend on configuration only.
+    """
+
+    name: str
+    resolve: Resolver
+    field_type: Any = None
+
+
+@dataclass(frozen=True, slots=True)
+class InjectionPlan:
+    """Everything the container needs to build an instance of a bean class."""
+
+    params: tuple[ParamInjection, ...] = ()
+    fields: tuple[FieldInjection, ...] = ()
+    default_constructor: bool = False
+
+    def dependency_types(self) -> list[Any]:
+        """Declared types of every injected constructor parameter and ``Autowired()`` field."""
+        return [p.param_type for p in self.params] + [f.field_type for f in self.fields if f.field_type is not None]
+
+
+def compile_param_resolver(param_type: Any) -> Resolver:
+    """Compile a parameter type into a resolver, handling Annotated, Optional, and list."""
+    origin = get_origin(param_type)
+
+    # Handle Annotated[T, Qualifier("name")]
+    if origin is Annotated:
+        args = get_args(param_type)
+        for metadata in args[1:]:
+            if isinstance(metadata, Qualifier):
+                qualifier = metadata.name
+                return lambda container: container.resolve_by_name(qualifier)
+        return compile_param_resolver(args[0])
+
+    # Handle Optional[T] (Union[T, None] or T | None via PEP 604)
+    if origin is Union or isinstance(param_type, types.UnionType):
+        non_none = [a for a in get_args(param_type) if a is not type(None)]
+        if len(non_none) == 1:
+            target = non_none[0]
+
+            def resolve_optional(container: Container) -> Any:
+                try:
+                    return container.resolve(target)
+                except (NoSuchBeanError, NoUniqueBeanError):
+                    return None
+
+            return resolve_optional
+
+    # Handle list[T]
+    if origin is list:
+        args = get_args(param_type)
+        if args:
+            item_type = args[0]
+            return lambda container: container.resolve_all(item_type)
+
+    # Handle type[T] or bare `type` — class references cannot be auto-resolved
+    if param_type is type or origin is type:
+        bean_type = param_type if isinstance(param_type, type) else None
+
+        def unresolvable(container: Container) -> Any:
+            raise NoSuchBeanError(bean_type=bean_type)
+
+        return unresolvable
+
+    return lambda container: container.resolve(param_type)
+
+
+def compile_injection_plan(cls: type) -> InjectionPlan:
+    """Introspect *cls* once and build its :class:`InjectionPlan`."""
+    init = cls.__init__  # type: ignore[misc]
+    if init is object.__init__:
+        return InjectionPlan(fields=_compile_fields(cls), default_constructor=True)
+
+    hints = typing.get_type_hints(init, include_extras=True)
+    hints.pop("return", None)
+    sig = inspect.signature(init)
+
+    params: list[ParamInjection] = []
+    for param_name, param_type in hints.items():
+        param = sig.parameters.get(param_name)
+        params.append(
+            ParamInjection(
+                name=param_name,
+                param_type=param_type,
+                resolve=compile_param_resolver(param_type),
+                has_default=param is not None and param.default is not inspect.Parameter.empty,
+            )
+        )
+    return InjectionPlan(params=tuple(params), fields=_compile_fields(cls))
+
+
+def _compile_fields(cls: type) -> tuple[FieldInjection, ...]:
+    """Collect fields marked with Autowired() or Value() into field injections."""
+    from pyfly.core.value import Value
+
+    try:
+        hints = typing.get_type_hints(cls, include_extras=True)
+    except NameError:
+        logger.warning(
+            "Could not resolve type hints for %s — Autowired fields will not be injected. "
+            "Check for unresolved forward references.",
+            cls.__qualname__,
+        )
+        return ()
+
+    fields: list[FieldInjection] = []
+    for attr_name, attr_type in hints.items():
+        default = getattr(cls, attr_name, None)
+        if isinstance(default, Value):
+            fields.append(FieldInjection(attr_name, _value_resolver(cls, attr_name, default)))
+        elif isinstance(default, Autowired):
+            resolver = _autowired_resolver(cls, attr_name, attr_type, default)
+            fields.append(FieldInjection(attr_name, resolver, field_type=attr_type))
+    return tuple(fields)
+
+
+def _value_resolver(cls: type, attr_name: str, value: Any) -> Resolver:
+    """Build a resolver for a ``@Value("${key}")`` field descriptor."""
+    from pyfly.core.config import Config
+
+    def resolve_value(container: Container) -> Any:
+        config_reg = container._registrations.get(Config)
+        if config_reg is None or config_reg.instance is None:
+            raise RuntimeError(f"Cannot resolve @Value for {cls.__qualname__}.{attr_name}: Config bean not registered")
+        return value.resolve(config_reg.instance)
+
+    return resolve_value
+
+
+def _autowired_resolver(cls: type, attr_name: str, attr_type: Any, autowired: Autowired) -> Resolver:
+    """Build a resolver for an ``Autowired()`` field."""
+    if autowired.qualifier:
+        qualifier = autowired.qualifier
+        return lambda container: container.resolve_by_name(qualifier)
+    if get_origin(attr_type) is Annotated:
+        return compile_param_resolver(attr_type)
+
+    required = autowired.required
+
+    def resolve_autowired(container: Container) -> Any:
+        try:
+            return container.resolve(attr_type)
+        except (NoSuchBeanError, NoUniqueBeanError):
+            if not required:
+                return None
+            raise NoSuchBeanError(
+                bean_type=attr_type if isinstance(attr_type, type) else None,
+                required_by=f"{cls.__qualname__}.{attr_name}",
+                parameter=f"{attr_name}: {getattr(attr_type, '__name__', repr(attr_type))} = Autowired()",
+            ) from None
+
+    return resolve_autowired
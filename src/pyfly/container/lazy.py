@@ -0,0 +1,140 @@
+# Copyright 2026 Firefly Software Solutions Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""@lazy marker and the proxy injected in place of not-yet-created lazy beans."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+T = TypeVar("T", bound=type)
+
+
+def lazy(cls: T) -> T:
+    """Defer creation of a singleton bean until it is first used.
+
+    Beans that depend on a lazy bean receive a :class:`LazyProxy` which
+    creates (and post-processes) the real instance on first attribute access.
+    Equivalent to passing ``lazy=True`` to a stereotype decorator.
+    """
+    cls.__pyfly_lazy__ = True  # type: ignore[attr-defined]
+    return cls
+
+
+class LazyProxy:
+    """Stand-in for a lazy singleton that materializes it on first use.
+
+    ``isinstance`` checks and dunder/marker probes see the bean's declared
+    type without triggering creation; any other attribute access, call, or
+    comparison resolves the target through the container and forwards to it.
+    Operations Python looks up on the type (``len()``, iteration, ``[]``,
+    ``in``, ``with`` / ``async with``, comparisons) are forwarded as well.
+    """
+
+    __slots__ = ("_pyfly_factory", "_pyfly_target", "_pyfly_type")
+
+    def __init__(self, bean_type: type, factory: Callable[[], Any]) -> None:
+        object.__setattr__(self, "_pyfly_type", bean_type)
+        object.__setattr__(self, "_pyfly_factory", factory)
+        object.__setattr__(self, "_pyfly_target", None)
+
+    def _pyfly_materialize(self) -> Any:
+        target = object.__getattribute__(self, "_pyfly_target")
+        if target is None:
+            target = object.__getattribute__(self, "_pyfly_factory")()
+            object.__setattr__(self, "_pyfly_target", target)
+        return target
+
+    @property  # type: ignore[misc]
+    def __class__(self) -> type:  # noqa: F811
+        return object.__getattribute__(self, "_pyfly_type")  # type: ignore[no-any-return]
+
+    @property
+    def pyfly_materialized(self) -> bool:
+        """Whether the real bean has been created yet."""
+        return object.__getattribute__(self, "_pyfly_target") is not None
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__") and object.__getattribute__(self, "_pyfly_target") is None:
+            # Dunder/marker probes from reflective scans (dir + getattr loops)
+            # are answered by the class so they do not force creation.
+            return getattr(object.__getattribute__(self, "_pyfly_type"), name)
+        return getattr(self._pyfly_materialize(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._pyfly_materialize(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self._pyfly_materialize(), name)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._pyfly_materialize()(*args, **kwargs)
+
+    def __eq__(self, other: object) -> bool:
+        return bool(self._pyfly_materialize() == other)
+
+    def __hash__(self) -> int:
+        return hash(self._pyfly_materialize())
+
+    def __bool__(self) -> bool:
+        return bool(self._pyfly_materialize())
+
+    def __str__(self) -> str:
+        return str(self._pyfly_materialize())
+
+    def __repr__(self) -> str:
+        if self.pyfly_materialized:
+            return repr(self._pyfly_materialize())
+        bean_type = object.__getattribute__(self, "_pyfly_type")
+        return f"<LazyProxy {bean_type.__qualname__} (not initialized)>"
+
+
+def _forward(name: str) -> Callable[..., Any]:
+    """Build a proxy method that calls the target type's *name* special method."""
+
+    def method(self: LazyProxy, *args: Any) -> Any:
+        target = self._pyfly_materialize()
+        impl = getattr(type(target), name, None)
+        if impl is None:
+            raise TypeError(f"'{type(target).__name__}' object does not support {name}")
+        return impl(target, *args)
+
+    method.__name__ = name
+    return method
+
+
+# Special methods Python looks up on the type, so __getattr__ never sees them
+for _name in (
+    "__len__",
+    "__length_hint__",
+    "__iter__",
+    "__next__",
+    "__reversed__",
+    "__contains__",
+    "__getitem__",
+    "__setitem__",
+    "__delitem__",
+    "__enter__",
+    "__exit__",
+    "__aenter__",
+    "__aexit__",
+    "__aiter__",
+    "__anext__",
+    "__lt__",
+    "__le__",
+    "__gt__",
+    "__ge__",
+):
+    setattr(LazyProxy, _name, _forward(_name))
+del _name
@@ -0,0 +1,152 @@
+# Copyright 2026 Firefly Software Solutions Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Per-class index of decorated methods, keyed by ``__pyfly_*__`` marker.
+
+Method decorators (``@post_construct``, ``@app_event_listener``,
+``@scheduled``, ``@shell_method`` …) tag the function object with a marker
+attribute.  Instead of every wiring phase running its own
+``dir(instance)`` + ``getattr`` sweep over every bean, the class ``__dict__``
+chain is read once per class and the result is shared by all phases.
+
+Only functions, ``staticmethod`` and ``classmethod`` objects defined on the
+class are indexed.  Properties and other descriptors are never evaluated.
+Functions and methods assigned to an instance (which the ``dir()`` scans
+also found) are picked up from the instance ``__dict__`` by
+:func:`marked_methods` and :func:`public_methods`.
+"""
+
+from __future__ import annotations
+
+import inspect
+import threading
+from dataclasses import dataclass, field
+from typing import Any
+from weakref import WeakKeyDictionary
+
+_MARKER_PREFIX = "__pyfly_"
+
+
+@dataclass(frozen=True, slots=True)
+class MethodIndex:
+    """Method names of one class, grouped by the markers set on them.
+
+    Names are sorted so consumers see the same order as the ``dir()`` scans
+    they replace.
+    """
+
+    methods: tuple[str, ...] = ()
+    markers: dict[str, tuple[str, ...]] = field(default_factory=dict)
+
+    def names(self, marker: str, *, include_private: bool = False) -> tuple[str, ...]:
+        """Names of methods carrying a truthy *marker* attribute."""
+        names = self.markers.get(marker, ())
+        if include_private:
+            return names
+        return tuple(name for name in names if not name.startswith("_"))
+
+    @property
+    def public_methods(self) -> tuple[str, ...]:
+        """Names of every method not starting with ``_``."""
+        return tuple(name for name in self.methods if not name.startswith("_"))
+
+
+_cache: WeakKeyDictionary[type, MethodIndex] = WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+def method_index(cls: type) -> MethodIndex:
+    """Return the (memoized) :class:`MethodIndex` for *cls*."""
+    try:
+        return _cache[cls]
+    except KeyError:
+        pass
+    index = _build_index(cls)
+    with _lock:
+        return _cache.setdefault(cls, index)
+
+
+def marked_methods(instance: Any, marker: str, *, include_private: bool = False) -> list[tuple[str, Any]]:
+    """Return ``(name, bound_method)`` pairs of *instance* carrying *marker*.
+
+    Attributes are read from the instance so that methods replaced on it
+    (for example by AOP weaving) are returned in their current form.
+    """
+    names = method_index(type(instance)).names(marker, include_private=include_private)
+    result: list[tuple[str, Any]] = []
+    for name in names:
+        try:
+            method = getattr(instance, name)
+        except Exception:
+            continue
+        result.append((name, method))
+    extra = [
+        (name, value)
+        for name, value in _instance_routines(instance).items()
+        if name not in names and (include_private or not name.startswith("_")) and getattr(value, marker, False)
+    ]
+    if extra:
+        result = sorted(result + extra, key=lambda item: item[0])
+    return result
+
+
+def public_methods(instance: Any) -> tuple[str, ...]:
+    """Names of *instance*'s public methods: the class index plus routines set on the instance."""
+    names = method_index(type(instance)).public_methods
+    extra = [name for name in _instance_routines(instance) if not name.startswith("_") and name not in names]
+    if extra:
+        return tuple(sorted((*names, *extra)))
+    return names
+
+
+def _instance_routines(instance: Any) -> dict[str, Any]:
+    """Functions and methods stored in *instance*'s own ``__dict__``."""
+    try:
+        attrs = vars(instance)
+    except TypeError:  # __slots__ or builtin instance
+        return {}
+    return {name: value for name, value in attrs.items() if inspect.isroutine(value)}
+
+
+def _build_index(cls: type) -> MethodIndex:
+    """Walk the MRO ``__dict__`` chain; the first definition of a name wins."""
+    seen: set[str] = set()
+    methods: list[str] = []
+    markers: dict[str, list[str]] = {}
+    for klass in cls.__mro__:
+        if klass is object:
+            continue
+        for name, raw in vars(klass).items():
+            if name in seen:
+                continue
+            seen.add(name)
+            func = _unwrap(raw)
+            if func is None:
+                continue
+            methods.append(name)
+            for key, value in getattr(func, "__dict__", {}).items():
+                if key.startswith(_MARKER_PREFIX) and value:
+                    markers.setdefault(key, []).append(name)
+    return MethodIndex(
+        methods=tuple(sorted(methods)),
+        markers={key: tuple(sorted(names)) for key, names in markers.items()},
+    )
+
+
+def _unwrap(raw: Any) -> Any:
+    """Return the underlying callable of a method-like class attribute, else ``None``."""
+    if isinstance(raw, (staticmethod, classmethod)):
+        return raw.__func__
+    if isinstance(raw, type) or not callable(raw):
+        return None
+    return raw
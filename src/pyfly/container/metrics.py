@@ -16,9 +16,25 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from enum import Enum
 
 
-@dataclass
+class MetricsMode(Enum):
+    """How much the container records about bean resolution.
+
+    - ``OFF``: nothing is recorded.
+    - ``SAMPLED``: creation metrics are recorded; only one resolve in
+      ``sample_interval`` is counted, adding ``sample_interval`` to that bean's
+      ``resolution_count`` (an unbiased estimate of the real count).
+    - ``FULL``: every resolve is counted.
+    """
+
+    OFF = "off"
+    SAMPLED = "sampled"
+    FULL = "full"
+
+
+@dataclass(slots=True)
 class BeanMetrics:
     """Metrics collected for a single bean registration."""
 
@@ -11,12 +11,12 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-"""Bean initialization ordering — @order decorator and precedence constants."""
+"""Bean initialization ordering — @order / @depends_on decorators and precedence constants."""
 
 from __future__ import annotations
 
 from collections.abc import Callable
-from typing import TypeVar
+from typing import Any, TypeVar
 
 T = TypeVar("T", bound=type)
 
@@ -41,3 +41,24 @@ def order(value: int) -> Callable[[T], T]:
 def get_order(cls: type) -> int:
     """Get the order value for a class, defaulting to 0."""
     return getattr(cls, "__pyfly_order__", 0)
+
+
+def depends_on(*beans: type | str) -> Callable[[T], T]:
+    """Declare beans that must be initialized before the decorated bean.
+
+    Accepts bean types or bean names.  Use it for dependencies that are not
+    visible in the constructor signature (e.g. a schema migrator that must
+    run before a repository starts).  Honoured by parallel startup when
+    grouping lifecycle hooks into dependency layers.
+    """
+
+    def decorator(cls: T) -> T:
+        cls.__pyfly_depends_on__ = tuple(beans)  # type: ignore[attr-defined]
+        return cls
+
+    return decorator
+
+
+def get_depends_on(cls: type) -> tuple[Any, ...]:
+    """Get the explicit ``@depends_on`` entries for a class, defaulting to none."""
+    return tuple(getattr(cls, "__pyfly_depends_on__", ()))
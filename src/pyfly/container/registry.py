@@ -17,10 +17,14 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+from pyfly.container.metrics import BeanMetrics
 from pyfly.container.types import Scope
 
+if TYPE_CHECKING:
+    from pyfly.container.injection_plan import InjectionPlan
+
 
 @dataclass
 class Registration:
@@ -31,3 +35,6 @@ class Registration:
     condition: Callable[..., bool] | None = None
     instance: Any = field(default=None, repr=False)
     name: str = ""
+    lazy: bool = False
+    plan: InjectionPlan | None = field(default=None, repr=False, compare=False)
+    metrics: BeanMetrics = field(default_factory=BeanMetrics, repr=False, compare=False)
@@ -20,6 +20,7 @@ import importlib
 import inspect
 import pkgutil
 import types
+from collections.abc import Iterator
 from typing import TYPE_CHECKING, Protocol
 
 if TYPE_CHECKING:
@@ -36,23 +37,25 @@ def scan_package(package_name: str, container: Container) -> int:
     Returns:
         Number of classes registered.
     """
-    count = 0
-    module = importlib.import_module(package_name)
+    return sum(_register_from_module(module, container) for module in iter_package_modules(package_name))
+
 
-    # Register stereotype-decorated classes from this module
-    count += _register_from_module(module, container)
+def iter_package_modules(package_name: str) -> Iterator[types.ModuleType]:
+    """Import and yield a package and, if it is a package, all its submodules.
+
+    Submodules that fail to import are skipped.
+    """
+    module = importlib.import_module(package_name)
+    yield module
 
     # If it's a package, scan submodules
     if hasattr(module, "__path__"):
         for _importer, modname, _ispkg in pkgutil.walk_packages(module.__path__, prefix=module.__name__ + "."):
             try:
-                submodule = importlib.import_module(modname)
-                count += _register_from_module(submodule, container)
+                yield importlib.import_module(modname)
             except ImportError:
                 continue
 
-    return count
-
 
 def scan_module_classes(module: types.ModuleType) -> list[type]:
     """Extract all stereotype-decorated classes from a module.
@@ -87,11 +90,17 @@ def _register_from_module(module: types.ModuleType, container: Container) -> int
 
 def _auto_bind_interfaces(cls: type, container: Container) -> None:
     """Auto-bind a class to its Protocol, ABC, and base class interfaces."""
-    for base in inspect.getmro(cls)[1:]:
-        if base is object:
-            continue
-        if _is_protocol(base) or inspect.isabstract(base) or _is_port(base):
-            container.bind(base, cls)
+    for base in interfaces_of(cls):
+        container.bind(base, cls)
+
+
+def interfaces_of(cls: type) -> list[type]:
+    """Return the Protocol, ABC, and port base classes *cls* is auto-bound to."""
+    return [
+        base
+        for base in inspect.getmro(cls)[1:]
+        if base is not object and (_is_protocol(base) or inspect.isabstract(base) or _is_port(base))
+    ]
 
 
 def _is_protocol(cls: type) -> bool:
@@ -46,6 +46,7 @@ def _make_stereotype(stereotype_name: str) -> Callable[..., Any]:
         scope: Scope = Scope.SINGLETON,
         profile: str = "",
         condition: Callable[..., bool] | None = None,
+        lazy: bool | None = None,
     ) -> Callable[[T], T]: ...
 
     def stereotype(
@@ -55,6 +56,7 @@ def _make_stereotype(stereotype_name: str) -> Callable[..., Any]:
         scope: Scope = Scope.SINGLETON,
         profile: str = "",
         condition: Callable[..., bool] | None = None,
+        lazy: bool | None = None,
     ) -> T | Callable[[T], T]:
         def decorator(cls: T) -> T:
             cls.__pyfly_injectable__ = True  # type: ignore[attr-defined]
@@ -65,6 +67,8 @@ def _make_stereotype(stereotype_name: str) -> Callable[..., Any]:
                 cls.__pyfly_bean_name__ = name  # type: ignore[attr-defined]
             if profile:
                 cls.__pyfly_profile__ = profile  # type: ignore[attr-defined]
+            if lazy is not None:
+                cls.__pyfly_lazy__ = lazy  # type: ignore[attr-defined]
             return cls
 
         if cls is not None:
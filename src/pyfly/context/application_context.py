@@ -16,12 +16,15 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import functools
 import inspect
 import logging
+import time
 import typing
 from collections import deque
-from typing import Any, TypeVar
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from pyfly.container.container import Container
 from pyfly.container.exceptions import (
@@ -29,7 +32,10 @@ from pyfly.container.exceptions import (
     NoSuchBeanError,
     NoUniqueBeanError,
 )
+from pyfly.container.method_index import marked_methods
+from pyfly.container.metrics import MetricsMode
 from pyfly.container.ordering import get_order
+from pyfly.container.registry import Registration
 from pyfly.container.types import Scope
 from pyfly.context.condition_evaluator import ConditionEvaluator
 from pyfly.context.environment import Environment
@@ -41,12 +47,82 @@ from pyfly.context.events import (
     ContextRefreshedEvent,
 )
 from pyfly.context.post_processor import BeanPostProcessor
+from pyfly.context.startup import run_wave, startup_waves
+from pyfly.context.startup_recorder import StartupRecorder
 from pyfly.core.config import Config
 
+if TYPE_CHECKING:
+    from pyfly.context.component_index import ComponentIndex
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Markers that make a bean ineligible for global lazy initialization: these are
+# discovered by scanning live instances during start(), so the bean must exist.
+_EAGER_CLASS_MARKERS = ("__pyfly_aspect__", "__pyfly_handler_type__", "__pyfly_saga__", "__pyfly_tcc__")
+_EAGER_METHOD_MARKERS = (
+    "__pyfly_app_event_listener__",
+    "__pyfly_message_listener__",
+    "__pyfly_scheduled__",
+    "__pyfly_async__",
+    "__pyfly_shell_method__",
+)
+
+
+def _has_async_post_construct(cls: type) -> bool:
+    """Whether *cls* declares an ``async`` ``@post_construct`` method."""
+    for klass in getattr(cls, "__mro__", ()):
+        for attr in vars(klass).values():
+            if getattr(attr, "__pyfly_post_construct__", False) and inspect.iscoroutinefunction(attr):
+                return True
+    return False
+
+
+def _bean_metrics_settings(config: Config) -> tuple[MetricsMode, int]:
+    """Read and validate ``pyfly.context.bean-metrics.mode`` and ``sample-interval``."""
+    mode = str(config.get("pyfly.context.bean-metrics.mode", "full")).lower()
+    allowed = [m.value for m in MetricsMode]
+    if mode not in allowed:
+        raise ValueError(
+            f"Invalid value {mode!r} for 'pyfly.context.bean-metrics.mode': expected one of {', '.join(allowed)}"
+        )
+    interval = config.get("pyfly.context.bean-metrics.sample-interval", 100)
+    try:
+        sample_interval = int(interval)
+    except (TypeError, ValueError):
+        sample_interval = 0
+    if sample_interval < 1:
+        raise ValueError(
+            f"Invalid value {interval!r} for 'pyfly.context.bean-metrics.sample-interval': expected an integer >= 1"
+        )
+    return MetricsMode(mode), sample_interval
+
+
+def _could_be_runner(cls: type) -> bool:
+    """Whether instances of *cls* would be invoked as CommandLineRunner / ApplicationRunner.
+
+    Runners are matched structurally by their ``run`` method, which is called
+    with a single argument: the CLI args (``list[str]``) or ``ApplicationArguments``.
+    """
+    run = inspect.getattr_static(cls, "run", None)
+    if not inspect.isfunction(run):
+        return False
+    params = list(inspect.signature(run).parameters.values())[1:]
+    positional = [p for p in params if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD)]
+    required = [p for p in params if p.default is p.empty and p.kind not in (p.VAR_POSITIONAL, p.VAR_KEYWORD)]
+    if not positional or len(required) > 1:
+        return False
+    try:
+        annotation = typing.get_type_hints(run).get(positional[0].name)
+    except Exception:  # unresolvable forward reference
+        return True
+    if annotation is None or annotation is list or typing.get_origin(annotation) is list:
+        return True
+    from pyfly.shell.runner import ApplicationArguments
+
+    return annotation is ApplicationArguments
+
 
 class ApplicationContext:
     """Central bean registry, lifecycle manager, and event publisher.
@@ -61,23 +137,55 @@ class ApplicationContext:
     - Profile-aware Environment
     """
 
-    def __init__(self, config: Config) -> None:
+    def __init__(self, config: Config, *, parent: ApplicationContext | None = None) -> None:
         self._config = config
-        self._container = Container()
+        self._container: Container = parent._container.create_child() if parent is not None else Container()
         self._environment = Environment(config)
-        self._event_bus = ApplicationEventBus()
+        self._parent = parent
+        self._event_bus: ApplicationEventBus = ApplicationEventBus(parent._event_bus if parent is not None else None)
         self._post_processors: list[BeanPostProcessor] = []
         self._started = False
         self._infrastructure_adapters: list[Any] = []
         self._task_scheduler: Any | None = None
         self._background_tasks: list[asyncio.Task[Any]] = []
         self._wiring_counts: dict[str, int] = {}
+        self._phase_timings: dict[str, float] = {}
+        self._parallel_startup = str(config.get("pyfly.context.parallel-startup", False)).lower() in (
+            "true",
+            "1",
+            "yes",
+        )
+        self._lazy_initialization = str(config.get("pyfly.context.lazy-initialization", False)).lower() in (
+            "true",
+            "1",
+            "yes",
+        )
+        self._component_index: ComponentIndex | None = None
+        self._container.configure_metrics(*_bean_metrics_settings(config))
+        self._startup_recorder: StartupRecorder | None = None
+        if parent is None and str(config.get("pyfly.context.startup-recorder.enabled", False)).lower() in (
+            "true",
+            "1",
+            "yes",
+        ):
+            # Started here so that imports done while scanning packages are captured too
+            self._startup_recorder = StartupRecorder()
+            self._startup_recorder.start_import_tracking()
+            self._container._startup_recorder = self._startup_recorder
+        # Post-processors applied to lazy beans materialized after step 5 of start()
+        self._lazy_post_processors: list[BeanPostProcessor] | None = None
 
         # Register config and container as singleton beans (injectable like Spring's ApplicationContext)
         self._container.register(Config, scope=Scope.SINGLETON)
         self._container._registrations[Config].instance = config
         self._container.register(Container, scope=Scope.SINGLETON)
         self._container._registrations[Container].instance = self._container
+        self._container._lazy_initializer = self._initialize_lazy_bean
+        if parent is not None:
+            # Child context: the parent's startup already ran; reuse its post-processors
+            self._post_processors = list(parent._post_processors)
+            self._lazy_post_processors = parent._lazy_post_processors
+            self._started = parent._started
 
     # ------------------------------------------------------------------
     # Bean registration
@@ -93,6 +201,23 @@ class ApplicationContext:
         """Register a BeanPostProcessor."""
         self._post_processors.append(processor)
 
+    def use_component_index(self, index: ComponentIndex) -> None:
+        """Discover auto-configurations from a build-time index instead of entry points."""
+        self._component_index = index
+
+    def create_child(self) -> ApplicationContext:
+        """Return a context over a child of this context's container.
+
+        The child shares every singleton this context already created and
+        needs no ``start()``: beans registered on it are created and
+        initialized (post-processors, ``@post_construct``,
+        ``@app_event_listener`` subscription) on first resolution.  Events
+        published on the child's bus also reach this context's listeners.
+        Overrides stay in the child, and ``stop()`` on the child only destroys
+        the beans it created.
+        """
+        return ApplicationContext(self._config, parent=self)
+
     # ------------------------------------------------------------------
     # Bean access
     # ------------------------------------------------------------------
@@ -138,6 +263,11 @@ class ApplicationContext:
         """Application event bus."""
         return self._event_bus
 
+    @property
+    def startup_recorder(self) -> StartupRecorder | None:
+        """Startup timeline, when ``pyfly.context.startup-recorder.enabled`` is set."""
+        return self._startup_recorder
+
     @property
     def bean_count(self) -> int:
         """Number of beans eagerly initialized during start()."""
@@ -159,75 +289,228 @@ class ApplicationContext:
                 provider=type(exc).__qualname__,
                 reason=str(exc),
             ) from exc
+        finally:
+            self._finish_startup_recording()
+
+    def _finish_startup_recording(self) -> None:
+        """Stop recording and write the Chrome trace file if one is configured."""
+        recorder = self._startup_recorder
+        if recorder is None:
+            return
+        recorder.stop_import_tracking()
+        self._container._startup_recorder = None
+        trace_file = str(self._config.get("pyfly.context.startup-recorder.trace-file", "") or "")
+        if trace_file:
+            try:
+                recorder.dump_chrome_trace(trace_file)
+            except OSError as exc:
+                logger.warning("startup_trace_write_failed", extra={"path": trace_file, "error": str(exc)})
+            else:
+                logger.debug("startup_trace_written", extra={"path": trace_file, "spans": len(recorder.spans)})
 
     async def _do_start(self) -> None:
         """Internal startup logic."""
+        self._phase_timings.clear()
+
         # 0. Register built-in @auto_configuration classes
-        self._register_auto_configurations()
+        with self._phase("register_auto_configurations"):
+            self._register_auto_configurations()
 
         # 1. Filter beans by active profiles
-        self._filter_by_profile()
+        with self._phase("filter_by_profile"):
+            self._filter_by_profile()
 
         # 1b. Evaluate @conditional_on_* decorators (pass 1: property/class)
-        self._evaluate_conditions()
+        with self._phase("evaluate_conditions"):
+            self._evaluate_conditions()
 
         # 2. Process user @configuration classes and their @bean methods
-        self._process_configurations(auto=False)
+        with self._phase("user_configurations"):
+            self._process_configurations(auto=False)
 
         # 2b. Process @auto_configuration classes (after user configs, so
         #     @conditional_on_missing_bean can see user-provided beans)
-        self._evaluate_bean_conditions()
-        self._process_configurations(auto=True)
+        with self._phase("auto_configurations"):
+            self._evaluate_bean_conditions()
+            self._process_configurations(auto=True)
 
         # 2c. Start infrastructure adapters (fail-fast: validates connectivity)
-        await self._start_infrastructure()
+        with self._phase("infrastructure"):
+            await self._start_infrastructure()
 
         # 3. Auto-discover BeanPostProcessors from registered beans
-        self._discover_post_processors()
+        with self._phase("post_processors"):
+            self._discover_post_processors()
 
         # 4. Eagerly resolve all singletons (sorted by @order)
-        sorted_entries = sorted(
-            self._container._registrations.items(),
-            key=lambda item: get_order(item[0]),
-        )
-        for cls, reg in sorted_entries:
-            if reg.scope == Scope.SINGLETON and reg.instance is None:
+        with self._phase("singletons"):
+            sorted_entries = sorted(
+                self._container._registrations.items(),
+                key=lambda item: get_order(item[0]),
+            )
+            pending = [
+                (cls, reg) for cls, reg in sorted_entries if reg.scope == Scope.SINGLETON and reg.instance is None
+            ]
+            # Mark every lazy bean first, so eager beans get proxies for lazy
+            # dependencies that come later in the order.
+            for cls, reg in pending:
+                reg.lazy = self._is_lazy(cls)
+                if reg.lazy and _has_async_post_construct(reg.impl_type):
+                    raise BeanCreationException(
+                        subsystem="lifecycle",
+                        provider=reg.impl_type.__qualname__,
+                        reason="lazy beans cannot have an async @post_construct method; "
+                        "make the method synchronous or the bean eager",
+                    )
+            for cls, reg in pending:
+                if reg.lazy or reg.instance is not None:
+                    continue
                 try:
                     self._container.resolve(cls)
                 except BeanCreationException as exc:
                     logger.debug("deferred_bean_resolution", extra={"bean": cls.__name__, "reason": str(exc)})
 
         # 5. Run post-processors and lifecycle hooks
-        sorted_pps = sorted(self._post_processors, key=lambda pp: get_order(type(pp)))
-        for reg in self._container._registrations.values():
-            if reg.instance is not None:
-                bean_name = reg.name or reg.impl_type.__name__
-
-                # BeanPostProcessor.before_init
-                for pp in sorted_pps:
-                    reg.instance = pp.before_init(reg.instance, bean_name)
-
-                # @post_construct
-                await self._call_post_construct(reg.instance)
-
-                # BeanPostProcessor.after_init
-                for pp in sorted_pps:
-                    reg.instance = pp.after_init(reg.instance, bean_name)
+        with self._phase("lifecycle"):
+            sorted_pps = sorted(self._post_processors, key=lambda pp: get_order(type(pp)))
+            initialized = [reg for reg in self._container._registrations.values() if reg.instance is not None]
+            self._lazy_post_processors = sorted_pps
+            if self._parallel_startup:
+                for wave in startup_waves(self._container, initialized):
+                    await run_wave([self._initialize_bean(reg, sorted_pps) for reg in wave])
+            else:
+                for reg in initialized:
+                    await self._initialize_bean(reg, sorted_pps)
 
         # 6. Wire decorator-based beans to their targets
-        self._wire_app_event_listeners()
-        self._wire_message_listeners()
-        self._wire_cqrs_handlers()
-        self._wire_scheduled()
-        self._wire_async_methods()
-        self._wire_shell_commands()
+        with self._phase("wiring"):
+            self._wire_app_event_listeners()
+            self._wire_message_listeners()
+            self._wire_cqrs_handlers()
+            self._wire_scheduled()
+            self._wire_async_methods()
+            self._wire_shell_commands()
 
         # 7. Publish lifecycle events
-        await self._event_bus.publish(ContextRefreshedEvent())
-        await self._event_bus.publish(ApplicationReadyEvent())
-        await self._invoke_runners()
+        with self._phase("events"):
+            await self._event_bus.publish(ContextRefreshedEvent())
+            await self._event_bus.publish(ApplicationReadyEvent())
+            await self._invoke_runners()
         self._started = True
 
+        # 8. Freeze the resolution table: lookups become a single dict hit
+        self._container.seal()
+
+        logger.debug(
+            "startup_phase_timings",
+            extra={"parallel": self._parallel_startup, "phases_ms": dict(self._phase_timings)},
+        )
+
+    async def _initialize_bean(self, reg: Registration, post_processors: list[BeanPostProcessor]) -> None:
+        """Run before_init, @post_construct and after_init for one resolved bean."""
+        bean_name = reg.name or reg.impl_type.__name__
+
+        with self._record(bean_name, "lifecycle"):
+            # BeanPostProcessor.before_init
+            for pp in post_processors:
+                reg.instance = pp.before_init(reg.instance, bean_name)
+
+            # @post_construct
+            await self._call_post_construct(reg.instance)
+
+            # BeanPostProcessor.after_init
+            for pp in post_processors:
+                reg.instance = pp.after_init(reg.instance, bean_name)
+
+    def _is_lazy(self, cls: type) -> bool:
+        """Whether a not-yet-created singleton should be deferred until first use.
+
+        An explicit ``@lazy`` / ``lazy=`` stereotype option always wins.  The
+        global ``pyfly.context.lazy-initialization`` switch skips beans that
+        must exist for wiring or weaving to see them.
+        """
+        explicit = getattr(cls, "__pyfly_lazy__", None)
+        if explicit is not None:
+            return bool(explicit)
+        return self._lazy_initialization and not self._requires_eager_init(cls)
+
+    @staticmethod
+    def _requires_eager_init(cls: type) -> bool:
+        """Check for class or method markers that are only discovered on live instances."""
+        if any(getattr(cls, marker, None) for marker in _EAGER_CLASS_MARKERS):
+            return True
+        if getattr(cls, "__pyfly_stereotype__", "") in ("configuration", "shell_component"):
+            return True
+        if isinstance(cls, type) and issubclass(cls, BeanPostProcessor):
+            return True
+        if _could_be_runner(cls) or _has_async_post_construct(cls):
+            return True
+        for klass in getattr(cls, "__mro__", ()):
+            for attr in vars(klass).values():
+                func = getattr(attr, "__func__", attr)
+                if any(getattr(func, marker, False) for marker in _EAGER_METHOD_MARKERS):
+                    return True
+        return False
+
+    def _initialize_lazy_bean(self, reg: Registration) -> Any:
+        """Run post-processors and @post_construct on a lazy bean as it is materialized.
+
+        Lazy beans created before step 5 of ``start()`` are handled there like
+        any other bean.  Materialization is synchronous, so ``@post_construct``
+        must be too: ``start()`` rejects lazy beans with async ones, and an
+        awaitable returned at this point fails the creation.
+        """
+        post_processors = self._lazy_post_processors
+        if post_processors is None:
+            return reg.instance
+        bean_name = reg.name or reg.impl_type.__name__
+
+        for pp in post_processors:
+            reg.instance = pp.before_init(reg.instance, bean_name)
+
+        for attr_name, method in self._post_construct_methods(reg.instance):
+            try:
+                result = method()
+            except Exception as exc:
+                raise BeanCreationException(
+                    subsystem="lifecycle",
+                    provider=type(reg.instance).__qualname__,
+                    reason=f"@post_construct method '{attr_name}' failed: {exc}",
+                ) from exc
+            if inspect.isawaitable(result):
+                if inspect.iscoroutine(result):
+                    result.close()
+                raise BeanCreationException(
+                    subsystem="lifecycle",
+                    provider=type(reg.instance).__qualname__,
+                    reason=f"@post_construct method '{attr_name}' of a lazy bean must not be async",
+                )
+
+        for pp in post_processors:
+            reg.instance = pp.after_init(reg.instance, bean_name)
+
+        if self._parent is not None:
+            # Child contexts never run start(): wire listeners as their beans appear
+            self._subscribe_app_event_listeners(reg.instance)
+        logger.debug("lazy_bean_initialized", extra={"bean": bean_name})
+        return reg.instance
+
+    @contextlib.contextmanager
+    def _phase(self, name: str) -> Iterator[None]:
+        """Record the wall-clock duration of a startup phase in milliseconds."""
+        start = time.perf_counter()
+        try:
+            with self._record(name, "phase"):
+                yield
+        finally:
+            self._phase_timings[name] = (time.perf_counter() - start) * 1000
+
+    def _record(self, name: str, category: str) -> contextlib.AbstractContextManager[Any]:
+        """A startup recorder span, or a no-op when the recorder is disabled."""
+        if self._startup_recorder is None:
+            return contextlib.nullcontext()
+        return self._startup_recorder.span(name, category)
+
     async def stop(self) -> None:
         """Stop the context: call @pre_destroy, publish ContextClosedEvent.
 
@@ -238,6 +521,10 @@ class ApplicationContext:
         """
         shutdown_timeout = float(self._config.get("pyfly.context.shutdown-timeout", 30))
 
+        # A context stopped without ever being started still holds the import hook
+        if self._startup_recorder is not None:
+            self._startup_recorder.stop_import_tracking()
+
         # Cancel tracked background tasks
         for task in self._background_tasks:
             if not task.done():
@@ -269,9 +556,9 @@ class ApplicationContext:
                 except Exception:
                     logger.debug("adapter_stop_failed", extra={"adapter": adapter_name}, exc_info=True)
 
-        # Call @pre_destroy on all resolved beans (reverse order)
-        for reg in reversed(list(self._container._registrations.values())):
-            if reg.instance is not None:
+        # Call @pre_destroy on all resolved beans (reverse order); shared parent beans are left alone
+        for cls, reg in reversed(list(self._container._registrations.items())):
+            if reg.instance is not None and not self._container.is_inherited(cls):
                 try:
                     await asyncio.wait_for(
                         self._call_pre_destroy(reg.instance),
@@ -283,7 +570,8 @@ class ApplicationContext:
                         extra={"bean": type(reg.instance).__qualname__, "timeout_s": shutdown_timeout},
                     )
 
-        await self._event_bus.publish(ContextClosedEvent())
+        # A child's shutdown is not the parent's: keep ContextClosedEvent local
+        await self._event_bus.publish_local(ContextClosedEvent())
         self._started = False
 
     # ------------------------------------------------------------------
@@ -292,29 +580,47 @@ class ApplicationContext:
 
     def _register_auto_configurations(self) -> None:
         """Register built-in @auto_configuration classes for condition evaluation."""
-        from pyfly.config.auto import discover_auto_configurations
+        if self._component_index is not None and self._component_index.auto_configurations:
+            from pyfly.context.component_index import auto_configurations_from_index
+
+            classes = auto_configurations_from_index(self._component_index, self._config, self._environment)
+        else:
+            from pyfly.config.auto import discover_auto_configurations
 
-        for cls in discover_auto_configurations():
+            classes = discover_auto_configurations()
+
+        for cls in classes:
             if cls not in self._container._registrations:
                 self.register_bean(cls)
 
     async def _start_infrastructure(self) -> None:
         """Start adapter beans that implement start()/stop() lifecycle."""
+        adapter_regs: list[Registration] = []
         for reg in self._container._registrations.values():
             if reg.instance is None:
                 continue
             if self._has_lifecycle_methods(reg.instance):
                 self._infrastructure_adapters.append(reg.instance)
+                adapter_regs.append(reg)
 
-        for adapter in self._infrastructure_adapters:
-            try:
+        if self._parallel_startup:
+            for wave in startup_waves(self._container, adapter_regs):
+                await run_wave([self._start_adapter(reg.instance) for reg in wave])
+        else:
+            for adapter in self._infrastructure_adapters:
+                await self._start_adapter(adapter)
+
+    async def _start_adapter(self, adapter: Any) -> None:
+        """Start a single infrastructure adapter, attributing failures to its subsystem."""
+        try:
+            with self._record(type(adapter).__qualname__, "infrastructure"):
                 await adapter.start()
-            except Exception as exc:
-                raise BeanCreationException(
-                    subsystem=self._infer_subsystem(adapter),
-                    provider=type(adapter).__name__,
-                    reason=str(exc),
-                ) from exc
+        except Exception as exc:
+            raise BeanCreationException(
+                subsystem=self._infer_subsystem(adapter),
+                provider=type(adapter).__name__,
+                reason=str(exc),
+            ) from exc
 
     @staticmethod
     def _has_lifecycle_methods(instance: object) -> bool:
@@ -368,9 +674,7 @@ class ApplicationContext:
 
     def _remove_registration(self, cls: type) -> None:
         """Remove a bean registration and its named entry."""
-        reg = self._container._registrations.pop(cls)
-        if reg.name and reg.name in self._container._named:
-            del self._container._named[reg.name]
+        self._container.unregister(cls)
 
     def _process_configurations(self, *, auto: bool = False) -> None:
         """Find @configuration beans, call their @bean methods, register results.
@@ -394,14 +698,11 @@ class ApplicationContext:
             # Collect @bean methods and sort by dependency order so that
             # beans whose parameters depend on other beans from the same
             # configuration class are created after their dependencies.
-            bean_methods: list[tuple[str, Any]] = []
-            for attr_name in dir(config_instance):
-                method = getattr(config_instance, attr_name, None)
-                if method is None or not getattr(method, "__pyfly_bean__", False):
-                    continue
-                if not evaluator.should_include_method(method):
-                    continue
-                bean_methods.append((attr_name, method))
+            bean_methods = [
+                (attr_name, method)
+                for attr_name, method in marked_methods(config_instance, "__pyfly_bean__", include_private=True)
+                if evaluator.should_include_method(method)
+            ]
 
             bean_methods = self._sort_bean_methods(bean_methods)
 
@@ -456,7 +757,8 @@ class ApplicationContext:
                     parameter=f"{param_name}: {getattr(param_type, '__name__', repr(param_type))}",
                 ) from None
 
-        return method(**kwargs)
+        with self._record(f"{type(config_instance).__qualname__}.{method.__name__}", "bean_method"):
+            return method(**kwargs)
 
     @staticmethod
     def _sort_bean_methods(
@@ -549,32 +851,29 @@ class ApplicationContext:
         """Scan singleton beans for @app_event_listener methods and subscribe to event bus."""
         count = 0
         for reg in self._container._registrations.values():
-            if reg.instance is None:
-                continue
-            for attr_name in dir(reg.instance):
-                if attr_name.startswith("_"):
-                    continue
-                try:
-                    method = getattr(reg.instance, attr_name)
-                except Exception:
-                    continue
-                if not getattr(method, "__pyfly_app_event_listener__", False):
-                    continue
-                # Infer event type from the method's type hints
-                hints = typing.get_type_hints(method)
-                event_type: type[ApplicationEvent] | None = None
-                for param_type in hints.values():
-                    if isinstance(param_type, type) and issubclass(param_type, ApplicationEvent):
-                        event_type = param_type
-                        break
-                if event_type is None:
-                    event_type = ApplicationEvent
-                self._event_bus.subscribe(event_type, method, owner_cls=type(reg.instance))
-                count += 1
+            if reg.instance is not None:
+                count += self._subscribe_app_event_listeners(reg.instance)
         self._wiring_counts["event_listeners"] = count
         if count:
             logger.debug("Wired %d @app_event_listener method(s)", count)
 
+    def _subscribe_app_event_listeners(self, instance: Any) -> int:
+        """Subscribe the @app_event_listener methods of *instance*; returns how many."""
+        count = 0
+        for _attr_name, method in marked_methods(instance, "__pyfly_app_event_listener__"):
+            # Infer event type from the method's type hints
+            hints = typing.get_type_hints(method)
+            event_type: type[ApplicationEvent] | None = None
+            for param_type in hints.values():
+                if isinstance(param_type, type) and issubclass(param_type, ApplicationEvent):
+                    event_type = param_type
+                    break
+            if event_type is None:
+                event_type = ApplicationEvent
+            self._event_bus.subscribe(event_type, method, owner_cls=type(instance))
+            count += 1
+        return count
+
     def _wire_message_listeners(self) -> None:
         """Scan beans for @message_listener methods and register with MessageBrokerPort."""
         count = 0
@@ -582,15 +881,7 @@ class ApplicationContext:
         for reg in self._container._registrations.values():
             if reg.instance is None:
                 continue
-            for attr_name in dir(reg.instance):
-                if attr_name.startswith("_"):
-                    continue
-                try:
-                    method = getattr(reg.instance, attr_name)
-                except Exception:
-                    continue
-                if not getattr(method, "__pyfly_message_listener__", False):
-                    continue
+            for _attr_name, method in marked_methods(reg.instance, "__pyfly_message_listener__"):
                 # Lazy-resolve broker on first hit
                 if broker is None:
                     try:
@@ -673,16 +964,7 @@ class ApplicationContext:
         for reg in self._container._registrations.values():
             if reg.instance is None:
                 continue
-            for attr_name in dir(reg.instance):
-                if attr_name.startswith("_"):
-                    continue
-                try:
-                    method = getattr(reg.instance, attr_name)
-                except Exception:
-                    continue
-                if not getattr(method, "__pyfly_async__", False):
-                    continue
-
+            for attr_name, method in marked_methods(reg.instance, "__pyfly_async__"):
                 # Wrap the method to offload execution
                 original = method
 
@@ -718,16 +1000,7 @@ class ApplicationContext:
                     logger.debug("No ShellRunnerPort registered; skipping @shell_method wiring")
                     self._wiring_counts["shell_commands"] = 0
                     return
-            for attr_name in dir(reg.instance):
-                if attr_name.startswith("_"):
-                    continue
-                try:
-                    method = getattr(reg.instance, attr_name)
-                except Exception:
-                    continue
-                if not getattr(method, "__pyfly_shell_method__", False):
-                    continue
-
+            for attr_name, method in marked_methods(reg.instance, "__pyfly_shell_method__"):
                 # Check @shell_method_availability
                 availability_checker_name = getattr(method, "__pyfly_shell_availability__", None)
                 if availability_checker_name:
@@ -806,6 +1079,11 @@ class ApplicationContext:
         """Counts from the decorator wiring phase."""
         return dict(self._wiring_counts)
 
+    @property
+    def startup_phase_timings(self) -> dict[str, float]:
+        """Wall-clock duration (ms) of each phase of the last ``start()``, in execution order."""
+        return dict(self._phase_timings)
+
     def get_bean_counts_by_stereotype(self) -> dict[str, int]:
         """Count beans grouped by stereotype (service, repository, controller, configuration)."""
         counts: dict[str, int] = {}
@@ -814,37 +1092,38 @@ class ApplicationContext:
             counts[stereotype] = counts.get(stereotype, 0) + 1
         return counts
 
+    @staticmethod
+    def _post_construct_methods(instance: Any) -> list[tuple[str, Any]]:
+        """Collect the bound @post_construct methods of an instance."""
+        return marked_methods(instance, "__pyfly_post_construct__", include_private=True)
+
     async def _call_post_construct(self, instance: Any) -> None:
         """Call all @post_construct methods on an instance."""
-        for attr_name in dir(instance):
-            method = getattr(instance, attr_name, None)
-            if method is not None and getattr(method, "__pyfly_post_construct__", False):
-                try:
-                    result = method()
-                    if inspect.isawaitable(result):
-                        await result
-                except Exception as exc:
-                    raise BeanCreationException(
-                        subsystem="lifecycle",
-                        provider=type(instance).__qualname__,
-                        reason=f"@post_construct method '{attr_name}' failed: {exc}",
-                    ) from exc
+        for attr_name, method in self._post_construct_methods(instance):
+            try:
+                result = method()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as exc:
+                raise BeanCreationException(
+                    subsystem="lifecycle",
+                    provider=type(instance).__qualname__,
+                    reason=f"@post_construct method '{attr_name}' failed: {exc}",
+                ) from exc
 
     async def _call_pre_destroy(self, instance: Any) -> None:
         """Call all @pre_destroy methods on an instance."""
-        for attr_name in dir(instance):
-            method = getattr(instance, attr_name, None)
-            if method is not None and getattr(method, "__pyfly_pre_destroy__", False):
-                try:
-                    result = method()
-                    if inspect.isawaitable(result):
-                        await result
-                except Exception as exc:
-                    logger.warning(
-                        "pre_destroy_failed",
-                        extra={
-                            "bean": type(instance).__qualname__,
-                            "method": attr_name,
-                            "error": str(exc),
-                        },
-                    )
+        for attr_name, method in marked_methods(instance, "__pyfly_pre_destroy__", include_private=True):
+            try:
+                result = method()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as exc:
+                logger.warning(
+                    "pre_destroy_failed",
+                    extra={
+                        "bean": type(instance).__qualname__,
+                        "method": attr_name,
+                        "error": str(exc),
+                    },
+                )
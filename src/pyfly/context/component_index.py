@@ -0,0 +1,342 @@
+# Copyright 2026 Firefly Software Solutions Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Build-time component index — replaces runtime package scanning.
+
+``pyfly index`` scans the application packages and the
+``pyfly.auto_configuration`` entry points once and writes their metadata
+(module, class, stereotype, scope, bindings, conditions) to a JSON file,
+the PyFly equivalent of Spring's ``META-INF/spring.components``.
+
+At startup the index is filtered by active profiles and by the conditions
+that can be decided without importing the bean (``@conditional_on_property``
+and ``@conditional_on_class``); only modules of surviving beans are imported.
+Bean-dependent conditions and stereotype ``condition`` callables are still
+evaluated by :class:`~pyfly.context.condition_evaluator.ConditionEvaluator`.
+
+Each indexed package carries a fingerprint of its source files; a package whose
+sources changed since the index was built is scanned instead.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import importlib.util
+import json
+import logging
+import time
+from dataclasses import MISSING, asdict, dataclass, field, fields
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pyfly.container.scanner import interfaces_of, iter_package_modules, scan_module_classes
+from pyfly.container.types import Scope
+
+if TYPE_CHECKING:
+    from pyfly.container.container import Container
+    from pyfly.context.environment import Environment
+    from pyfly.core.config import Config
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = "pyfly-index.json"
+INDEX_VERSION = 2
+
+
+@dataclass
+class IndexedComponent:
+    """Metadata for one stereotype-decorated class (or auto-configuration)."""
+
+    module: str
+    qualname: str
+    stereotype: str = ""
+    scope: str = Scope.SINGLETON.name
+    name: str = ""
+    profile: str = ""
+    bindings: list[str] = field(default_factory=list)
+    conditions: list[dict[str, Any]] = field(default_factory=list)
+    dynamic_condition: bool = False
+    entry_point: str = ""
+
+    @classmethod
+    def from_class(cls, bean_cls: type, *, entry_point: str = "") -> IndexedComponent:
+        """Capture the metadata of an imported class."""
+        scope = getattr(bean_cls, "__pyfly_scope__", None) or Scope.SINGLETON
+        return cls(
+            module=bean_cls.__module__,
+            qualname=bean_cls.__qualname__,
+            stereotype=getattr(bean_cls, "__pyfly_stereotype__", ""),
+            scope=scope.name,
+            name=getattr(bean_cls, "__pyfly_bean_name__", ""),
+            profile=getattr(bean_cls, "__pyfly_profile__", ""),
+            bindings=[_qualified_name(base) for base in interfaces_of(bean_cls)],
+            conditions=[_serialize_condition(cond) for cond in getattr(bean_cls, "__pyfly_conditions__", [])],
+            dynamic_condition=getattr(bean_cls, "__pyfly_condition__", None) is not None,
+            entry_point=entry_point,
+        )
+
+    def load(self) -> type:
+        """Import the declaring module and return the class."""
+        return _import_qualified(f"{self.module}:{self.qualname}")
+
+
+@dataclass
+class ComponentIndex:
+    """The serialized result of scanning packages and auto-configurations."""
+
+    packages: list[str] = field(default_factory=list)
+    components: list[IndexedComponent] = field(default_factory=list)
+    auto_configurations: list[IndexedComponent] = field(default_factory=list)
+    fingerprints: dict[str, str] = field(default_factory=dict)
+    version: int = INDEX_VERSION
+    generated_at: float = 0.0
+
+    def covers(self, package: str) -> bool:
+        """Whether *package* was scanned when the index was built."""
+        return package in self.packages
+
+    def is_current(self, package: str) -> bool:
+        """Whether the sources of *package* are unchanged since the index was built."""
+        recorded = self.fingerprints.get(package)
+        return recorded is not None and recorded == package_fingerprint(package)
+
+    def save(self, path: str | Path) -> None:
+        """Write the index as JSON."""
+        Path(path).write_text(json.dumps(asdict(self), indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: str | Path) -> ComponentIndex:
+        """Read an index written by :meth:`save`.
+
+        Raises:
+            ValueError: If the file was written by an incompatible index version
+                or contains malformed component entries.
+        """
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        if data.get("version") != INDEX_VERSION:
+            raise ValueError(
+                f"Unsupported component index version {data.get('version')!r} in {path} "
+                f"(expected {INDEX_VERSION}); regenerate it with 'pyfly index'"
+            )
+        return cls(
+            packages=list(data.get("packages", [])),
+            components=_indexed_components(data.get("components", []), path),
+            auto_configurations=_indexed_components(data.get("auto_configurations", []), path),
+            fingerprints=dict(data.get("fingerprints", {})),
+            version=data["version"],
+            generated_at=float(data.get("generated_at", 0.0)),
+        )
+
+
+def _indexed_components(entries: list[Any], path: str | Path) -> list[IndexedComponent]:
+    """Build the entries of an index file, rejecting unknown or missing fields."""
+    known = {f.name for f in fields(IndexedComponent)}
+    required = {f.name for f in fields(IndexedComponent) if f.default is MISSING and f.default_factory is MISSING}
+    components: list[IndexedComponent] = []
+    for entry in entries:
+        if not isinstance(entry, dict):
+            raise ValueError(f"Malformed component entry {entry!r} in {path}; regenerate it with 'pyfly index'")
+        unknown, missing = set(entry) - known, required - set(entry)
+        if unknown or missing:
+            problems = [f"unknown fields {sorted(unknown)}"] if unknown else []
+            problems += [f"missing fields {sorted(missing)}"] if missing else []
+            raise ValueError(
+                f"Malformed component entry {entry.get('qualname', '?')!r} in {path} ({', '.join(problems)}); "
+                "regenerate it with 'pyfly index'"
+            )
+        components.append(IndexedComponent(**entry))
+    return components
+
+
+def build_component_index(packages: list[str]) -> ComponentIndex:
+    """Scan *packages* and the auto-configuration entry points into an index."""
+    from importlib.metadata import entry_points
+
+    components: list[IndexedComponent] = []
+    for package in packages:
+        for module in iter_package_modules(package):
+            components.extend(IndexedComponent.from_class(cls) for cls in scan_module_classes(module))
+
+    auto_configurations: list[IndexedComponent] = []
+    for ep in entry_points(group="pyfly.auto_configuration"):
+        try:
+            cls = ep.load()
+        except ImportError:
+            logger.debug("Skipped auto-configuration entry point '%s': %s", ep.name, ep.value)
+            continue
+        if getattr(cls, "__pyfly_auto_configuration__", False):
+            auto_configurations.append(IndexedComponent.from_class(cls, entry_point=ep.name))
+
+    return ComponentIndex(
+        packages=list(packages),
+        components=components,
+        auto_configurations=auto_configurations,
+        fingerprints={package: package_fingerprint(package) for package in packages},
+        generated_at=time.time(),
+    )
+
+
+def package_fingerprint(package: str) -> str:
+    """Hash the source files of *package* (or of a single module) without importing it.
+
+    Returns an empty string when the package cannot be located.
+    """
+    try:
+        spec = importlib.util.find_spec(package)
+    except (ImportError, ValueError):
+        return ""
+    if spec is None:
+        return ""
+    files: list[tuple[str, Path]] = []
+    if spec.submodule_search_locations:
+        for location in spec.submodule_search_locations:
+            root = Path(location)
+            files.extend((p.relative_to(root).as_posix(), p) for p in root.rglob("*.py"))
+    elif spec.origin and spec.has_location:
+        files.append((Path(spec.origin).name, Path(spec.origin)))
+    digest = hashlib.sha256()
+    for relative, path in sorted(files):
+        digest.update(relative.encode())
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def load_component_index(config: Config, base_dir: str | Path | None = None) -> ComponentIndex | None:
+    """Load the index configured by ``pyfly.context.component-index``, if present.
+
+    The index is opt-in: an empty value (the default) disables it, and a missing
+    file falls back to scanning. A relative location is resolved against
+    *base_dir* (the project directory), or the working directory when unset.
+    """
+    location = str(config.get("pyfly.context.component-index", "") or "")
+    if not location:
+        return None
+    path = Path(location)
+    if not path.is_absolute() and base_dir is not None:
+        path = Path(base_dir) / path
+    if not path.is_file():
+        return None
+    index = ComponentIndex.load(path)
+    logger.debug(
+        "component_index_loaded",
+        extra={"path": str(path), "components": len(index.components), "packages": index.packages},
+    )
+    return index
+
+
+def register_from_index(
+    index: ComponentIndex,
+    package: str,
+    container: Container,
+    config: Config,
+    environment: Environment,
+) -> int:
+    """Register the indexed beans of *package* that can survive startup filtering.
+
+    All classes are resolved before anything is registered, so an index that no
+    longer matches the code leaves *container* untouched.
+
+    Returns:
+        Number of classes registered.
+
+    Raises:
+        ImportError: If an indexed module no longer exists.
+        AttributeError: If an indexed class or interface no longer exists.
+    """
+    resolved: list[tuple[IndexedComponent, type, list[type]]] = []
+    for component in index.components:
+        if component.module != package and not component.module.startswith(package + "."):
+            continue
+        if not passes_static_filters(component, config, environment):
+            continue
+        cls = component.load()
+        resolved.append((component, cls, [_import_qualified(binding) for binding in component.bindings]))
+
+    for component, cls, bindings in resolved:
+        container.register(
+            cls,
+            scope=getattr(cls, "__pyfly_scope__", None) or Scope[component.scope],
+            condition=getattr(cls, "__pyfly_condition__", None),
+            name=getattr(cls, "__pyfly_bean_name__", ""),
+        )
+        for interface in bindings:
+            container.bind(interface, cls)
+    return len(resolved)
+
+
+def auto_configurations_from_index(
+    index: ComponentIndex,
+    config: Config,
+    environment: Environment,
+) -> list[type]:
+    """Import only the indexed auto-configurations whose static conditions pass."""
+    classes: list[type] = []
+    for component in index.auto_configurations:
+        if not passes_static_filters(component, config, environment):
+            continue
+        try:
+            classes.append(component.load())
+        except (ImportError, AttributeError):
+            logger.debug("Skipped indexed auto-configuration '%s'", component.entry_point)
+    return classes
+
+
+def passes_static_filters(component: IndexedComponent, config: Config, environment: Environment) -> bool:
+    """Evaluate the profile and import-free conditions recorded for *component*."""
+    if component.profile and not environment.accepts_profiles(component.profile):
+        return False
+    for cond in component.conditions:
+        if cond["type"] == "on_property":
+            value = config.get(cond["key"])
+            if value is None:
+                return False
+            if cond["having_value"] and str(value).lower() != cond["having_value"].lower():
+                return False
+        elif cond["type"] == "on_class" and not _module_available(cond["module_name"]):
+            return False
+    return True
+
+
+def _serialize_condition(cond: dict[str, Any]) -> dict[str, Any]:
+    """Keep the JSON-safe part of a ``@conditional_on_*`` record."""
+    if cond["type"] == "on_property":
+        return {"type": "on_property", "key": cond["key"], "having_value": cond["having_value"]}
+    if cond["type"] == "on_class":
+        return {"type": "on_class", "module_name": cond["module_name"]}
+    if "bean_type" in cond:
+        return {"type": cond["type"], "bean_type": _qualified_name(cond["bean_type"])}
+    return {"type": cond["type"]}
+
+
+def _module_available(module_name: str) -> bool:
+    """Check whether a module can be imported without importing it."""
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def _qualified_name(cls: type) -> str:
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def _import_qualified(ref: str) -> type:
+    """Resolve a ``module:Qualified.Name`` reference."""
+    module_name, _, qualname = ref.partition(":")
+    obj: Any = importlib.import_module(module_name)
+    for part in qualname.split("."):
+        obj = getattr(obj, part)
+    return obj  # type: ignore[no-any-return]
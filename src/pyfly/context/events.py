@@ -49,13 +49,18 @@ def app_event_listener(func: F) -> F:
 
 
 class ApplicationEventBus:
-    """Simple in-process event bus for application lifecycle events."""
+    """Simple in-process event bus for application lifecycle events.
 
-    def __init__(self) -> None:
+    A bus created with a *parent* (the bus of a parent context) also hands
+    every event published on it to the parent's listeners.
+    """
+
+    def __init__(self, parent: ApplicationEventBus | None = None) -> None:
         self._listeners: dict[
             type[ApplicationEvent],
             list[tuple[Callable[..., Awaitable[None]], type | None]],
         ] = {}
+        self._parent = parent
 
     def subscribe(
         self,
@@ -72,7 +77,13 @@ class ApplicationEventBus:
         self._listeners[event_type].sort(key=lambda e: get_order(e[1]) if e[1] else 0)
 
     async def publish(self, event: ApplicationEvent) -> None:
-        """Publish an event to all matching listeners (pre-sorted by @order)."""
+        """Publish an event to all matching listeners (pre-sorted by @order), then to the parent bus."""
+        await self.publish_local(event)
+        if self._parent is not None:
+            await self._parent.publish(event)
+
+    async def publish_local(self, event: ApplicationEvent) -> None:
+        """Publish an event to this bus's listeners only."""
         for event_type, entries in self._listeners.items():
             if isinstance(event, event_type):
                 for listener, _owner in entries:
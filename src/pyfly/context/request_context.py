@@ -14,17 +14,23 @@
 """Request-scoped context backed by contextvars.
 
 Each HTTP request gets a fresh RequestContext via RequestContextFilter.
-The context stores request_id, security_context, and arbitrary attributes.
+The context stores request_id, security_context, arbitrary attributes, and
+the instances of REQUEST-scoped beans (in a separate type-keyed map).
 """
 
 from __future__ import annotations
 
+import inspect
+import logging
 import uuid
 from contextvars import ContextVar
 from typing import Any
 
+from pyfly.container.method_index import marked_methods
 from pyfly.security.context import SecurityContext
 
+logger = logging.getLogger(__name__)
+
 _request_context_var: ContextVar[RequestContext | None] = ContextVar("pyfly_request_context", default=None)
 
 
@@ -39,6 +45,8 @@ class RequestContext:
         self._request_id = request_id or uuid.uuid4().hex
         self._security_context: SecurityContext | None = None
         self._attributes: dict[str, Any] = {}
+        self._beans: dict[type, Any] = {}
+        self._bean_creation_order: list[Any] = []
 
     @property
     def request_id(self) -> str:
@@ -58,6 +66,43 @@ class RequestContext:
     def set(self, key: str, value: Any) -> None:
         self._attributes[key] = value
 
+    # ------------------------------------------------------------------
+    # REQUEST-scoped beans
+    # ------------------------------------------------------------------
+
+    def get_bean(self, bean_type: type) -> Any:
+        """Return this request's instance of *bean_type*, or ``None`` if not created yet."""
+        return self._beans.get(bean_type)
+
+    def set_bean(self, bean_type: type, instance: Any) -> None:
+        """Store this request's instance of *bean_type*."""
+        self._beans[bean_type] = instance
+        self._bean_creation_order.append(instance)
+
+    async def destroy_beans(self) -> None:
+        """Call ``@pre_destroy`` on this request's beans in reverse creation order.
+
+        Failures are logged and do not stop the remaining beans from being destroyed.
+        """
+        instances, self._bean_creation_order = self._bean_creation_order, []
+        self._beans = {}
+        for instance in reversed(instances):
+            for attr_name, method in marked_methods(instance, "__pyfly_pre_destroy__", include_private=True):
+                try:
+                    result = method()
+                    if inspect.isawaitable(result):
+                        await result
+                except Exception as exc:
+                    logger.warning(
+                        "pre_destroy_failed",
+                        extra={
+                            "bean": type(instance).__qualname__,
+                            "method": attr_name,
+                            "request_id": self._request_id,
+                            "error": str(exc),
+                        },
+                    )
+
     @classmethod
     def init(cls, request_id: str | None = None) -> RequestContext:
         """Create and set a new RequestContext for the current async task."""
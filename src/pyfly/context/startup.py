@@ -0,0 +1,149 @@
+# Copyright 2026 Firefly Software Solutions Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Bean dependency graph used by parallel startup.
+
+Edges come from constructor and ``Autowired()`` type hints (via the
+registration's injection plan) plus explicit ``@depends_on`` entries.  The
+graph is layered with Kahn's algorithm; each layer is then split by
+``@order`` value so that lower orders still run before higher ones.  Beans
+inside one resulting *wave* have no dependency on each other and can have
+their ``start()`` / ``@post_construct`` hooks awaited concurrently with
+:func:`run_wave`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import types
+from collections.abc import Coroutine, Sequence
+from itertools import groupby
+from typing import TYPE_CHECKING, Annotated, Any, Union, get_args, get_origin
+
+from pyfly.container.bean import Qualifier
+from pyfly.container.exceptions import NoSuchBeanError, NoUniqueBeanError
+from pyfly.container.injection_plan import compile_injection_plan
+from pyfly.container.ordering import get_depends_on, get_order
+
+if TYPE_CHECKING:
+    from pyfly.container.container import Container
+    from pyfly.container.registry import Registration
+
+
+def startup_waves(container: Container, registrations: Sequence[Registration]) -> list[list[Registration]]:
+    """Group *registrations* into waves that can be initialized concurrently.
+
+    Waves must be processed one after another.  Registrations caught in a
+    dependency cycle are appended at the end, one per wave, in their original
+    order.
+    """
+    index = {id(reg): i for i, reg in enumerate(registrations)}
+    remaining: list[set[int]] = []
+    dependents: list[list[int]] = [[] for _ in registrations]
+    for i, reg in enumerate(registrations):
+        deps = {index[id(target)] for target in _direct_dependencies(container, reg) if id(target) in index}
+        deps.discard(i)
+        remaining.append(deps)
+        for j in deps:
+            dependents[j].append(i)
+
+    waves: list[list[Registration]] = []
+    placed: set[int] = set()
+    ready = [i for i, deps in enumerate(remaining) if not deps]
+    while ready:
+        placed.update(ready)
+        layer = sorted(ready, key=lambda i: get_order(registrations[i].impl_type))
+        for _order, group in groupby(layer, key=lambda i: get_order(registrations[i].impl_type)):
+            waves.append([registrations[i] for i in group])
+        next_ready: list[int] = []
+        for j in ready:
+            for i in dependents[j]:
+                remaining[i].discard(j)
+                if not remaining[i] and i not in placed:
+                    next_ready.append(i)
+        ready = next_ready
+
+    waves.extend([reg] for i, reg in enumerate(registrations) if i not in placed)
+    return waves
+
+
+async def run_wave(coros: Sequence[Coroutine[Any, Any, None]]) -> None:
+    """Await *coros* concurrently; on the first failure cancel the rest and re-raise it.
+
+    Like the sequential startup, nothing keeps running after a failure: the
+    remaining tasks are cancelled and awaited before the exception propagates.
+    """
+    tasks = [asyncio.ensure_future(coro) for coro in coros]
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    finally:
+        pending = [task for task in tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+    errors = [exc for task in tasks if not task.cancelled() and (exc := task.exception()) is not None]
+    if errors:
+        raise errors[0]
+
+
+def _direct_dependencies(container: Container, reg: Registration) -> list[Registration]:
+    """Registrations that *reg* needs initialized before itself."""
+    plan = reg.plan
+    if plan is None:
+        try:
+            plan = compile_injection_plan(reg.impl_type)
+        except Exception:
+            plan = None
+
+    targets: list[Registration] = []
+    if plan is not None:
+        for dep_type in plan.dependency_types():
+            targets.extend(_registrations_for(container, dep_type))
+    for dep in get_depends_on(reg.impl_type):
+        targets.extend(_registrations_for(container, dep))
+    return targets
+
+
+def _registrations_for(container: Container, dep: Any) -> list[Registration]:
+    """Map a dependency declaration (type hint or bean name) to registrations."""
+    if isinstance(dep, str):
+        named = container._named.get(dep)
+        return [named] if named is not None else []
+
+    origin = get_origin(dep)
+    if origin is Annotated:
+        args = get_args(dep)
+        for metadata in args[1:]:
+            if isinstance(metadata, Qualifier):
+                return _registrations_for(container, metadata.name)
+        return _registrations_for(container, args[0])
+
+    if origin is Union or isinstance(dep, types.UnionType):
+        return [reg for arg in get_args(dep) if arg is not type(None) for reg in _registrations_for(container, arg)]
+
+    if origin is list:
+        args = get_args(dep)
+        if not args:
+            return []
+        try:
+            return list(container._lookup_all_registrations(args[0]))
+        except KeyError:
+            return []
+
+    if not isinstance(dep, type):
+        return []
+    try:
+        return [container._lookup_registration(dep)]
+    except (NoSuchBeanError, NoUniqueBeanError, KeyError):
+        return []
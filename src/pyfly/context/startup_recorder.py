@@ -0,0 +1,304 @@
+# Copyright 2026 Firefly Software Solutions Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Startup timeline recorder — nested spans for phases, beans and imports.
+
+Enabled with ``pyfly.context.startup-recorder.enabled``.  The recorder keeps
+every span in memory (the PyFly equivalent of Spring Boot's
+``BufferingApplicationStartup``) and can render them as:
+
+- a JSON-friendly report (served by the ``/actuator/startup`` endpoint), and
+- a Chrome trace-event file that opens in ``chrome://tracing`` or Perfetto.
+
+Span categories:
+
+``phase``
+    A step of ``ApplicationContext.start()``.
+``bean``
+    Creation of one bean; ``constructor_ms`` is the bean's own ``__init__``
+    and ``dependencies_ms`` everything else — resolving constructor and
+    ``Autowired()`` dependencies (which appear as child spans) and compiling
+    the injection plan.
+``bean_method``, ``lifecycle``, ``infrastructure``
+    ``@bean`` factory calls, post-processors + ``@post_construct``, and
+    adapter ``start()`` calls.
+``import``
+    Execution of one module; nested imports are child spans.  Each bean
+    report carries the import time of its declaring module.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import importlib.abc
+import json
+import os
+import sys
+import threading
+import time
+import weakref
+from collections.abc import Iterator, Sequence
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+_current_span: ContextVar[int | None] = ContextVar("pyfly_startup_span", default=None)
+
+
+@dataclass(slots=True)
+class StartupSpan:
+    """One recorded step; times are ``perf_counter_ns`` values."""
+
+    id: int
+    name: str
+    category: str
+    start_ns: int
+    parent: int | None = None
+    lane: int = 0
+    end_ns: int = 0
+    args: dict[str, Any] = field(default_factory=dict)
+    _token: Token[int | None] | None = field(default=None, repr=False)
+
+    @property
+    def duration_ns(self) -> int:
+        return self.end_ns - self.start_ns
+
+
+class StartupRecorder:
+    """Collects nested :class:`StartupSpan` records during application startup."""
+
+    def __init__(self) -> None:
+        self._origin_ns = time.perf_counter_ns()
+        self._spans: list[StartupSpan] = []
+        self._lanes: dict[int, int] = {}
+        self._lock = threading.Lock()
+        self._import_finder: weakref.finalize[Any, Any] | None = None
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def begin(self, name: str, category: str, **args: Any) -> StartupSpan:
+        """Open a span nested under the current one; close it with :meth:`end`."""
+        with self._lock:
+            span = StartupSpan(
+                id=len(self._spans),
+                name=name,
+                category=category,
+                start_ns=time.perf_counter_ns(),
+                parent=_current_span.get(),
+                lane=self._lane(),
+                args=args,
+            )
+            self._spans.append(span)
+        span._token = _current_span.set(span.id)
+        return span
+
+    def end(self, span: StartupSpan, **args: Any) -> None:
+        """Close *span*, merging *args* into its arguments."""
+        span.end_ns = time.perf_counter_ns()
+        if args:
+            span.args.update(args)
+        if span._token is not None:
+            # ValueError: closed from a different context (e.g. another task)
+            with contextlib.suppress(ValueError):
+                _current_span.reset(span._token)
+            span._token = None
+
+    @contextlib.contextmanager
+    def span(self, name: str, category: str, **args: Any) -> Iterator[StartupSpan]:
+        """Record the enclosed block as a span."""
+        span = self.begin(name, category, **args)
+        try:
+            yield span
+        finally:
+            self.end(span)
+
+    def _lane(self) -> int:
+        """Trace lane: one per asyncio task (or thread), so concurrent spans do not overlap."""
+        try:
+            task: object | None = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        key = id(task) if task is not None else threading.get_ident()
+        return self._lanes.setdefault(key, len(self._lanes) + 1)
+
+    # ------------------------------------------------------------------
+    # Import timing
+    # ------------------------------------------------------------------
+
+    def start_import_tracking(self) -> None:
+        """Record an ``import`` span for every module executed from now on.
+
+        The import hook is removed by :meth:`stop_import_tracking`, or when
+        the recorder is garbage-collected, whichever comes first.
+        """
+        if self._import_finder is None:
+            finder = _ImportTimingFinder(self)
+            sys.meta_path.insert(0, finder)
+            self._import_finder = weakref.finalize(self, _remove_finder, finder)
+
+    def stop_import_tracking(self) -> None:
+        """Stop recording module imports."""
+        if self._import_finder is not None:
+            self._import_finder()
+            self._import_finder = None
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+
+    @property
+    def spans(self) -> Sequence[StartupSpan]:
+        """All recorded spans in the order they were opened."""
+        return tuple(self._spans)
+
+    def import_times_ms(self) -> dict[str, float]:
+        """Inclusive import time of each recorded module, in milliseconds."""
+        return {s.name: _ms(s.duration_ns) for s in self._spans if s.category == "import" and s.end_ns}
+
+    def to_dict(self) -> dict[str, Any]:
+        """Report with every span plus a per-bean summary."""
+        spans = [s for s in self._spans if s.end_ns]
+        child_ns: dict[int, int] = {}
+        for s in spans:
+            if s.parent is not None:
+                child_ns[s.parent] = child_ns.get(s.parent, 0) + s.duration_ns
+
+        imports = self.import_times_ms()
+        beans: dict[str, dict[str, Any]] = {}
+        for s in spans:
+            if s.category != "bean":
+                continue
+            beans[s.name] = {
+                "duration_ms": _ms(s.duration_ns),
+                "dependencies_ms": s.args.get("dependencies_ms", 0.0),
+                "constructor_ms": s.args.get("constructor_ms", 0.0),
+                "import_ms": imports.get(s.args.get("module", ""), 0.0),
+            }
+
+        roots = [s for s in spans if s.parent is None and s.category == "phase"]
+        return {
+            "total_ms": _ms(sum(s.duration_ns for s in roots)),
+            "spans": [
+                {
+                    "id": s.id,
+                    "parent": s.parent,
+                    "name": s.name,
+                    "category": s.category,
+                    "start_ms": _ms(s.start_ns - self._origin_ns),
+                    "duration_ms": _ms(s.duration_ns),
+                    "self_ms": _ms(max(0, s.duration_ns - child_ns.get(s.id, 0))),
+                    "args": s.args,
+                }
+                for s in spans
+            ],
+            "beans": beans,
+        }
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Render the spans in the Chrome trace-event format (complete ``X`` events)."""
+        pid = os.getpid()
+        events: list[dict[str, Any]] = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": lane,
+                "args": {"name": "startup" if lane == 1 else f"startup-{lane}"},
+            }
+            for lane in sorted(set(self._lanes.values()))
+        ]
+        for s in self._spans:
+            if not s.end_ns:
+                continue
+            events.append(
+                {
+                    "name": s.name,
+                    "cat": s.category,
+                    "ph": "X",
+                    "ts": (s.start_ns - self._origin_ns) / 1000,
+                    "dur": s.duration_ns / 1000,
+                    "pid": pid,
+                    "tid": s.lane,
+                    "args": s.args,
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def dump_chrome_trace(self, path: str | Path) -> None:
+        """Write :meth:`to_chrome_trace` as JSON to *path*."""
+        Path(path).write_text(json.dumps(self.to_chrome_trace(), default=str), encoding="utf-8")
+
+
+def _ms(ns: int) -> float:
+    return round(ns / 1_000_000, 3)
+
+
+class _ImportTimingFinder(importlib.abc.MetaPathFinder):
+    """Meta-path finder that wraps loaders so module execution is recorded."""
+
+    def __init__(self, recorder: StartupRecorder) -> None:
+        # Weak, so an abandoned recorder can be collected and take the hook with it
+        self._recorder = weakref.ref(recorder)
+        self._local = threading.local()
+
+    def find_spec(self, fullname: str, path: Any, target: ModuleType | None = None) -> Any:
+        recorder = self._recorder()
+        if recorder is None or getattr(self._local, "busy", False):
+            return None
+        self._local.busy = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._local.busy = False
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, recorder)
+        return spec
+
+
+def _remove_finder(finder: _ImportTimingFinder) -> None:
+    with contextlib.suppress(ValueError):
+        sys.meta_path.remove(finder)
+
+
+class _TimedLoader(importlib.abc.Loader):
+    """Delegating loader that records ``exec_module`` as an ``import`` span."""
+
+    def __init__(self, loader: Any, recorder: StartupRecorder) -> None:
+        self._loader = loader
+        self._recorder = recorder
+
+    def create_module(self, spec: Any) -> ModuleType | None:
+        return self._loader.create_module(spec)  # type: ignore[no-any-return]
+
+    def exec_module(self, module: ModuleType) -> None:
+        # Put the real loader back so the module never sees the wrapper.
+        module.__loader__ = self._loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = self._loader
+        with self._recorder.span(module.__name__, "import"):
+            self._loader.exec_module(module)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._loader, name)
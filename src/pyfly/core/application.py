@@ -32,6 +32,7 @@ except ImportError:
 
 if TYPE_CHECKING:
     from pyfly.context.application_context import ApplicationContext
+    from pyfly.context.component_index import ComponentIndex
 
 T = TypeVar("T")
 
@@ -97,11 +98,18 @@ class PyFlyApplication:
         # Create ApplicationContext
         self._context = ApplicationContext(self.config)
 
+        # Use the build-time component index when present (see `pyfly index`)
+        index = self._load_component_index(config_dir)
+        if index is not None:
+            self._context.use_component_index(index)
+
         # Auto-discover beans from scanned packages (logging deferred to startup)
         self._scan_results: list[tuple[str, int]] = []
         for package in self._scan_packages:
             try:
-                count = scan_package(package, self._context.container)
+                count = self._register_from_index(index, package) if index is not None else None
+                if count is None:
+                    count = scan_package(package, self._context.container)
                 self._scan_results.append((package, count))
             except ImportError as e:
                 self._logger.warning("scan_failed", package=package, error=str(e))
@@ -320,6 +328,37 @@ class PyFlyApplication:
         self._logger.info("shutting_down", app=self._name)
         await self._context.stop()
 
+    def _load_component_index(self, config_dir: Path | None) -> ComponentIndex | None:
+        """Load the component index, falling back to package scanning if it is unusable."""
+        from pyfly.context.component_index import load_component_index
+
+        try:
+            return load_component_index(self.config, base_dir=config_dir)
+        except (OSError, ValueError) as e:
+            self._logger.warning("component_index_ignored", error=str(e))
+            return None
+
+    def _register_from_index(self, index: ComponentIndex, package: str) -> int | None:
+        """Register *package* from the index, or return ``None`` if it must be scanned."""
+        from pyfly.context.component_index import register_from_index
+
+        if not index.covers(package):
+            return None
+        if not index.is_current(package):
+            self._logger.warning("component_index_stale", package=package)
+            return None
+        try:
+            return register_from_index(
+                index,
+                package,
+                self._context.container,
+                self.config,
+                self._context.environment,
+            )
+        except (ImportError, AttributeError) as e:
+            self._logger.warning("component_index_stale", package=package, error=str(e))
+            return None
+
     def _find_config_dir(self, config_path: str | Path | None) -> Path | None:
         """Find the project directory containing config files."""
         if config_path:
@@ -14,9 +14,10 @@
 """PyFly Logging — hexagonal logging port and adapters."""
 
 from pyfly.logging.port import LoggingPort
+from pyfly.logging.queue_handler import BatchingQueueHandler
 from pyfly.logging.stdlib_adapter import StdlibLoggingAdapter
 
-__all__ = ["LoggingPort", "StdlibLoggingAdapter"]
+__all__ = ["BatchingQueueHandler", "LoggingPort", "StdlibLoggingAdapter"]
 
 try:
     from pyfly.logging.structlog_adapter import StructlogAdapter
@@ -0,0 +1,247 @@
+# Copyright 2026 Firefly Software Solutions Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""BatchingQueueHandler — formats and writes log records on a background thread.
+
+Logging calls merge the message arguments into the message (so the record
+captures argument values as they were at the call and holds no references
+to them), then append the record to a bounded in-memory queue (a ``deque``,
+whose ``append`` is atomic and takes no lock).  A daemon thread
+drains the queue in batches, formats the records and writes each batch to
+the target stream with a single ``write()`` and ``flush()``, so rendering
+and stdout I/O no longer run on the event loop thread.
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any
+
+from pyfly.core.config import Config
+
+DEFAULT_CAPACITY = 10_000
+DEFAULT_BATCH_SIZE = 256
+DEFAULT_FLUSH_INTERVAL = 0.05  # seconds
+
+OVERFLOW_POLICIES = ("drop", "block")
+
+
+class BatchingQueueHandler(logging.Handler):
+    """Queues records for a background thread that hands them to *target* in batches.
+
+    When the queue holds *capacity* records, the ``"drop"`` policy discards
+    new records (counted in :attr:`dropped`) and ``"block"`` makes the
+    logging call wait until the writer thread has made room.
+
+    If *target* is a plain :class:`logging.StreamHandler`, each batch is
+    written with one ``write()``; any other handler receives the records one
+    by one on the writer thread.
+
+    Args:
+        target: Handler that formats and outputs the records.
+        capacity: Maximum number of queued records.
+        overflow: ``"drop"`` or ``"block"``.
+        batch_size: Records per batch; a full batch wakes the writer early.
+        flush_interval: Seconds between writes while fewer records are queued.
+    """
+
+    def __init__(
+        self,
+        target: logging.Handler,
+        capacity: int = DEFAULT_CAPACITY,
+        overflow: str = "drop",
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ) -> None:
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {OVERFLOW_POLICIES}, got {overflow!r}")
+        super().__init__()
+        self._target = target
+        self._capacity = capacity
+        self._block = overflow == "block"
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._batch_stream = isinstance(target, logging.StreamHandler) and (
+            type(target).emit is logging.StreamHandler.emit
+        )
+        self._queue: deque[logging.LogRecord] = deque()
+        self._wakeup = threading.Event()
+        self._room = threading.Event()
+        self._writing = False
+        self._stopping = False
+        self._dropped = 0
+        self._dropped_lock = threading.Lock()
+        self._written = 0
+        self._thread = threading.Thread(target=self._run, name="pyfly-log-writer", daemon=True)
+        self._thread.start()
+
+    # ------------------------------------------------------------------
+    # Producer side (any thread)
+    # ------------------------------------------------------------------
+
+    def handle(self, record: logging.LogRecord) -> Any:
+        # Unlike Handler.handle(), no handler lock: the queue append is atomic
+        rv = self.filter(record)
+        if isinstance(rv, logging.LogRecord):
+            record = rv
+        if rv:
+            self.emit(record)
+        return rv
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if len(self._queue) >= self._capacity and not (self._block and self._wait_for_room()):
+            with self._dropped_lock:
+                self._dropped += 1
+            return
+        try:
+            prepared = self._prepare(record)
+        except Exception:
+            self.handleError(record)
+            return
+        self._queue.append(prepared)
+        if len(self._queue) >= self._batch_size:
+            self._wakeup.set()
+
+    def _prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Copy *record* with its arguments merged and its traceback rendered.
+
+        Like :meth:`logging.handlers.QueueHandler.prepare`, but the record is
+        not formatted: formatting stays on the writer thread.  A message
+        without arguments (such as structlog's event dict) is kept as it is.
+        """
+        prepared = copy.copy(record)
+        if record.args:
+            prepared.msg = record.getMessage()
+            prepared.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                formatter = self._target.formatter or logging.Formatter()
+                prepared.exc_text = formatter.formatException(record.exc_info)
+            prepared.exc_info = None
+        return prepared
+
+    def _wait_for_room(self) -> bool:
+        while len(self._queue) >= self._capacity:
+            if self._stopping or not self._thread.is_alive():
+                return False
+            self._room.clear()
+            self._wakeup.set()
+            self._room.wait(self._flush_interval)
+        return True
+
+    # ------------------------------------------------------------------
+    # Writer thread
+    # ------------------------------------------------------------------
+
+    def _run(self) -> None:
+        while True:
+            self._wakeup.wait(self._flush_interval)
+            self._wakeup.clear()
+            self._drain()
+            if self._stopping and not self._queue:
+                return
+
+    def _drain(self) -> None:
+        queue = self._queue
+        while queue:
+            self._writing = True
+            batch: list[logging.LogRecord] = []
+            while queue and len(batch) < self._batch_size:
+                batch.append(queue.popleft())  # this thread is the only consumer
+            self._room.set()
+            self._write(batch)
+            self._written += len(batch)
+        self._writing = False
+
+    def _write(self, batch: list[logging.LogRecord]) -> None:
+        target = self._target
+        records = [record for record in batch if record.levelno >= target.level]
+        if not self._batch_stream:
+            for record in records:
+                target.handle(record)
+            return
+
+        stream_handler: logging.StreamHandler[Any] = target  # type: ignore[assignment]
+        lines: list[str] = []
+        for record in records:
+            if not stream_handler.filter(record):
+                continue
+            try:
+                lines.append(stream_handler.format(record) + stream_handler.terminator)
+            except Exception:
+                stream_handler.handleError(record)
+        if not lines:
+            return
+        stream_handler.acquire()
+        try:
+            stream_handler.stream.write("".join(lines))
+            stream_handler.stream.flush()
+        except Exception:
+            stream_handler.handleError(records[-1])
+        finally:
+            stream_handler.release()
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def flush(self, timeout: float = 5.0) -> None:
+        """Wait until every record queued so far has been written."""
+        deadline = time.monotonic() + timeout
+        while (self._queue or self._writing) and self._thread.is_alive() and time.monotonic() < deadline:
+            self._wakeup.set()
+            time.sleep(0.001)
+
+    def close(self) -> None:
+        """Write the remaining records, stop the writer thread and close *target*."""
+        if not self._stopping:
+            self._stopping = True
+            self._wakeup.set()
+            self._thread.join(timeout=5.0)
+            self._target.close()
+        super().close()
+
+    @property
+    def dropped(self) -> int:
+        """Records discarded because the queue was full."""
+        return self._dropped
+
+    def get_stats(self) -> dict[str, int]:
+        """Queue depth and counters since the handler was created."""
+        return {
+            "queued": len(self._queue),
+            "written": self._written,
+            "dropped": self._dropped,
+            "capacity": self._capacity,
+        }
+
+
+def queue_enabled(config: Config) -> bool:
+    """Whether ``pyfly.logging.queue.enabled`` is set."""
+    return str(config.get("pyfly.logging.queue.enabled", False)).lower() in ("true", "1", "yes")
+
+
+def queue_handler_from_config(target: logging.Handler, config: Config) -> BatchingQueueHandler:
+    """Wrap *target* in a :class:`BatchingQueueHandler` configured from ``pyfly.logging.queue``."""
+    prefix = "pyfly.logging.queue"
+    return BatchingQueueHandler(
+        target,
+        capacity=int(config.get(f"{prefix}.capacity", DEFAULT_CAPACITY)),
+        overflow=str(config.get(f"{prefix}.overflow", "drop")).lower(),
+        batch_size=int(config.get(f"{prefix}.batch-size", DEFAULT_BATCH_SIZE)),
+        flush_interval=float(config.get(f"{prefix}.flush-interval", DEFAULT_FLUSH_INTERVAL)),
+    )
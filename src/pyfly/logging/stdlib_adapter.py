@@ -20,6 +20,7 @@ import sys
 from typing import Any
 
 from pyfly.core.config import Config
+from pyfly.logging.queue_handler import queue_enabled, queue_handler_from_config
 
 
 class _StructuredLogger:
@@ -66,6 +67,8 @@ class StdlibLoggingAdapter:
         self._root_level: str = "INFO"
         self._format: str = "console"
         self._module_levels: dict[str, str] = {}
+        self._queued: bool = False
+        self._config: Config | None = None
 
     def configure(self, config: Config) -> None:
         """Configure stdlib logging from the logging section of config."""
@@ -73,6 +76,8 @@ class StdlibLoggingAdapter:
         self._root_level = str(level_section.pop("root", "INFO")).upper()
         self._module_levels = {k: str(v).upper() for k, v in level_section.items()}
         self._format = str(config.get("pyfly.logging.format", "console")).lower()
+        self._queued = queue_enabled(config)
+        self._config = config
 
         self._setup_logging()
         self._apply_levels()
@@ -95,6 +100,17 @@ class StdlibLoggingAdapter:
         else:
             fmt = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
 
+        if self._queued and self._config is not None:
+            # Format and write on a background thread, in batches
+            stream_handler = logging.StreamHandler(sys.stdout)
+            stream_handler.setFormatter(logging.Formatter(fmt))
+            logging.basicConfig(
+                handlers=[queue_handler_from_config(stream_handler, self._config)],
+                level=log_level,
+                force=True,
+            )
+            return
+
         logging.basicConfig(
             format=fmt,
             stream=sys.stdout,
@@ -22,6 +22,7 @@ from typing import Any
 import structlog
 
 from pyfly.core.config import Config
+from pyfly.logging.queue_handler import queue_enabled, queue_handler_from_config
 
 
 class StructlogAdapter:
@@ -31,6 +32,8 @@ class StructlogAdapter:
         self._root_level: str = "INFO"
         self._format: str = "console"
         self._module_levels: dict[str, str] = {}
+        self._queued: bool = False
+        self._config: Config | None = None
 
     def configure(self, config: Config) -> None:
         """Configure structlog from the logging section of config."""
@@ -38,6 +41,8 @@ class StructlogAdapter:
         self._root_level = str(level_section.pop("root", "INFO")).upper()
         self._module_levels = {k: str(v).upper() for k, v in level_section.items()}
         self._format = str(config.get("pyfly.logging.format", "console")).lower()
+        self._queued = queue_enabled(config)
+        self._config = config
 
         self._setup_structlog()
         self._apply_levels()
@@ -64,11 +69,17 @@ class StructlogAdapter:
             structlog.processors.UnicodeDecoder(),
         ]
 
+        renderer: structlog.types.Processor
         if self._format == "json":
-            processors.append(structlog.processors.JSONRenderer())
+            renderer = structlog.processors.JSONRenderer()
         else:
-            processors.append(structlog.dev.ConsoleRenderer(sort_keys=False))
+            renderer = structlog.dev.ConsoleRenderer(sort_keys=False)
 
+        if self._queued and self._config is not None:
+            self._setup_queued(processors, renderer, log_level, self._config)
+            return
+
+        processors.append(renderer)
         structlog.configure(
             processors=processors,
             logger_factory=structlog.stdlib.LoggerFactory(),
@@ -83,7 +94,62 @@ class StructlogAdapter:
             force=True,
         )
 
+    @staticmethod
+    def _setup_queued(
+        processors: list[structlog.types.Processor],
+        renderer: structlog.types.Processor,
+        log_level: int,
+        config: Config,
+    ) -> None:
+        """Render and write on a background thread instead of the calling one.
+
+        The cheap processors (context, level, timestamp) still run at the
+        call site; the renderer runs in a ``ProcessorFormatter`` behind a
+        :class:`~pyfly.logging.queue_handler.BatchingQueueHandler`.
+        """
+        structlog.configure(
+            processors=[*processors, _capture_exc_info, structlog.stdlib.ProcessorFormatter.wrap_for_formatter],
+            logger_factory=structlog.stdlib.LoggerFactory(),
+            wrapper_class=structlog.stdlib.BoundLogger,
+            cache_logger_on_first_use=True,
+        )
+
+        formatter_processors: list[structlog.types.Processor] = [
+            structlog.stdlib.ProcessorFormatter.remove_processors_meta
+        ]
+        if isinstance(renderer, structlog.processors.JSONRenderer):
+            # The console renderer prints tracebacks itself; JSON needs them as a string
+            formatter_processors.append(structlog.processors.format_exc_info)
+        formatter_processors.append(renderer)
+
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(
+            structlog.stdlib.ProcessorFormatter(
+                processors=formatter_processors,
+                # Records from plain stdlib loggers (uvicorn, libraries)
+                foreign_pre_chain=[
+                    structlog.stdlib.add_logger_name,
+                    structlog.stdlib.add_log_level,
+                    structlog.processors.TimeStamper(fmt="iso"),
+                ],
+            )
+        )
+        logging.basicConfig(
+            handlers=[queue_handler_from_config(stream_handler, config)],
+            level=log_level,
+            force=True,
+        )
+
     def _apply_levels(self) -> None:
         """Apply per-module log levels."""
         for module, level in self._module_levels.items():
             self.set_level(module, level)
+
+
+def _capture_exc_info(
+    logger: Any, method_name: str, event_dict: structlog.types.EventDict
+) -> structlog.types.EventDict:
+    """Resolve ``exc_info=True`` at the call site; the renderer runs on another thread."""
+    if event_dict.get("exc_info") is True:
+        event_dict["exc_info"] = sys.exc_info()
+    return event_dict
@@ -11,15 +11,20 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-"""PyFly Resilience — rate limiting, bulkhead, timeout, and fallback patterns."""
+"""PyFly Resilience — rate limiting, bulkhead, adaptive concurrency, timeout, and fallback patterns."""
 
+from pyfly.resilience.adaptive_limit import AdaptiveConcurrencyLimiter, AimdLimit, GradientLimit, LimitAlgorithm
 from pyfly.resilience.bulkhead import Bulkhead, bulkhead
 from pyfly.resilience.fallback import fallback
 from pyfly.resilience.rate_limiter import RateLimiter, rate_limiter
 from pyfly.resilience.time_limiter import time_limiter
 
 __all__ = [
+    "AdaptiveConcurrencyLimiter",
+    "AimdLimit",
     "Bulkhead",
+    "GradientLimit",
+    "LimitAlgorithm",
     "RateLimiter",
     "bulkhead",
     "fallback",
@@ -0,0 +1,188 @@
+# Copyright 2026 Firefly Software Solutions Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Adaptive concurrency limiting — limits that follow the latency of the protected resource."""
+
+from __future__ import annotations
+
+import math
+from typing import Protocol, runtime_checkable
+
+
+@runtime_checkable
+class LimitAlgorithm(Protocol):
+    """Computes the concurrency limit from latency samples."""
+
+    @property
+    def limit(self) -> int:
+        """Current number of concurrent calls allowed."""
+        ...
+
+    def on_sample(self, rtt: float, in_flight: int, dropped: bool) -> None:
+        """Update the limit with one completed call.
+
+        Args:
+            rtt: Latency of the call in seconds.
+            in_flight: Calls in flight when it completed (itself included).
+            dropped: Whether the call failed in a way that signals overload.
+        """
+        ...
+
+
+class AimdLimit:
+    """Additive increase, multiplicative decrease.
+
+    Each successful call taken while at least half the limit was in use
+    raises the limit by one.  A dropped call, or one slower than *timeout*,
+    multiplies it by *backoff_ratio*.
+
+    Args:
+        initial_limit: Limit before any sample arrived.
+        min_limit: The limit never drops below this.
+        max_limit: The limit never grows above this.
+        backoff_ratio: Factor applied to the limit on overload.
+        timeout: Calls slower than this many seconds count as overload.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 20,
+        min_limit: int = 1,
+        max_limit: int = 200,
+        backoff_ratio: float = 0.9,
+        timeout: float = 5.0,
+    ) -> None:
+        self._limit = float(initial_limit)
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._backoff_ratio = backoff_ratio
+        self._timeout = timeout
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def on_sample(self, rtt: float, in_flight: int, dropped: bool) -> None:
+        if dropped or rtt > self._timeout:
+            self._limit = max(self._min_limit, self._limit * self._backoff_ratio)
+        elif in_flight * 2 >= self._limit:
+            self._limit = min(self._max_limit, self._limit + 1)
+
+
+class GradientLimit:
+    """Scales the limit by the ratio of long-term to current latency.
+
+    The long-term latency is an exponential average over about
+    *long_window* samples.  While calls are as fast as usual (within
+    *tolerance*), the limit grows by a queue allowance of ``sqrt(limit)``;
+    as they slow down, it shrinks by up to half per sample.  Changes are
+    damped by *smoothing*.
+
+    Args:
+        initial_limit: Limit before any sample arrived.
+        min_limit: The limit never drops below this.
+        max_limit: The limit never grows above this.
+        smoothing: Weight of a new estimate against the current limit (0-1].
+        tolerance: Current latency may exceed the long-term one by this factor
+            before the limit shrinks.
+        long_window: Number of samples the long-term latency averages over.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 20,
+        min_limit: int = 1,
+        max_limit: int = 200,
+        smoothing: float = 0.2,
+        tolerance: float = 1.5,
+        long_window: int = 600,
+    ) -> None:
+        self._limit = float(initial_limit)
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._smoothing = smoothing
+        self._tolerance = tolerance
+        self._alpha = 2.0 / (long_window + 1)
+        self._long_rtt = 0.0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def on_sample(self, rtt: float, in_flight: int, dropped: bool) -> None:
+        if self._long_rtt == 0.0:
+            self._long_rtt = rtt
+        else:
+            self._long_rtt += (rtt - self._long_rtt) * self._alpha
+            if self._long_rtt > rtt * 2:
+                # Recover quickly once a latency spike is over
+                self._long_rtt *= 0.95
+
+        if dropped:
+            gradient = 0.5
+        elif in_flight * 2 < self._limit:
+            return  # Not enough load to learn anything about the limit
+        elif rtt <= 0.0:
+            gradient = 1.0
+        else:
+            gradient = max(0.5, min(1.0, self._tolerance * self._long_rtt / rtt))
+
+        estimate = self._limit * gradient + math.sqrt(self._limit)
+        new_limit = self._limit * (1 - self._smoothing) + estimate * self._smoothing
+        self._limit = max(self._min_limit, min(self._max_limit, new_limit))
+
+
+class AdaptiveConcurrencyLimiter:
+    """Admits calls while fewer than the algorithm's limit are in flight.
+
+    Like :class:`~pyfly.resilience.Bulkhead`, excess calls are rejected
+    immediately rather than queued — but the limit itself is recomputed by a
+    :class:`LimitAlgorithm` from the latency of every completed call.
+
+    Args:
+        algorithm: Limit algorithm; defaults to :class:`AimdLimit`.
+    """
+
+    def __init__(self, algorithm: LimitAlgorithm | None = None) -> None:
+        self._algorithm = algorithm if algorithm is not None else AimdLimit()
+        self._in_flight = 0
+        self._rejected = 0
+
+    def try_acquire(self, share: float = 1.0) -> bool:
+        """Admit a call if in-flight calls are below *share* of the limit."""
+        if self._in_flight >= max(1, int(self._algorithm.limit * share)):
+            self._rejected += 1
+            return False
+        self._in_flight += 1
+        return True
+
+    def release(self, rtt: float | None = None, dropped: bool = False) -> None:
+        """Complete an admitted call; *rtt* ``None`` releases it without a sample."""
+        if rtt is not None:
+            self._algorithm.on_sample(rtt, self._in_flight, dropped)
+        self._in_flight -= 1
+
+    @property
+    def limit(self) -> int:
+        """Current concurrency limit."""
+        return self._algorithm.limit
+
+    @property
+    def in_flight(self) -> int:
+        """Calls admitted and not yet released."""
+        return self._in_flight
+
+    @property
+    def rejected(self) -> int:
+        """Calls rejected since the limiter was created."""
+        return self._rejected
@@ -23,6 +23,7 @@ from dataclasses import dataclass
 from datetime import timedelta
 from typing import Any
 
+from pyfly.container.method_index import marked_methods
 from pyfly.scheduling.adapters.asyncio_executor import AsyncIOTaskExecutor
 from pyfly.scheduling.cron import CronExpression
 from pyfly.scheduling.ports.outbound import TaskExecutorPort
@@ -63,23 +64,13 @@ class TaskScheduler:
     def discover(self, beans: list[Any]) -> int:
         """Scan beans for @scheduled methods. Return number of scheduled methods found.
 
-        For each bean, inspects all attributes. If an attribute is callable and
-        has ``__pyfly_scheduled__ == True``, it is recorded for later scheduling.
+        Methods are looked up in the class-level :func:`method_index` (plus
+        functions assigned to the bean), so only public methods marked with
+        ``__pyfly_scheduled__`` are touched.
         """
         count = 0
         for bean in beans:
-            for name in dir(bean):
-                if name.startswith("_"):
-                    continue
-                try:
-                    attr = getattr(bean, name)
-                except Exception:  # noqa: BLE001
-                    continue
-                if not callable(attr):
-                    continue
-                if not getattr(attr, "__pyfly_scheduled__", False):
-                    continue
-
+            for name, attr in marked_methods(bean, "__pyfly_scheduled__"):
                 entry = _ScheduledEntry(
                     bean=bean,
                     method=attr,
@@ -20,19 +20,25 @@ from pyfly.container import Container, Scope
 
 def create_test_container(
     overrides: dict[type, type] | None = None,
+    parent: Container | None = None,
 ) -> Container:
     """Create a pre-configured Container for testing.
 
     Registers any override mappings (interface -> test implementation)
     so tests can substitute real services with fakes/mocks.
 
+    When *parent* is given the container is a :meth:`Container.create_child`
+    of it: the parent's beans and already-created singletons are reused
+    instead of being rebuilt, and overrides never leak back into the parent.
+
     Args:
         overrides: Mapping of interface types to test implementations.
+        parent: Fully wired container to layer the test container over.
 
     Returns:
         A configured Container ready for testing.
     """
-    container = Container()
+    container = parent.create_child() if parent is not None else Container()
 
     if overrides:
         for interface, impl in overrides.items():
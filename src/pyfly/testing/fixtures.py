@@ -15,6 +15,10 @@
 
 from __future__ import annotations
 
+import asyncio
+from typing import ClassVar
+from weakref import WeakKeyDictionary
+
 from pyfly.context.application_context import ApplicationContext
 from pyfly.core.config import Config
 from pyfly.eda.adapters.memory import InMemoryEventBus
@@ -30,17 +34,38 @@ class PyFlyTestCase:
                 await self.setup()
                 # ... use self.context and self.event_bus
                 await self.teardown()
+
+    The framework context is started once per event loop and shared by the
+    tests running in that loop; each test gets a child of it (see
+    :meth:`ApplicationContext.create_child`), so beans registered by one test
+    are invisible to the others.  A test that runs in a new loop (e.g. with
+    pytest-asyncio's function-scoped loops) gets a new framework context, so
+    loop-bound resources are never reused across loops.
     """
 
     context: ApplicationContext
     event_bus: InMemoryEventBus
 
+    _base_contexts: ClassVar[WeakKeyDictionary[asyncio.AbstractEventLoop, ApplicationContext]] = WeakKeyDictionary()
+
     async def setup(self) -> None:
         """Initialize test infrastructure."""
-        self.context = ApplicationContext(Config({}))
+        loop = asyncio.get_running_loop()
+        base = PyFlyTestCase._base_contexts.get(loop)
+        if base is None:
+            base = ApplicationContext(Config({}))
+            await base.start()
+            PyFlyTestCase._base_contexts[loop] = base
+        self.context = base.create_child()
         self.event_bus = InMemoryEventBus()
-        await self.context.start()
 
     async def teardown(self) -> None:
         """Clean up test infrastructure."""
         await self.context.stop()
+
+    @classmethod
+    async def close_base_context(cls) -> None:
+        """Stop the current loop's framework context, e.g. from a loop-scoped fixture."""
+        base = PyFlyTestCase._base_contexts.pop(asyncio.get_running_loop(), None)
+        if base is not None:
+            await base.stop()
@@ -21,6 +21,8 @@ Import concrete adapter types from the adapter package::
 
 # Re-export controller_advice from container for convenience
 from pyfly.container.stereotypes import controller_advice
+from pyfly.web.caching import cache_response
+from pyfly.web.coalescing import coalesce_requests
 from pyfly.web.cors import CORSConfig
 from pyfly.web.exception_handler import exception_handler
 from pyfly.web.filters import OncePerRequestFilter
@@ -51,6 +53,8 @@ __all__ = [
     "UploadedFile",
     "Valid",
     "WebFilter",
+    "cache_response",
+    "coalesce_requests",
     "delete_mapping",
     "exception_handler",
     "get_mapping",
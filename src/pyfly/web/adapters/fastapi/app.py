@@ -27,6 +27,7 @@ from pyfly.web.adapters.fastapi.controller import FastAPIControllerRegistrar
 from pyfly.web.adapters.fastapi.errors import register_exception_handlers
 from pyfly.web.adapters.starlette.filter_chain import WebFilterChainMiddleware
 from pyfly.web.adapters.starlette.filters import (
+    AdaptiveConcurrencyFilter,
     RequestLoggingFilter,
     SecurityHeadersFilter,
     TransactionIdFilter,
@@ -165,11 +166,13 @@ def create_app(
     if actuator_enabled:
         from pyfly.actuator.adapters.starlette import make_starlette_actuator_routes
         from pyfly.actuator.endpoints.beans_endpoint import BeansEndpoint
+        from pyfly.actuator.endpoints.concurrency_endpoint import ConcurrencyEndpoint
         from pyfly.actuator.endpoints.env_endpoint import EnvEndpoint
         from pyfly.actuator.endpoints.health_endpoint import HealthEndpoint
         from pyfly.actuator.endpoints.info_endpoint import InfoEndpoint
         from pyfly.actuator.endpoints.loggers_endpoint import LoggersEndpoint
         from pyfly.actuator.endpoints.metrics_endpoint import MetricsEndpoint
+        from pyfly.actuator.endpoints.startup_endpoint import StartupEndpoint
         from pyfly.actuator.health import HealthAggregator, HealthIndicator
         from pyfly.actuator.registry import ActuatorRegistry
 
@@ -191,8 +194,12 @@ def create_app(
             registry.register(BeansEndpoint(context))
             registry.register(EnvEndpoint(context))
             registry.register(InfoEndpoint(context))
+            registry.register(StartupEndpoint(context))
         registry.register(LoggersEndpoint())
         registry.register(MetricsEndpoint())
+        for web_filter in filters:
+            if isinstance(web_filter, AdaptiveConcurrencyFilter):
+                registry.register(ConcurrencyEndpoint(web_filter))
 
         # Auto-discover custom ActuatorEndpoint beans from context
         if context is not None:
@@ -22,7 +22,7 @@ from starlette.requests import Request
 from starlette.responses import JSONResponse, Response
 
 from pyfly.web.adapters.starlette.resolver import ParameterResolver
-from pyfly.web.adapters.starlette.response import handle_return_value
+from pyfly.web.adapters.starlette.response import handle_return_value, json_encoder_for
 
 
 async def _maybe_await(result: Any) -> Any:
@@ -107,6 +107,7 @@ class FastAPIControllerRegistrar:
     ) -> Any:
         """Create a FastAPI endpoint that lazily resolves the controller bean on first request."""
         _cache: dict[str, Any] = {}
+        encoder = json_encoder_for(getattr(controller_cls, method_name))
 
         async def lazy_endpoint(request: Request) -> Response:
             if "instance" not in _cache:
@@ -118,7 +119,7 @@ class FastAPIControllerRegistrar:
             try:
                 kwargs = await _cache["resolver"].resolve(request)
                 result = await _maybe_await(_cache["method"](**kwargs))
-                return handle_return_value(result, status_code)
+                return handle_return_value(result, status_code, encoder=encoder)
             except Exception as exc:
                 for exc_type, handler in _cache["exc_handlers"].items():
                     if isinstance(exc, exc_type):
@@ -128,4 +129,10 @@ class FastAPIControllerRegistrar:
                         return handle_return_value(result)
                 raise
 
+        # Read by ResponseCacheFilter / RequestCoalescingFilter, which match the route before it is called
+        controller_method = getattr(controller_cls, method_name)
+        lazy_endpoint.__pyfly_cache_response__ = getattr(  # type: ignore[attr-defined]
+            controller_method, "__pyfly_cache_response__", None
+        )
+        lazy_endpoint.__pyfly_coalesce__ = getattr(controller_method, "__pyfly_coalesce__", None)  # type: ignore[attr-defined]
         return lazy_endpoint
@@ -30,11 +30,13 @@ from pyfly.web.adapters.starlette.filters import (
 from pyfly.web.adapters.starlette.request_logger import RequestLoggingMiddleware
 from pyfly.web.adapters.starlette.resolver import ParameterResolver
 from pyfly.web.adapters.starlette.response import handle_return_value
+from pyfly.web.adapters.starlette.routing import RadixRouter
 from pyfly.web.adapters.starlette.security_headers import SecurityHeadersMiddleware
 
 __all__ = [
     "ControllerRegistrar",
     "ParameterResolver",
+    "RadixRouter",
     "RequestLoggingFilter",
     "RequestLoggingMiddleware",
     "SecurityHeadersFilter",
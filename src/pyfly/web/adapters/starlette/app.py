@@ -16,6 +16,9 @@
 from __future__ import annotations
 
 import contextlib
+import functools
+import logging
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 from starlette.applications import Starlette
@@ -32,11 +35,13 @@ from pyfly.web.adapters.starlette.docs import (
 from pyfly.web.adapters.starlette.errors import global_exception_handler
 from pyfly.web.adapters.starlette.filter_chain import WebFilterChainMiddleware
 from pyfly.web.adapters.starlette.filters import (
+    AdaptiveConcurrencyFilter,
     RequestLoggingFilter,
     SecurityHeadersFilter,
     TransactionIdFilter,
 )
-from pyfly.web.openapi import OpenAPIGenerator
+from pyfly.web.adapters.starlette.routing import RadixRouter
+from pyfly.web.openapi import OpenAPIDocument, OpenAPIGenerator
 from pyfly.web.ports.filter import WebFilter
 from pyfly.websocket.adapters.starlette import WebSocketRegistrar
 
@@ -44,6 +49,8 @@ if TYPE_CHECKING:
     from pyfly.context.application_context import ApplicationContext
     from pyfly.web.cors import CORSConfig
 
+logger = logging.getLogger(__name__)
+
 
 def create_app(
     title: str = "PyFly",
@@ -71,6 +78,9 @@ def create_app(
     - CORS support (when cors is provided)
     - WebSocket routes (auto-discovered from @websocket_mapping)
     - SSE routes (auto-discovered from @sse_mapping)
+
+    Set ``pyfly.web.router: radix`` to match routes through a
+    :class:`RadixRouter` instead of Starlette's linear scan.
     """
     # --- Build the WebFilter chain ---
     filters: list[WebFilter] = [
@@ -89,6 +99,8 @@ def create_app(
                     reg.instance,
                     (TransactionIdFilter, RequestLoggingFilter, SecurityHeadersFilter),
                 )
+                # A @bean declared as "-> WebFilter" is registered under both types
+                and not any(f is reg.instance for f in filters)
             ):
                 filters.append(reg.instance)
 
@@ -151,11 +163,13 @@ def create_app(
     if actuator_enabled:
         from pyfly.actuator.adapters.starlette import make_starlette_actuator_routes
         from pyfly.actuator.endpoints.beans_endpoint import BeansEndpoint
+        from pyfly.actuator.endpoints.concurrency_endpoint import ConcurrencyEndpoint
         from pyfly.actuator.endpoints.env_endpoint import EnvEndpoint
         from pyfly.actuator.endpoints.health_endpoint import HealthEndpoint
         from pyfly.actuator.endpoints.info_endpoint import InfoEndpoint
         from pyfly.actuator.endpoints.loggers_endpoint import LoggersEndpoint
         from pyfly.actuator.endpoints.metrics_endpoint import MetricsEndpoint
+        from pyfly.actuator.endpoints.startup_endpoint import StartupEndpoint
         from pyfly.actuator.health import HealthAggregator, HealthIndicator
         from pyfly.actuator.registry import ActuatorRegistry
 
@@ -177,8 +191,12 @@ def create_app(
             registry.register(BeansEndpoint(context))
             registry.register(EnvEndpoint(context))
             registry.register(InfoEndpoint(context))
+            registry.register(StartupEndpoint(context))
         registry.register(LoggersEndpoint())
         registry.register(MetricsEndpoint())
+        for web_filter in filters:
+            if isinstance(web_filter, AdaptiveConcurrencyFilter):
+                registry.register(ConcurrencyEndpoint(web_filter))
 
         # Auto-discover custom ActuatorEndpoint beans from context
         if context is not None:
@@ -282,13 +300,23 @@ def create_app(
     route_metadata = registrar.collect_route_metadata(context) if context is not None else []
 
     # Generate OpenAPI spec and doc routes
+    openapi_document: OpenAPIDocument | None = None
+    generator: OpenAPIGenerator | None = None
     if docs_enabled:
         generator = OpenAPIGenerator(title=title, version=version, description=description)
-        spec = generator.generate(route_metadata or None)
+        generate = functools.partial(generator.generate, route_metadata or None)
+        openapi_file = str(context.config.get("pyfly.web.docs.openapi-file", "")) if context is not None else ""
+        if openapi_file and Path(openapi_file).is_file():
+            # Pre-generated at build time with ``pyfly openapi``
+            openapi_document = OpenAPIDocument.from_file(openapi_file)
+        else:
+            if openapi_file:
+                logger.warning("openapi_file_missing", extra={"path": openapi_file})
+            openapi_document = OpenAPIDocument(generate)
 
         routes.extend(
             [
-                Route("/openapi.json", make_openapi_endpoint(spec)),
+                Route("/openapi.json", make_openapi_endpoint(openapi_document)),
                 Route("/docs", make_swagger_ui_endpoint(title)),
                 Route("/redoc", make_redoc_endpoint(title)),
             ]
@@ -300,10 +328,14 @@ def create_app(
         routes=routes,
         lifespan=lifespan,  # type: ignore[arg-type]
     )
+    if context is not None and str(context.config.get("pyfly.web.router", "starlette")).lower() == "radix":
+        app.router = RadixRouter(routes, lifespan=lifespan)
 
     # Store metadata for startup logging
     app.state.pyfly_route_metadata = route_metadata
     app.state.pyfly_docs_enabled = docs_enabled
+    app.state.pyfly_openapi = openapi_document
+    app.state.pyfly_openapi_generator = generator
 
     # Register global exception handler
     app.add_exception_handler(Exception, global_exception_handler)
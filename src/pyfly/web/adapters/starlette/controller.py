@@ -25,7 +25,7 @@ from starlette.responses import JSONResponse, Response
 from starlette.routing import Route
 
 from pyfly.web.adapters.starlette.resolver import ParameterResolver
-from pyfly.web.adapters.starlette.response import handle_return_value
+from pyfly.web.adapters.starlette.response import handle_return_value, json_encoder_for
 from pyfly.web.params import Body, Cookie, Header, PathVar, QueryParam, Valid
 
 _BINDING_TYPES = {PathVar, QueryParam, Body, Header, Cookie}
@@ -341,6 +341,7 @@ class ControllerRegistrar:
 
         _cache: dict[str, Any] = {}
         _init_lock = asyncio.Lock()
+        encoder = json_encoder_for(getattr(controller_cls, method_name))
 
         async def lazy_endpoint(request: Request) -> Response:
             if "instance" not in _cache:
@@ -358,7 +359,7 @@ class ControllerRegistrar:
             try:
                 kwargs = await _cache["resolver"].resolve(request)
                 result = await _maybe_await(_cache["method"](**kwargs))
-                return handle_return_value(result, status_code, accept=accept)
+                return handle_return_value(result, status_code, accept=accept, encoder=encoder)
             except Exception as exc:
                 # 1. Check controller-local exception handlers
                 for exc_type, handler in _cache["exc_handlers"].items():
@@ -376,4 +377,10 @@ class ControllerRegistrar:
                         return handle_return_value(result, accept=accept)
                 raise
 
+        # Read by ResponseCacheFilter / RequestCoalescingFilter, which match the route before it is called
+        controller_method = getattr(controller_cls, method_name)
+        lazy_endpoint.__pyfly_cache_response__ = getattr(  # type: ignore[attr-defined]
+            controller_method, "__pyfly_cache_response__", None
+        )
+        lazy_endpoint.__pyfly_coalesce__ = getattr(controller_method, "__pyfly_coalesce__", None)  # type: ignore[attr-defined]
         return lazy_endpoint
@@ -15,11 +15,15 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Awaitable, Callable
 from typing import Any
 
 from starlette.requests import Request
-from starlette.responses import HTMLResponse, JSONResponse
+from starlette.responses import HTMLResponse, Response
+
+from pyfly.web.http_headers import etag_matches, negotiate_encoding
+from pyfly.web.openapi import OpenAPIDocument
 
 SWAGGER_UI_HTML = """<!DOCTYPE html>
 <html lang="en">
@@ -92,11 +96,32 @@ REDOC_HTML = """<!DOCTYPE html>
 </html>"""
 
 
-def make_openapi_endpoint(spec_dict: dict[str, Any]) -> Callable[[Request], Awaitable[JSONResponse]]:
-    """Create the /openapi.json endpoint handler."""
-
-    async def openapi_json(request: Request) -> JSONResponse:
-        return JSONResponse(spec_dict)
+def make_openapi_endpoint(
+    spec: dict[str, Any] | OpenAPIDocument,
+) -> Callable[[Request], Awaitable[Response]]:
+    """Create the /openapi.json endpoint handler.
+
+    The document is serialized once (a lazy document is generated in a
+    worker thread on the first request) and served from memory with a
+    strong ETag, ``304 Not Modified`` for matching ``If-None-Match``
+    requests, and a pre-compressed gzip copy for clients that accept it.
+    """
+    document = spec if isinstance(spec, OpenAPIDocument) else OpenAPIDocument(spec)
+    render_lock = asyncio.Lock()
+
+    async def openapi_json(request: Request) -> Response:
+        if not document.rendered:
+            async with render_lock:
+                if not document.rendered:
+                    await asyncio.to_thread(document.render)
+
+        headers = {"etag": document.etag, "cache-control": "no-cache", "vary": "accept-encoding"}
+        if etag_matches(request.headers.get("if-none-match"), document.etag):
+            return Response(status_code=304, headers=headers)
+        if negotiate_encoding(request.headers.get("accept-encoding", "")) == "gzip":
+            headers["content-encoding"] = "gzip"
+            return Response(document.gzip_body, media_type="application/json", headers=headers)
+        return Response(document.body, media_type="application/json", headers=headers)
 
     return openapi_json
 
@@ -11,20 +11,74 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-"""WebFilterChainMiddleware — pure ASGI middleware wrapping all WebFilters."""
+"""WebFilterChainMiddleware — pure ASGI middleware wrapping all WebFilters.
+
+By default the response body is **streamed**: ``call_next`` returns as soon
+as the downstream app sends ``http.response.start``, with a response object
+carrying the status and headers.  Filters read the status and edit headers
+(or cookies) on it; once the outermost filter returns, the edited start
+message is sent and the body chunks are relayed to the client as the app
+produces them.  Time-to-first-byte and memory use do not depend on the body
+size, and SSE / large downloads work through the chain.
+
+Because ``call_next`` returns before the body is produced, work a filter
+would do "after the response" (tearing down request state, measuring the
+duration) belongs in a callback registered with :func:`after_response`; the
+middleware runs those callbacks once the body has been relayed.
+
+Filters that must see or rewrite the body set ``requires_response_body =
+True``; if any filter that applies to a path does, that path's responses are
+buffered into a plain ``Response`` (capped at :data:`MAX_RESPONSE_BODY_SIZE`)
+as before.
+"""
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+import asyncio
+import contextlib
+import inspect
+import logging
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator, Sequence
+from contextvars import ContextVar
+from pathlib import Path
 from typing import Any, cast
 
 from starlette.requests import Request
 from starlette.responses import Response
-from starlette.types import ASGIApp, Receive, Scope, Send
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from pyfly.web.filters import OncePerRequestFilter
 from pyfly.web.ports.filter import CallNext, WebFilter
 
+logger = logging.getLogger(__name__)
+
 MAX_RESPONSE_BODY_SIZE = 100 * 1024 * 1024  # 100 MB
+MAX_CACHED_PATHS = 4096  # distinct paths whose resolved chain is remembered
+
+_PATHSEND_CHUNK_SIZE = 64 * 1024  # 64 KB
+_END = object()
+# Streamed responses created during the current request, cancelled when it ends
+_streams: ContextVar[list[StreamedResponse] | None] = ContextVar("pyfly_filter_chain_streams", default=None)
+# Callbacks registered with after_response() during the current request
+_completions: ContextVar[list[Callable[[], Awaitable[None] | None]] | None] = ContextVar(
+    "pyfly_filter_chain_completions", default=None
+)
+
+
+def after_response(callback: Callable[[], Awaitable[None] | None]) -> bool:
+    """Run *callback* once the current request's response has been sent.
+
+    Callbacks run after the last body chunk was relayed (or the request
+    failed or was cancelled), in reverse registration order, in the
+    request's context.  Failures are logged.  Returns ``False`` when not
+    called inside :class:`WebFilterChainMiddleware`; the caller must then
+    run *callback* itself.
+    """
+    completions = _completions.get()
+    if completions is None:
+        return False
+    completions.append(callback)
+    return True
 
 
 class WebFilterChainMiddleware:
@@ -33,6 +87,12 @@ class WebFilterChainMiddleware:
     Each filter's ``should_not_filter()`` is checked before invocation — if it
     returns ``True``, the filter is skipped and the next one in the chain runs.
 
+    For :class:`OncePerRequestFilter` subclasses that keep the default
+    ``should_not_filter()``, applicability depends only on the path: it is
+    evaluated once per path against the precompiled patterns, and the
+    resulting chain (with those filters either bound directly or left out)
+    is cached and reused.  Other filters are still asked on every request.
+
     Uses raw ASGI protocol instead of ``BaseHTTPMiddleware`` to avoid the
     ``anyio`` dependency that causes ``ModuleNotFoundError`` with ASGI servers
     that don't register with sniffio (e.g. Granian).
@@ -41,6 +101,10 @@ class WebFilterChainMiddleware:
     def __init__(self, app: ASGIApp, filters: Sequence[WebFilter] = ()) -> None:
         self.app = app
         self._filters = list(filters)
+        self._path_filters = [_is_path_filter(f) for f in self._filters]
+        # applicability mask -> chain, and path -> chain (bounded)
+        self._chains: dict[tuple[bool | None, ...], CallNext] = {}
+        self._chain_by_path: dict[str, CallNext] = {}
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         if scope["type"] != "http":
@@ -52,55 +116,219 @@ class WebFilterChainMiddleware:
             return
 
         request = Request(scope, receive, send)
+        chain = self._chain_by_path.get(scope["path"]) or self._chain_for(scope["path"])
+        streams: list[StreamedResponse] = []
+        completions: list[Callable[[], Awaitable[None] | None]] = []
+        token = _streams.set(streams)
+        completions_token = _completions.set(completions)
+        try:
+            response = cast(Response, await chain(request))
+            await response(scope, receive, send)
+        finally:
+            _streams.reset(token)
+            _completions.reset(completions_token)
+            # Downstream apps whose response a filter discarded (or that were cut off
+            # by a disconnect) are still parked on the relay queue.
+            for stream in streams:
+                stream.cancel()
+            for callback in reversed(completions):
+                await _run_completion(callback)
+
+    def _chain_for(self, path: str) -> CallNext:
+        """Build (or reuse) the filter chain for *path* and cache it."""
+        mask = tuple(
+            cast(OncePerRequestFilter, f).applies_to_path(path) if static else None
+            for f, static in zip(self._filters, self._path_filters, strict=True)
+        )
+        chain = self._chains.get(mask)
+        if chain is None:
+            buffer_body = any(
+                applies is not False and getattr(f, "requires_response_body", False)
+                for f, applies in zip(self._filters, mask, strict=True)
+            )
+            chain = self._call_app_buffered if buffer_body else self._call_app
+            for f, applies in zip(reversed(self._filters), reversed(mask), strict=True):
+                if applies is None:
+                    chain = _wrap(f, chain)
+                elif applies:
+                    chain = _bind(f, chain)
+            self._chains[mask] = chain
+        if len(self._chain_by_path) >= MAX_CACHED_PATHS:
+            self._chain_by_path.clear()
+        self._chain_by_path[path] = chain
+        return chain
+
+    async def _call_app(self, request: Request) -> Response:
+        """Terminal: run the downstream ASGI app and hand its streamed response to the filters."""
+        response = await StreamedResponse.start(self.app, request.scope, request.receive)
+        if isinstance(response, StreamedResponse):
+            streams = _streams.get()
+            if streams is not None:
+                streams.append(response)
+        return response
+
+    async def _call_app_buffered(self, request: Request) -> Response:
+        """Terminal for chains with a body filter: run the app to completion first."""
+        return await self._buffered_response(request.scope, request.receive)
+
+    async def _buffered_response(self, scope: Scope, receive: Receive) -> Response:
+        """Run the downstream app to completion and collect its body into a ``Response``."""
+        status_code = 200
+        raw_headers: list[tuple[bytes, bytes]] = []
+        body_parts: list[bytes] = []
+        size = 0
+
+        def _append(chunk: bytes) -> None:
+            nonlocal size
+            size += len(chunk)
+            if size > MAX_RESPONSE_BODY_SIZE:
+                raise RuntimeError(
+                    f"Response body exceeds {MAX_RESPONSE_BODY_SIZE} bytes. "
+                    "Consider excluding this route from the filter chain."
+                )
+            body_parts.append(chunk)
+
+        async def _intercept(message: Message) -> None:
+            nonlocal status_code, raw_headers
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                raw_headers = list(message.get("headers", []))
+            elif message["type"] == "http.response.body":
+                body = message.get("body", b"")
+                if body:
+                    _append(body)
+            elif message["type"] == "http.response.pathsend":
+                # ASGI pathsend extension (Granian zero-copy file serving)
+                for chunk in _read_file_chunks(message.get("path", "")):
+                    _append(chunk)
+
+        await self.app(scope, receive, _intercept)
+
+        response = Response(content=b"".join(body_parts), status_code=status_code)
+        response.raw_headers[:] = raw_headers
+        return response
+
+
+class StreamedResponse(Response):
+    """Downstream response whose body has not been read yet.
+
+    Created when the downstream app sends ``http.response.start``: filters see
+    its ``status_code`` and may edit ``headers`` / ``set_cookie()`` like any
+    Starlette response.  Sending it emits the (edited) start message and then
+    relays the body messages as the downstream app produces them.  There is no
+    ``body`` attribute — filters that need the body must declare
+    ``requires_response_body = True``.
+    """
+
+    def __init__(
+        self,
+        status_code: int,
+        raw_headers: list[tuple[bytes, bytes]],
+        task: asyncio.Task[None],
+        queue: asyncio.Queue[Any],
+    ) -> None:
+        # Response.__init__ would render a body and set content-length; skip it
+        self.status_code = status_code
+        self.raw_headers = raw_headers
+        self.background = None
+        self._task = task
+        self._queue = queue
 
-        async def _call_app(req: Any) -> Response:
-            """Terminal: run downstream ASGI app and capture its response."""
-            status_code = 200
-            raw_headers: list[tuple[bytes, bytes]] = []
-            body_parts: list[bytes] = []
-
-            async def _intercept(message: Any) -> None:
-                nonlocal status_code, raw_headers
-                if message["type"] == "http.response.start":
-                    status_code = message["status"]
-                    raw_headers = list(message.get("headers", []))
-                elif message["type"] == "http.response.body":
-                    body = message.get("body", b"")
-                    if body:
-                        body_parts.append(body)
-                        if sum(len(p) for p in body_parts) > MAX_RESPONSE_BODY_SIZE:
-                            raise RuntimeError(
-                                f"Response body exceeds {MAX_RESPONSE_BODY_SIZE} bytes. "
-                                "Consider excluding this route from the filter chain."
-                            )
-                elif message["type"] == "http.response.pathsend":
-                    # ASGI pathsend extension (Granian zero-copy file serving).
-                    # Stream the file in chunks to avoid OOM on large files.
-                    from pathlib import Path
-
-                    path = message.get("path", "")
-                    if path:
-                        file_path = Path(path)
-                        chunk_size = 64 * 1024  # 64 KB chunks
-                        with file_path.open("rb") as fh:
-                            while True:
-                                chunk = fh.read(chunk_size)
-                                if not chunk:
-                                    break
-                                body_parts.append(chunk)
-
-            await self.app(scope, receive, _intercept)
-
-            response = Response(content=b"".join(body_parts), status_code=status_code)
-            response.raw_headers[:] = raw_headers
-            return response
-
-        chain: CallNext = _call_app
-        for f in reversed(self._filters):
-            chain = _wrap(f, chain)
-
-        response = cast(Response, await chain(request))
-        await response(scope, receive, send)
+    @classmethod
+    async def start(cls, app: ASGIApp, scope: Scope, receive: Receive) -> Response:
+        """Run *app* in a task and return once it has started its response."""
+        loop = asyncio.get_running_loop()
+        started: asyncio.Future[Message | None] = loop.create_future()
+        # One message in flight: the app waits for the client, so memory stays flat
+        queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=1)
+
+        async def _intercept(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                started.set_result(message)
+            else:
+                await queue.put(message)
+
+        async def _run() -> None:
+            try:
+                await app(scope, receive, _intercept)
+            finally:
+                if not started.done():
+                    started.set_result(None)
+                else:
+                    with contextlib.suppress(asyncio.CancelledError):
+                        await queue.put(_END)
+
+        task = loop.create_task(_run())
+        message = await started
+        if message is None:
+            # Failed (or returned) before starting a response: surface its outcome
+            await task
+            return Response(status_code=200)
+        return cls(message["status"], list(message.get("headers", [])), task, queue)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+        pathsend = "http.response.pathsend" in scope.get("extensions", {})
+        while True:
+            message = await self._queue.get()
+            if message is _END:
+                break
+            if message["type"] == "http.response.pathsend" and not pathsend:
+                # The server cannot send files itself: stream the file as body chunks
+                for chunk in _read_file_chunks(message.get("path", "")):
+                    await send({"type": "http.response.body", "body": chunk, "more_body": True})
+                await send({"type": "http.response.body", "body": b"", "more_body": False})
+                continue
+            await send(message)
+        await self._task
+
+    async def iter_body(self) -> AsyncIterator[bytes]:
+        """Yield the body chunks as the downstream app produces them.
+
+        For filters that transform the body as it streams (e.g. compression):
+        the response must not be sent afterwards; return a new response that
+        sends this one's (edited) status and headers and the transformed chunks.
+        """
+        while (message := await self._queue.get()) is not _END:
+            if message["type"] == "http.response.body":
+                if body := message.get("body", b""):
+                    yield body
+            elif message["type"] == "http.response.pathsend":
+                for chunk in _read_file_chunks(message.get("path", "")):
+                    yield chunk
+        await self._task
+
+    async def read(self) -> bytes:
+        """Consume the whole body (for filters that only sometimes need it).
+
+        The response must not be sent afterwards; return a new ``Response``
+        built from the body and this response's status and headers instead.
+        """
+        return b"".join([chunk async for chunk in self.iter_body()])
+
+    def cancel(self) -> None:
+        """Stop the downstream app if its body is no longer going to be relayed."""
+        if not self._task.done():
+            self._task.cancel()
+        elif not self._task.cancelled():
+            self._task.exception()  # mark retrieved: nobody else awaits a discarded response
+
+
+def _is_path_filter(web_filter: WebFilter) -> bool:
+    """Whether *web_filter*'s applicability is decided by its URL patterns alone."""
+    return (
+        isinstance(web_filter, OncePerRequestFilter)
+        and type(web_filter).should_not_filter is OncePerRequestFilter.should_not_filter
+    )
+
+
+def _bind(web_filter: WebFilter, next_call: CallNext) -> CallNext:
+    """Create a closure that always invokes *web_filter* (applicability already known)."""
+
+    async def _inner(request: Request) -> Response:
+        return cast(Response, await web_filter.do_filter(request, next_call))
+
+    return _inner
 
 
 def _wrap(web_filter: WebFilter, next_call: CallNext) -> CallNext:
@@ -112,3 +340,21 @@ def _wrap(web_filter: WebFilter, next_call: CallNext) -> CallNext:
         return cast(Response, await web_filter.do_filter(request, next_call))
 
     return _inner
+
+
+async def _run_completion(callback: Callable[[], Awaitable[None] | None]) -> None:
+    try:
+        result = callback()
+        if inspect.isawaitable(result):
+            await result
+    except Exception as exc:
+        logger.warning("after_response_callback_failed", extra={"callback": repr(callback), "error": str(exc)})
+
+
+def _read_file_chunks(path: str) -> Iterator[bytes]:
+    """Yield the content of *path* in fixed-size chunks."""
+    if not path:
+        return
+    with Path(path).open("rb") as fh:
+        while chunk := fh.read(_PATHSEND_CHUNK_SIZE):
+            yield chunk
@@ -13,14 +13,22 @@
 # limitations under the License.
 """Built-in WebFilter implementations for Starlette."""
 
+from pyfly.web.adapters.starlette.filters.compression_filter import CompressionFilter
+from pyfly.web.adapters.starlette.filters.concurrency_limit_filter import AdaptiveConcurrencyFilter
 from pyfly.web.adapters.starlette.filters.http_security_filter import HttpSecurityFilter
+from pyfly.web.adapters.starlette.filters.request_coalescing_filter import RequestCoalescingFilter
 from pyfly.web.adapters.starlette.filters.request_logging_filter import RequestLoggingFilter
+from pyfly.web.adapters.starlette.filters.response_cache_filter import ResponseCacheFilter
 from pyfly.web.adapters.starlette.filters.security_headers_filter import SecurityHeadersFilter
 from pyfly.web.adapters.starlette.filters.transaction_id_filter import TransactionIdFilter
 
 __all__ = [
+    "AdaptiveConcurrencyFilter",
+    "CompressionFilter",
     "HttpSecurityFilter",
+    "RequestCoalescingFilter",
     "RequestLoggingFilter",
+    "ResponseCacheFilter",
     "SecurityHeadersFilter",
     "TransactionIdFilter",
 ]
@@ -0,0 +1,195 @@
+# Copyright 2026 Firefly Software Solutions Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""CompressionFilter — gzip/deflate response compression negotiated via ``Accept-Encoding``.
+
+Streamed responses are compressed chunk by chunk as the downstream app
+produces them, so compression never buffers the body.  Streams of unknown
+length are flushed after every chunk, so incremental output (NDJSON,
+progress updates) reaches the client without waiting for zlib's buffer.  Chunks (or buffered
+bodies) of at least ``offload_threshold`` bytes are compressed in a worker
+thread — zlib releases the GIL — so large payloads do not stall the event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import zlib
+from collections.abc import Sequence
+from typing import Any
+
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+
+from pyfly.container.ordering import HIGHEST_PRECEDENCE, order
+from pyfly.web.adapters.starlette.filter_chain import StreamedResponse
+from pyfly.web.filters import OncePerRequestFilter
+from pyfly.web.http_headers import negotiate_encoding
+from pyfly.web.ports.filter import CallNext
+
+DEFAULT_LEVEL = 6
+DEFAULT_MIN_SIZE = 1024  # bytes
+DEFAULT_OFFLOAD_THRESHOLD = 256 * 1024  # bytes
+
+# Media types that are already compressed (or must not be delayed, like SSE)
+DEFAULT_EXCLUDED_MEDIA_TYPES: tuple[str, ...] = (
+    "image/",
+    "video/",
+    "audio/",
+    "font/woff",
+    "application/zip",
+    "application/gzip",
+    "application/x-gzip",
+    "application/x-7z-compressed",
+    "application/x-bzip2",
+    "application/x-rar-compressed",
+    "application/zstd",
+    "application/pdf",
+    "application/octet-stream",
+    "text/event-stream",
+)
+
+# zlib ``wbits`` per content coding: gzip container, zlib container (HTTP "deflate")
+_WBITS = {"gzip": 16 + zlib.MAX_WBITS, "deflate": zlib.MAX_WBITS}
+
+
+@order(HIGHEST_PRECEDENCE + 50)
+class CompressionFilter(OncePerRequestFilter):
+    """Compresses responses for clients that accept ``gzip`` or ``deflate``.
+
+    Skipped for ``HEAD`` requests, for statuses without a body, for partial
+    content (``206`` or a ``Content-Range``, whose byte offsets refer to the
+    unencoded body), for ``Cache-Control: no-transform``, for responses that
+    already carry a ``Content-Encoding``, for excluded media types, and for
+    bodies known to be smaller than ``min_size``.  Streamed responses without
+    a ``Content-Length`` are always compressed.
+
+    Args:
+        level: zlib compression level (1 = fastest, 9 = smallest).
+        min_size: Bodies below this many bytes are sent as they are.
+        excluded_media_types: Media types (or ``type/`` prefixes) never compressed.
+        offload_threshold: Chunks of at least this many bytes are compressed
+            in a worker thread.
+    """
+
+    def __init__(
+        self,
+        level: int = DEFAULT_LEVEL,
+        min_size: int = DEFAULT_MIN_SIZE,
+        excluded_media_types: Sequence[str] = DEFAULT_EXCLUDED_MEDIA_TYPES,
+        offload_threshold: int = DEFAULT_OFFLOAD_THRESHOLD,
+    ) -> None:
+        self._level = level
+        self._min_size = min_size
+        self._excluded = tuple(media_type.lower() for media_type in excluded_media_types)
+        self._offload_threshold = offload_threshold
+
+    async def do_filter(self, request: Request, call_next: CallNext) -> Any:
+        encoding = negotiate_encoding(request.headers.get("accept-encoding", ""))
+        response = await call_next(request)
+        if encoding is None or request.method == "HEAD" or not self._should_compress(response):
+            return response
+
+        if isinstance(response, StreamedResponse):
+            return CompressedStreamResponse(response, encoding, self._level, self._offload_threshold)
+
+        body = response.body
+        if len(body) >= self._offload_threshold:
+            compressed = await asyncio.to_thread(_compress, body, encoding, self._level)
+        else:
+            compressed = _compress(body, encoding, self._level)
+        new_response = Response(content=compressed, status_code=response.status_code)
+        new_response.raw_headers[:] = [
+            (name, value) for name, value in response.raw_headers if name.lower() != b"content-length"
+        ]
+        new_response.raw_headers.append((b"content-length", str(len(compressed)).encode("latin-1")))
+        _mark_encoded(new_response, encoding)
+        return new_response
+
+    def _should_compress(self, response: Any) -> bool:
+        status = response.status_code
+        if status < 200 or status in (204, 206, 304):
+            return False
+        headers = response.headers
+        if "content-encoding" in headers or "content-range" in headers:
+            return False
+        if "no-transform" in headers.get("cache-control", "").lower():
+            return False
+        content_type = headers.get("content-type", "").lower()
+        if content_type.startswith(self._excluded):
+            return False
+        if isinstance(response, StreamedResponse):
+            length = headers.get("content-length")
+            return length is None or int(length) >= self._min_size
+        return len(response.body) >= self._min_size
+
+
+class CompressedStreamResponse(Response):
+    """Relays a :class:`StreamedResponse`, compressing each body chunk as it arrives.
+
+    Without a ``Content-Length`` on the source, each chunk is followed by a
+    ``Z_SYNC_FLUSH`` so the client can decode it right away.
+    """
+
+    def __init__(self, source: StreamedResponse, encoding: str, level: int, offload_threshold: int) -> None:
+        # Response.__init__ would render a body and set content-length; skip it
+        self._sync_flush = "content-length" not in source.headers
+        self.status_code = source.status_code
+        self.raw_headers = [(name, value) for name, value in source.raw_headers if name.lower() != b"content-length"]
+        self.background = None
+        self._source = source
+        self._encoding = encoding
+        self._level = level
+        self._offload_threshold = offload_threshold
+        _mark_encoded(self, encoding)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+        compressor = zlib.compressobj(self._level, zlib.DEFLATED, _WBITS[self._encoding])
+        compress = functools.partial(_compress_chunk, compressor, sync_flush=self._sync_flush)
+        async for chunk in self._source.iter_body():
+            if len(chunk) >= self._offload_threshold:
+                data = await asyncio.to_thread(compress, chunk)
+            else:
+                data = compress(chunk)
+            if data:
+                await send({"type": "http.response.body", "body": data, "more_body": True})
+        await send({"type": "http.response.body", "body": compressor.flush(), "more_body": False})
+
+
+def _compress(body: bytes, encoding: str, level: int) -> bytes:
+    compressor = zlib.compressobj(level, zlib.DEFLATED, _WBITS[encoding])
+    return compressor.compress(body) + compressor.flush()
+
+
+def _compress_chunk(compressor: Any, chunk: bytes, *, sync_flush: bool) -> bytes:
+    data: bytes = compressor.compress(chunk)
+    if sync_flush:
+        data += compressor.flush(zlib.Z_SYNC_FLUSH)
+    return data
+
+
+def _mark_encoded(response: Response, encoding: str) -> None:
+    headers = response.headers
+    headers["content-encoding"] = encoding
+    vary = headers.get("vary")
+    if vary is None:
+        headers["vary"] = "accept-encoding"
+    elif "accept-encoding" not in vary.lower():
+        headers["vary"] = f"{vary}, accept-encoding"
+    # The encoded representation is not byte-identical to the one a strong ETag names
+    etag = headers.get("etag")
+    if etag is not None and etag.startswith('"'):
+        headers["etag"] = "W/" + etag
@@ -0,0 +1,159 @@
+# Copyright 2026 Firefly Software Solutions Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""AdaptiveConcurrencyFilter — sheds load once a route group is at its adaptive limit.
+
+Every route group (a set of URL patterns) has an
+:class:`~pyfly.resilience.AdaptiveConcurrencyLimiter` whose limit follows the
+group's latency.  Requests beyond the limit are answered with
+``503 Service Unavailable`` and ``Retry-After`` instead of queueing until
+they all time out.  Only ``RequestContextFilter`` and ``CompressionFilter``
+run first; transaction-ID, logging and security filters and the handler do
+no work for a rejected request.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any
+
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+
+from pyfly.container.ordering import HIGHEST_PRECEDENCE, order
+from pyfly.resilience.adaptive_limit import AdaptiveConcurrencyLimiter, AimdLimit, LimitAlgorithm
+from pyfly.web.adapters.starlette.filters import metrics_filter
+from pyfly.web.filters import OncePerRequestFilter, path_matcher
+from pyfly.web.ports.filter import CallNext
+
+DEFAULT_GROUP = "default"
+DEFAULT_CRITICAL_PATTERNS: tuple[str, ...] = ("/actuator/*", "/health", "/ready")
+MAX_CACHED_PATHS = 4096  # distinct paths whose group and priority are remembered
+
+# Statuses from downstream that mean "overloaded" rather than "done"
+_OVERLOAD_STATUSES = frozenset({503, 504})
+
+
+@order(HIGHEST_PRECEDENCE + 75)
+class AdaptiveConcurrencyFilter(OncePerRequestFilter):
+    """Rejects requests with ``503`` once their route group is at its concurrency limit.
+
+    Priority classes:
+
+    - **critical** — paths matching *critical_patterns* (health and actuator
+      by default) bypass the filter and are never shed.
+    - **low** — paths matching *low_priority_patterns* are admitted only
+      while the group is below *low_priority_share* of its limit, so they are
+      shed first.
+    - **normal** — everything else.
+
+    Latency is measured to the start of the response (the whole handler run
+    for ordinary endpoints).  Exceptions and downstream ``503``/``504``
+    responses count as overload.
+
+    Args:
+        groups: Route group name to URL patterns; the first matching group
+            wins and unmatched paths share the ``"default"`` group.
+        algorithm: Factory for each group's :class:`LimitAlgorithm`.
+        critical_patterns: Paths that are never shed.
+        low_priority_patterns: Paths that are shed first.
+        low_priority_share: Fraction of the limit low-priority requests may use.
+        retry_after: Seconds sent in ``Retry-After`` on rejection.
+    """
+
+    def __init__(
+        self,
+        groups: Mapping[str, Sequence[str]] | None = None,
+        algorithm: Callable[[], LimitAlgorithm] = AimdLimit,
+        critical_patterns: Sequence[str] = DEFAULT_CRITICAL_PATTERNS,
+        low_priority_patterns: Sequence[str] = (),
+        low_priority_share: float = 0.8,
+        retry_after: int = 1,
+    ) -> None:
+        self.exclude_patterns = list(critical_patterns)
+        self._groups = [(name, path_matcher(patterns)) for name, patterns in (groups or {}).items()]
+        self._is_low_priority = path_matcher(low_priority_patterns)
+        self._low_priority_share = low_priority_share
+        self._retry_after = str(retry_after)
+        self._algorithm = algorithm
+        self._limiters: dict[str, AdaptiveConcurrencyLimiter] = {}
+        self._classes: dict[str, tuple[str, bool]] = {}
+        # group -> (limit gauge, in-flight gauge) when prometheus_client is installed
+        self._gauges: dict[str, tuple[Any, Any]] = {}
+
+    async def do_filter(self, request: Request, call_next: CallNext) -> Any:
+        path = request.url.path
+        group, low_priority = self._classes.get(path) or self._classify(path)
+        limiter = self._limiters.get(group) or self._limiter(group)
+
+        if not limiter.try_acquire(self._low_priority_share if low_priority else 1.0):
+            if metrics_filter.REQUESTS_SHED is not None:
+                metrics_filter.REQUESTS_SHED.labels(group=group, priority="low" if low_priority else "normal").inc()
+            return self._reject(path)
+
+        gauges = self._gauges.get(group)
+        if gauges is not None:
+            gauges[1].inc()
+        start = time.perf_counter()
+        dropped: bool | None = None  # None: cancelled, no latency sample
+        try:
+            response = await call_next(request)
+            dropped = response.status_code in _OVERLOAD_STATUSES
+            return response
+        except Exception:
+            dropped = True
+            raise
+        finally:
+            rtt = None if dropped is None else time.perf_counter() - start
+            limiter.release(rtt, dropped=bool(dropped))
+            if gauges is not None:
+                gauges[0].set(limiter.limit)
+                gauges[1].dec()
+
+    def get_stats(self) -> dict[str, dict[str, int]]:
+        """Limit, in-flight and rejected counts per route group."""
+        return {
+            group: {"limit": limiter.limit, "in_flight": limiter.in_flight, "rejected": limiter.rejected}
+            for group, limiter in self._limiters.items()
+        }
+
+    def _classify(self, path: str) -> tuple[str, bool]:
+        group = next((name for name, matches in self._groups if matches(path)), DEFAULT_GROUP)
+        classification = (group, self._is_low_priority(path))
+        if len(self._classes) >= MAX_CACHED_PATHS:
+            self._classes.clear()
+        self._classes[path] = classification
+        return classification
+
+    def _limiter(self, group: str) -> AdaptiveConcurrencyLimiter:
+        limiter = self._limiters[group] = AdaptiveConcurrencyLimiter(self._algorithm())
+        if metrics_filter.CONCURRENCY_LIMIT is not None and metrics_filter.CONCURRENCY_IN_FLIGHT is not None:
+            limit_gauge = metrics_filter.CONCURRENCY_LIMIT.labels(group=group)
+            limit_gauge.set(limiter.limit)
+            self._gauges[group] = (limit_gauge, metrics_filter.CONCURRENCY_IN_FLIGHT.labels(group=group))
+        return limiter
+
+    def _reject(self, path: str) -> JSONResponse:
+        return JSONResponse(
+            {
+                "type": "about:blank",
+                "title": "Service Unavailable",
+                "status": 503,
+                "detail": "Server is at its concurrency limit; retry later",
+                "instance": path,
+            },
+            status_code=503,
+            media_type="application/problem+json",
+            headers={"Retry-After": self._retry_after},
+        )
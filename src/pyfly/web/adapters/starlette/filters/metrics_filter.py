@@ -15,6 +15,7 @@
 
 from __future__ import annotations
 
+import functools
 import time
 from typing import Any
 
@@ -25,6 +26,9 @@ except ImportError:
     Gauge = None  # type: ignore[assignment,misc]
     Histogram = None  # type: ignore[assignment,misc]
 
+from pyfly.web.adapters.starlette.filter_chain import after_response
+from pyfly.web.adapters.starlette.route_policy import MAX_CACHED_PATHS
+from pyfly.web.adapters.starlette.routing import match_route_path
 from pyfly.web.filters import OncePerRequestFilter
 from pyfly.web.ports.filter import CallNext
 
@@ -33,6 +37,10 @@ from pyfly.web.ports.filter import CallNext
 _REQUESTS_TOTAL: Counter | None = None
 _REQUEST_DURATION: Histogram | None = None
 _ACTIVE_REQUESTS: Gauge | None = None
+# Recorded by AdaptiveConcurrencyFilter
+CONCURRENCY_LIMIT: Gauge | None = None
+CONCURRENCY_IN_FLIGHT: Gauge | None = None
+REQUESTS_SHED: Counter | None = None
 
 if Counter is not None:
     _REQUESTS_TOTAL = Counter(
@@ -49,6 +57,28 @@ if Counter is not None:
         "http_active_requests",
         "Number of in-flight HTTP requests",
     )
+    CONCURRENCY_LIMIT = Gauge(
+        "http_concurrency_limit",
+        "Adaptive concurrency limit per route group",
+        ["group"],
+    )
+    CONCURRENCY_IN_FLIGHT = Gauge(
+        "http_concurrency_in_flight",
+        "Requests admitted by the adaptive concurrency limit per route group",
+        ["group"],
+    )
+    REQUESTS_SHED = Counter(
+        "http_requests_shed_total",
+        "Requests rejected by the adaptive concurrency limit",
+        ["group", "priority"],
+    )
+
+
+# Label values for requests no route matched, and for non-standard methods
+UNMATCHED_PATH = "UNMATCHED"
+OTHER_METHOD = "OTHER"
+
+_METHODS = frozenset({"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS", "TRACE", "CONNECT"})
 
 
 class MetricsFilter(OncePerRequestFilter):
@@ -58,6 +88,20 @@ class MetricsFilter(OncePerRequestFilter):
         - ``http_requests_total`` — counter by method, path, status
         - ``http_request_duration_seconds`` — histogram by method, path
         - ``http_active_requests`` — gauge of in-flight requests
+
+    ``path`` is the matched route template (``/orders/{id}``, prefixed by
+    any ``Mount`` paths), not the request path; requests no route matched
+    share the ``UNMATCHED`` value and non-standard methods are recorded as
+    ``OTHER``.  The number of time series is therefore bounded by the route
+    table, not by traffic.  The template is resolved by matching the request
+    against the app's router before the handler runs and remembered per
+    method and path.  Labelled children are created once per
+    (method, path, status) and reused.  Durations run until the response
+    body has been sent.
+
+    With ``AdaptiveConcurrencyFilter`` enabled, the same registry also carries
+    ``http_concurrency_limit`` / ``http_concurrency_in_flight`` (gauges by
+    route group) and ``http_requests_shed_total`` (counter by group, priority).
     """
 
     __pyfly_order__ = -100  # Run early, after RequestContext
@@ -71,22 +115,54 @@ class MetricsFilter(OncePerRequestFilter):
         self._requests_total: Counter = _REQUESTS_TOTAL
         self._request_duration: Histogram = _REQUEST_DURATION
         self._active_requests: Gauge = _ACTIVE_REQUESTS
+        # (method, path, status) -> (counter child, histogram child)
+        self._children: dict[tuple[str, str, str], tuple[Any, Any]] = {}
+        # (method, request path) -> route template
+        self._templates: dict[tuple[str, str], str] = {}
 
     async def do_filter(self, request: Any, call_next: CallNext) -> Any:
-        method = request.method
-        path = request.url.path
+        method = request.method if request.method in _METHODS else OTHER_METHOD
+        # Resolved before the handler runs: routing rewrites root_path in the shared scope
+        path = self._route_template(method, request.scope)
 
         self._active_requests.inc()
         start = time.perf_counter()
         try:
             response = await call_next(request)
-            status = str(response.status_code)
-            return response
-        except Exception:
-            status = "500"
+        except BaseException:
+            self._record(method, path, "500", start)
             raise
-        finally:
-            duration = time.perf_counter() - start
-            self._request_duration.labels(method=method, path=path).observe(duration)
-            self._requests_total.labels(method=method, path=path, status=status).inc()
-            self._active_requests.dec()
+        status = str(response.status_code)
+        if not after_response(functools.partial(self._record, method, path, status, start)):
+            self._record(method, path, status, start)
+        return response
+
+    def _route_template(self, method: str, scope: Any) -> str:
+        """Path template of the route that will handle *scope*, or :data:`UNMATCHED_PATH`."""
+        key = (method, scope.get("path", ""))
+        template = self._templates.get(key)
+        if template is None:
+            router = getattr(scope.get("app"), "router", None)
+            matched = match_route_path(router, scope) if router is not None else None
+            template = UNMATCHED_PATH if matched is None else matched
+            if len(self._templates) >= MAX_CACHED_PATHS:
+                self._templates.clear()
+            self._templates[key] = template
+        return template
+
+    def _record(self, method: str, path: str, status: str, start: float) -> None:
+        duration = time.perf_counter() - start
+        key = (method, path, status)
+        children = self._children.get(key) or self._create_children(key)
+        children[1].observe(duration)
+        children[0].inc()
+        self._active_requests.dec()
+
+    def _create_children(self, key: tuple[str, str, str]) -> tuple[Any, Any]:
+        method, path, status = key
+        children = (
+            self._requests_total.labels(method=method, path=path, status=status),
+            self._request_duration.labels(method=method, path=path),
+        )
+        self._children[key] = children
+        return children
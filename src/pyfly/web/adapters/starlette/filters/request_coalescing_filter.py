@@ -0,0 +1,136 @@
+# Copyright 2026 Firefly Software Solutions Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""RequestCoalescingFilter — single-flight execution of ``@coalesce_requests`` routes.
+
+The first ``GET`` for a key (path, query string and the policy's vary
+headers) runs the handler; identical requests arriving while it is in flight
+await its response bytes instead.  When a hot resource falls out of the
+cache, one handler call per key reaches the database instead of hundreds.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from pyfly.container.ordering import HIGHEST_PRECEDENCE, order
+from pyfly.web.adapters.starlette.filter_chain import StreamedResponse
+from pyfly.web.adapters.starlette.route_policy import RoutePolicies, request_key_digest
+from pyfly.web.coalescing import CoalescePolicy
+from pyfly.web.filters import OncePerRequestFilter
+from pyfly.web.ports.filter import CallNext
+
+# (status, headers, body) of a response that waiting requests replay
+_Shared = tuple[int, list[tuple[bytes, bytes]], bytes]
+
+# Per-request headers that are not copied to waiting requests
+_UNSHARED_HEADERS = frozenset({b"date"})
+
+
+@order(HIGHEST_PRECEDENCE + 380)
+class RequestCoalescingFilter(OncePerRequestFilter):
+    """Shares one in-flight execution between identical ``GET`` requests.
+
+    Ordered after the security filters (each request is authorized on its
+    own) and before ``ResponseCacheFilter``, so a cache stampede results in a
+    single lookup, handler call and store.
+
+    Waiting requests run the handler themselves when the first response
+    cannot be shared: it sets a cookie, is a stream of unknown length, is
+    larger than the policy's ``max_body_size``, or the first request was
+    cancelled.  An exception raised by the first request is raised in the
+    waiting ones too.
+    """
+
+    def __init__(self) -> None:
+        self._policies: RoutePolicies[CoalescePolicy] = RoutePolicies("__pyfly_coalesce__")
+        self._in_flight: dict[str, asyncio.Future[_Shared | None]] = {}
+        self._executions = 0
+        self._coalesced = 0
+
+    async def do_filter(self, request: Request, call_next: CallNext) -> Any:
+        if request.method != "GET":
+            return await call_next(request)
+        policy = self._policies.get(request)
+        if policy is None:
+            return await call_next(request)
+
+        key = self._key(request, policy)
+        pending = self._in_flight.get(key)
+        if pending is not None:
+            # shield: a waiter that goes away must not cancel the shared future
+            shared = await asyncio.shield(pending)
+            if shared is None:
+                return await call_next(request)
+            self._coalesced += 1
+            return _replay(shared)
+
+        future: asyncio.Future[_Shared | None] = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        self._executions += 1
+        try:
+            response = await call_next(request)
+            shared = await self._share(response, policy)
+        except Exception as exc:
+            future.set_exception(exc)
+            future.exception()  # retrieved here when nobody was waiting
+            raise
+        except BaseException:
+            future.set_result(None)  # cancelled: waiters run on their own
+            raise
+        else:
+            future.set_result(shared)
+        finally:
+            del self._in_flight[key]
+        return response if shared is None else _replay(shared)
+
+    def get_stats(self) -> dict[str, int]:
+        """Handler executions and requests served from another request's response."""
+        return {
+            "executions": self._executions,
+            "coalesced": self._coalesced,
+            "in_flight": len(self._in_flight),
+        }
+
+    @staticmethod
+    def _key(request: Request, policy: CoalescePolicy) -> str:
+        vary_values = tuple(request.headers.get(header, "") for header in policy.vary)
+        return f"{request.url.path}#{request_key_digest(request.url.query, vary_values)}"
+
+    @staticmethod
+    async def _share(response: Any, policy: CoalescePolicy) -> _Shared | None:
+        """Read *response* into a replayable form, or ``None`` if it must not be shared."""
+        if "set-cookie" in response.headers:
+            return None
+        if isinstance(response, StreamedResponse):
+            length = response.headers.get("content-length")
+            if length is None or int(length) > policy.max_body_size:
+                return None
+            body = await response.read()
+        else:
+            body = response.body
+            if len(body) > policy.max_body_size:
+                return None
+        headers = [(name, value) for name, value in response.raw_headers if name.lower() not in _UNSHARED_HEADERS]
+        return response.status_code, headers, body
+
+
+def _replay(shared: _Shared) -> Response:
+    status, headers, body = shared
+    response = Response(content=body, status_code=status)
+    response.raw_headers[:] = headers
+    return response
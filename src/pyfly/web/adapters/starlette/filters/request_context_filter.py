@@ -19,10 +19,12 @@ can access the request context.
 
 from __future__ import annotations
 
+import functools
 from typing import Any
 
 from pyfly.container.ordering import HIGHEST_PRECEDENCE
 from pyfly.context.request_context import RequestContext
+from pyfly.web.adapters.starlette.filter_chain import after_response
 from pyfly.web.filters import OncePerRequestFilter
 from pyfly.web.ports.filter import CallNext
 
@@ -31,16 +33,25 @@ class RequestContextFilter(OncePerRequestFilter):
     """Creates a fresh RequestContext for each incoming HTTP request.
 
     Honors the ``X-Request-Id`` header if present; otherwise generates a UUID.
-    Clears the context after the response is sent (even on error).
+    Once the response has been sent (even on error) the request's REQUEST-scoped
+    beans get their ``@pre_destroy`` calls and the context is cleared.  Inside
+    the filter chain this waits for a streamed body to finish, so streaming
+    handlers can keep using their REQUEST-scoped beans.
     """
 
     __pyfly_order__ = HIGHEST_PRECEDENCE
 
     async def do_filter(self, request: Any, call_next: CallNext) -> Any:
         request_id = getattr(request, "headers", {}).get("x-request-id")
-        RequestContext.init(request_id=request_id)
+        ctx = RequestContext.init(request_id=request_id)
+        if after_response(functools.partial(_teardown, ctx)):
+            return await call_next(request)
         try:
-            response = await call_next(request)
-            return response
+            return await call_next(request)
         finally:
-            RequestContext.clear()
+            await _teardown(ctx)
+
+
+async def _teardown(ctx: RequestContext) -> None:
+    await ctx.destroy_beans()
+    RequestContext.clear()
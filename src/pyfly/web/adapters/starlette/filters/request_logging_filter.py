@@ -23,6 +23,7 @@ from starlette.requests import Request
 from starlette.responses import Response
 
 from pyfly.container.ordering import HIGHEST_PRECEDENCE, order
+from pyfly.web.adapters.starlette.filter_chain import after_response
 from pyfly.web.filters import OncePerRequestFilter
 from pyfly.web.ports.filter import CallNext
 
@@ -36,7 +37,10 @@ except ImportError:
 
 @order(HIGHEST_PRECEDENCE + 200)
 class RequestLoggingFilter(OncePerRequestFilter):
-    """Logs HTTP method, path, status code, and duration for each request."""
+    """Logs HTTP method, path, status code, and duration for each request.
+
+    The duration runs until the response body has been sent.
+    """
 
     async def do_filter(self, request: Request, call_next: CallNext) -> Response:
         start = time.perf_counter()
@@ -57,13 +61,19 @@ class RequestLoggingFilter(OncePerRequestFilter):
             )
             raise
 
-        duration_ms = (time.perf_counter() - start) * 1000
-        logger.info(
-            "http_request",
-            method=request.method,
-            path=request.url.path,
-            status_code=response.status_code,
-            duration_ms=round(duration_ms, 2),
-            transaction_id=tx_id,
-        )
+        status_code = response.status_code
+
+        def _log() -> None:
+            duration_ms = (time.perf_counter() - start) * 1000
+            logger.info(
+                "http_request",
+                method=request.method,
+                path=request.url.path,
+                status_code=status_code,
+                duration_ms=round(duration_ms, 2),
+                transaction_id=tx_id,
+            )
+
+        if not after_response(_log):
+            _log()
         return response
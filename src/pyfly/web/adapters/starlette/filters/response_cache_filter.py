@@ -0,0 +1,206 @@
+# Copyright 2026 Firefly Software Solutions Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""ResponseCacheFilter — serves ``@cache_response`` routes from a cache.
+
+For ``GET``/``HEAD`` requests to a route whose handler is decorated with
+:func:`~pyfly.web.caching.cache_response`, the filter looks the response up
+in a :class:`~pyfly.cache.CacheAdapter` (or :class:`~pyfly.cache.CacheManager`
+for failover) before the handler runs.  Hits are answered from the cache —
+with ``304 Not Modified`` when ``If-None-Match`` carries the stored strong
+ETag — and misses are stored after the handler produced a cacheable ``200``.
+
+Entries are JSON-compatible dicts (the body is base64-encoded), so any cache
+backend works, including Redis.  Keys carry the method and path in clear text;
+the query string and the ``vary`` header values (credentials, by default) are
+hashed, so no token or cookie ends up in a key name.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import logging
+from typing import Any
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from pyfly.cache.manager import CacheManager
+from pyfly.cache.ports.outbound import CacheAdapter
+from pyfly.container.ordering import HIGHEST_PRECEDENCE, order
+from pyfly.web.adapters.starlette.filter_chain import StreamedResponse
+from pyfly.web.adapters.starlette.route_policy import RoutePolicies, request_key_digest
+from pyfly.web.caching import ResponseCachePolicy
+from pyfly.web.filters import OncePerRequestFilter
+from pyfly.web.http_headers import etag_matches
+from pyfly.web.ports.filter import CallNext
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "pyfly:response:"
+
+# Per-request headers that must not be replayed from the cache
+_UNCACHED_HEADERS = frozenset({b"date", b"set-cookie"})
+# Stored headers a 304 must repeat (RFC 9110 §15.4.5)
+_NOT_MODIFIED_HEADERS = frozenset({"cache-control", "content-location", "expires", "vary"})
+
+
+@order(HIGHEST_PRECEDENCE + 400)
+class ResponseCacheFilter(OncePerRequestFilter):
+    """Caches responses of ``@cache_response`` routes and answers conditional requests.
+
+    Ordered after the security filters, so authorization is enforced before
+    a cached response is served.
+    """
+
+    def __init__(self, cache: CacheAdapter | CacheManager) -> None:
+        self._cache = cache
+        # HEAD is served by GET routes, so the policy is looked up for GET
+        self._policies: RoutePolicies[ResponseCachePolicy] = RoutePolicies("__pyfly_cache_response__", method="GET")
+        self._hits = 0
+        self._misses = 0
+        self._not_modified = 0
+        self._stores = 0
+
+    async def do_filter(self, request: Request, call_next: CallNext) -> Any:
+        if request.method not in ("GET", "HEAD"):
+            return await call_next(request)
+        policy = self._policies.get(request)
+        if policy is None:
+            return await call_next(request)
+
+        key = self._cache_key(request, policy)
+        entry = await self._get(key)
+        if entry is not None:
+            self._hits += 1
+            return self._respond(request, entry, policy)
+
+        self._misses += 1
+        response = await call_next(request)
+        if request.method != "GET" or not self._is_cacheable(response, policy):
+            return response
+
+        body = await response.read() if isinstance(response, StreamedResponse) else response.body
+        entry = {
+            "status": response.status_code,
+            "headers": [
+                [name.decode("latin-1"), value.decode("latin-1")]
+                for name, value in response.raw_headers
+                if name.lower() not in _UNCACHED_HEADERS
+            ],
+            "body": base64.b64encode(body).decode("ascii"),
+            "etag": _strong_etag(body),
+        }
+        await self._put(key, entry, policy)
+        return self._respond(request, entry, policy, body=body)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Hit/miss counters since the filter was created."""
+        lookups = self._hits + self._misses
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "not_modified": self._not_modified,
+            "stores": self._stores,
+            "hit_ratio": round(self._hits / lookups, 4) if lookups else 0.0,
+        }
+
+    async def evict(self, method: str, path: str, query: str = "", vary_values: tuple[str, ...] = ()) -> bool:
+        """Remove one cached response, e.g. after the resource changed.
+
+        *vary_values* are the request's values of the route's ``vary`` headers,
+        in order.  With an in-memory cache this only affects the current
+        process; other instances keep serving their copy until it expires.
+        """
+        return await self._cache.evict(_format_key(method, path, query, vary_values))
+
+    # ------------------------------------------------------------------
+    # Cache access
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _cache_key(request: Request, policy: ResponseCachePolicy) -> str:
+        vary_values = tuple(request.headers.get(header, "") for header in policy.vary)
+        return _format_key("GET", request.url.path, request.url.query, vary_values)
+
+    async def _get(self, key: str) -> dict[str, Any] | None:
+        try:
+            entry = await self._cache.get(key)
+        except Exception:
+            logger.warning("Response cache lookup failed for '%s'", key, exc_info=True)
+            return None
+        return entry if isinstance(entry, dict) else None
+
+    async def _put(self, key: str, entry: dict[str, Any], policy: ResponseCachePolicy) -> None:
+        try:
+            await self._cache.put(key, entry, ttl=policy.ttl)
+        except Exception:
+            logger.warning("Response cache store failed for '%s'", key, exc_info=True)
+            return
+        self._stores += 1
+
+    @staticmethod
+    def _is_cacheable(response: Any, policy: ResponseCachePolicy) -> bool:
+        if response.status_code != 200 or "set-cookie" in response.headers:
+            return False
+        cache_control = response.headers.get("cache-control", "").lower()
+        if "no-store" in cache_control or "private" in cache_control:
+            return False
+        if isinstance(response, StreamedResponse):
+            # Only bodies of known size: streams (SSE, downloads) go straight through
+            length = response.headers.get("content-length")
+            return length is not None and int(length) <= policy.max_body_size
+        return len(response.body) <= policy.max_body_size
+
+    # ------------------------------------------------------------------
+    # Responses
+    # ------------------------------------------------------------------
+
+    def _respond(
+        self,
+        request: Request,
+        entry: dict[str, Any],
+        policy: ResponseCachePolicy,
+        body: bytes | None = None,
+    ) -> Response:
+        etag = entry["etag"]
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            self._not_modified += 1
+            response = Response(status_code=304)
+            response.raw_headers[:] = [
+                (name.encode("latin-1"), value.encode("latin-1"))
+                for name, value in entry["headers"]
+                if name.lower() in _NOT_MODIFIED_HEADERS
+            ]
+        else:
+            content = b""
+            if request.method != "HEAD":
+                content = base64.b64decode(entry["body"]) if body is None else body
+            response = Response(content=content, status_code=entry["status"])
+            # The stored headers keep the content-length of the full body, also for HEAD
+            response.raw_headers[:] = [
+                (name.encode("latin-1"), value.encode("latin-1")) for name, value in entry["headers"]
+            ]
+        response.headers["etag"] = etag
+        if policy.vary:
+            response.headers["vary"] = ", ".join(policy.vary)
+        return response
+
+
+def _format_key(method: str, path: str, query: str, vary_values: tuple[str, ...]) -> str:
+    return f"{KEY_PREFIX}{method}:{path}#{request_key_digest(query, vary_values)}"
+
+
+def _strong_etag(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
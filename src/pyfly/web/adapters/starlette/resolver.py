@@ -11,16 +11,31 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-"""ParameterResolver — inspects handler signatures and auto-binds from Request."""
+"""ParameterResolver — inspects handler signatures and auto-binds from Request.
+
+Each handler's signature is inspected once, when its route is registered, and
+compiled into one binder closure per parameter.  A binder reads its value
+straight from the right request attribute (``path_params``, ``query_params``,
+``headers``, ``cookies`` or the body) and runs a coercer chosen for the
+parameter's type up front, so per-request work is a dict lookup and a
+conversion — no dispatch on the binding type.
+"""
 
 from __future__ import annotations
 
+import enum
+import functools
 import inspect
+import operator
+import types
 import typing
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
-from typing import Any, get_args, get_origin
+from datetime import date, datetime, time
+from typing import Any, TypeGuard, Union, get_args, get_origin
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
+from pydantic import ValidationError as PydanticValidationError
 from starlette.requests import Request
 
 from pyfly.web.params import Body, Cookie, File, Header, PathVar, QueryParam, UploadedFile, Valid
@@ -28,6 +43,17 @@ from pyfly.web.params import Body, Cookie, File, Header, PathVar, QueryParam, Up
 _BINDING_TYPES = {PathVar, QueryParam, Body, Header, Cookie, File}
 _MISSING = object()
 
+Coercer = Callable[[str], Any]
+_Coercion = tuple[Coercer, str]
+Binder = Callable[[Request], Any]
+
+_path_params: Callable[[Request], Any] = operator.attrgetter("path_params")
+_SOURCES: dict[type, Callable[[Request], Any]] = {
+    QueryParam: operator.attrgetter("query_params"),
+    Header: operator.attrgetter("headers"),
+    Cookie: operator.attrgetter("cookies"),
+}
+
 
 @dataclass
 class ResolvedParam:
@@ -43,12 +69,15 @@ class ResolvedParam:
 class ParameterResolver:
     """Inspects a handler method's signature and resolves parameters from a Request.
 
-    At startup, inspects type hints to detect PathVar, QueryParam, Body, Header, Cookie.
-    At runtime, resolves each parameter from the Starlette Request.
+    At startup, inspects type hints to detect PathVar, QueryParam, Body, Header, Cookie
+    and compiles a binder per parameter.  At runtime, runs the binders against the
+    Starlette Request.
     """
 
     def __init__(self, handler: Any) -> None:
         self.params = self._inspect(handler)
+        self._binders = [(p.name, *self._compile(p)) for p in self.params]
+        self._all_sync = not any(is_async for _, _, is_async in self._binders)
 
     def _inspect(self, handler: Any) -> list[ResolvedParam]:
         hints = typing.get_type_hints(handler, include_extras=True)
@@ -110,86 +139,52 @@ class ParameterResolver:
 
     async def resolve(self, request: Request) -> dict[str, Any]:
         """Resolve all parameters from the request."""
+        if self._all_sync:
+            return {name: bind(request) for name, bind, _ in self._binders}
         kwargs: dict[str, Any] = {}
-        for param in self.params:
-            value = await self._resolve_one(request, param)
-            if param.validate:
-                value = self._run_validation(value, param)
-            kwargs[param.name] = value
+        for name, bind, is_async in self._binders:
+            kwargs[name] = await bind(request) if is_async else bind(request)
         return kwargs
 
-    async def _resolve_one(self, request: Request, param: ResolvedParam) -> Any:
-        if param.binding_type is Request:
-            return request
-        if param.binding_type is PathVar:
-            return self._resolve_path_var(request, param)
-        if param.binding_type is QueryParam:
-            return self._resolve_query_param(request, param)
-        if param.binding_type is Body:
-            return await self._resolve_body(request, param)
-        if param.binding_type is Header:
-            return self._resolve_header(request, param)
-        if param.binding_type is Cookie:
-            return self._resolve_cookie(request, param)
-        if param.binding_type is File:
-            return await self._resolve_file(request, param)
-        return None  # pragma: no cover
-
-    def _resolve_path_var(self, request: Request, param: ResolvedParam) -> Any:
-        raw = request.path_params.get(param.name)
-        if raw is None:
-            if param.default is not _MISSING:
-                return param.default
-            msg = f"Missing path variable: {param.name}"
-            raise ValueError(msg)
-        return self._coerce(raw, param.inner_type)
-
-    def _resolve_query_param(self, request: Request, param: ResolvedParam) -> Any:
-        raw = request.query_params.get(param.name)
-        if raw is None:
-            if param.default is not _MISSING:
-                return param.default
-            return None
-        return self._coerce(raw, param.inner_type)
-
-    async def _resolve_body(self, request: Request, param: ResolvedParam) -> Any:
-        body_bytes = await request.body()
-        if issubclass(param.inner_type, BaseModel):
-            if param.validate:
-                # Valid[Body[T]] or Valid[T]: catch Pydantic errors for structured 422
-                from pydantic import ValidationError as PydanticValidationError
-
-                from pyfly.kernel.exceptions import ValidationException
-
-                try:
-                    return param.inner_type.model_validate_json(body_bytes)
-                except PydanticValidationError as exc:
-                    errors = exc.errors()
-                    detail = "; ".join(f"{'.'.join(str(loc) for loc in e['loc'])}: {e['msg']}" for e in errors)
-                    raise ValidationException(
-                        f"Validation failed: {detail}",
-                        code="VALIDATION_ERROR",
-                        context={"errors": errors},
-                    ) from exc
-            return param.inner_type.model_validate_json(body_bytes)
-        return param.inner_type(body_bytes.decode())  # type: ignore[call-arg]
-
-    def _resolve_header(self, request: Request, param: ResolvedParam) -> Any:
-        header_name = param.name.replace("_", "-")
-        raw = request.headers.get(header_name)
-        if raw is None:
-            if param.default is not _MISSING:
-                return param.default
-            return None
-        return self._coerce(raw, param.inner_type)
-
-    def _resolve_cookie(self, request: Request, param: ResolvedParam) -> Any:
-        raw = request.cookies.get(param.name)
-        if raw is None:
-            if param.default is not _MISSING:
-                return param.default
-            return None
-        return self._coerce(raw, param.inner_type)
+    # ------------------------------------------------------------------
+    # Compilation (once per handler)
+    # ------------------------------------------------------------------
+
+    def _compile(self, param: ResolvedParam) -> tuple[Binder, bool]:
+        """Build the binder for *param*; the flag tells whether it returns an awaitable."""
+        binding = param.binding_type
+        if binding is Request:
+            return _bind_request, False
+        if binding is Body:
+            return _body_binder(param), True
+        if binding is File:
+            return functools.partial(self._resolve_file, param=param), True
+
+        if binding is PathVar:
+            source, key, multi = _path_params, param.name, False
+        else:
+            source = _SOURCES[binding]
+            key = param.name.replace("_", "-") if binding is Header else param.name
+            multi = binding is not Cookie
+        if param.default is not _MISSING:
+            on_missing = _return(param.default)
+        elif binding is PathVar:
+            on_missing = _raise_missing(f"Missing path variable: {param.name}")
+        else:
+            on_missing = _return(None)
+
+        item_type = _list_item_type(param.inner_type)
+        if item_type is not None:
+            binder = _list_binder(source, key, _build_coercer(item_type), on_missing, multi)
+        else:
+            binder = _value_binder(source, key, _build_coercer(param.inner_type), on_missing)
+
+        if param.validate and _is_model(param.inner_type):
+            binder = functools.partial(self._validated, binder, param)
+        return binder, False
+
+    def _validated(self, binder: Binder, param: ResolvedParam, request: Request) -> Any:
+        return self._run_validation(binder(request), param)
 
     def _run_validation(self, value: Any, param: ResolvedParam) -> Any:
         """Run Pydantic validation on a resolved value.
@@ -212,21 +207,7 @@ class ParameterResolver:
 
         return value
 
-    def _coerce(self, value: str, target_type: type) -> Any:
-        """Coerce a string value to the target type."""
-        if target_type is str:
-            return value
-        try:
-            return target_type(value)
-        except (ValueError, TypeError) as exc:
-            from pyfly.kernel.exceptions import InvalidRequestException
-
-            raise InvalidRequestException(
-                f"Cannot convert '{value}' to {target_type.__name__}",
-                code="TYPE_CONVERSION_ERROR",
-            ) from exc
-
-    async def _resolve_file(self, request: Request, param: ResolvedParam) -> Any:
+    async def _resolve_file(self, request: Request, *, param: ResolvedParam) -> Any:
         """Resolve a File[UploadedFile] or File[list[UploadedFile]] parameter."""
         form = await request.form()
 
@@ -252,3 +233,213 @@ class ParameterResolver:
             size=upload.size or 0,
             _file=upload.file,
         )
+
+
+# ----------------------------------------------------------------------
+# Binder factories
+# ----------------------------------------------------------------------
+
+
+def _bind_request(request: Request) -> Request:
+    return request
+
+
+def _return(value: Any) -> Callable[[], Any]:
+    return lambda: value
+
+
+def _raise_missing(message: str) -> Callable[[], Any]:
+    def on_missing() -> Any:
+        raise ValueError(message)
+
+    return on_missing
+
+
+def _value_binder(
+    source: Callable[[Request], Any], key: str, coercer: _Coercion | None, on_missing: Callable[[], Any]
+) -> Binder:
+    """Binder for a single value read with ``source(request).get(key)``."""
+    if coercer is None:
+
+        def bind_raw(request: Request) -> Any:
+            raw = source(request).get(key)
+            return on_missing() if raw is None else raw
+
+        return bind_raw
+
+    convert, type_name = coercer
+
+    def bind(request: Request) -> Any:
+        raw = source(request).get(key)
+        if raw is None:
+            return on_missing()
+        try:
+            return convert(raw)
+        except (ValueError, TypeError, KeyError) as exc:
+            raise _conversion_error(raw, type_name) from exc
+
+    return bind
+
+
+def _list_binder(
+    source: Callable[[Request], Any],
+    key: str,
+    coercer: _Coercion | None,
+    on_missing: Callable[[], Any],
+    multi: bool,
+) -> Binder:
+    """Binder for ``list[T]``: repeated keys for query/headers, comma-separated otherwise."""
+    convert, type_name = coercer or (str, "str")
+
+    def bind(request: Request) -> Any:
+        values = source(request)
+        if multi:
+            raw = values.getlist(key)
+        else:
+            joined = values.get(key)
+            raw = joined.split(",") if joined else []
+        if not raw:
+            return on_missing()
+        try:
+            return [convert(v) for v in raw]
+        except (ValueError, TypeError, KeyError) as exc:
+            raise _conversion_error(",".join(raw), type_name) from exc
+
+    return bind
+
+
+def _body_binder(param: ResolvedParam) -> Callable[[Request], Awaitable[Any]]:
+    """Binder for ``Body[T]``: JSON models and types via Pydantic, ``str``/``bytes`` as-is."""
+    inner = param.inner_type
+    if inner is bytes:
+
+        async def bind_bytes(request: Request) -> Any:
+            return await request.body()
+
+        return bind_bytes
+
+    if inner is str:
+
+        async def bind_text(request: Request) -> Any:
+            return (await request.body()).decode()
+
+        return bind_text
+
+    parse: Callable[[bytes], Any]
+    if _is_model(inner):
+        parse = inner.model_validate_json
+    else:
+        adapter = _type_adapter(inner)
+        if adapter is None:
+
+            async def bind_constructed(request: Request) -> Any:
+                return inner((await request.body()).decode())
+
+            return bind_constructed
+        parse = adapter.validate_json
+
+    if not param.validate:
+
+        async def bind(request: Request) -> Any:
+            return parse(await request.body())
+
+        return bind
+
+    async def bind_validated(request: Request) -> Any:
+        body = await request.body()
+        try:
+            return parse(body)
+        except PydanticValidationError as exc:
+            # Valid[Body[T]] or Valid[T]: structured 422
+            raise _validation_exception(exc) from exc
+
+    return bind_validated
+
+
+def _validation_exception(exc: PydanticValidationError) -> Exception:
+    from pyfly.kernel.exceptions import ValidationException
+
+    errors = exc.errors()
+    detail = "; ".join(f"{'.'.join(str(loc) for loc in e['loc'])}: {e['msg']}" for e in errors)
+    return ValidationException(
+        f"Validation failed: {detail}",
+        code="VALIDATION_ERROR",
+        context={"errors": errors},
+    )
+
+
+# ----------------------------------------------------------------------
+# Coercers
+# ----------------------------------------------------------------------
+
+
+def _build_coercer(target: Any) -> _Coercion | None:
+    """Return a ``str -> target`` converter and the type name used in errors.
+
+    ``None`` means the raw string is used as-is.
+    """
+    target = _unwrap_optional(target)
+    if target is str or target is Any:
+        return None
+    convert: Coercer
+    if isinstance(target, type) and issubclass(target, enum.Enum):
+        convert = _enum_coercer(target)
+    elif target is datetime:
+        convert = datetime.fromisoformat
+    elif target is date:
+        convert = date.fromisoformat
+    elif target is time:
+        convert = time.fromisoformat
+    else:
+        convert = target
+    return convert, getattr(target, "__name__", str(target))
+
+
+def _conversion_error(value: str, type_name: str) -> Exception:
+    from pyfly.kernel.exceptions import InvalidRequestException
+
+    return InvalidRequestException(
+        f"Cannot convert '{value}' to {type_name}",
+        code="TYPE_CONVERSION_ERROR",
+    )
+
+
+def _enum_coercer(enum_type: type[enum.Enum]) -> Coercer:
+    """Match an enum by value (compared as text), then by member name."""
+    by_text: dict[str, enum.Enum] = {str(m.value): m for m in enum_type}
+    for member in enum_type:
+        by_text.setdefault(member.name, member)
+    return by_text.__getitem__
+
+
+def _unwrap_optional(target: Any) -> Any:
+    """``T | None`` / ``Optional[T]`` -> ``T``."""
+    if get_origin(target) in (Union, types.UnionType):
+        args = [a for a in get_args(target) if a is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return target
+
+
+def _list_item_type(target: Any) -> Any | None:
+    """Item type of ``list[T]`` (``str`` for a bare ``list``), else ``None``."""
+    target = _unwrap_optional(target)
+    if target is list:
+        return str
+    if get_origin(target) is list:
+        args = get_args(target)
+        return args[0] if args else str
+    return None
+
+
+def _is_model(target: Any) -> TypeGuard[type[BaseModel]]:
+    return isinstance(target, type) and issubclass(target, BaseModel)
+
+
+@functools.cache
+def _type_adapter(target: Any) -> TypeAdapter[Any] | None:
+    """Shared ``TypeAdapter`` per type; ``None`` when Pydantic cannot build a schema for it."""
+    try:
+        return TypeAdapter(target)
+    except Exception:
+        return None
@@ -11,16 +11,41 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-"""Return value handler -- converts handler return values to Starlette Responses."""
+"""Return value handler -- converts handler return values to Starlette Responses.
+
+JSON bodies are encoded straight to bytes: pydantic-core's ``to_json`` handles
+models (with their compiled serializers), dataclasses, datetimes, UUIDs and
+enums; plain ``dict``/``list`` payloads use ``orjson`` when it is installed.
+Models are serialized by field name, never by alias, and non-finite floats
+(``NaN``/``inf``) are written as ``null`` by every backend.
+Controllers pick an encoder per route from the handler's return annotation
+once, via :func:`json_encoder_for`.
+"""
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import dataclasses
+import functools
+import typing
+from collections.abc import AsyncIterator, Callable, Iterable, Sequence
+from typing import Any, get_args, get_origin
+
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_json
+from starlette.responses import JSONResponse, Response, StreamingResponse
+
+from pyfly.web.converters import dict_to_xml_bytes, iter_xml
 
-from pydantic import BaseModel
-from starlette.responses import JSONResponse, Response
+try:
+    import orjson  # type: ignore[import-not-found,unused-ignore]
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment,unused-ignore]
 
-from pyfly.web.converters import dict_to_xml
+JsonEncoder = Callable[[Any], bytes]
+"""Turns a handler result into a JSON document."""
+
+XML_STREAM_THRESHOLD = 1000  # list results longer than this are streamed as XML
 
 
 class XMLResponse(Response):
@@ -36,19 +61,71 @@ def _wants_xml(accept: str | None) -> bool:
     return "application/xml" in accept
 
 
-def _to_json_data(result: Any) -> Any:
-    """Normalize a handler result into a JSON-serializable value."""
-    if isinstance(result, BaseModel):
-        return result.model_dump(mode="json")
-    if isinstance(result, list) and result and isinstance(result[0], BaseModel):
-        return [item.model_dump(mode="json") for item in result]
-    return result
+class EncodedJSONResponse(JSONResponse):
+    """``JSONResponse`` whose content is an already-encoded JSON document."""
+
+    def render(self, content: Any) -> bytes:
+        return content  # type: ignore[no-any-return]
+
+
+def encode_json(result: Any) -> bytes:
+    """Encode any handler result as JSON, choosing the backend by its runtime type."""
+    if (
+        orjson is not None
+        and type(result) in (dict, list)
+        and not (type(result) is list and result and isinstance(result[0], BaseModel))
+    ):
+        try:
+            encoded: bytes = orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS)
+            return encoded
+        except TypeError:
+            pass  # models nested in a dict, ints beyond 64 bits, ...
+    return to_json(result, by_alias=False, inf_nan_mode="null")
+
+
+def json_encoder_for(handler: Callable[..., Any]) -> JsonEncoder:
+    """Return the JSON encoder for *handler*'s return annotation.
+
+    ``list[Model]`` (or ``Sequence``/``Iterable`` of a model or dataclass)
+    gets a cached ``TypeAdapter`` that serializes the whole list in one call;
+    everything else uses :func:`encode_json`.
+    """
+    try:
+        annotation = typing.get_type_hints(handler).get("return")
+    except Exception:  # unresolvable forward reference
+        return encode_json
+
+    args = get_args(annotation)
+    if type(None) in args and len(args) == 2:  # Optional[X] -- None never reaches the encoder
+        annotation = args[0] if args[1] is type(None) else args[1]
+        args = get_args(annotation)
+    if get_origin(annotation) not in (list, Sequence, Iterable) or len(args) != 1:
+        return encode_json
+    item_type = args[0]
+    if isinstance(item_type, type) and (issubclass(item_type, BaseModel) or dataclasses.is_dataclass(item_type)):
+        return _list_encoder(item_type)
+    return encode_json
+
+
+@functools.cache
+def _list_encoder(item_type: type) -> JsonEncoder:
+    dump_json = TypeAdapter(list[item_type]).dump_json  # type: ignore[valid-type]
+
+    def encode_list(result: Any) -> bytes:
+        # The adapter serializes by the declared type, so subclasses (whose
+        # extra fields it would drop) and stray values take the generic path.
+        if type(result) is list and all(type(item) is item_type for item in result):
+            return dump_json(result)
+        return encode_json(result)
+
+    return encode_list
 
 
 def handle_return_value(
     result: Any,
     status_code: int = 200,
     accept: str | None = None,
+    encoder: JsonEncoder = encode_json,
 ) -> Response:
     """Convert a handler's return value into a Starlette Response.
 
@@ -56,6 +133,10 @@ def handle_return_value(
     - ``Response`` -> passed through unchanged
     - ``BaseModel`` -> JSON (or XML when *accept* contains ``application/xml``)
     - ``dict``, ``list``, ``str``, etc. -> JSON (or XML)
+
+    JSON bodies are produced by *encoder* (see :func:`json_encoder_for`).
+    XML for lists longer than :data:`XML_STREAM_THRESHOLD` is streamed in
+    chunks instead of being rendered as one document.
     """
     if result is None:
         actual_status = status_code if status_code != 200 else 204
@@ -65,7 +146,14 @@ def handle_return_value(
         return result
 
     if _wants_xml(accept):
-        xml_body = dict_to_xml(result)
-        return XMLResponse(content=xml_body, status_code=status_code)
+        if isinstance(result, list) and len(result) > XML_STREAM_THRESHOLD:
+            return StreamingResponse(_stream_xml(result), status_code=status_code, media_type="application/xml")
+        return XMLResponse(content=dict_to_xml_bytes(result), status_code=status_code)
+
+    return EncodedJSONResponse(encoder(result), status_code=status_code)
+
 
-    return JSONResponse(_to_json_data(result), status_code=status_code)
+async def _stream_xml(result: list[Any]) -> AsyncIterator[bytes]:
+    for chunk in iter_xml(result):
+        yield chunk
+        await asyncio.sleep(0)  # let other requests run between chunks
@@ -0,0 +1,81 @@
+# Copyright 2026 Firefly Software Solutions Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Route policy lookup shared by filters that act on decorated controller methods.
+
+``@cache_response`` and ``@coalesce_requests`` store a policy on the handler.
+:class:`RoutePolicies` finds the route serving a path before it runs, reads
+that policy and remembers it per path; :func:`request_key_digest` turns the
+per-request parts of a key into a fixed-length hash.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Any, Generic, TypeVar
+
+from starlette.requests import Request
+
+from pyfly.web.adapters.starlette.routing import match_endpoint
+
+P = TypeVar("P")
+
+MAX_CACHED_PATHS = 4096  # distinct paths whose route policy is remembered
+
+_UNKNOWN: Any = object()
+
+
+class RoutePolicies(Generic[P]):
+    """Per-path cache of the policy a route decorator stored on its handler.
+
+    Args:
+        attribute: Handler attribute holding the policy, e.g. ``"__pyfly_cache_response__"``.
+        method: Match routes as if the request used this method (``HEAD`` is
+            served by ``GET`` routes); ``None`` uses the request's own method.
+    """
+
+    def __init__(self, attribute: str, method: str | None = None) -> None:
+        self._attribute = attribute
+        self._method = method
+        self._policies: dict[str, P | None] = {}
+
+    def get(self, request: Request) -> P | None:
+        """The policy of the route serving *request*, or ``None`` if it has none."""
+        path = request.url.path
+        policy = self._policies.get(path, _UNKNOWN)
+        if policy is _UNKNOWN:
+            policy = self._resolve(request)
+            if len(self._policies) >= MAX_CACHED_PATHS:
+                self._policies.clear()
+            self._policies[path] = policy
+        return policy
+
+    def _resolve(self, request: Request) -> P | None:
+        router = getattr(request.scope.get("app"), "router", None)
+        if router is None:
+            return None
+        scope = request.scope if self._method is None else {**request.scope, "method": self._method}
+        return getattr(match_endpoint(router, scope), self._attribute, None)
+
+
+def request_key_digest(query: str, vary_values: tuple[str, ...]) -> str:
+    """Hash of a request's query string and vary header values, for use in a key.
+
+    Vary values are usually credentials (``Authorization``, ``Cookie``) and
+    must not appear in key names; hashing also bounds the key's length.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (query, *vary_values):
+        digest.update(part.encode("utf-8", "surrogateescape"))
+        digest.update(b"\0")
+    return digest.hexdigest()
@@ -0,0 +1,277 @@
+# Copyright 2026 Firefly Software Solutions Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Radix-tree router -- route matching that does not grow with the route table.
+
+Starlette's :class:`~starlette.routing.Router` tests every route's regex in
+declaration order.  :class:`RadixRouter` indexes ``Route`` and
+``WebSocketRoute`` paths by segment instead: static segments are dictionary
+lookups and ``{name}``, ``{name:int}``, ``{name:float}`` and ``{name:uuid}``
+segments are typed parameter nodes.  Everything else -- ``Mount``, ``Host``,
+``{name:path}``, custom convertors, parameters sharing a segment with text
+such as ``/{name}.{ext}`` -- is matched by its own regex as before.
+
+Matching semantics are Starlette's: of all routes that match, the one
+declared first wins, a path match with the wrong method yields 405, and
+``redirect_slashes`` is honoured.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from starlette._utils import get_route_path
+from starlette.convertors import Convertor, FloatConvertor, IntegerConvertor, StringConvertor, UUIDConvertor
+from starlette.datastructures import URL
+from starlette.responses import RedirectResponse
+from starlette.routing import BaseRoute, Host, Match, Mount, Route, Router, WebSocketRoute
+from starlette.types import Receive, Scope, Send
+
+_PARAM = re.compile(r"{([a-zA-Z_][a-zA-Z0-9_]*)(:[a-zA-Z_][a-zA-Z0-9_]*)?}")
+
+# Convertors whose pattern can never span a "/"
+_SEGMENT_CONVERTORS = (StringConvertor, IntegerConvertor, FloatConvertor, UUIDConvertor)
+
+
+def match_endpoint(router: Any, scope: Scope) -> Any:
+    """Return the endpoint *router* would dispatch *scope* to, or ``None``.
+
+    Lets filters read handler metadata (e.g. ``@cache_response``) before the
+    route runs.  Uses :meth:`RadixRouter.match` when available, otherwise
+    scans ``router.routes`` like Starlette does.
+    """
+    _, match, child_scope = _match(router, scope)
+    return child_scope.get("endpoint") if match is Match.FULL else None
+
+
+def match_route_path(router: Any, scope: Scope) -> str | None:
+    """Return the path template of the route *router* would dispatch *scope* to, or ``None``.
+
+    Descends into ``Mount`` and ``Host`` routes, prefixing mount paths
+    (``/v2/items/{id:int}``).  A route that matches the path but not the
+    method counts, since it is the one that answers ``405``.
+    """
+    route, match, child_scope = _match(router, scope)
+    if match is Match.NONE:
+        return None
+    if isinstance(route, Mount | Host):
+        prefix = route.path if isinstance(route, Mount) else ""
+        inner = getattr(route.app, "router", route.app)
+        if not hasattr(inner, "routes"):
+            return prefix  # a plain ASGI app, e.g. StaticFiles
+        path = match_route_path(inner, {**scope, **child_scope})
+        return None if path is None else prefix + path
+    path = getattr(route, "path", None)
+    return path if isinstance(path, str) else None
+
+
+def _match(router: Any, scope: Scope) -> tuple[Any, Match, Scope]:
+    """Like :meth:`RadixRouter.match`, scanning ``router.routes`` for other routers."""
+    match_route = getattr(router, "match", None)
+    if match_route is not None:
+        matched: tuple[Any, Match, Scope] = match_route(scope)
+        return matched
+    partial: tuple[BaseRoute, Scope] | None = None
+    for route in router.routes:
+        match, child_scope = route.matches(scope)
+        if match is Match.FULL:
+            return route, match, child_scope
+        if match is Match.PARTIAL and partial is None:
+            partial = (route, child_scope)
+    if partial is not None:
+        return partial[0], Match.PARTIAL, partial[1]
+    return None, Match.NONE, {}
+
+
+class _Leaf:
+    """A route stored at the node its last path segment leads to."""
+
+    __slots__ = ("index", "route", "names", "convertors", "methods")
+
+    def __init__(self, index: int, route: Route | WebSocketRoute, names: tuple[str, ...]) -> None:
+        self.index = index
+        self.route = route
+        self.names = names
+        self.convertors = tuple(route.param_convertors[name] for name in names)
+        self.methods = route.methods if isinstance(route, Route) else None
+
+
+class _Node:
+    __slots__ = ("static", "params", "leaves")
+
+    def __init__(self) -> None:
+        self.static: dict[str, _Node] = {}
+        # (pattern, segment check, child); one child per distinct pattern
+        self.params: list[tuple[str, Callable[[str], Any] | None, _Node]] = []
+        self.leaves: list[_Leaf] = []
+
+    def param_child(self, convertor: Convertor[Any]) -> _Node:
+        for pattern, _, child in self.params:
+            if pattern == convertor.regex:
+                return child
+        child = _Node()
+        # Non-empty is all a plain {name} needs; the others check the segment's shape.
+        check = None if isinstance(convertor, StringConvertor) else re.compile(convertor.regex).fullmatch
+        self.params.append((convertor.regex, check, child))
+        return child
+
+    def collect(self, segments: list[str], i: int, values: list[str], out: list[tuple[_Leaf, tuple[str, ...]]]) -> None:
+        if i == len(segments):
+            for leaf in self.leaves:
+                out.append((leaf, tuple(values)))
+            return
+        segment = segments[i]
+        child = self.static.get(segment)
+        if child is not None:
+            child.collect(segments, i + 1, values, out)
+        if segment:
+            for _, check, child in self.params:
+                if check is None or check(segment):
+                    values.append(segment)
+                    child.collect(segments, i + 1, values, out)
+                    values.pop()
+
+
+class RadixRouter(Router):
+    """Drop-in :class:`~starlette.routing.Router` that matches through a radix tree.
+
+    The index is built on first use and rebuilt whenever routes are added.
+    """
+
+    def __init__(self, routes: Sequence[BaseRoute] | None = None, **kwargs: Any) -> None:
+        super().__init__(routes, **kwargs)
+        self._trees: dict[str, _Node] = {}
+        self._fallback: list[tuple[int, BaseRoute]] = []
+        self._indexed = -1
+
+    # ------------------------------------------------------------------
+    # Index
+    # ------------------------------------------------------------------
+
+    def _build_index(self) -> None:
+        self._trees = {"http": _Node(), "websocket": _Node()}
+        self._fallback = []
+        for index, route in enumerate(self.routes):
+            if not self._insert(index, route):
+                self._fallback.append((index, route))
+        self._indexed = len(self.routes)
+
+    def _insert(self, index: int, route: BaseRoute) -> bool:
+        if type(route) is Route:
+            node = self._trees["http"]
+        elif type(route) is WebSocketRoute:
+            node = self._trees["websocket"]
+        else:
+            return False
+        if not route.path.startswith("/"):
+            return False
+
+        names: list[str] = []
+        for segment in route.path.split("/")[1:]:
+            if "{" not in segment:
+                node = node.static.setdefault(segment, _Node())
+                continue
+            param = _PARAM.fullmatch(segment)
+            if param is None:
+                return False
+            convertor = route.param_convertors[param.group(1)]
+            if not isinstance(convertor, _SEGMENT_CONVERTORS):
+                return False
+            names.append(param.group(1))
+            node = node.param_child(convertor)
+        node.leaves.append(_Leaf(index, route, tuple(names)))
+        return True
+
+    def match(self, scope: Scope) -> tuple[BaseRoute | None, Match, Scope]:
+        """Return the route that handles *scope*, how it matched, and its child scope."""
+        if self._indexed != len(self.routes):
+            self._build_index()
+
+        candidates: list[tuple[_Leaf, tuple[str, ...]]] = []
+        tree = self._trees.get(scope["type"])
+        if tree is not None:
+            tree.collect(get_route_path(scope).split("/")[1:], 0, [], candidates)
+            if len(candidates) > 1:
+                candidates.sort(key=lambda candidate: candidate[0].index)
+
+        partial: tuple[BaseRoute, Scope] | None = None
+        fallback = iter(self._fallback)
+        pending = next(fallback, None)
+        for leaf, values in candidates:
+            # Routes that are not in the tree keep their place in the declaration order
+            while pending is not None and pending[0] < leaf.index:
+                match, child_scope = pending[1].matches(scope)
+                if match is Match.FULL:
+                    return pending[1], match, child_scope
+                if match is Match.PARTIAL and partial is None:
+                    partial = (pending[1], child_scope)
+                pending = next(fallback, None)
+
+            path_params = dict(scope.get("path_params", {}))
+            for name, convertor, value in zip(leaf.names, leaf.convertors, values, strict=True):
+                path_params[name] = convertor.convert(value)
+            child_scope = {"endpoint": leaf.route.endpoint, "path_params": path_params}
+            if leaf.methods and scope["method"] not in leaf.methods:
+                if partial is None:
+                    partial = (leaf.route, child_scope)
+                continue
+            return leaf.route, Match.FULL, child_scope
+
+        while pending is not None:
+            match, child_scope = pending[1].matches(scope)
+            if match is Match.FULL:
+                return pending[1], match, child_scope
+            if match is Match.PARTIAL and partial is None:
+                partial = (pending[1], child_scope)
+            pending = next(fallback, None)
+
+        if partial is not None:
+            return partial[0], Match.PARTIAL, partial[1]
+        return None, Match.NONE, {}
+
+    # ------------------------------------------------------------------
+    # ASGI
+    # ------------------------------------------------------------------
+
+    async def app(self, scope: Scope, receive: Receive, send: Send) -> None:
+        assert scope["type"] in ("http", "websocket", "lifespan")
+
+        if "router" not in scope:
+            scope["router"] = self
+
+        if scope["type"] == "lifespan":
+            await self.lifespan(scope, receive, send)
+            return
+
+        route, _match, child_scope = self.match(scope)
+        if route is not None:
+            scope["route"] = route
+            scope.update(child_scope)
+            await route.handle(scope, receive, send)
+            return
+
+        route_path = get_route_path(scope)
+        if scope["type"] == "http" and self.redirect_slashes and route_path != "/":
+            redirect_scope = dict(scope)
+            if route_path.endswith("/"):
+                redirect_scope["path"] = redirect_scope["path"].rstrip("/")
+            else:
+                redirect_scope["path"] = redirect_scope["path"] + "/"
+            if self.match(redirect_scope)[0] is not None:
+                response = RedirectResponse(url=str(URL(scope=redirect_scope)))
+                await response(scope, receive, send)
+                return
+
+        await self.default(scope, receive, send)
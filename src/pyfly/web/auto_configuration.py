@@ -20,7 +20,10 @@ from pyfly.context.conditions import (
     auto_configuration,
     conditional_on_class,
     conditional_on_missing_bean,
+    conditional_on_property,
 )
+from pyfly.core.config import Config
+from pyfly.web.ports.filter import WebFilter
 from pyfly.web.ports.outbound import WebServerPort
 
 
@@ -47,3 +50,46 @@ class WebAutoConfiguration:
         from pyfly.web.adapters.starlette.adapter import StarletteWebAdapter
 
         return StarletteWebAdapter()
+
+    @bean
+    @conditional_on_property("pyfly.web.compression.enabled", having_value="true")
+    def compression_filter(self, config: Config) -> WebFilter:
+        from pyfly.web.adapters.starlette.filters.compression_filter import CompressionFilter
+
+        return CompressionFilter(
+            level=int(config.get("pyfly.web.compression.level", 6)),
+            min_size=int(config.get("pyfly.web.compression.min-size", 1024)),
+        )
+
+    @bean
+    @conditional_on_property("pyfly.web.coalescing.enabled", having_value="true")
+    def request_coalescing_filter(self) -> WebFilter:
+        """Single-flight execution for ``@coalesce_requests`` routes; a no-op for other routes."""
+        from pyfly.web.adapters.starlette.filters.request_coalescing_filter import RequestCoalescingFilter
+
+        return RequestCoalescingFilter()
+
+    @bean
+    @conditional_on_property("pyfly.web.concurrency.enabled", having_value="true")
+    def concurrency_filter(self, config: Config) -> WebFilter:
+        from pyfly.resilience.adaptive_limit import AimdLimit, GradientLimit
+        from pyfly.web.adapters.starlette.filters.concurrency_limit_filter import (
+            DEFAULT_CRITICAL_PATTERNS,
+            AdaptiveConcurrencyFilter,
+        )
+
+        prefix = "pyfly.web.concurrency"
+        algorithm_cls = (
+            GradientLimit if str(config.get(f"{prefix}.algorithm", "aimd")).lower() == "gradient" else AimdLimit
+        )
+        initial_limit = int(config.get(f"{prefix}.initial-limit", 20))
+        min_limit = int(config.get(f"{prefix}.min-limit", 1))
+        max_limit = int(config.get(f"{prefix}.max-limit", 200))
+
+        return AdaptiveConcurrencyFilter(
+            groups=config.get(f"{prefix}.groups") or None,
+            algorithm=lambda: algorithm_cls(initial_limit=initial_limit, min_limit=min_limit, max_limit=max_limit),
+            critical_patterns=config.get(f"{prefix}.critical-patterns") or DEFAULT_CRITICAL_PATTERNS,
+            low_priority_patterns=config.get(f"{prefix}.low-priority-patterns") or (),
+            retry_after=int(config.get(f"{prefix}.retry-after", 1)),
+        )
@@ -0,0 +1,73 @@
+# Copyright 2026 Firefly Software Solutions Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""HTTP response caching decorator for controller methods."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+DEFAULT_VARY: tuple[str, ...] = ("authorization", "cookie")
+DEFAULT_MAX_BODY_SIZE = 1024 * 1024  # 1 MB
+
+
+@dataclass(frozen=True)
+class ResponseCachePolicy:
+    """How responses of one route are cached (set by :func:`cache_response`)."""
+
+    ttl: timedelta | None = None
+    vary: tuple[str, ...] = DEFAULT_VARY
+    max_body_size: int = DEFAULT_MAX_BODY_SIZE
+
+
+def cache_response(
+    ttl: timedelta | None = None,
+    vary: Sequence[str] = DEFAULT_VARY,
+    max_body_size: int = DEFAULT_MAX_BODY_SIZE,
+) -> Callable[[F], F]:
+    """Cache successful ``GET`` responses of a controller method.
+
+    Enforced by ``ResponseCacheFilter``: responses are stored in the cache
+    keyed by path, query string and the *vary* request headers, served from
+    there until *ttl* expires, and answered with ``304 Not Modified`` when
+    the client's ``If-None-Match`` carries the current ETag.
+
+    Usage::
+
+        @get_mapping("/{id}")
+        @cache_response(ttl=timedelta(minutes=5), vary=["Authorization", "Accept-Language"])
+        async def get_product(self, id: PathVar[str]) -> ProductResponse: ...
+
+    Args:
+        ttl: Time-to-live of a cached response; ``None`` keeps it until evicted.
+        vary: Request headers whose values select different cached responses.
+            The default keeps callers with different credentials apart; pass
+            ``()`` only for responses that are the same for everyone.
+        max_body_size: Larger responses are passed through without caching.
+    """
+    policy = ResponseCachePolicy(
+        ttl=ttl,
+        vary=tuple(header.lower() for header in vary),
+        max_body_size=max_body_size,
+    )
+
+    def decorator(func: F) -> F:
+        func.__pyfly_cache_response__ = policy  # type: ignore[attr-defined]
+        return func
+
+    return decorator
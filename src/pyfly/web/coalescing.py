@@ -0,0 +1,67 @@
+# Copyright 2026 Firefly Software Solutions Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Request coalescing (single-flight) decorator for controller methods."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from pyfly.web.caching import DEFAULT_MAX_BODY_SIZE, DEFAULT_VARY
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+@dataclass(frozen=True)
+class CoalescePolicy:
+    """How concurrent requests to one route are coalesced (set by :func:`coalesce_requests`)."""
+
+    vary: tuple[str, ...] = DEFAULT_VARY
+    max_body_size: int = DEFAULT_MAX_BODY_SIZE
+
+
+def coalesce_requests(
+    vary: Sequence[str] = DEFAULT_VARY,
+    max_body_size: int = DEFAULT_MAX_BODY_SIZE,
+) -> Callable[[F], F]:
+    """Let concurrent identical ``GET`` requests share one handler execution.
+
+    Enforced by ``RequestCoalescingFilter``: while a request is in flight,
+    requests with the same path, query string and *vary* header values wait
+    for it and receive a copy of its response instead of running the handler
+    themselves.  Only use it on idempotent routes.
+
+    Usage::
+
+        @get_mapping("/{id}")
+        @coalesce_requests()
+        async def get_product(self, id: PathVar[str]) -> ProductResponse: ...
+
+    Args:
+        vary: Request headers whose values must match for requests to share a
+            response; same default as :func:`~pyfly.web.caching.cache_response`.
+        max_body_size: Larger responses (and streams of unknown length) are not
+            shared; waiting requests then run the handler themselves.
+    """
+    policy = CoalescePolicy(
+        vary=tuple(header.lower() for header in vary),
+        max_body_size=max_body_size,
+    )
+
+    def decorator(func: F) -> F:
+        func.__pyfly_coalesce__ = policy  # type: ignore[attr-defined]
+        return func
+
+    return decorator
@@ -16,14 +16,17 @@
 Exception converters: chain of responsibility for translating external library
 exceptions (Pydantic, JSON, SQLAlchemy, etc.) into PyFly exceptions.
 
-XML converters: dict/BaseModel to XML string and XML string to dict using
+XML converters: dict/BaseModel to XML, written directly as escaped text (or
+streamed in chunks) without building an element tree, and XML to dict using
 Python's stdlib ``xml.etree.ElementTree`` (no extra dependencies).
 """
 
 from __future__ import annotations
 
 import json
+import sys
 import xml.etree.ElementTree as ET
+from collections.abc import Iterable, Iterator
 from typing import Any, Protocol
 
 from pydantic import BaseModel, ValidationError
@@ -96,23 +99,91 @@ class JSONExceptionConverter:
 # XML data conversion utilities
 # ---------------------------------------------------------------------------
 
+XML_DECLARATION = "<?xml version='1.0' encoding='utf-8'?>\n"
 
-def _build_element(parent: ET.Element, key: str, value: Any) -> None:
-    """Recursively attach *value* to *parent* as a child element named *key*."""
+# Top-level entries are flushed by iter_xml() once this many fragments are pending
+_STREAM_FLUSH_PARTS = 4096
+
+
+def _escape_text(text: str) -> str:
+    """Escape character data the way ``ElementTree`` does (``&``, ``<``, ``>``)."""
+    if "&" in text:
+        text = text.replace("&", "&amp;")
+    if "<" in text:
+        text = text.replace("<", "&lt;")
+    if ">" in text:
+        text = text.replace(">", "&gt;")
+    return text
+
+
+def _write_element(out: list[str], key: str, value: Any) -> None:
+    """Append *value* to *out* as XML fragments of an element named *key*.
+
+    ``list`` values produce repeated sibling elements; empty elements are
+    self-closing, as ``ElementTree`` renders them.
+    """
     if isinstance(value, BaseModel):
-        _build_element(parent, key, value.model_dump(mode="json"))
-    elif isinstance(value, dict):
-        child = ET.SubElement(parent, key)
+        value = value.model_dump(mode="json")
+    if isinstance(value, dict):
+        out.append(f"<{key}>")
+        mark = len(out)
         for k, v in value.items():
-            _build_element(child, k, v)
+            _write_element(out, str(k), v)
+        if len(out) == mark:
+            out[-1] = f"<{key} />"
+        else:
+            out.append(f"</{key}>")
     elif isinstance(value, list):
         for item in value:
-            _build_element(parent, key, item)
+            _write_element(out, key, item)
     elif value is None:
-        child = ET.SubElement(parent, key)
+        out.append(f"<{key} />")
     else:
-        child = ET.SubElement(parent, key)
-        child.text = str(value)
+        text = str(value)
+        out.append(f"<{key}>{_escape_text(text)}</{key}>" if text else f"<{key} />")
+
+
+def _dict_entries(data: dict[Any, Any]) -> Iterator[tuple[str, Any]]:
+    """Yield the elements of a dict, one per item of list values (they become siblings)."""
+    for k, v in data.items():
+        key = str(k)
+        if isinstance(v, list):
+            for item in v:
+                yield key, item
+        else:
+            yield key, v
+
+
+def _iter_fragments(data: Any, root_tag: str, flush_parts: int) -> Iterator[str]:
+    """Yield the XML document for *data* in pieces of about *flush_parts* fragments."""
+    if isinstance(data, BaseModel):
+        data = data.model_dump(mode="json")
+
+    if isinstance(data, dict):
+        entries: Iterable[tuple[str, Any]] = _dict_entries(data)
+    elif isinstance(data, list):
+        entries = (("item", item) for item in data)
+    else:
+        text = str(data)
+        if text:
+            yield f"{XML_DECLARATION}<{root_tag}>{_escape_text(text)}</{root_tag}>"
+        else:
+            yield f"{XML_DECLARATION}<{root_tag} />"
+        return
+
+    out = [XML_DECLARATION, f"<{root_tag}>"]
+    empty = True
+    for key, value in entries:
+        _write_element(out, key, value)
+        if len(out) >= flush_parts:
+            empty = False
+            yield "".join(out)
+            out.clear()
+    if empty and len(out) == 2:
+        yield f"{XML_DECLARATION}<{root_tag} />"
+        return
+    out.append(f"</{root_tag}>")
+    yield "".join(out)
 
 
 def dict_to_xml(data: Any, root_tag: str = "response") -> str:
@@ -122,50 +193,51 @@ def dict_to_xml(data: Any, root_tag: str = "response") -> str:
     - ``list`` values produce repeated sibling elements named ``<item>``.
     - ``None`` produces an empty element.
     - Primitives are rendered as text content of the root element.
+
+    The document is written as escaped text fragments directly, without
+    building an ``ElementTree``; the output is the same.
     """
-    if isinstance(data, BaseModel):
-        data = data.model_dump(mode="json")
+    return "".join(_iter_fragments(data, root_tag, sys.maxsize))
 
-    root = ET.Element(root_tag)
 
-    if isinstance(data, dict):
-        for key, value in data.items():
-            _build_element(root, key, value)
-    elif isinstance(data, list):
-        for item in data:
-            _build_element(root, "item", item)
-    else:
-        root.text = str(data)
+def dict_to_xml_bytes(data: Any, root_tag: str = "response") -> bytes:
+    """Like :func:`dict_to_xml`, encoded as UTF-8 (the declared encoding)."""
+    return dict_to_xml(data, root_tag).encode("utf-8")
+
 
-    return ET.tostring(root, encoding="unicode", xml_declaration=True)
+def iter_xml(data: Any, root_tag: str = "response") -> Iterator[bytes]:
+    """Yield the UTF-8 XML document for *data* in chunks, for streaming large lists.
 
+    Each chunk holds a few thousand elements, so the whole document is never
+    held in memory at once.
+    """
+    for fragment in _iter_fragments(data, root_tag, _STREAM_FLUSH_PARTS):
+        yield fragment.encode("utf-8")
 
-def _element_to_dict(element: ET.Element) -> dict[str, Any] | str | None:
-    """Recursively convert an XML element to a dict, string, or None."""
-    children = list(element)
-    if not children:
-        return element.text
 
+def _children_to_dict(element: ET.Element) -> dict[str, Any]:
+    """Convert the children of *element*; leaves become their text (or ``None``)."""
     result: dict[str, Any] = {}
-    for child in children:
-        child_value = _element_to_dict(child)
+    for child in element:
+        value = _children_to_dict(child) if len(child) else child.text
         tag = child.tag
         if tag in result:
             existing = result[tag]
-            if isinstance(existing, list):
-                existing.append(child_value)
+            if type(existing) is list:
+                existing.append(value)
             else:
-                result[tag] = [existing, child_value]
+                result[tag] = [existing, value]
         else:
-            result[tag] = child_value
+            result[tag] = value
     return result
 
 
-def xml_to_dict(xml_string: str) -> dict[str, Any]:
+def xml_to_dict(xml_string: str | bytes) -> dict[str, Any]:
     """Parse an XML string and return a dict representation.
 
     The root element becomes the single top-level key.  Repeated sibling
     elements with the same tag name are collected into a list.
+    Raises ``xml.etree.ElementTree.ParseError`` for malformed XML.
     """
     root = ET.fromstring(xml_string)
-    return {root.tag: _element_to_dict(root)}
+    return {root.tag: _children_to_dict(root) if len(root) else root.text}
@@ -20,7 +20,10 @@ so no Starlette import is needed.
 from __future__ import annotations
 
 import abc
-from fnmatch import fnmatch
+import functools
+import re
+from collections.abc import Callable, Sequence
+from fnmatch import translate
 from typing import Any
 
 from pyfly.web.ports.filter import CallNext
@@ -37,23 +40,47 @@ class OncePerRequestFilter(abc.ABC):
             If empty (default), the filter applies to *all* paths.
         exclude_patterns: Glob patterns to exclude even if ``url_patterns``
             matches.  Checked *after* ``url_patterns``.
+        requires_response_body: Set to ``True`` if ``do_filter()`` reads or
+            replaces the response body.  Otherwise the response passed back
+            from ``call_next`` only carries status and headers, and the body
+            streams straight through to the client.
     """
 
     url_patterns: list[str] = []
     exclude_patterns: list[str] = []
+    requires_response_body: bool = False
 
     def should_not_filter(self, request: Any) -> bool:
         """Return ``True`` if the request path does not match this filter's patterns."""
-        path: str = request.url.path
+        return not self.applies_to_path(request.url.path)
 
+    def applies_to_path(self, path: str) -> bool:
+        """Whether ``url_patterns`` / ``exclude_patterns`` select *path*."""
         # If url_patterns are set, at least one must match
-        if self.url_patterns and not any(fnmatch(path, p) for p in self.url_patterns):
-            return True
+        if self.url_patterns and not path_matcher(self.url_patterns)(path):
+            return False
 
         # If any exclude pattern matches, skip
-        return bool(self.exclude_patterns and any(fnmatch(path, p) for p in self.exclude_patterns))
+        return not (self.exclude_patterns and path_matcher(self.exclude_patterns)(path))
 
     @abc.abstractmethod
     async def do_filter(self, request: Any, call_next: CallNext) -> Any:
         """Execute the filter logic.  Must call ``await call_next(request)`` to proceed."""
         ...
+
+
+def path_matcher(patterns: Sequence[str]) -> Callable[[str], bool]:
+    """Return a predicate testing a path against any of the glob *patterns*.
+
+    The patterns are compiled into one regular expression, memoized per
+    pattern tuple; matching follows :func:`fnmatch.fnmatchcase`.
+    """
+    return _compile_patterns(tuple(patterns))
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_patterns(patterns: tuple[str, ...]) -> Callable[[str], bool]:
+    if not patterns:
+        return lambda path: False
+    regex = re.compile("|".join(f"(?:{translate(p)})" for p in patterns))
+    return lambda path: regex.match(path) is not None
@@ -15,7 +15,12 @@
 
 from __future__ import annotations
 
+import gzip
+import hashlib
+import json
 import re
+from collections.abc import Callable
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast, get_args, get_origin
 
 from pydantic import BaseModel
@@ -323,3 +328,78 @@ class OpenAPIGenerator:
     def _get_list_inner_type(t: Any) -> type:
         """Extract the inner type from ``list[T]``."""
         return cast(type, get_args(t)[0])
+
+
+class OpenAPIDocument:
+    """An OpenAPI spec serialized once: JSON bytes, a strong ETag and a gzip copy.
+
+    *spec* may be a callable, in which case the spec is generated on the
+    first :meth:`render` (e.g. the first ``/openapi.json`` request) instead
+    of at startup.  :meth:`from_file` loads a document written at build time
+    by ``pyfly openapi``, so no introspection happens at all.
+
+    Usage::
+
+        document = OpenAPIDocument(lambda: OpenAPIGenerator("My API", "1.0.0").generate(metadata))
+        document.write("openapi.json")
+    """
+
+    def __init__(self, spec: dict[str, Any] | Callable[[], dict[str, Any]]) -> None:
+        self._source = spec
+        self._body: bytes | None = None
+        self._gzip_body = b""
+        self._etag = ""
+
+    @classmethod
+    def from_json(cls, body: bytes) -> OpenAPIDocument:
+        """Wrap an already-serialized OpenAPI JSON document."""
+        document = cls({})
+        document._set_body(body)
+        return document
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> OpenAPIDocument:
+        """Load a document written by :meth:`write` (or ``pyfly openapi``)."""
+        return cls.from_json(Path(path).read_bytes())
+
+    @property
+    def rendered(self) -> bool:
+        """Whether the spec has been generated and serialized."""
+        return self._body is not None
+
+    def render(self) -> None:
+        """Generate (if needed) and serialize the spec; later calls do nothing."""
+        if self._body is None:
+            spec = self._source() if callable(self._source) else self._source
+            self._set_body(json.dumps(spec, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+    @property
+    def body(self) -> bytes:
+        """The spec as compact UTF-8 JSON."""
+        self.render()
+        return cast(bytes, self._body)
+
+    @property
+    def gzip_body(self) -> bytes:
+        """:attr:`body` gzip-compressed."""
+        self.render()
+        return self._gzip_body
+
+    @property
+    def etag(self) -> str:
+        """Strong ETag of :attr:`body`."""
+        self.render()
+        return self._etag
+
+    def spec(self) -> dict[str, Any]:
+        """The spec as a dict."""
+        return cast(dict[str, Any], json.loads(self.body))
+
+    def write(self, path: str | Path) -> None:
+        """Write the serialized spec to *path*."""
+        Path(path).write_bytes(self.body)
+
+    def _set_body(self, body: bytes) -> None:
+        self._gzip_body = gzip.compress(body, compresslevel=9, mtime=0)
+        self._etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+        self._body = body
@@ -37,6 +37,12 @@ class WebFilter(Protocol):
 
     Implement this protocol directly *or* extend ``OncePerRequestFilter``
     for automatic URL-pattern matching.
+
+    The response returned by ``call_next`` exposes the status and headers
+    while its body is still streaming.  A filter that needs the body declares
+    a ``requires_response_body = True`` attribute, which makes the chain
+    buffer the responses of the paths it applies to.  Work that must wait
+    for the body to be sent goes in an ``after_response()`` callback.
     """
 
     async def do_filter(self, request: Any, call_next: CallNext) -> Any:
@@ -28,11 +28,14 @@ Usage::
                 await asyncio.sleep(1)
 """
 
+from pyfly.web.sse.broadcast import SseBroadcaster, SseSubscription
 from pyfly.web.sse.decorators import sse_mapping
 from pyfly.web.sse.response import SseEmitter, format_sse_event
 
 __all__ = [
+    "SseBroadcaster",
     "SseEmitter",
+    "SseSubscription",
     "format_sse_event",
     "sse_mapping",
 ]
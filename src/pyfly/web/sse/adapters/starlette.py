@@ -22,7 +22,8 @@ and :class:`~pyfly.websocket.adapters.starlette.WebSocketRegistrar`.
 
 from __future__ import annotations
 
-from collections.abc import AsyncGenerator
+import inspect
+from collections.abc import AsyncIterable, AsyncIterator
 from typing import Any
 
 from starlette.requests import Request
@@ -35,26 +36,27 @@ from pyfly.web.sse.response import SSE_HEADERS, format_sse_event
 _CONTROLLER_STEREOTYPES = ("rest_controller", "controller")
 
 
-async def _wrap_generator(generator: AsyncGenerator[Any, None]) -> AsyncGenerator[str, None]:
+async def _wrap_generator(generator: AsyncIterable[Any]) -> AsyncIterator[str | bytes]:
     """Wrap an async generator, auto-formatting non-string yields as SSE events."""
     async for item in generator:
-        if isinstance(item, str):
+        if isinstance(item, (str, bytes)):
             yield item
         else:
             yield format_sse_event(item)
 
 
-def make_sse_response(generator: AsyncGenerator[Any, None]) -> StreamingResponse:
+def make_sse_response(generator: AsyncIterable[Any]) -> StreamingResponse:
     """Wrap an async generator in a ``StreamingResponse`` with SSE headers.
 
-    Yields that are already strings are passed through unchanged (the caller
-    is responsible for SSE formatting).  All other yields are auto-wrapped
+    Yields that are already strings or bytes (e.g. from an
+    :class:`~pyfly.web.sse.broadcast.SseSubscription`) are passed through
+    unchanged (the caller is responsible for SSE formatting).  All other yields are auto-wrapped
     with :func:`~pyfly.web.sse.response.format_sse_event`.
 
     Parameters
     ----------
     generator:
-        An async generator producing SSE event data.
+        An async generator (or other async iterable) producing SSE event data.
 
     Returns
     -------
@@ -114,8 +116,10 @@ class SSERegistrar:
         context and a ``ParameterResolver`` is built for the handler method.
         Subsequent requests reuse the cached instances.
 
-        The handler method is expected to be an async generator.  Its return
-        value is wrapped with :func:`make_sse_response` to produce a
+        The handler method is expected to be an async generator, or a coroutine
+        returning an async iterable such as an
+        :class:`~pyfly.web.sse.broadcast.SseSubscription`.  The stream is
+        wrapped with :func:`make_sse_response` to produce a
         ``StreamingResponse`` with the correct SSE headers.
         """
         _cache: dict[str, Any] = {}
@@ -129,6 +133,8 @@ class SSERegistrar:
 
             kwargs = await _cache["resolver"].resolve(request)
             generator = _cache["method"](**kwargs)
+            if inspect.isawaitable(generator):
+                generator = await generator
             return make_sse_response(generator)
 
         return lazy_sse_endpoint
@@ -0,0 +1,233 @@
+# Copyright 2026 Firefly Software Solutions Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""SSE broadcasting — publish an event once, fan it out to every subscriber.
+
+:class:`SseBroadcaster` serializes each published event to bytes once and
+appends the same bytes to the bounded queue of every subscriber of the
+topic.  A subscriber whose client cannot keep up is handled per the
+overflow policy (its events are dropped, or it is disconnected so the
+client reconnects), and recent events are kept in a per-topic ring buffer
+so reconnecting clients resume from their ``Last-Event-ID``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator
+from typing import Any
+
+from pyfly.web.sse.response import format_sse_event
+
+DEFAULT_BUFFER_SIZE = 1000  # events kept per topic for Last-Event-ID replay
+DEFAULT_QUEUE_SIZE = 256  # undelivered events per subscriber
+
+OVERFLOW_POLICIES = ("drop", "disconnect")
+
+
+class SseSubscription:
+    """One client's stream of a topic; iterate it to receive encoded events.
+
+    Returned by :meth:`SseBroadcaster.subscribe` and meant to be returned
+    from an ``@sse_mapping`` handler.  Iteration yields every event queued
+    since the previous step in one ``bytes`` chunk and unsubscribes when the
+    stream ends or the client disconnects.
+    """
+
+    def __init__(self, broadcaster: SseBroadcaster, topic: str, queue_size: int) -> None:
+        self.topic = topic
+        self._broadcaster = broadcaster
+        self._queue_size = queue_size
+        self._events: deque[bytes] = deque()
+        self._ready = asyncio.Event()
+        self._closed = False
+        self.dropped = 0
+
+    @property
+    def closed(self) -> bool:
+        """Whether the stream has ended (or will, once its queued events are sent)."""
+        return self._closed
+
+    def close(self, discard: bool = False) -> None:
+        """End the stream once the queued events are sent (or right away with *discard*)."""
+        if discard:
+            self._events.clear()
+        if not self._closed:
+            self._closed = True
+            self._ready.set()
+            self._broadcaster._unsubscribe(self)
+
+    def _offer(self, chunk: bytes) -> bool:
+        if self._closed or len(self._events) >= self._queue_size:
+            return False
+        self._events.append(chunk)
+        self._ready.set()
+        return True
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        events = self._events
+        try:
+            while True:
+                if events:
+                    chunk = events.popleft() if len(events) == 1 else b"".join(events)
+                    events.clear()
+                    yield chunk
+                    continue
+                if self._closed:
+                    return
+                self._ready.clear()
+                await self._ready.wait()
+        finally:
+            self.close(discard=True)
+
+
+class _Topic:
+    __slots__ = ("subscribers", "history", "next_id")
+
+    def __init__(self, buffer_size: int) -> None:
+        self.subscribers: set[SseSubscription] = set()
+        self.history: deque[tuple[str, bytes]] = deque(maxlen=buffer_size)
+        self.next_id = 1
+
+
+class SseBroadcaster:
+    """Publish/subscribe hub for Server-Sent Events.
+
+    Usage::
+
+        broadcaster = SseBroadcaster()
+
+        @sse_mapping("/prices")
+        async def prices(self, last_event_id: Header[str] = ""):
+            return broadcaster.subscribe("prices", last_event_id=last_event_id or None)
+
+        broadcaster.publish("prices", {"symbol": "AAPL", "price": 150.25})
+
+    Not thread-safe: publish and subscribe from the event loop thread.
+
+    Args:
+        buffer_size: Events kept per topic for ``Last-Event-ID`` replay.
+        queue_size: Undelivered events a subscriber may hold before the
+            overflow policy applies.
+        overflow: ``"drop"`` skips events for a full subscriber;
+            ``"disconnect"`` ends its stream, so the client reconnects and
+            catches up from the replay buffer.
+    """
+
+    def __init__(
+        self,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        overflow: str = "drop",
+    ) -> None:
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {OVERFLOW_POLICIES}, got {overflow!r}")
+        self._buffer_size = buffer_size
+        self._queue_size = queue_size
+        self._disconnect = overflow == "disconnect"
+        self._topics: dict[str, _Topic] = {}
+        self._published = 0
+        self._delivered = 0
+        self._dropped = 0
+        self._disconnected = 0
+
+    def publish(
+        self,
+        topic: str,
+        data: Any,
+        event: str | None = None,
+        id: str | None = None,
+    ) -> int:
+        """Encode *data* as one SSE event and queue it for every subscriber of *topic*.
+
+        Events without an *id* are numbered per topic, so clients can resume
+        with ``Last-Event-ID``.  Returns the number of subscribers that
+        received the event.
+        """
+        state = self._topic(topic)
+        if id is None:
+            id = str(state.next_id)
+            state.next_id += 1
+        chunk = format_sse_event(data, event=event, id=id).encode("utf-8")
+        state.history.append((id, chunk))
+        self._published += 1
+
+        delivered = 0
+        for subscription in list(state.subscribers):
+            if subscription._offer(chunk):
+                delivered += 1
+            elif self._disconnect:
+                self._disconnected += 1
+                subscription.close(discard=True)
+            else:
+                self._dropped += 1
+                subscription.dropped += 1
+        self._delivered += delivered
+        return delivered
+
+    def subscribe(self, topic: str, last_event_id: str | None = None) -> SseSubscription:
+        """Subscribe to *topic*, first replaying the buffered events after *last_event_id*.
+
+        If *last_event_id* is no longer buffered, every buffered event is
+        replayed.
+        """
+        state = self._topic(topic)
+        subscription = SseSubscription(self, topic, self._queue_size)
+        if last_event_id is not None:
+            replay = list(state.history)
+            for index, (event_id, _) in enumerate(replay):
+                if event_id == last_event_id:
+                    replay = replay[index + 1 :]
+                    break
+            # Replay is bounded by the ring buffer, not the subscriber queue
+            subscription._events.extend(chunk for _, chunk in replay)
+        state.subscribers.add(subscription)
+        return subscription
+
+    def subscriber_count(self, topic: str) -> int:
+        """Number of open subscriptions to *topic*."""
+        state = self._topics.get(topic)
+        return len(state.subscribers) if state is not None else 0
+
+    def close(self, topic: str | None = None) -> None:
+        """End the streams of *topic* (or of every topic) after their queued events."""
+        if topic is None:
+            states = list(self._topics.values())
+        else:
+            states = [self._topics[topic]] if topic in self._topics else []
+        for state in states:
+            for subscription in list(state.subscribers):
+                subscription.close()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Subscriber and delivery counters since the broadcaster was created."""
+        return {
+            "topics": len(self._topics),
+            "subscribers": sum(len(state.subscribers) for state in self._topics.values()),
+            "published": self._published,
+            "delivered": self._delivered,
+            "dropped": self._dropped,
+            "disconnected": self._disconnected,
+        }
+
+    def _topic(self, topic: str) -> _Topic:
+        state = self._topics.get(topic)
+        if state is None:
+            state = self._topics[topic] = _Topic(self._buffer_size)
+        return state
+
+    def _unsubscribe(self, subscription: SseSubscription) -> None:
+        state = self._topics.get(subscription.topic)
+        if state is not None:
+            state.subscribers.discard(subscription)
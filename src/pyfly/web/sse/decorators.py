@@ -31,7 +31,8 @@ def sse_mapping(path: str = "") -> Callable[[F], F]:
 
     The decorated method should be an async generator that yields data
     objects.  Each yielded value is automatically formatted as an SSE
-    event and streamed to the client.
+    event and streamed to the client.  It may instead return an async
+    iterable such as an :class:`~pyfly.web.sse.broadcast.SseSubscription`.
 
     Usage::
 
@@ -31,8 +31,10 @@ Usage::
 
 from pyfly.websocket.decorators import websocket_mapping
 from pyfly.websocket.handler import WebSocketHandler, WebSocketSession
+from pyfly.websocket.rooms import RoomManager
 
 __all__ = [
+    "RoomManager",
     "WebSocketHandler",
     "WebSocketSession",
     "websocket_mapping",
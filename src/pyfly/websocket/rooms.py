@@ -0,0 +1,353 @@
+# Copyright 2026 Firefly Software Solutions Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""WebSocket rooms — named groups of sessions with queued, shared-frame broadcast.
+
+:class:`RoomManager` encodes a broadcast once and queues the same frame for
+every member of the room.  Each connection has its own bounded send queue
+drained by its own writer task, so one slow client never delays the others:
+when its queue is full, new messages are dropped (or the connection is
+closed, per policy).  Messages published with a ``coalesce_key`` replace a
+still-queued message with the same key, so high-rate updates (prices,
+positions, presence) deliver only the latest value to clients that lag.
+
+With a :class:`~pyfly.messaging.ports.outbound.MessageBrokerPort`, rooms span
+workers: :meth:`RoomManager.publish` goes through the broker and every
+worker delivers the message to its local members.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+from collections import deque
+from typing import Any
+
+from pydantic import BaseModel
+
+from pyfly.messaging.ports.outbound import MessageBrokerPort
+from pyfly.messaging.types import Message
+from pyfly.websocket.handler import WebSocketSession
+
+try:
+    from prometheus_client import Counter, Gauge
+except ImportError:
+    Counter = None  # type: ignore[assignment,misc]
+    Gauge = None  # type: ignore[assignment,misc]
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUEUE_SIZE = 256  # unsent messages per connection
+DEFAULT_TOPIC = "pyfly.websocket.rooms"
+SLOW_CONSUMER_CLOSE_CODE = 1013  # "Try Again Later"
+
+OVERFLOW_POLICIES = ("drop", "close")
+
+# Module-level singletons — Prometheus collectors are registered globally.
+# Every RoomManager adds and subtracts its own messages, so the gauge is the
+# process-wide total.
+_QUEUE_DEPTH: Gauge | None = None
+_MESSAGES_DROPPED: Counter | None = None
+if Gauge is not None:
+    _QUEUE_DEPTH = Gauge("websocket_send_queue_depth", "Messages queued for WebSocket clients")
+    _MESSAGES_DROPPED = Counter(
+        "websocket_messages_dropped_total",
+        "Broadcast messages not delivered to a slow WebSocket client",
+        ["reason"],
+    )
+
+
+def encode_frame(data: Any) -> str | bytes:
+    """Encode *data* as a WebSocket frame payload: ``bytes`` are sent as binary, the rest as text.
+
+    Pydantic models are serialized via ``model_dump_json()``, strings are
+    sent unchanged and everything else is JSON-encoded.
+    """
+    if isinstance(data, (str, bytes)):
+        return data
+    if isinstance(data, BaseModel):
+        return data.model_dump_json()
+    return json.dumps(data)
+
+
+class _Connection:
+    """Send queue and writer task of one session."""
+
+    __slots__ = ("session", "rooms", "queue", "pending", "ready", "writer")
+
+    def __init__(self, session: WebSocketSession) -> None:
+        self.session = session
+        self.rooms: set[str] = set()
+        # Entries are [coalesce_key, payload]; a coalesced message rewrites its payload in place
+        self.queue: deque[list[Any]] = deque()
+        self.pending: dict[str, list[Any]] = {}
+        self.ready = asyncio.Event()
+        self.writer: asyncio.Task[None] | None = None
+
+
+class RoomManager:
+    """Room membership and broadcast for :class:`~pyfly.websocket.handler.WebSocketSession`.
+
+    Usage::
+
+        rooms = RoomManager()
+
+        @websocket_mapping("/chat/{room}")
+        async def chat(self, session: WebSocketSession) -> None:
+            await session.accept()
+            room = session.path_params["room"]
+            rooms.join(room, session)
+            try:
+                while True:
+                    rooms.broadcast(room, {"text": await session.receive_text()})
+            finally:
+                rooms.leave_all(session)
+
+    Not thread-safe: use it from the event loop thread.
+
+    Args:
+        queue_size: Unsent messages a connection may hold before the overflow
+            policy applies.
+        overflow: ``"drop"`` discards new messages for a full connection;
+            ``"close"`` closes it with code 1013 so the client reconnects.
+        broker: Optional message broker that carries :meth:`publish` calls
+            to every worker; call :meth:`start` to subscribe to it.
+        topic: Broker topic used for room messages.
+    """
+
+    def __init__(
+        self,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        overflow: str = "drop",
+        broker: MessageBrokerPort | None = None,
+        topic: str = DEFAULT_TOPIC,
+    ) -> None:
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {OVERFLOW_POLICIES}, got {overflow!r}")
+        self._queue_size = queue_size
+        self._close_slow = overflow == "close"
+        self._broker = broker
+        self._topic = topic
+        self._rooms: dict[str, set[_Connection]] = {}
+        self._connections: dict[WebSocketSession, _Connection] = {}
+        self._closing: set[asyncio.Task[None]] = set()
+        self._queued = 0
+        self._sent = 0
+        self._dropped = 0
+        self._coalesced = 0
+        self._slow_closed = 0
+
+    # ------------------------------------------------------------------
+    # Membership
+    # ------------------------------------------------------------------
+
+    def join(self, room: str, session: WebSocketSession) -> None:
+        """Add *session* to *room*, starting its writer task on first join."""
+        conn = self._connections.get(session)
+        if conn is None:
+            conn = self._connections[session] = _Connection(session)
+            conn.writer = asyncio.get_running_loop().create_task(self._write(conn))
+        conn.rooms.add(room)
+        self._rooms.setdefault(room, set()).add(conn)
+
+    def leave(self, room: str, session: WebSocketSession) -> None:
+        """Remove *session* from *room*; its queue is discarded once it is in no room."""
+        conn = self._connections.get(session)
+        if conn is None or room not in conn.rooms:
+            return
+        conn.rooms.discard(room)
+        self._remove_member(room, conn)
+        if not conn.rooms:
+            self._discard(conn)
+
+    def leave_all(self, session: WebSocketSession) -> None:
+        """Remove *session* from every room, e.g. when its connection closes."""
+        conn = self._connections.get(session)
+        if conn is not None:
+            self._discard(conn)
+
+    def members(self, room: str) -> list[WebSocketSession]:
+        """Sessions currently in *room*."""
+        return [conn.session for conn in self._rooms.get(room, ())]
+
+    def rooms_of(self, session: WebSocketSession) -> set[str]:
+        """Rooms *session* has joined."""
+        conn = self._connections.get(session)
+        return set(conn.rooms) if conn is not None else set()
+
+    # ------------------------------------------------------------------
+    # Sending
+    # ------------------------------------------------------------------
+
+    def broadcast(
+        self,
+        room: str,
+        data: Any,
+        *,
+        coalesce_key: str | None = None,
+        exclude: WebSocketSession | None = None,
+    ) -> int:
+        """Queue *data* for every local member of *room*; returns how many accepted it.
+
+        The frame is encoded once and shared by all recipients.  With
+        *coalesce_key*, a message with the same key that is still queued for
+        a member is replaced instead of queueing another one.
+        """
+        members = self._rooms.get(room)
+        if not members:
+            return 0
+        payload = encode_frame(data)
+        accepted = 0
+        for conn in list(members):
+            if conn.session is not exclude and self._enqueue(conn, payload, coalesce_key):
+                accepted += 1
+        return accepted
+
+    async def publish(self, room: str, data: Any, *, coalesce_key: str | None = None) -> None:
+        """Broadcast to *room* on every worker (through the broker), or locally without one."""
+        if self._broker is None:
+            self.broadcast(room, data, coalesce_key=coalesce_key)
+            return
+        payload = encode_frame(data)
+        headers = {"room": room, "frame": "binary" if isinstance(payload, bytes) else "text"}
+        if coalesce_key is not None:
+            headers["coalesce-key"] = coalesce_key
+        value = payload if isinstance(payload, bytes) else payload.encode("utf-8")
+        await self._broker.publish(self._topic, value, headers=headers)
+
+    def _enqueue(self, conn: _Connection, payload: str | bytes, coalesce_key: str | None) -> bool:
+        if coalesce_key is not None:
+            entry = conn.pending.get(coalesce_key)
+            if entry is not None:
+                entry[1] = payload
+                self._coalesced += 1
+                return True
+        if len(conn.queue) >= self._queue_size:
+            if self._close_slow:
+                self._close_slow_consumer(conn)
+            else:
+                self._dropped += 1
+                if _MESSAGES_DROPPED is not None:
+                    _MESSAGES_DROPPED.labels(reason="queue_full").inc()
+            return False
+        entry = [coalesce_key, payload]
+        if coalesce_key is not None:
+            conn.pending[coalesce_key] = entry
+        conn.queue.append(entry)
+        self._adjust_queued(1)
+        conn.ready.set()
+        return True
+
+    async def _write(self, conn: _Connection) -> None:
+        """Writer task: send the connection's queued messages in order."""
+        session = conn.session
+        try:
+            while True:
+                while conn.queue:
+                    coalesce_key, payload = entry = conn.queue.popleft()
+                    self._adjust_queued(-1)
+                    if coalesce_key is not None and conn.pending.get(coalesce_key) is entry:
+                        del conn.pending[coalesce_key]
+                    if isinstance(payload, bytes):
+                        await session.send_bytes(payload)
+                    else:
+                        await session.send_text(payload)
+                    self._sent += 1
+                conn.ready.clear()
+                await conn.ready.wait()
+        except Exception:
+            # The client went away: stop sending to it
+            logger.debug("WebSocket send failed; removing session from its rooms", exc_info=True)
+            self._discard(conn)
+
+    def _close_slow_consumer(self, conn: _Connection) -> None:
+        self._slow_closed += 1
+        if _MESSAGES_DROPPED is not None:
+            _MESSAGES_DROPPED.labels(reason="slow_consumer_closed").inc()
+        self._discard(conn)
+        task = asyncio.get_running_loop().create_task(self._close_session(conn.session))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    @staticmethod
+    async def _close_session(session: WebSocketSession) -> None:
+        with contextlib.suppress(Exception):
+            await session.close(code=SLOW_CONSUMER_CLOSE_CODE, reason="Client too slow")
+
+    def _discard(self, conn: _Connection) -> None:
+        """Forget *conn*: leave its rooms, drop its queue and stop its writer."""
+        if self._connections.get(conn.session) is not conn:
+            return
+        del self._connections[conn.session]
+        for room in conn.rooms:
+            self._remove_member(room, conn)
+        conn.rooms.clear()
+        self._adjust_queued(-len(conn.queue))
+        conn.queue.clear()
+        conn.pending.clear()
+        if conn.writer is not None and conn.writer is not asyncio.current_task():
+            conn.writer.cancel()
+
+    def _adjust_queued(self, delta: int) -> None:
+        self._queued += delta
+        if _QUEUE_DEPTH is not None and delta:
+            _QUEUE_DEPTH.inc(delta)
+
+    def _remove_member(self, room: str, conn: _Connection) -> None:
+        members = self._rooms.get(room)
+        if members is not None:
+            members.discard(conn)
+            if not members:
+                del self._rooms[room]
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def start(self) -> None:
+        """Subscribe to the broker topic so :meth:`publish` reaches this worker's members."""
+        if self._broker is not None:
+            # No consumer group: every worker receives every room message
+            await self._broker.subscribe(self._topic, self._on_broker_message)
+
+    async def stop(self) -> None:
+        """Stop every writer task and forget all rooms."""
+        for conn in list(self._connections.values()):
+            self._discard(conn)
+        for task in list(self._closing):
+            with contextlib.suppress(Exception, asyncio.CancelledError):
+                await task
+
+    async def _on_broker_message(self, message: Message) -> None:
+        room = message.headers.get("room")
+        if room is None:
+            return
+        payload: str | bytes = message.value
+        if message.headers.get("frame") != "binary":
+            payload = message.value.decode("utf-8")
+        self.broadcast(room, payload, coalesce_key=message.headers.get("coalesce-key"))
+
+    def get_stats(self) -> dict[str, Any]:
+        """Room, queue and delivery counters since the manager was created."""
+        return {
+            "rooms": len(self._rooms),
+            "connections": len(self._connections),
+            "queued": self._queued,
+            "max_queue_depth": max((len(conn.queue) for conn in self._connections.values()), default=0),
+            "sent": self._sent,
+            "dropped": self._dropped,
+            "coalesced": self._coalesced,
+            "slow_closed": self._slow_closed,
+        }
@@ -18,7 +18,7 @@ from starlette.applications import Starlette
 from starlette.testclient import TestClient
 
 from pyfly.actuator.adapters.starlette import make_starlette_actuator_routes
-from pyfly.actuator.endpoints import BeansEndpoint, EnvEndpoint, HealthEndpoint, InfoEndpoint
+from pyfly.actuator.endpoints import BeansEndpoint, EnvEndpoint, HealthEndpoint, InfoEndpoint, StartupEndpoint
 from pyfly.actuator.health import HealthAggregator, HealthStatus
 from pyfly.actuator.registry import ActuatorRegistry
 from pyfly.container.stereotypes import component, service
@@ -57,6 +57,7 @@ def _make_test_routes(context, agg=None):
     registry.register(BeansEndpoint(context))
     registry.register(EnvEndpoint(context))
     registry.register(InfoEndpoint(context))
+    registry.register(StartupEndpoint(context))
     return make_starlette_actuator_routes(registry)
 
 
@@ -151,6 +152,37 @@ class TestInfoEndpoint:
         assert data["app"]["description"] == "A test app"
 
 
+# ---------------------------------------------------------------------------
+# /actuator/startup
+# ---------------------------------------------------------------------------
+
+
+class TestStartupEndpoint:
+    @pytest.mark.asyncio
+    async def test_returns_recorded_timeline(self):
+        cfg = Config({"pyfly": {"context": {"startup-recorder": {"enabled": True}}}})
+        ctx = ApplicationContext(cfg)
+        ctx.register_bean(DummyService)
+        await ctx.start()
+
+        client = TestClient(Starlette(routes=_make_test_routes(ctx)))
+        resp = client.get("/actuator/startup")
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["enabled"] is True
+        assert "singletons" in data["phases_ms"]
+        assert "DummyService" in data["beans"]
+        assert any(span["category"] == "phase" for span in data["spans"])
+
+    @pytest.mark.asyncio
+    async def test_disabled_without_recorder(self):
+        ctx = ApplicationContext(Config({}))
+        await ctx.start()
+
+        client = TestClient(Starlette(routes=_make_test_routes(ctx)))
+        assert "startup" not in client.get("/actuator").json()["_links"]
+
+
 # ---------------------------------------------------------------------------
 # /actuator index
 # ---------------------------------------------------------------------------
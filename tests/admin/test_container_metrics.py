@@ -15,8 +15,12 @@
 
 import time
 
+import pytest
+
 from pyfly.container.container import Container
-from pyfly.container.metrics import BeanMetrics
+from pyfly.container.metrics import BeanMetrics, MetricsMode
+from pyfly.context.application_context import ApplicationContext
+from pyfly.core.config import Config
 
 
 class TestBeanMetrics:
@@ -93,3 +97,65 @@ class TestContainerMetrics:
         c.register(Greeter)
         metrics = c.get_bean_metrics(Greeter)
         assert metrics is None
+
+
+class TestMetricsModes:
+    def test_metrics_live_on_registration(self):
+        c = Container()
+        c.register(Greeter)
+        c.resolve(Greeter)
+        assert c.get_bean_metrics(Greeter) is c._registrations[Greeter].metrics
+
+    def test_bean_metrics_are_slotted(self):
+        assert not hasattr(BeanMetrics(), "__dict__")
+
+    def test_default_mode_is_full(self):
+        assert Container().metrics_mode is MetricsMode.FULL
+
+    def test_off_records_nothing(self):
+        c = Container()
+        c.configure_metrics(MetricsMode.OFF)
+        c.register(Greeter)
+        for _ in range(5):
+            c.resolve(Greeter)
+        assert c.get_bean_metrics(Greeter) is None
+        assert c.get_all_metrics() == {}
+
+    def test_sampled_counts_one_in_interval(self):
+        c = Container()
+        c.configure_metrics(MetricsMode.SAMPLED, sample_interval=10)
+        c.register(Greeter)
+        for _ in range(100):
+            c.resolve(Greeter)
+        metrics = c.get_bean_metrics(Greeter)
+        assert metrics is not None
+        assert metrics.resolution_count == 100
+        assert metrics.created_at is not None
+
+    def test_sampled_count_is_a_multiple_of_interval(self):
+        c = Container()
+        c.configure_metrics(MetricsMode.SAMPLED, sample_interval=10)
+        c.register(Greeter)
+        for _ in range(25):
+            c.resolve(Greeter)
+        assert c.get_bean_metrics(Greeter).resolution_count == 20
+
+    def test_rejects_non_positive_interval(self):
+        with pytest.raises(ValueError):
+            Container().configure_metrics(MetricsMode.SAMPLED, sample_interval=0)
+
+    def test_context_rejects_unknown_mode(self):
+        cfg = Config({"pyfly": {"context": {"bean-metrics": {"mode": "verbose"}}}})
+        with pytest.raises(ValueError, match=r"'pyfly\.context\.bean-metrics\.mode'.*off, sampled, full"):
+            ApplicationContext(cfg)
+
+    def test_context_rejects_invalid_sample_interval(self):
+        cfg = Config({"pyfly": {"context": {"bean-metrics": {"mode": "sampled", "sample-interval": "often"}}}})
+        with pytest.raises(ValueError, match=r"'pyfly\.context\.bean-metrics\.sample-interval'"):
+            ApplicationContext(cfg)
+
+    def test_context_reads_mode_from_config(self):
+        cfg = Config({"pyfly": {"context": {"bean-metrics": {"mode": "sampled", "sample-interval": 50}}}})
+        ctx = ApplicationContext(cfg)
+        assert ctx.container.metrics_mode is MetricsMode.SAMPLED
+        assert ctx.container._sample_interval == 50
@@ -375,3 +375,30 @@ class TestNonMatchingMethods:
         with pytest.raises(ValueError):
             await svc.explode()
         assert calls == []
+
+
+# ---------------------------------------------------------------------------
+# Instance attributes
+# ---------------------------------------------------------------------------
+
+
+class TestInstanceAttributes:
+    @pytest.mark.asyncio
+    async def test_callable_assigned_to_instance_is_woven(self) -> None:
+        calls: list[str] = []
+
+        @aspect
+        class HandlerAspect:
+            @before("service.MyService.handler")
+            def on_handler(self, jp):
+                calls.append("before")
+
+        async def handler() -> str:
+            return "handled"
+
+        svc = MyService()
+        svc.handler = handler
+        weave_bean(svc, "service.MyService", _make_registry(HandlerAspect()))
+
+        assert await svc.handler() == "handled"
+        assert calls == ["before"]
@@ -64,3 +64,22 @@ class TestInMemoryCacheStats:
             mock_time.monotonic.return_value = 1e12
             keys = cache.get_keys()
             assert keys == ["fresh"]
+
+
+class TestInMemoryCacheMaxSize:
+    async def test_least_recently_used_entry_is_evicted(self):
+        cache = InMemoryCache(max_size=2)
+        await cache.put("a", 1)
+        await cache.put("b", 2)
+        assert await cache.get("a") == 1  # "b" is now the least recently used
+        await cache.put("c", 3)
+
+        assert sorted(cache.get_keys()) == ["a", "c"]
+        assert cache.get_stats()["max_size"] == 2
+
+    async def test_overwriting_a_key_does_not_evict(self):
+        cache = InMemoryCache(max_size=2)
+        await cache.put("a", 1)
+        await cache.put("b", 2)
+        await cache.put("b", 3)
+        assert sorted(cache.get_keys()) == ["a", "b"]
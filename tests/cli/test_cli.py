@@ -15,6 +15,7 @@
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
 from unittest.mock import patch
 
@@ -2148,3 +2149,53 @@ class TestNewCli:
         assert result.exit_code == 0, result.output
         assert "python -m my_tool.main" in result.output
         assert "pyfly run" not in result.output
+
+
+class TestOpenAPICommand:
+    def test_writes_document(self, tmp_path: Path, monkeypatch: object):
+        pkg = tmp_path / "src" / "docsapp"
+        pkg.mkdir(parents=True)
+        (pkg / "__init__.py").write_text("")
+        (pkg / "main.py").write_text(
+            "from pyfly.web.adapters.starlette import create_app\napp = create_app(title='Docs App', version='2.0')\n"
+        )
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.syspath_prepend(str(tmp_path / "src"))
+
+        result = CliRunner().invoke(cli, ["openapi", "--app", "docsapp.main:app", "-o", "spec.json"])
+        assert result.exit_code == 0, result.output
+        spec = json.loads((tmp_path / "spec.json").read_text())
+        assert spec["info"]["title"] == "Docs App"
+
+    def test_regenerates_instead_of_copying_served_file(self, tmp_path: Path, monkeypatch: object):
+        pkg = tmp_path / "src" / "fileddocsapp"
+        pkg.mkdir(parents=True)
+        (pkg / "__init__.py").write_text("")
+        (pkg / "main.py").write_text(
+            "from pyfly.context.application_context import ApplicationContext\n"
+            "from pyfly.core.config import Config\n"
+            "from pyfly.web.adapters.starlette import create_app\n"
+            "config = Config({'pyfly': {'web': {'docs': {'openapi-file': 'spec.json'}}}})\n"
+            "app = create_app(title='Fresh', context=ApplicationContext(config))\n"
+        )
+        (tmp_path / "spec.json").write_text(json.dumps({"openapi": "3.1.0", "info": {"title": "Stale"}, "paths": {}}))
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.syspath_prepend(str(tmp_path / "src"))
+
+        result = CliRunner().invoke(cli, ["openapi", "--app", "fileddocsapp.main:app", "-o", "spec.json"])
+        assert result.exit_code == 0, result.output
+        assert json.loads((tmp_path / "spec.json").read_text())["info"]["title"] == "Fresh"
+
+    def test_app_without_docs_fails(self, tmp_path: Path, monkeypatch: object):
+        pkg = tmp_path / "src" / "nodocsapp"
+        pkg.mkdir(parents=True)
+        (pkg / "__init__.py").write_text("")
+        (pkg / "main.py").write_text(
+            "from pyfly.web.adapters.starlette import create_app\napp = create_app(docs_enabled=False)\n"
+        )
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.syspath_prepend(str(tmp_path / "src"))
+
+        result = CliRunner().invoke(cli, ["openapi", "--app", "nodocsapp.main:app"])
+        assert result.exit_code == 1
+        assert not (tmp_path / "openapi.json").exists()
@@ -15,6 +15,8 @@
 
 from __future__ import annotations
 
+from unittest.mock import MagicMock
+
 import pytest
 
 from pyfly.config.auto import AutoConfiguration, discover_auto_configurations
@@ -124,6 +126,22 @@ class TestAutoConfigurationClasses:
 
         assert isinstance(adapter, InMemoryCache)
 
+    def test_cache_auto_config_produces_response_cache_filter(self):
+        from pyfly.cache.adapters.memory import InMemoryCache
+        from pyfly.cache.auto_configuration import CacheAutoConfiguration
+        from pyfly.web.adapters.starlette.filters import ResponseCacheFilter
+
+        instance = CacheAutoConfiguration()
+        config = Config({"pyfly": {"cache": {"response": {"max-entries": 10}}}})
+        memory_filter = instance.response_cache_filter(InMemoryCache(), config)
+        assert isinstance(memory_filter, ResponseCacheFilter)
+        assert isinstance(memory_filter._cache, InMemoryCache)
+        assert memory_filter._cache.get_stats()["max_size"] == 10
+
+        shared = MagicMock()
+        shared_filter = instance.response_cache_filter(shared, config)
+        assert shared_filter._cache is shared
+
     def test_messaging_auto_config_produces_memory_broker(self):
         from pyfly.messaging.auto_configuration import MessagingAutoConfiguration
 
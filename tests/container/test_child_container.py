@@ -0,0 +1,177 @@
+# Copyright 2026 Firefly Software Solutions Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for child containers and child application contexts."""
+
+from typing import Protocol
+
+import pytest
+
+from pyfly.container import Container, Scope
+from pyfly.container.exceptions import NoSuchBeanError
+from pyfly.context.application_context import ApplicationContext
+from pyfly.context.events import ApplicationEvent, ContextClosedEvent, app_event_listener
+from pyfly.context.lifecycle import post_construct, pre_destroy
+from pyfly.core.config import Config
+
+
+class Repository(Protocol):
+    def name(self) -> str: ...
+
+
+class RealRepository:
+    def name(self) -> str:
+        return "real"
+
+
+class FakeRepository:
+    def name(self) -> str:
+        return "fake"
+
+
+class Service:
+    def __init__(self, repo: Repository) -> None:
+        self.repo = repo
+
+
+def _parent() -> Container:
+    parent = Container()
+    parent.register(RealRepository)
+    parent.bind(Repository, RealRepository)
+    parent.register(Service)
+    return parent
+
+
+class TestCreateChild:
+    def test_shares_created_singletons(self):
+        parent = _parent()
+        service = parent.resolve(Service)
+        child = parent.create_child()
+        assert child.resolve(Service) is service
+        assert child.is_inherited(Service)
+        assert child.parent is parent
+
+    def test_overrides_stay_in_child(self):
+        parent = _parent()
+        child = parent.create_child()
+        child.register(FakeRepository)
+        child._bindings[Repository] = [FakeRepository]  # replace, not add
+
+        assert child.resolve(Service).repo.name() == "fake"
+        assert parent.resolve(Service).repo.name() == "real"
+        assert FakeRepository not in parent._registrations
+
+    def test_bind_does_not_touch_parent_bindings(self):
+        parent = _parent()
+        child = parent.create_child()
+        child.bind(Repository, FakeRepository)
+        assert parent._bindings[Repository] == [RealRepository]
+
+    def test_unresolved_parent_beans_are_created_in_child(self):
+        parent = _parent()
+        child = parent.create_child()
+        service = child.resolve(Service)
+        assert parent._registrations[Service].instance is None
+        assert not child.is_inherited(Service)
+        assert child.resolve(Service) is service
+
+    def test_unregister_in_child_keeps_parent_bean(self):
+        parent = _parent()
+        parent.resolve(Service)
+        child = parent.create_child()
+        child.unregister(Service)
+        with pytest.raises(NoSuchBeanError):
+            child.resolve(Service)
+        assert parent.resolve(Service) is not None
+
+    def test_container_bean_resolves_to_child(self):
+        parent = _parent()
+        parent.register(Container, scope=Scope.SINGLETON)
+        parent._registrations[Container].instance = parent
+        child = parent.create_child()
+        assert child.resolve(Container) is child
+        assert parent.resolve(Container) is parent
+
+
+class Cache:
+    def __init__(self) -> None:
+        self.events: list[str] = []
+
+    @post_construct
+    def init(self) -> None:
+        self.events.append("init")
+
+    @pre_destroy
+    def close(self) -> None:
+        self.events.append("close")
+
+
+class OrderPlaced(ApplicationEvent):
+    pass
+
+
+class OrderAudit:
+    def __init__(self) -> None:
+        self.events: list[str] = []
+
+    @app_event_listener
+    async def on_order(self, event: OrderPlaced) -> None:
+        self.events.append("order")
+
+    @app_event_listener
+    async def on_closed(self, event: ContextClosedEvent) -> None:
+        self.events.append("closed")
+
+
+class TestChildContext:
+    async def test_child_beans_are_initialized_on_first_use(self):
+        parent = ApplicationContext(Config({}))
+        await parent.start()
+        child = parent.create_child()
+        child.register_bean(Cache)
+
+        assert child.get_bean(Cache).events == ["init"]
+        assert Cache not in parent.container._registrations
+
+    async def test_stop_only_destroys_child_beans(self):
+        parent = ApplicationContext(Config({}))
+        parent.register_bean(Cache)
+        await parent.start()
+        shared = parent.get_bean(Cache)
+
+        child = parent.create_child()
+        assert child.get_bean(Cache) is shared
+        await child.stop()
+
+        assert shared.events == ["init"]
+
+    async def test_child_beans_receive_application_events(self):
+        parent = ApplicationContext(Config({}))
+        await parent.start()
+        child = parent.create_child()
+        child.register_bean(OrderAudit)
+        audit = child.get_bean(OrderAudit)
+
+        await child.event_bus.publish(OrderPlaced())
+        assert audit.events == ["order"]
+
+    async def test_child_events_reach_parent_but_child_close_does_not(self):
+        parent = ApplicationContext(Config({}))
+        parent.register_bean(OrderAudit)
+        await parent.start()
+        audit = parent.get_bean(OrderAudit)
+
+        child = parent.create_child()
+        await child.event_bus.publish(OrderPlaced())
+        await child.stop()
+        assert audit.events == ["order"]
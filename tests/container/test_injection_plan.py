@@ -0,0 +1,89 @@
+# Copyright 2026 Firefly Software Solutions Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for precompiled injection plans."""
+
+from typing import Annotated
+from unittest.mock import patch
+
+from pyfly.container import Autowired, Container, Qualifier, Scope
+from pyfly.container.injection_plan import compile_injection_plan
+
+
+class Clock:
+    pass
+
+
+class Store:
+    pass
+
+
+class Handler:
+    store: Store = Autowired()
+
+    def __init__(self, clock: Clock, named: Annotated[Store, Qualifier("store")], retries: int = 3) -> None:
+        self.clock = clock
+        self.named = named
+        self.retries = retries
+
+
+class TestCompileInjectionPlan:
+    def test_plan_captures_params_and_fields(self):
+        plan = compile_injection_plan(Handler)
+
+        assert [p.name for p in plan.params] == ["clock", "named", "retries"]
+        assert [p.has_default for p in plan.params] == [False, False, True]
+        assert [f.name for f in plan.fields] == ["store"]
+        assert plan.default_constructor is False
+
+    def test_default_constructor_plan(self):
+        plan = compile_injection_plan(Clock)
+
+        assert plan.default_constructor is True
+        assert plan.params == ()
+
+
+class TestContainerUsesPlan:
+    def _container(self) -> Container:
+        container = Container()
+        container.register(Clock)
+        container.register(Store, name="store")
+        container.register(Handler, scope=Scope.TRANSIENT)
+        return container
+
+    def test_plan_compiled_once_per_registration(self):
+        container = self._container()
+
+        with patch(
+            "pyfly.container.container.compile_injection_plan",
+            wraps=compile_injection_plan,
+        ) as compile_spy:
+            first = container.resolve(Handler)
+            second = container.resolve(Handler)
+
+        assert first is not second
+        assert first.clock is second.clock
+        assert first.named is first.store
+        assert first.retries == 3
+        handler_compiles = [c for c in compile_spy.call_args_list if c.args[0] is Handler]
+        assert len(handler_compiles) == 1
+
+    def test_reregister_discards_plan(self):
+        container = self._container()
+        container.resolve(Handler)
+        assert container._registrations[Handler].plan is not None
+
+        container.register(Handler, scope=Scope.TRANSIENT)
+
+        assert container._registrations[Handler].plan is None
+        assert isinstance(container.resolve(Handler), Handler)
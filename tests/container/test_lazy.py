@@ -0,0 +1,272 @@
+# Copyright 2026 Firefly Software Solutions Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for lazy singletons and LazyProxy injection."""
+
+from typing import Any
+
+import pytest
+
+from pyfly.container import Container, LazyProxy, lazy
+from pyfly.container.exceptions import BeanCreationException
+from pyfly.container.stereotypes import service
+from pyfly.context.application_context import ApplicationContext
+from pyfly.context.events import ApplicationReadyEvent, app_event_listener
+from pyfly.context.lifecycle import post_construct
+from pyfly.core.config import Config
+
+created: list[str] = []
+
+
+@lazy
+class ReportGenerator:
+    def __init__(self) -> None:
+        created.append("report")
+        self.initialized = False
+
+    @post_construct
+    def init(self) -> None:
+        self.initialized = True
+
+    def render(self) -> str:
+        return "report"
+
+
+@service
+class AdminFacade:
+    def __init__(self, reports: ReportGenerator) -> None:
+        self.reports = reports
+
+
+@service(lazy=True)
+class AuditTrail:
+    def __init__(self) -> None:
+        created.append("audit")
+
+
+@service
+class PlainService:
+    def __init__(self) -> None:
+        created.append("plain")
+
+
+@service
+class ReadyListener:
+    def __init__(self) -> None:
+        created.append("listener")
+
+    @app_event_listener
+    async def on_ready(self, event: ApplicationReadyEvent) -> None:
+        pass
+
+
+@service(lazy=False)
+class AlwaysEager:
+    def __init__(self) -> None:
+        created.append("eager")
+
+
+@lazy
+class Catalog:
+    def __init__(self) -> None:
+        self.items = ["a", "b"]
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __getitem__(self, index: int) -> str:
+        return self.items[index]
+
+    def __contains__(self, item: str) -> bool:
+        return item in self.items
+
+    async def __aenter__(self) -> "Catalog":
+        self.items.append("entered")
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        self.items.remove("entered")
+
+
+@service
+class CatalogUser:
+    def __init__(self, catalog: Catalog) -> None:
+        self.catalog = catalog
+
+
+@lazy
+class AsyncInitLazy:
+    @post_construct
+    async def init(self) -> None:
+        pass
+
+
+@service
+class AsyncInit:
+    def __init__(self) -> None:
+        created.append("async-init")
+
+    @post_construct
+    async def init(self) -> None:
+        pass
+
+
+@service
+class JobService:
+    def __init__(self) -> None:
+        created.append("job")
+
+    def run(self, job_id: str, retries: int) -> None:
+        pass
+
+
+@service
+class StartupRunner:
+    def __init__(self) -> None:
+        created.append("runner")
+
+    async def run(self, args: list[str]) -> None:
+        pass
+
+
+@service
+class LateDependency:
+    __pyfly_order__ = 10
+
+    def __init__(self) -> None:
+        created.append("late")
+
+
+@service(lazy=False)
+class AlwaysEagerWithLateDependency:
+    __pyfly_order__ = -10
+
+    def __init__(self, later: LateDependency) -> None:
+        self.later = later
+
+
+class TaggingPostProcessor:
+    def before_init(self, bean: Any, bean_name: str) -> Any:
+        return bean
+
+    def after_init(self, bean: Any, bean_name: str) -> Any:
+        bean.tagged = True
+        return bean
+
+
+class TestLazyProxy:
+    def test_dependent_receives_proxy(self):
+        created.clear()
+        container = Container()
+        container.register(ReportGenerator)
+        container.register(AdminFacade)
+
+        facade = container.resolve(AdminFacade)
+
+        assert created == []
+        assert isinstance(facade.reports, ReportGenerator)
+        assert not facade.reports.pyfly_materialized
+        assert facade.reports.render() == "report"
+        assert created == ["report"]
+        assert facade.reports.pyfly_materialized
+
+    def test_direct_resolve_returns_real_instance(self):
+        container = Container()
+        container.register(ReportGenerator)
+
+        instance = container.resolve(ReportGenerator)
+
+        assert type(instance) is ReportGenerator
+        assert not isinstance(instance, LazyProxy)
+
+    def test_proxies_share_the_singleton(self):
+        container = Container()
+        container.register(ReportGenerator)
+        container.register(AdminFacade)
+
+        facade = container.resolve(AdminFacade)
+
+        assert facade.reports == container.resolve(ReportGenerator)
+
+    async def test_implicit_special_methods_are_forwarded(self):
+        container = Container()
+        container.register(Catalog)
+        container.register(CatalogUser)
+
+        catalog = container.resolve(CatalogUser).catalog
+
+        assert not catalog.pyfly_materialized
+        assert len(catalog) == 2
+        assert list(catalog) == ["a", "b"]
+        assert catalog[1] == "b"
+        assert "a" in catalog
+        async with catalog as entered:
+            assert "entered" in entered.items
+        assert catalog.items == ["a", "b"]
+        with pytest.raises(TypeError):
+            catalog < catalog  # noqa: B015
+
+
+class TestLazyInApplicationContext:
+    async def test_lazy_bean_skipped_at_startup_and_post_processed_on_use(self):
+        created.clear()
+        ctx = ApplicationContext(Config({}))
+        ctx.register_bean(ReportGenerator)
+        ctx.register_bean(AdminFacade)
+        ctx.register_post_processor(TaggingPostProcessor())
+        await ctx.start()
+
+        assert "report" not in created
+        reports = ctx.get_bean(AdminFacade).reports
+        assert reports.initialized is True
+        assert reports.tagged is True
+        assert created.count("report") == 1
+
+    async def test_global_lazy_initialization(self):
+        created.clear()
+        ctx = ApplicationContext(Config({"pyfly": {"context": {"lazy-initialization": True}}}))
+        for cls in (AuditTrail, PlainService, ReadyListener, AlwaysEager):
+            ctx.register_bean(cls)
+        await ctx.start()
+
+        assert sorted(created) == ["eager", "listener"]
+        ctx.get_bean(PlainService)
+        assert "plain" in created
+
+    async def test_async_post_construct_is_rejected_on_lazy_beans(self):
+        ctx = ApplicationContext(Config({}))
+        ctx.register_bean(AsyncInitLazy)
+        with pytest.raises(BeanCreationException, match="async @post_construct"):
+            await ctx.start()
+
+    async def test_global_lazy_initialization_keeps_eager_only_what_needs_it(self):
+        created.clear()
+        ctx = ApplicationContext(Config({"pyfly": {"context": {"lazy-initialization": True}}}))
+        for cls in (AsyncInit, JobService, StartupRunner):
+            ctx.register_bean(cls)
+        await ctx.start()
+
+        assert sorted(created) == ["async-init", "runner"]
+
+    async def test_global_lazy_initialization_applies_to_later_dependencies(self):
+        created.clear()
+        ctx = ApplicationContext(Config({"pyfly": {"context": {"lazy-initialization": True}}}))
+        ctx.register_bean(LateDependency)
+        ctx.register_bean(AlwaysEagerWithLateDependency)
+        await ctx.start()
+
+        assert created == []
+        assert not ctx.get_bean(AlwaysEagerWithLateDependency).later.pyfly_materialized
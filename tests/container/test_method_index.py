@@ -0,0 +1,122 @@
+# Copyright 2026 Firefly Software Solutions Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the per-class decorated-method index."""
+
+from pyfly.container.method_index import marked_methods, method_index, public_methods
+from pyfly.context.events import app_event_listener
+from pyfly.context.lifecycle import post_construct, pre_destroy
+from pyfly.scheduling.decorators import scheduled
+from pyfly.scheduling.task_scheduler import TaskScheduler
+
+
+class Base:
+    @post_construct
+    def init_base(self) -> None:
+        pass
+
+    @pre_destroy
+    def close(self) -> None:
+        pass
+
+
+class Child(Base):
+    property_reads = 0
+
+    @property
+    def expensive(self) -> int:
+        type(self).property_reads += 1
+        return 42
+
+    @app_event_listener
+    async def on_event(self, event: object) -> None:
+        pass
+
+    @app_event_listener
+    async def _private_listener(self, event: object) -> None:
+        pass
+
+    def close(self) -> None:  # overrides the @pre_destroy method without the marker
+        pass
+
+    @staticmethod
+    def helper() -> None:
+        pass
+
+    @scheduled(fixed_rate="1s")
+    async def tick(self) -> None:
+        pass
+
+
+class TestMethodIndex:
+    def test_groups_names_by_marker(self):
+        index = method_index(Child)
+        assert index.names("__pyfly_post_construct__") == ("init_base",)
+        assert index.names("__pyfly_scheduled__") == ("tick",)
+
+    def test_private_names_are_opt_in(self):
+        index = method_index(Child)
+        assert index.names("__pyfly_app_event_listener__") == ("on_event",)
+        assert index.names("__pyfly_app_event_listener__", include_private=True) == (
+            "_private_listener",
+            "on_event",
+        )
+
+    def test_override_without_marker_hides_base_marker(self):
+        assert method_index(Child).names("__pyfly_pre_destroy__") == ()
+        assert method_index(Base).names("__pyfly_pre_destroy__") == ("close",)
+
+    def test_public_methods_exclude_properties(self):
+        methods = method_index(Child).public_methods
+        assert "expensive" not in methods
+        assert {"close", "helper", "init_base", "on_event", "tick"} <= set(methods)
+
+    def test_is_memoized_per_class(self):
+        assert method_index(Child) is method_index(Child)
+
+
+class TestMarkedMethods:
+    def test_returns_bound_methods_without_touching_properties(self):
+        Child.property_reads = 0
+        bean = Child()
+        methods = marked_methods(bean, "__pyfly_post_construct__")
+        assert methods == [("init_base", bean.init_base)]
+        assert Child.property_reads == 0
+
+    def test_returns_instance_overrides(self):
+        bean = Child()
+        replacement = bean.on_event
+        bean.on_event = replacement  # e.g. replaced by AOP weaving
+        assert marked_methods(bean, "__pyfly_app_event_listener__") == [("on_event", replacement)]
+
+    def test_scheduler_discovery_uses_index(self):
+        Child.property_reads = 0
+        scheduler = TaskScheduler()
+        assert scheduler.discover([Child()]) == 1
+        assert Child.property_reads == 0
+
+    def test_includes_functions_assigned_to_the_instance(self):
+        @app_event_listener
+        async def on_other(event: object) -> None:
+            pass
+
+        bean = Child()
+        bean.on_other = on_other
+        bean.label = "not a method"
+
+        assert marked_methods(bean, "__pyfly_app_event_listener__") == [
+            ("on_event", bean.on_event),
+            ("on_other", on_other),
+        ]
+        assert "on_other" in public_methods(bean)
+        assert "label" not in public_methods(bean)
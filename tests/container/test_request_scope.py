@@ -17,6 +17,7 @@ import pytest
 
 from pyfly.container.container import Container
 from pyfly.container.types import Scope
+from pyfly.context.lifecycle import pre_destroy
 from pyfly.context.request_context import RequestContext
 
 
@@ -75,3 +76,88 @@ class TestRequestScope:
 
         with pytest.raises(RuntimeError, match="No active request context"):
             container.resolve(DummyRequestService)
+
+
+destroyed: list[str] = []
+
+
+class AuditTrail:
+    @pre_destroy
+    def flush(self) -> None:
+        destroyed.append("audit")
+
+
+class UnitOfWork:
+    def __init__(self, audit: AuditTrail) -> None:
+        self.audit = audit
+
+    @pre_destroy
+    async def close(self) -> None:
+        destroyed.append("uow")
+
+
+class FailingCleanup:
+    @pre_destroy
+    def close(self) -> None:
+        raise RuntimeError("boom")
+
+
+class TestRequestBeanStorage:
+    """REQUEST-scoped instances live in a type-keyed map, not in the attributes."""
+
+    def test_beans_not_stored_in_attributes(self):
+        container = Container()
+        container.register(DummyRequestService, scope=Scope.REQUEST)
+
+        ctx = RequestContext.init()
+        try:
+            instance = container.resolve(DummyRequestService)
+            assert ctx.get_bean(DummyRequestService) is instance
+            assert ctx._attributes == {}
+        finally:
+            RequestContext.clear()
+
+    def test_bean_map_filled_on_first_resolve(self):
+        container = Container()
+        container.register(DummyRequestService, scope=Scope.REQUEST)
+
+        ctx = RequestContext.init()
+        try:
+            assert ctx._beans == {}
+            instance = container.resolve(DummyRequestService)
+            assert ctx._beans == {DummyRequestService: instance}
+        finally:
+            RequestContext.clear()
+
+    async def test_destroy_beans_runs_pre_destroy_in_reverse_creation_order(self):
+        destroyed.clear()
+        container = Container()
+        container.register(AuditTrail, scope=Scope.REQUEST)
+        container.register(UnitOfWork, scope=Scope.REQUEST)
+
+        ctx = RequestContext.init()
+        try:
+            container.resolve(UnitOfWork)  # creates AuditTrail first
+            await ctx.destroy_beans()
+        finally:
+            RequestContext.clear()
+
+        assert destroyed == ["uow", "audit"]
+        assert ctx.get_bean(UnitOfWork) is None
+
+    async def test_destroy_failures_do_not_stop_other_beans(self, caplog):
+        destroyed.clear()
+        container = Container()
+        container.register(AuditTrail, scope=Scope.REQUEST)
+        container.register(FailingCleanup, scope=Scope.REQUEST)
+
+        ctx = RequestContext.init()
+        try:
+            container.resolve(AuditTrail)
+            container.resolve(FailingCleanup)
+            await ctx.destroy_beans()
+        finally:
+            RequestContext.clear()
+
+        assert destroyed == ["audit"]
+        assert "pre_destroy_failed" in caplog.text
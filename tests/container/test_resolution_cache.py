@@ -0,0 +1,125 @@
+# Copyright 2026 Firefly Software Solutions Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the memoized interface-to-implementation resolution table."""
+
+import pytest
+
+from pyfly.container import Container, NoSuchBeanError, NoUniqueBeanError, primary
+from pyfly.context.application_context import ApplicationContext
+from pyfly.core.config import Config
+
+
+class Notifier:
+    pass
+
+
+class EmailNotifier(Notifier):
+    pass
+
+
+@primary
+class SmsNotifier(Notifier):
+    pass
+
+
+class PushNotifier(Notifier):
+    pass
+
+
+class TestResolutionCache:
+    def test_interface_lookup_is_memoized(self):
+        container = Container()
+        container.register(EmailNotifier)
+        container.bind(Notifier, EmailNotifier)
+
+        container.resolve(Notifier)
+
+        assert container._resolution_cache[Notifier] is container._registrations[EmailNotifier]
+
+    def test_bind_invalidates_cached_lookup(self):
+        container = Container()
+        container.register(EmailNotifier)
+        container.register(SmsNotifier)
+        container.bind(Notifier, EmailNotifier)
+        assert isinstance(container.resolve(Notifier), EmailNotifier)
+
+        container.bind(Notifier, SmsNotifier)
+
+        assert isinstance(container.resolve(Notifier), SmsNotifier)
+
+    def test_resolve_all_reflects_new_bindings(self):
+        container = Container()
+        container.register(EmailNotifier)
+        container.register(PushNotifier)
+        container.bind(Notifier, EmailNotifier)
+        assert len(container.resolve_all(Notifier)) == 1
+
+        container.bind(Notifier, PushNotifier)
+
+        assert [type(n) for n in container.resolve_all(Notifier)] == [EmailNotifier, PushNotifier]
+
+    def test_ambiguous_lookup_is_not_cached(self):
+        container = Container()
+        container.register(EmailNotifier)
+        container.register(PushNotifier)
+        container.bind(Notifier, EmailNotifier)
+        container.bind(Notifier, PushNotifier)
+
+        with pytest.raises(NoUniqueBeanError):
+            container.resolve(Notifier)
+        assert Notifier not in container._resolution_cache
+
+    def test_unregister_invalidates_cached_lookup(self):
+        container = Container()
+        container.register(EmailNotifier, name="email")
+        container.resolve(EmailNotifier)
+
+        container.unregister(EmailNotifier)
+
+        with pytest.raises(NoSuchBeanError):
+            container.resolve(EmailNotifier)
+        assert not container.contains("email")
+
+
+class TestSealedContainer:
+    def test_seal_precomputes_every_lookup(self):
+        container = Container()
+        container.register(EmailNotifier)
+        container.register(SmsNotifier)
+        container.bind(Notifier, EmailNotifier)
+        container.bind(Notifier, SmsNotifier)
+
+        container.seal()
+
+        assert container.sealed
+        assert container._resolution_cache[Notifier] is container._registrations[SmsNotifier]
+        assert len(container._resolve_all_cache[Notifier]) == 2
+
+    def test_registration_after_seal_unseals(self):
+        container = Container()
+        container.register(EmailNotifier)
+        container.seal()
+
+        container.register(PushNotifier)
+
+        assert not container.sealed
+        assert isinstance(container.resolve(PushNotifier), PushNotifier)
+
+    async def test_application_context_seals_after_start(self):
+        ctx = ApplicationContext(Config({}))
+        ctx.register_bean(EmailNotifier)
+
+        await ctx.start()
+
+        assert ctx.container.sealed
@@ -0,0 +1,313 @@
+# Copyright 2026 Firefly Software Solutions Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the build-time component index."""
+
+import json
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from pyfly.cli.main import cli
+from pyfly.container import Container
+from pyfly.context.component_index import (
+    INDEX_VERSION,
+    ComponentIndex,
+    build_component_index,
+    load_component_index,
+    register_from_index,
+)
+from pyfly.context.environment import Environment
+from pyfly.core.application import PyFlyApplication, pyfly_application
+from pyfly.core.config import Config
+
+_MODULES = {
+    "__init__.py": "",
+    "ports.py": """
+        from typing import Protocol
+
+        class Greeter(Protocol):
+            def greet(self) -> str: ...
+    """,
+    "services.py": """
+        from pyfly.container import service
+        from pyfly.context.conditions import conditional_on_class, conditional_on_property
+        from idxapp.ports import Greeter
+
+        @service
+        class EnglishGreeter(Greeter):
+            def greet(self) -> str:
+                return "hello"
+
+        @service(profile="dev")
+        class DevOnlyService:
+            pass
+
+        @conditional_on_property("feature.enabled", having_value="true")
+        @service
+        class FeatureService:
+            pass
+
+        @conditional_on_class("module_that_does_not_exist_anywhere")
+        @service
+        class MissingDependencyService:
+            pass
+    """,
+    "late.py": """
+        from pyfly.container import service
+
+        @service
+        class LateService:
+            pass
+    """,
+}
+
+
+@pytest.fixture
+def idxapp(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    package = tmp_path / "idxapp"
+    package.mkdir()
+    for name, source in _MODULES.items():
+        (package / name).write_text(textwrap.dedent(source))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.chdir(tmp_path)
+    yield tmp_path
+    for name in [m for m in sys.modules if m == "idxapp" or m.startswith("idxapp.")]:
+        del sys.modules[name]
+
+
+def _names(container: Container) -> set[str]:
+    return {cls.__name__ for cls in container._registrations}
+
+
+def _forget_idxapp() -> None:
+    for name in [m for m in sys.modules if m.startswith("idxapp")]:
+        del sys.modules[name]
+
+
+def _rename_late_service(root: Path) -> None:
+    (root / "idxapp" / "late.py").write_text(
+        "from pyfly.container import service\n\n\n@service\nclass RenamedService:\n    pass\n"
+    )
+    _forget_idxapp()
+
+
+def _enable_index(root: Path) -> None:
+    (root / "pyfly.yaml").write_text('pyfly:\n  context:\n    component-index: "pyfly-index.json"\n')
+
+
+class TestBuildComponentIndex:
+    def test_records_components_and_metadata(self, idxapp):
+        index = build_component_index(["idxapp"])
+        by_name = {c.qualname: c for c in index.components}
+
+        assert set(by_name) == {
+            "EnglishGreeter",
+            "DevOnlyService",
+            "FeatureService",
+            "MissingDependencyService",
+            "LateService",
+        }
+        assert by_name["EnglishGreeter"].stereotype == "service"
+        assert by_name["EnglishGreeter"].bindings == ["idxapp.ports:Greeter"]
+        assert by_name["DevOnlyService"].profile == "dev"
+        assert by_name["FeatureService"].conditions == [
+            {"type": "on_property", "key": "feature.enabled", "having_value": "true"}
+        ]
+
+    def test_includes_auto_configurations(self, idxapp):
+        index = build_component_index(["idxapp"])
+        assert index.auto_configurations
+        assert all(c.entry_point for c in index.auto_configurations)
+
+    def test_round_trips_through_json(self, idxapp):
+        index = build_component_index(["idxapp"])
+        index.save(idxapp / "index.json")
+        loaded = ComponentIndex.load(idxapp / "index.json")
+        assert loaded == index
+
+    def test_fingerprints_track_package_sources(self, idxapp):
+        index = build_component_index(["idxapp"])
+        assert index.is_current("idxapp")
+
+        _rename_late_service(idxapp)
+        assert not index.is_current("idxapp")
+
+    def test_unknown_package_is_never_current(self, idxapp):
+        index = build_component_index(["idxapp"])
+        assert not index.is_current("not_indexed_pkg")
+
+    def test_rejects_other_versions(self, tmp_path):
+        path = tmp_path / "index.json"
+        path.write_text(json.dumps({"version": INDEX_VERSION + 1}))
+        with pytest.raises(ValueError, match="pyfly index"):
+            ComponentIndex.load(path)
+
+    @pytest.mark.parametrize(
+        ("entry", "problem"),
+        [
+            ({"module": "m", "qualname": "C", "lazy": True}, "unknown fields \\['lazy'\\]"),
+            ({"qualname": "C"}, "missing fields \\['module'\\]"),
+            ("m:C", "Malformed component entry"),
+        ],
+    )
+    def test_rejects_malformed_entries(self, tmp_path, entry, problem):
+        path = tmp_path / "index.json"
+        path.write_text(json.dumps({"version": INDEX_VERSION, "components": [entry]}))
+        with pytest.raises(ValueError, match=problem) as exc_info:
+            ComponentIndex.load(path)
+        assert str(path) in str(exc_info.value)
+        assert "pyfly index" in str(exc_info.value)
+
+
+class TestRegisterFromIndex:
+    def test_static_filters_skip_beans_before_import(self, idxapp):
+        index = build_component_index(["idxapp"])
+        _forget_idxapp()
+
+        config = Config({"feature": {"enabled": "true"}})
+        container = Container()
+        count = register_from_index(index, "idxapp", container, config, Environment(config))
+
+        assert _names(container) == {"EnglishGreeter", "FeatureService", "LateService"}
+        assert count == 3
+        assert container.resolve(sys.modules["idxapp.ports"].Greeter).greet() == "hello"
+
+    def test_only_imports_modules_of_surviving_beans(self, idxapp):
+        index = build_component_index(["idxapp"])
+        index.components = [c for c in index.components if c.module != "idxapp.late"]
+        _forget_idxapp()
+
+        config = Config({})
+        register_from_index(index, "idxapp", Container(), config, Environment(config))
+
+        assert "idxapp.late" not in sys.modules
+
+    def test_active_profile_includes_profile_beans(self, idxapp):
+        index = build_component_index(["idxapp"])
+        config = Config({"pyfly": {"profiles": {"active": "dev"}}})
+        container = Container()
+        register_from_index(index, "idxapp", container, config, Environment(config))
+        assert "DevOnlyService" in _names(container)
+
+    def test_renamed_class_raises_without_registering_anything(self, idxapp):
+        index = build_component_index(["idxapp"])
+        _rename_late_service(idxapp)
+
+        config = Config({})
+        container = Container()
+        with pytest.raises(AttributeError):
+            register_from_index(index, "idxapp", container, config, Environment(config))
+        assert _names(container) == set()
+
+
+class TestLoadComponentIndex:
+    def test_missing_file_returns_none(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        assert load_component_index(Config({})) is None
+
+    def test_disabled_by_default(self, idxapp):
+        build_component_index(["idxapp"]).save(idxapp / "pyfly-index.json")
+        assert load_component_index(Config(Config._load_framework_defaults())) is None
+
+    def test_empty_location_disables_index(self, idxapp):
+        build_component_index(["idxapp"]).save(idxapp / "pyfly-index.json")
+        config = Config({"pyfly": {"context": {"component-index": ""}}})
+        assert load_component_index(config) is None
+
+    def test_relative_location_resolves_against_base_dir(self, idxapp, tmp_path_factory, monkeypatch):
+        build_component_index(["idxapp"]).save(idxapp / "pyfly-index.json")
+        monkeypatch.chdir(tmp_path_factory.mktemp("elsewhere"))
+        config = Config({"pyfly": {"context": {"component-index": "pyfly-index.json"}}})
+
+        assert load_component_index(config) is None
+        index = load_component_index(config, base_dir=idxapp)
+        assert index is not None
+        assert index.covers("idxapp")
+
+    def test_loads_configured_location(self, idxapp):
+        build_component_index(["idxapp"]).save(idxapp / "custom.json")
+        config = Config({"pyfly": {"context": {"component-index": str(idxapp / "custom.json")}}})
+        index = load_component_index(config)
+        assert index is not None
+        assert index.covers("idxapp")
+
+
+class TestApplicationUsesIndex:
+    async def test_application_registers_from_index(self, idxapp):
+        index = build_component_index(["idxapp"])
+        index.components = [c for c in index.components if c.qualname != "LateService"]
+        index.save(idxapp / "pyfly-index.json")
+        _enable_index(idxapp)
+
+        @pyfly_application(name="indexed", scan_packages=["idxapp"])
+        class App:
+            pass
+
+        app = PyFlyApplication(App)
+        registered = _names(app.context.container)
+        assert "EnglishGreeter" in registered
+        assert "LateService" not in registered  # not in the index, so never scanned
+
+    async def test_application_ignores_index_unless_enabled(self, idxapp):
+        index = build_component_index(["idxapp"])
+        index.components = [c for c in index.components if c.qualname != "LateService"]
+        index.save(idxapp / "pyfly-index.json")
+
+        @pyfly_application(name="indexed", scan_packages=["idxapp"])
+        class App:
+            pass
+
+        app = PyFlyApplication(App)
+        assert "LateService" in _names(app.context.container)
+
+    async def test_application_scans_package_changed_since_indexing(self, idxapp):
+        build_component_index(["idxapp"]).save(idxapp / "pyfly-index.json")
+        _enable_index(idxapp)
+        _rename_late_service(idxapp)
+
+        @pyfly_application(name="indexed", scan_packages=["idxapp"])
+        class App:
+            pass
+
+        app = PyFlyApplication(App)
+        registered = _names(app.context.container)
+        assert "RenamedService" in registered
+        assert "LateService" not in registered
+
+    async def test_application_falls_back_to_scanning_on_bad_index(self, idxapp):
+        (idxapp / "pyfly-index.json").write_text(json.dumps({"version": 0}))
+        _enable_index(idxapp)
+
+        @pyfly_application(name="indexed", scan_packages=["idxapp"])
+        class App:
+            pass
+
+        app = PyFlyApplication(App)
+        assert "LateService" in _names(app.context.container)
+
+
+class TestIndexCommand:
+    def test_writes_index_file(self, idxapp):
+        result = CliRunner().invoke(cli, ["index", "idxapp", "-o", "out.json"])
+        assert result.exit_code == 0, result.output
+        index = ComponentIndex.load(idxapp / "out.json")
+        assert index.packages == ["idxapp"]
+        assert len(index.components) == 5
+
+    def test_unknown_package_fails(self, idxapp):
+        result = CliRunner().invoke(cli, ["index", "no_such_pkg_for_index"])
+        assert result.exit_code == 1
@@ -0,0 +1,207 @@
+# Copyright 2026 Firefly Software Solutions Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the dependency-graph driven parallel startup mode."""
+
+import asyncio
+
+import pytest
+
+from pyfly.container import Container, depends_on, order
+from pyfly.container.bean import bean
+from pyfly.container.exceptions import BeanCreationException
+from pyfly.container.stereotypes import configuration, service
+from pyfly.context.application_context import ApplicationContext
+from pyfly.context.lifecycle import post_construct
+from pyfly.context.startup import run_wave, startup_waves
+from pyfly.core.config import Config
+
+events: list[str] = []
+
+
+class Database:
+    pass
+
+
+class Broker:
+    pass
+
+
+class Repository:
+    def __init__(self, db: Database) -> None:
+        self.db = db
+
+
+@depends_on(Repository)
+class Warmer:
+    pass
+
+
+@order(-10)
+class Early:
+    pass
+
+
+def _waves(container: Container, *types: type) -> list[set[type]]:
+    regs = [container._registrations[t] for t in types]
+    return [{reg.impl_type for reg in wave} for wave in startup_waves(container, regs)]
+
+
+class TestStartupWaves:
+    def test_independent_beans_share_a_wave(self):
+        container = Container()
+        for cls in (Database, Broker):
+            container.register(cls)
+
+        assert _waves(container, Database, Broker) == [{Database, Broker}]
+
+    def test_constructor_and_depends_on_edges_create_layers(self):
+        container = Container()
+        for cls in (Warmer, Repository, Database, Broker):
+            container.register(cls)
+
+        waves = _waves(container, Warmer, Repository, Database, Broker)
+
+        assert waves == [{Database, Broker}, {Repository}, {Warmer}]
+
+    def test_order_splits_a_layer(self):
+        container = Container()
+        for cls in (Database, Early):
+            container.register(cls)
+
+        assert _waves(container, Database, Early) == [{Early}, {Database}]
+
+
+class SlowPoolAdapter:
+    async def start(self) -> None:
+        events.append("pool:start")
+        await asyncio.sleep(0.05)
+        events.append("pool:ready")
+
+    async def stop(self) -> None:
+        pass
+
+
+class SlowBrokerAdapter:
+    async def start(self) -> None:
+        events.append("broker:start")
+        await asyncio.sleep(0.05)
+        events.append("broker:ready")
+
+    async def stop(self) -> None:
+        pass
+
+
+@configuration
+class InfrastructureConfig:
+    @bean
+    def pool(self) -> SlowPoolAdapter:
+        return SlowPoolAdapter()
+
+    @bean
+    def broker(self) -> SlowBrokerAdapter:
+        return SlowBrokerAdapter()
+
+
+@service
+class CacheWarmer:
+    def __init__(self, pool: SlowPoolAdapter) -> None:
+        self.pool = pool
+
+    @post_construct
+    async def warm(self) -> None:
+        events.append("warmer:init")
+
+
+class TestParallelStartup:
+    def _context(self, parallel: bool) -> ApplicationContext:
+        events.clear()
+        ctx = ApplicationContext(Config({"pyfly": {"context": {"parallel-startup": parallel}}}))
+        for cls in (InfrastructureConfig, CacheWarmer):
+            ctx.register_bean(cls)
+        return ctx
+
+    async def test_adapters_start_concurrently(self):
+        ctx = self._context(parallel=True)
+        await ctx.start()
+
+        assert set(events[:2]) == {"pool:start", "broker:start"}
+        assert events[-1] == "warmer:init"
+
+    async def test_serial_startup_is_default(self):
+        ctx = self._context(parallel=False)
+        await ctx.start()
+
+        assert events[0].endswith(":start")
+        assert events[1].endswith(":ready")
+
+    async def test_phase_timings_reported(self):
+        ctx = self._context(parallel=True)
+        await ctx.start()
+
+        timings = ctx.startup_phase_timings
+        assert list(timings)[0] == "register_auto_configurations"
+        assert {"infrastructure", "singletons", "lifecycle", "wiring"} <= set(timings)
+        assert timings["infrastructure"] >= 0
+
+    async def test_failed_adapter_cancels_the_rest_of_its_wave(self):
+        cancelled = asyncio.Event()
+
+        class FailingAdapter:
+            async def start(self) -> None:
+                raise ConnectionError("unreachable")
+
+            async def stop(self) -> None:
+                pass
+
+        class HangingAdapter:
+            async def start(self) -> None:
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+
+            async def stop(self) -> None:
+                pass
+
+        ctx = ApplicationContext(Config({"pyfly": {"context": {"parallel-startup": True}}}))
+        ctx.register_bean(FailingAdapter)
+        ctx.register_bean(HangingAdapter)
+        ctx._container.resolve(FailingAdapter)
+        ctx._container.resolve(HangingAdapter)
+
+        with pytest.raises(BeanCreationException, match="unreachable"):
+            await asyncio.wait_for(ctx._start_infrastructure(), timeout=2)
+        assert cancelled.is_set()
+
+
+class TestRunWave:
+    async def test_first_error_is_raised_after_others_are_cancelled(self):
+        states: list[str] = []
+
+        async def fails() -> None:
+            await asyncio.sleep(0)
+            raise ValueError("boom")
+
+        async def slow() -> None:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                states.append("cancelled")
+                raise
+
+        with pytest.raises(ValueError, match="boom"):
+            await run_wave([slow(), fails()])
+        assert states == ["cancelled"]
+        assert [t for t in asyncio.all_tasks() if t is not asyncio.current_task()] == []
@@ -0,0 +1,167 @@
+# Copyright 2026 Firefly Software Solutions Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the startup timeline recorder."""
+
+import gc
+import importlib
+import json
+import sys
+import time
+
+from pyfly.container.bean import bean
+from pyfly.container.stereotypes import configuration, service
+from pyfly.context.application_context import ApplicationContext
+from pyfly.context.startup_recorder import StartupRecorder
+from pyfly.core.config import Config
+
+
+class Clock:
+    pass
+
+
+class SlowRepository:
+    def __init__(self) -> None:
+        time.sleep(0.01)
+
+
+@service
+class ReportService:
+    def __init__(self, repo: SlowRepository) -> None:
+        self.repo = repo
+
+
+@configuration
+class ClockConfig:
+    @bean
+    def clock(self) -> Clock:
+        return Clock()
+
+
+def _recording_config(**extra: object) -> Config:
+    return Config({"pyfly": {"context": {"startup-recorder": {"enabled": True, **extra}}}})
+
+
+class TestStartupRecorder:
+    def test_spans_nest_under_the_open_span(self):
+        recorder = StartupRecorder()
+        with recorder.span("outer", "phase") as outer, recorder.span("inner", "bean") as inner:
+            pass
+        assert inner.parent == outer.id
+        assert outer.parent is None
+        assert outer.duration_ns >= inner.duration_ns
+
+    def test_chrome_trace_uses_complete_events(self):
+        recorder = StartupRecorder()
+        with recorder.span("phase", "phase", detail=1):
+            pass
+        trace = recorder.to_chrome_trace()
+        events = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+        assert events == [
+            {
+                "name": "phase",
+                "cat": "phase",
+                "ph": "X",
+                "ts": events[0]["ts"],
+                "dur": events[0]["dur"],
+                "pid": events[0]["pid"],
+                "tid": 1,
+                "args": {"detail": 1},
+            }
+        ]
+        assert any(e["ph"] == "M" and e["name"] == "thread_name" for e in trace["traceEvents"])
+
+    def test_records_module_imports(self, tmp_path, monkeypatch):
+        (tmp_path / "recorded_mod_a.py").write_text("import recorded_mod_b\n")
+        (tmp_path / "recorded_mod_b.py").write_text("VALUE = 1\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        recorder = StartupRecorder()
+        recorder.start_import_tracking()
+        try:
+            module = importlib.import_module("recorded_mod_a")
+        finally:
+            recorder.stop_import_tracking()
+            sys.modules.pop("recorded_mod_a", None)
+            sys.modules.pop("recorded_mod_b", None)
+
+        spans = {s.name: s for s in recorder.spans if s.category == "import"}
+        assert spans["recorded_mod_b"].parent == spans["recorded_mod_a"].id
+        assert module.__loader__ is module.__spec__.loader
+        assert type(module.__loader__).__name__ == "SourceFileLoader"
+        assert "recorded_mod_a" in recorder.import_times_ms()
+
+
+class TestContextRecording:
+    async def test_disabled_by_default(self):
+        ctx = ApplicationContext(Config({}))
+        await ctx.start()
+        assert ctx.startup_recorder is None
+
+    async def test_records_phases_beans_and_bean_methods(self):
+        ctx = ApplicationContext(_recording_config())
+        ctx.register_bean(ReportService)  # created first, so SlowRepository is created as its dependency
+        ctx.register_bean(SlowRepository)
+        ctx.register_bean(ClockConfig)
+        await ctx.start()
+
+        recorder = ctx.startup_recorder
+        assert recorder is not None
+        spans = recorder.spans
+        phases = [s.name for s in spans if s.category == "phase"]
+        assert phases == list(ctx.startup_phase_timings)
+        assert any(s.category == "bean_method" and s.name == "ClockConfig.clock" for s in spans)
+        assert any(s.category == "lifecycle" and s.name == "ReportService" for s in spans)
+
+        report = recorder.to_dict()
+        service_report = report["beans"]["ReportService"]
+        assert service_report["dependencies_ms"] >= 10
+        assert service_report["constructor_ms"] < service_report["dependencies_ms"]
+
+        by_id = {s.id: s for s in spans}
+        repo_span = next(s for s in spans if s.category == "bean" and s.name == "SlowRepository")
+        assert by_id[repo_span.parent].name == "ReportService"
+
+    async def test_stops_recording_after_start(self):
+        ctx = ApplicationContext(_recording_config())
+        await ctx.start()
+        recorder = ctx.startup_recorder
+        assert recorder is not None
+        assert recorder._import_finder is None
+        assert ctx.container._startup_recorder is None
+
+    async def test_stop_without_start_removes_import_hook(self):
+        hooks = len(sys.meta_path)
+        ctx = ApplicationContext(_recording_config())
+        assert len(sys.meta_path) == hooks + 1
+
+        await ctx.stop()
+        assert len(sys.meta_path) == hooks
+
+    def test_abandoned_context_removes_import_hook(self):
+        hooks = len(sys.meta_path)
+        ctx = ApplicationContext(_recording_config())
+        assert len(sys.meta_path) == hooks + 1
+
+        del ctx
+        gc.collect()
+        assert len(sys.meta_path) == hooks
+
+    async def test_writes_chrome_trace_file(self, tmp_path):
+        trace_file = tmp_path / "startup-trace.json"
+        ctx = ApplicationContext(_recording_config(**{"trace-file": str(trace_file)}))
+        ctx.register_bean(SlowRepository)
+        await ctx.start()
+
+        trace = json.loads(trace_file.read_text())
+        names = {e["name"] for e in trace["traceEvents"] if e["ph"] == "X"}
+        assert {"singletons", "SlowRepository"} <= names
@@ -0,0 +1,275 @@
+# Copyright 2026 Firefly Software Solutions Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for BatchingQueueHandler — off-thread, batched log output."""
+
+import io
+import logging
+import sys
+import threading
+
+import pytest
+import structlog
+
+from pyfly.core.config import Config
+from pyfly.logging.queue_handler import BatchingQueueHandler, queue_enabled, queue_handler_from_config
+from pyfly.logging.stdlib_adapter import StdlibLoggingAdapter
+from pyfly.logging.structlog_adapter import StructlogAdapter
+
+
+def _record(msg: str, level: int = logging.INFO) -> logging.LogRecord:
+    return logging.LogRecord("test", level, __file__, 1, msg, None, None)
+
+
+class _BlockingHandler(logging.Handler):
+    """Target that holds the writer thread until released."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.release_writer = threading.Event()
+        self.messages: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.release_writer.wait(5.0)
+        self.messages.append(record.getMessage())
+
+
+class _CountingStream(io.StringIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.writes = 0
+
+    def write(self, s: str) -> int:
+        self.writes += 1
+        return super().write(s)
+
+
+@pytest.fixture
+def restore_logging():
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield
+    for handler in root.handlers:
+        if handler not in handlers:
+            handler.close()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+    structlog.reset_defaults()
+
+
+class TestBatchingQueueHandler:
+    def test_writes_batch_with_single_write(self):
+        stream = _CountingStream()
+        target = logging.StreamHandler(stream)
+        target.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+        handler = BatchingQueueHandler(target, batch_size=100, flush_interval=10.0)
+        try:
+            for i in range(50):
+                handler.handle(_record(f"msg {i}"))
+            handler.flush()
+            assert stream.getvalue().splitlines() == [f"INFO msg {i}" for i in range(50)]
+            assert stream.writes == 1
+            assert handler.get_stats()["written"] == 50
+        finally:
+            handler.close()
+
+    def test_full_batch_wakes_writer(self):
+        stream = io.StringIO()
+        handler = BatchingQueueHandler(logging.StreamHandler(stream), batch_size=2, flush_interval=10.0)
+        try:
+            handler.handle(_record("a"))
+            handler.handle(_record("b"))
+            handler.flush(timeout=1.0)
+            assert stream.getvalue() == "a\nb\n"
+        finally:
+            handler.close()
+
+    def test_respects_target_level(self):
+        stream = io.StringIO()
+        target = logging.StreamHandler(stream)
+        target.setLevel(logging.WARNING)
+        handler = BatchingQueueHandler(target)
+        try:
+            handler.handle(_record("quiet", logging.INFO))
+            handler.handle(_record("loud", logging.WARNING))
+            handler.flush()
+            assert stream.getvalue() == "loud\n"
+        finally:
+            handler.close()
+
+    def test_other_handlers_receive_records_on_writer_thread(self):
+        seen: list[str] = []
+
+        class _Recording(logging.Handler):
+            def emit(self, record: logging.LogRecord) -> None:
+                seen.append(threading.current_thread().name)
+
+        handler = BatchingQueueHandler(_Recording())
+        try:
+            handler.handle(_record("x"))
+            handler.flush()
+            assert seen == ["pyfly-log-writer"]
+        finally:
+            handler.close()
+
+    def test_drop_policy_counts_dropped_records(self):
+        target = _BlockingHandler()
+        handler = BatchingQueueHandler(target, capacity=2, batch_size=1, flush_interval=0.001)
+        try:
+            handler.handle(_record("first"))  # taken by the writer, which then blocks
+            while handler.get_stats()["queued"]:
+                pass
+            for i in range(5):
+                handler.handle(_record(f"queued {i}"))
+            assert handler.dropped == 3
+            assert handler.get_stats()["queued"] == 2
+        finally:
+            target.release_writer.set()
+            handler.close()
+        assert target.messages == ["first", "queued 0", "queued 1"]
+
+    def test_arguments_are_merged_when_queued(self):
+        target = _BlockingHandler()
+        handler = BatchingQueueHandler(target, flush_interval=0.001)
+        items = ["a"]
+        record = logging.LogRecord("test", logging.INFO, __file__, 1, "items=%s", (items,), None)
+        try:
+            handler.handle(record)
+            items.append("b")  # mutated after the call, before the write
+        finally:
+            target.release_writer.set()
+            handler.close()
+        assert target.messages == ["items=['a']"]
+        assert record.args == (items,)  # the caller's record is left untouched
+
+    def test_exception_rendered_when_queued(self):
+        stream = io.StringIO()
+        handler = BatchingQueueHandler(logging.StreamHandler(stream), flush_interval=0.001)
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            record = logging.LogRecord("test", logging.ERROR, __file__, 1, "failed", None, sys.exc_info())
+        handler.handle(record)
+        handler.close()
+        assert "failed\nTraceback" in stream.getvalue()
+        assert "RuntimeError: boom" in stream.getvalue()
+
+    def test_block_policy_waits_for_room(self):
+        target = _BlockingHandler()
+        handler = BatchingQueueHandler(target, capacity=1, overflow="block", batch_size=1, flush_interval=0.001)
+        try:
+            handler.handle(_record("first"))
+            while handler.get_stats()["queued"]:
+                pass
+            handler.handle(_record("second"))
+            threading.Timer(0.05, target.release_writer.set).start()
+            handler.handle(_record("third"))  # blocks until the writer catches up
+            handler.flush()
+        finally:
+            target.release_writer.set()
+            handler.close()
+        assert target.messages == ["first", "second", "third"]
+        assert handler.dropped == 0
+
+    def test_invalid_overflow_policy(self):
+        with pytest.raises(ValueError, match="overflow"):
+            BatchingQueueHandler(logging.NullHandler(), overflow="spill")
+
+    def test_close_drains_queue(self):
+        stream = io.StringIO()
+        handler = BatchingQueueHandler(logging.StreamHandler(stream), flush_interval=10.0)
+        for i in range(3):
+            handler.handle(_record(str(i)))
+        handler.close()
+        assert stream.getvalue() == "0\n1\n2\n"
+
+
+class TestQueueConfig:
+    def test_disabled_by_default(self):
+        assert not queue_enabled(Config({}))
+
+    def test_reads_queue_properties(self):
+        config = Config(
+            {"pyfly": {"logging": {"queue": {"enabled": True, "capacity": 50, "overflow": "BLOCK", "batch-size": 8}}}}
+        )
+        handler = queue_handler_from_config(logging.NullHandler(), config)
+        try:
+            assert queue_enabled(config)
+            assert handler.get_stats()["capacity"] == 50
+            assert handler._block
+            assert handler._batch_size == 8
+        finally:
+            handler.close()
+
+
+@pytest.mark.usefixtures("restore_logging")
+class TestQueuedAdapters:
+    QUEUED = {"pyfly": {"logging": {"format": "json", "queue": {"enabled": True}}}}
+
+    def _queue_handler(self) -> BatchingQueueHandler:
+        handlers = logging.getLogger().handlers
+        assert len(handlers) == 1
+        assert isinstance(handlers[0], BatchingQueueHandler)
+        return handlers[0]
+
+    def _capture(self) -> tuple[BatchingQueueHandler, io.StringIO]:
+        handler = self._queue_handler()
+        stream = io.StringIO()
+        handler._target.setStream(stream)  # type: ignore[attr-defined]
+        return handler, stream
+
+    def test_structlog_renders_on_writer_thread(self):
+        adapter = StructlogAdapter()
+        adapter.configure(Config(self.QUEUED))
+        handler, stream = self._capture()
+
+        logger = adapter.get_logger("orders")
+        logger.info("order_placed", order_id=42)
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            logger.exception("order_failed")
+        handler.flush()
+
+        output = stream.getvalue()
+        assert '"event": "order_placed"' in output
+        assert '"order_id": 42' in output
+        assert '"logger": "orders"' in output
+        assert "RuntimeError: boom" in output
+
+    def test_structlog_renders_foreign_records(self):
+        adapter = StructlogAdapter()
+        adapter.configure(Config(self.QUEUED))
+        handler, stream = self._capture()
+
+        logging.getLogger("uvicorn.access").warning("GET /health %s", 200)
+        handler.flush()
+
+        output = stream.getvalue()
+        assert '"event": "GET /health 200"' in output
+        assert '"level": "warning"' in output
+
+    def test_stdlib_adapter_queued(self):
+        adapter = StdlibLoggingAdapter()
+        adapter.configure(Config(self.QUEUED))
+        handler, stream = self._capture()
+
+        adapter.get_logger("billing").warning("invoice late")
+        handler.flush()
+
+        assert "invoice late" in stream.getvalue()
+
+    def test_not_queued_by_default(self):
+        adapter = StructlogAdapter()
+        adapter.configure(Config({}))
+        assert not any(isinstance(h, BatchingQueueHandler) for h in logging.getLogger().handlers)
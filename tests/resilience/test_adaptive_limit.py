@@ -0,0 +1,104 @@
+# Copyright 2026 Firefly Software Solutions Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for adaptive concurrency limits."""
+
+from __future__ import annotations
+
+from pyfly.resilience import AdaptiveConcurrencyLimiter, AimdLimit, GradientLimit, LimitAlgorithm
+
+
+class TestAimdLimit:
+    def test_grows_by_one_under_load(self) -> None:
+        limit = AimdLimit(initial_limit=10)
+        limit.on_sample(0.01, in_flight=5, dropped=False)
+        assert limit.limit == 11
+
+    def test_does_not_grow_when_underused(self) -> None:
+        limit = AimdLimit(initial_limit=10)
+        limit.on_sample(0.01, in_flight=2, dropped=False)
+        assert limit.limit == 10
+
+    def test_backs_off_on_drop_and_timeout(self) -> None:
+        limit = AimdLimit(initial_limit=100, backoff_ratio=0.5, timeout=1.0)
+        limit.on_sample(0.01, in_flight=50, dropped=True)
+        assert limit.limit == 50
+        limit.on_sample(2.0, in_flight=50, dropped=False)
+        assert limit.limit == 25
+
+    def test_respects_bounds(self) -> None:
+        limit = AimdLimit(initial_limit=2, min_limit=2, max_limit=3)
+        for _ in range(5):
+            limit.on_sample(0.01, in_flight=3, dropped=False)
+        assert limit.limit == 3
+        for _ in range(5):
+            limit.on_sample(0.01, in_flight=3, dropped=True)
+        assert limit.limit == 2
+
+
+class TestGradientLimit:
+    def test_grows_while_latency_is_steady(self) -> None:
+        limit = GradientLimit(initial_limit=20)
+        for _ in range(50):
+            limit.on_sample(0.01, in_flight=limit.limit, dropped=False)
+        assert limit.limit > 20
+
+    def test_shrinks_when_latency_rises(self) -> None:
+        limit = GradientLimit(initial_limit=100, long_window=1000)
+        for _ in range(100):
+            limit.on_sample(0.01, in_flight=100, dropped=False)
+        grown = limit.limit
+        for _ in range(30):
+            limit.on_sample(0.1, in_flight=limit.limit, dropped=False)
+        assert limit.limit < grown / 2
+
+    def test_ignores_samples_without_load(self) -> None:
+        limit = GradientLimit(initial_limit=20)
+        limit.on_sample(1.0, in_flight=1, dropped=False)
+        assert limit.limit == 20
+
+    def test_satisfies_protocol(self) -> None:
+        assert isinstance(GradientLimit(), LimitAlgorithm)
+        assert isinstance(AimdLimit(), LimitAlgorithm)
+
+
+class TestAdaptiveConcurrencyLimiter:
+    def test_rejects_beyond_limit(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter(AimdLimit(initial_limit=2))
+        assert limiter.try_acquire()
+        assert limiter.try_acquire()
+        assert not limiter.try_acquire()
+        assert limiter.in_flight == 2
+        assert limiter.rejected == 1
+
+    def test_share_reserves_capacity(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter(AimdLimit(initial_limit=10))
+        for _ in range(5):
+            assert limiter.try_acquire(share=0.5)
+        assert not limiter.try_acquire(share=0.5)
+        assert limiter.try_acquire()
+
+    def test_release_feeds_the_algorithm(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter(AimdLimit(initial_limit=2))
+        limiter.try_acquire()
+        limiter.try_acquire()
+        limiter.release(0.01)
+        assert limiter.limit == 3
+        assert limiter.in_flight == 1
+
+    def test_release_without_sample_keeps_limit(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter(AimdLimit(initial_limit=2))
+        limiter.try_acquire()
+        limiter.release()
+        assert limiter.limit == 2
+        assert limiter.in_flight == 0
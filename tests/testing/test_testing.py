@@ -13,6 +13,9 @@
 # limitations under the License.
 """Tests for PyFly testing utilities."""
 
+import asyncio
+from typing import ClassVar
+
 import pytest
 
 from pyfly.container import Container
@@ -49,6 +52,42 @@ class TestPyFlyTestCase:
         assert isinstance(instance, list)
         await tc.teardown()
 
+    @pytest.mark.asyncio
+    async def test_tests_share_base_context_but_not_beans(self):
+        first = PyFlyTestCase()
+        await first.setup()
+        first.context.container.register(list)
+
+        second = PyFlyTestCase()
+        await second.setup()
+        assert second.context.container.parent is first.context.container.parent
+        assert list not in second.context.container._registrations
+        await first.teardown()
+        await second.teardown()
+
+
+class TestPyFlyTestCaseAcrossLoops:
+    """pytest-asyncio runs each test in a new loop; each loop needs its own framework context."""
+
+    bases: ClassVar[list[tuple[asyncio.AbstractEventLoop, Container | None]]] = []
+
+    async def _check_base_per_loop(self) -> None:
+        tc = PyFlyTestCase()
+        await tc.setup()
+        self.bases.append((asyncio.get_running_loop(), tc.context.container.parent))
+        await tc.teardown()
+        for loop, base in self.bases:
+            for other_loop, other_base in self.bases:
+                assert (loop is other_loop) == (base is other_base)
+
+    @pytest.mark.asyncio
+    async def test_first_loop(self):
+        await self._check_base_per_loop()
+
+    @pytest.mark.asyncio
+    async def test_second_loop(self):
+        await self._check_base_per_loop()
+
 
 class TestEventAssertions:
     @pytest.mark.asyncio
@@ -116,3 +155,19 @@ class TestCreateTestContainer:
         container = create_test_container(overrides={object: FakeDB})
         instance = container.resolve(object)
         assert isinstance(instance, FakeDB)
+
+    def test_child_of_parent_container(self):
+        class RealDB:
+            pass
+
+        class FakeDB:
+            pass
+
+        parent = Container()
+        parent.register(RealDB)
+        real = parent.resolve(RealDB)
+
+        container = create_test_container(overrides={object: FakeDB}, parent=parent)
+        assert container.resolve(RealDB) is real
+        assert isinstance(container.resolve(object), FakeDB)
+        assert FakeDB not in parent._registrations
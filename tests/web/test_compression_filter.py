@@ -0,0 +1,199 @@
+# Copyright 2026 Firefly Software Solutions Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for CompressionFilter."""
+
+import gzip
+import zlib
+from typing import Any
+
+import pytest
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from pyfly.web.adapters.starlette.filter_chain import WebFilterChainMiddleware
+from pyfly.web.adapters.starlette.filters import CompressionFilter
+from pyfly.web.filters import OncePerRequestFilter
+from pyfly.web.http_headers import negotiate_encoding
+
+PAYLOAD = [{"id": i, "name": f"item-{i}", "status": "active"} for i in range(200)]
+
+
+async def large(request: Request) -> Response:
+    return JSONResponse(PAYLOAD, headers={"etag": '"abc"', "vary": "accept-language"})
+
+
+async def small(request: Request) -> Response:
+    return JSONResponse({"ok": True})
+
+
+async def image(request: Request) -> Response:
+    return Response(b"\x89PNG" * 1000, media_type="image/png")
+
+
+async def stream(request: Request) -> Response:
+    async def chunks():
+        for i in range(50):
+            yield f"line {i} ".encode() * 100
+
+    return StreamingResponse(chunks(), media_type="text/plain")
+
+
+async def events(request: Request) -> Response:
+    async def chunks():
+        yield b"data: x\n\n" * 200
+
+    return StreamingResponse(chunks(), media_type="text/event-stream")
+
+
+async def partial(request: Request) -> Response:
+    return Response(b"x" * 3000, status_code=206, headers={"content-range": "bytes 0-2999/60000"})
+
+
+async def no_transform(request: Request) -> Response:
+    return JSONResponse(PAYLOAD, headers={"cache-control": "public, no-transform"})
+
+
+class BodyReader(OncePerRequestFilter):
+    requires_response_body = True
+
+    async def do_filter(self, request: Any, call_next: Any) -> Any:
+        return await call_next(request)
+
+
+def make_client(*filters: Any) -> TestClient:
+    app = Starlette(
+        routes=[
+            Route("/large", large),
+            Route("/small", small),
+            Route("/image", image),
+            Route("/stream", stream),
+            Route("/events", events),
+            Route("/partial", partial),
+            Route("/no-transform", no_transform),
+        ],
+        middleware=[Middleware(WebFilterChainMiddleware, filters=list(filters))],
+    )
+    return TestClient(app)
+
+
+def raw_get(client: TestClient, path: str, encoding: str) -> Any:
+    with client.stream("GET", path, headers={"Accept-Encoding": encoding}) as response:
+        response.raw = b"".join(response.iter_raw())
+        return response
+
+
+class TestCompressionFilter:
+    @pytest.mark.parametrize("filters", [[], [BodyReader()]], ids=["streamed", "buffered"])
+    def test_gzip_large_json(self, filters):
+        client = make_client(CompressionFilter(), *filters)
+        response = raw_get(client, "/large", "gzip, deflate")
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "accept-language, accept-encoding"
+        assert response.headers["etag"] == 'W/"abc"'
+        assert gzip.decompress(response.raw) == JSONResponse(PAYLOAD).body
+        assert len(response.raw) < len(JSONResponse(PAYLOAD).body) / 4
+
+    def test_deflate_when_preferred(self):
+        client = make_client(CompressionFilter())
+        response = raw_get(client, "/large", "gzip;q=0.5, deflate")
+        assert response.headers["content-encoding"] == "deflate"
+        assert zlib.decompress(response.raw) == JSONResponse(PAYLOAD).body
+
+    def test_streaming_body_without_length_is_compressed(self):
+        client = make_client(CompressionFilter())
+        response = raw_get(client, "/stream", "gzip")
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        assert gzip.decompress(response.raw).startswith(b"line 0 line 0")
+
+    @pytest.mark.parametrize("path", ["/small", "/image", "/events", "/partial", "/no-transform"])
+    def test_skipped_responses(self, path):
+        client = make_client(CompressionFilter())
+        response = raw_get(client, path, "gzip")
+        assert "content-encoding" not in response.headers
+
+    @pytest.mark.asyncio
+    async def test_stream_without_length_flushes_every_chunk(self):
+        async def app(scope, receive, send):
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            for line in (b'{"progress": 1}\n', b'{"progress": 2}\n'):
+                await send({"type": "http.response.body", "body": line * 100, "more_body": True})
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+        sent: list[dict] = []
+
+        async def send(message):
+            sent.append(message)
+
+        async def receive():
+            return {"type": "http.request", "body": b""}
+
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "path": "/",
+            "query_string": b"",
+            "headers": [(b"accept-encoding", b"gzip")],
+        }
+        await WebFilterChainMiddleware(app, [CompressionFilter()])(scope, receive, send)
+
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        bodies = [m["body"] for m in sent if m["type"] == "http.response.body"]
+        assert decompressor.decompress(bodies[0]) == b'{"progress": 1}\n' * 100
+        assert decompressor.decompress(bodies[1]) == b'{"progress": 2}\n' * 100
+
+    def test_client_without_accept_encoding(self):
+        client = make_client(CompressionFilter())
+        response = raw_get(client, "/large", "identity")
+        assert "content-encoding" not in response.headers
+
+    def test_large_chunks_are_compressed_off_loop(self, monkeypatch):
+        import asyncio
+
+        calls = []
+        original = asyncio.to_thread
+
+        async def spy(func, *args):
+            calls.append(func)
+            return await original(func, *args)
+
+        monkeypatch.setattr(asyncio, "to_thread", spy)
+        client = make_client(CompressionFilter(offload_threshold=1024))
+        response = raw_get(client, "/large", "gzip")
+        assert gzip.decompress(response.raw) == JSONResponse(PAYLOAD).body
+        assert calls
+
+
+class TestNegotiateEncoding:
+    @pytest.mark.parametrize(
+        ("header", "expected"),
+        [
+            ("", None),
+            ("gzip", "gzip"),
+            ("deflate, gzip", "gzip"),
+            ("br, deflate", "deflate"),
+            ("gzip;q=0, deflate;q=0.1", "deflate"),
+            ("*", "gzip"),
+            ("*;q=0", None),
+            ("identity", None),
+            ("GZIP;q=0.8", "gzip"),
+        ],
+    )
+    def test_negotiation(self, header, expected):
+        assert negotiate_encoding(header) == expected
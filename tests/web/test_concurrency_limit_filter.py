@@ -0,0 +1,167 @@
+# Copyright 2026 Firefly Software Solutions Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for AdaptiveConcurrencyFilter."""
+
+import asyncio
+from typing import Any
+
+import httpx
+import pytest
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+from pyfly.actuator.endpoints import ConcurrencyEndpoint
+from pyfly.resilience import AimdLimit
+from pyfly.web.adapters.starlette.filter_chain import WebFilterChainMiddleware
+from pyfly.web.adapters.starlette.filters import AdaptiveConcurrencyFilter, metrics_filter
+
+
+def make_app(concurrency_filter: AdaptiveConcurrencyFilter, gate: asyncio.Event) -> Starlette:
+    async def slow(request: Request) -> Response:
+        await gate.wait()
+        return JSONResponse({"ok": True})
+
+    async def fail(request: Request) -> Response:
+        raise RuntimeError("boom")
+
+    return Starlette(
+        routes=[
+            Route("/api/orders", slow),
+            Route("/api/reports", slow),
+            Route("/admin/export", slow),
+            Route("/health", slow),
+            Route("/fail", fail),
+        ],
+        middleware=[Middleware(WebFilterChainMiddleware, filters=[concurrency_filter])],
+    )
+
+
+def aimd(limit: int) -> Any:
+    return lambda: AimdLimit(initial_limit=limit, min_limit=1)
+
+
+async def settle() -> None:
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+
+class TestAdaptiveConcurrencyFilter:
+    async def test_sheds_beyond_limit_with_retry_after(self):
+        gate = asyncio.Event()
+        concurrency_filter = AdaptiveConcurrencyFilter(algorithm=aimd(2), retry_after=3)
+        transport = httpx.ASGITransport(app=make_app(concurrency_filter, gate))
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            held = [asyncio.create_task(client.get("/api/orders")) for _ in range(2)]
+            await settle()
+            rejected = await client.get("/api/orders")
+            gate.set()
+            admitted = await asyncio.gather(*held)
+
+        assert rejected.status_code == 503
+        assert rejected.headers["retry-after"] == "3"
+        assert rejected.headers["content-type"] == "application/problem+json"
+        assert [r.status_code for r in admitted] == [200, 200]
+        assert concurrency_filter.get_stats()["default"]["rejected"] == 1
+        assert concurrency_filter.get_stats()["default"]["in_flight"] == 0
+
+    async def test_groups_have_independent_limits(self):
+        gate = asyncio.Event()
+        concurrency_filter = AdaptiveConcurrencyFilter(groups={"reports": ["/api/reports"]}, algorithm=aimd(1))
+        transport = httpx.ASGITransport(app=make_app(concurrency_filter, gate))
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            held = asyncio.create_task(client.get("/api/reports"))
+            await settle()
+            other = asyncio.create_task(client.get("/api/orders"))
+            await settle()
+            assert (await client.get("/api/reports")).status_code == 503
+            gate.set()
+            assert (await held).status_code == 200
+            assert (await other).status_code == 200
+
+        assert set(concurrency_filter.get_stats()) == {"reports", "default"}
+
+    async def test_critical_paths_are_never_shed(self):
+        gate = asyncio.Event()
+        concurrency_filter = AdaptiveConcurrencyFilter(algorithm=aimd(1))
+        transport = httpx.ASGITransport(app=make_app(concurrency_filter, gate))
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            held = asyncio.create_task(client.get("/api/orders"))
+            await settle()
+            health = asyncio.create_task(client.get("/health"))
+            await settle()
+            gate.set()
+            assert (await health).status_code == 200
+            assert (await held).status_code == 200
+
+    async def test_low_priority_is_shed_first(self):
+        gate = asyncio.Event()
+        concurrency_filter = AdaptiveConcurrencyFilter(
+            algorithm=aimd(4), low_priority_patterns=["/admin/*"], low_priority_share=0.5
+        )
+        transport = httpx.ASGITransport(app=make_app(concurrency_filter, gate))
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            held = [asyncio.create_task(client.get("/api/orders")) for _ in range(2)]
+            await settle()
+            low = await client.get("/admin/export")
+            normal = asyncio.create_task(client.get("/api/orders"))
+            await settle()
+            gate.set()
+            results = await asyncio.gather(*held, normal)
+
+        assert low.status_code == 503
+        assert [r.status_code for r in results] == [200, 200, 200]
+
+    async def test_errors_shrink_the_limit(self):
+        concurrency_filter = AdaptiveConcurrencyFilter(algorithm=aimd(10))
+        transport = httpx.ASGITransport(app=make_app(concurrency_filter, asyncio.Event()), raise_app_exceptions=False)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            await client.get("/fail")
+
+        assert concurrency_filter.get_stats()["default"]["limit"] == 9
+
+    async def test_shed_requests_are_counted_in_metrics(self):
+        pytest.importorskip("prometheus_client")
+        gate = asyncio.Event()
+        concurrency_filter = AdaptiveConcurrencyFilter(groups={"metered": ["/api/*"]}, algorithm=aimd(1))
+        shed = metrics_filter.REQUESTS_SHED.labels(group="metered", priority="normal")
+        before = shed._value.get()
+        transport = httpx.ASGITransport(app=make_app(concurrency_filter, gate))
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            held = asyncio.create_task(client.get("/api/orders"))
+            await settle()
+            await client.get("/api/orders")
+            gate.set()
+            await held
+
+        assert shed._value.get() == before + 1
+        assert metrics_filter.CONCURRENCY_LIMIT.labels(group="metered")._value.get() == 2
+        assert metrics_filter.CONCURRENCY_IN_FLIGHT.labels(group="metered")._value.get() == 0
+
+
+class TestConcurrencyEndpoint:
+    async def test_reports_groups(self):
+        concurrency_filter = AdaptiveConcurrencyFilter(algorithm=aimd(5))
+        transport = httpx.ASGITransport(app=make_app(concurrency_filter, asyncio.Event()), raise_app_exceptions=False)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            await client.get("/fail")
+
+        endpoint = ConcurrencyEndpoint(concurrency_filter)
+        assert endpoint.endpoint_id == "concurrency"
+        assert await endpoint.handle() == {
+            "groups": {"default": {"limit": 4, "in_flight": 0, "rejected": 0}},
+            "rejected": 0,
+        }
@@ -13,6 +13,9 @@
 # limitations under the License.
 """Tests for exception converter system."""
 
+import xml.etree.ElementTree as ET
+
+import pytest
 from pydantic import BaseModel, ValidationError
 
 from pyfly.kernel.exceptions import (
@@ -23,6 +26,10 @@ from pyfly.web.converters import (
     ExceptionConverterService,
     JSONExceptionConverter,
     PydanticExceptionConverter,
+    dict_to_xml,
+    dict_to_xml_bytes,
+    iter_xml,
+    xml_to_dict,
 )
 
 
@@ -114,3 +121,50 @@ class TestJSONExceptionConverter:
     def test_does_not_handle_other_exceptions(self):
         converter = JSONExceptionConverter()
         assert converter.can_handle(ValueError("nope")) is False
+
+
+class TestXmlConversion:
+    def test_dict_to_xml(self):
+        xml = dict_to_xml({"id": 1, "name": "a & <b>", "tags": ["x", "y"], "meta": {}, "note": None})
+        assert xml == (
+            "<?xml version='1.0' encoding='utf-8'?>\n"
+            "<response><id>1</id><name>a &amp; &lt;b&gt;</name><tags>x</tags><tags>y</tags>"
+            "<meta /><note /></response>"
+        )
+
+    def test_matches_element_tree(self):
+        data = {"order": {"id": "7", "lines": [{"sku": "A", "qty": 2}, {"sku": "B", "qty": 1}]}}
+        root = ET.Element("response")
+        order = ET.SubElement(root, "order")
+        ET.SubElement(order, "id").text = "7"
+        for sku, qty in (("A", "2"), ("B", "1")):
+            line = ET.SubElement(order, "lines")
+            ET.SubElement(line, "sku").text = sku
+            ET.SubElement(line, "qty").text = qty
+        assert dict_to_xml(data) == ET.tostring(root, encoding="unicode", xml_declaration=True)
+
+    def test_model_and_list_root(self):
+        class Item(BaseModel):
+            id: int
+
+        assert dict_to_xml([Item(id=1), Item(id=2)], root_tag="items") == (
+            "<?xml version='1.0' encoding='utf-8'?>\n<items><item><id>1</id></item><item><id>2</id></item></items>"
+        )
+
+    def test_iter_xml_chunks_join_to_document(self):
+        data = [{"id": i} for i in range(10_000)]
+        chunks = list(iter_xml(data))
+        assert len(chunks) > 1
+        assert b"".join(chunks) == dict_to_xml_bytes(data)
+
+    def test_round_trip(self):
+        data = {"id": "1", "tags": ["x", "y"], "owner": {"name": "Ann"}}
+        assert xml_to_dict(dict_to_xml_bytes(data)) == {"response": data}
+
+    def test_xml_to_dict_ignores_attributes_and_comments(self):
+        xml = '<order id="7"><!-- c --><note> hi </note><empty/></order>'
+        assert xml_to_dict(xml.encode()) == {"order": {"note": " hi ", "empty": None}}
+
+    def test_xml_to_dict_invalid(self):
+        with pytest.raises(ET.ParseError):
+            xml_to_dict("<order><id>1</order>")
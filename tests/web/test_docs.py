@@ -13,12 +13,19 @@
 # limitations under the License.
 """Tests for Swagger UI and ReDoc doc endpoints."""
 
+import gzip
+import json
+
 import pytest
+from starlette.applications import Starlette
+from starlette.routing import Route
 from starlette.testclient import TestClient
 
 from pyfly.context.application_context import ApplicationContext
 from pyfly.core.config import Config
 from pyfly.web.adapters.starlette.app import create_app
+from pyfly.web.adapters.starlette.docs import make_openapi_endpoint
+from pyfly.web.openapi import OpenAPIDocument
 
 
 class TestDocEndpoints:
@@ -61,3 +68,72 @@ class TestDocEndpoints:
         client = TestClient(app)
         response = client.get("/docs")
         assert response.status_code == 404
+
+
+class TestOpenAPIEndpointCaching:
+    def test_generated_once_lazily(self):
+        calls = []
+
+        def generate():
+            calls.append(1)
+            return {"openapi": "3.1.0", "paths": {}}
+
+        app = Starlette(routes=[Route("/openapi.json", make_openapi_endpoint(OpenAPIDocument(generate)))])
+        assert calls == []
+
+        client = TestClient(app)
+        for _ in range(3):
+            assert client.get("/openapi.json").json()["openapi"] == "3.1.0"
+        assert calls == [1]
+
+    def test_etag_and_not_modified(self):
+        client = TestClient(create_app(title="Cached"))
+        response = client.get("/openapi.json", headers={"accept-encoding": "identity"})
+        etag = response.headers["etag"]
+        assert etag.startswith('"')
+        assert response.headers["cache-control"] == "no-cache"
+
+        revalidated = client.get("/openapi.json", headers={"if-none-match": etag})
+        assert revalidated.status_code == 304
+        assert revalidated.content == b""
+        assert revalidated.headers["etag"] == etag
+
+    def test_serves_precompressed_gzip(self):
+        app = create_app(title="Zipped")
+        client = TestClient(app)
+        response = client.get("/openapi.json", headers={"accept-encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.json()["info"]["title"] == "Zipped"
+        assert response.num_bytes_downloaded == len(app.state.pyfly_openapi.gzip_body)
+
+    @pytest.mark.asyncio
+    async def test_serves_pregenerated_file(self, tmp_path):
+        spec_file = tmp_path / "openapi.json"
+        spec_file.write_text(json.dumps({"openapi": "3.1.0", "info": {"title": "From file"}, "paths": {}}))
+        ctx = ApplicationContext(Config({"pyfly": {"web": {"docs": {"openapi-file": str(spec_file)}}}}))
+        await ctx.start()
+
+        client = TestClient(create_app(title="Introspected", context=ctx))
+        assert client.get("/openapi.json").json()["info"]["title"] == "From file"
+
+    @pytest.mark.asyncio
+    async def test_missing_pregenerated_file_falls_back_to_generating(self, tmp_path):
+        missing = tmp_path / "openapi.json"
+        ctx = ApplicationContext(Config({"pyfly": {"web": {"docs": {"openapi-file": str(missing)}}}}))
+        await ctx.start()
+
+        client = TestClient(create_app(title="Introspected", context=ctx))
+        assert client.get("/openapi.json").json()["info"]["title"] == "Introspected"
+
+
+class TestOpenAPIDocument:
+    def test_body_etag_and_gzip(self):
+        document = OpenAPIDocument({"openapi": "3.1.0", "info": {"title": "Café"}})
+        assert document.body == '{"openapi":"3.1.0","info":{"title":"Café"}}'.encode()
+        assert gzip.decompress(document.gzip_body) == document.body
+        assert document.etag == OpenAPIDocument.from_json(document.body).etag
+
+    def test_write_and_load(self, tmp_path):
+        document = OpenAPIDocument({"openapi": "3.1.0"})
+        document.write(tmp_path / "spec.json")
+        assert OpenAPIDocument.from_file(tmp_path / "spec.json").spec() == {"openapi": "3.1.0"}
@@ -38,3 +38,57 @@ class TestWebAutoConfiguration:
         condition_types = [c["type"] for c in conditions]
         assert "on_class" in condition_types
         assert "on_missing_bean" in condition_types
+
+    def test_compression_filter_bean_is_opt_in(self):
+        conditions = getattr(WebAutoConfiguration.compression_filter, "__pyfly_conditions__", [])
+        assert [c["type"] for c in conditions] == ["on_property"]
+        assert conditions[0]["key"] == "pyfly.web.compression.enabled"
+
+    def test_compression_filter_bean_reads_config(self):
+        from pyfly.core.config import Config
+        from pyfly.web.adapters.starlette.filters import CompressionFilter
+
+        config = Config({"pyfly": {"web": {"compression": {"enabled": True, "level": 1, "min-size": 10}}}})
+        web_filter = WebAutoConfiguration().compression_filter(config)
+        assert isinstance(web_filter, CompressionFilter)
+        assert web_filter._level == 1
+        assert web_filter._min_size == 10
+
+    def test_concurrency_filter_bean_reads_config(self):
+        from pyfly.core.config import Config
+        from pyfly.resilience import GradientLimit
+        from pyfly.web.adapters.starlette.filters import AdaptiveConcurrencyFilter
+
+        conditions = getattr(WebAutoConfiguration.concurrency_filter, "__pyfly_conditions__", [])
+        assert conditions[0]["key"] == "pyfly.web.concurrency.enabled"
+
+        config = Config(
+            {
+                "pyfly": {
+                    "web": {
+                        "concurrency": {
+                            "enabled": True,
+                            "algorithm": "gradient",
+                            "initial-limit": 7,
+                            "groups": {"reports": ["/api/reports/*"]},
+                            "low-priority-patterns": ["/admin/*"],
+                        }
+                    }
+                }
+            }
+        )
+        web_filter = WebAutoConfiguration().concurrency_filter(config)
+        assert isinstance(web_filter, AdaptiveConcurrencyFilter)
+        algorithm = web_filter._algorithm()
+        assert isinstance(algorithm, GradientLimit)
+        assert algorithm.limit == 7
+        assert web_filter.exclude_patterns == ["/actuator/*", "/health", "/ready"]
+        assert web_filter._classify("/api/reports/daily") == ("reports", False)
+        assert web_filter._classify("/admin/users") == ("default", True)
+
+    def test_request_coalescing_filter_bean(self):
+        from pyfly.web.adapters.starlette.filters import RequestCoalescingFilter
+
+        conditions = getattr(WebAutoConfiguration.request_coalescing_filter, "__pyfly_conditions__", [])
+        assert conditions[0]["key"] == "pyfly.web.coalescing.enabled"
+        assert isinstance(WebAutoConfiguration().request_coalescing_filter(), RequestCoalescingFilter)
@@ -15,6 +15,8 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 from starlette.applications import Starlette
 from starlette.middleware import Middleware
@@ -24,7 +26,7 @@ from starlette.routing import Route
 from starlette.testclient import TestClient
 
 from pyfly.container.ordering import HIGHEST_PRECEDENCE, get_order, order
-from pyfly.web.adapters.starlette.filter_chain import WebFilterChainMiddleware
+from pyfly.web.adapters.starlette.filter_chain import StreamedResponse, WebFilterChainMiddleware, after_response
 from pyfly.web.filters import OncePerRequestFilter
 
 # ---------------------------------------------------------------------------
@@ -194,6 +196,154 @@ class TestFilterChainPathsend:
         assert headers[b"x-filter-a"] == b"applied"
 
 
+async def _run(mw, path: str = "/") -> list[dict]:
+    sent: list[dict] = []
+
+    async def send(message):
+        sent.append(message)
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    scope = {"type": "http", "method": "GET", "path": path, "query_string": b"", "headers": []}
+    await mw(scope, receive, send)
+    return sent
+
+
+class BodyRewriteFilter(OncePerRequestFilter):
+    requires_response_body = True
+
+    async def do_filter(self, request, call_next):
+        response = await call_next(request)
+        return PlainTextResponse(response.body.decode().upper())
+
+
+class TestFilterChainStreaming:
+    @pytest.mark.asyncio
+    async def test_headers_filter_sees_start_before_body_is_produced(self):
+        release = asyncio.Event()
+        seen: list[object] = []
+
+        class InspectFilter(OncePerRequestFilter):
+            async def do_filter(self, request, call_next):
+                response = await call_next(request)
+                seen.append(response)
+                release.set()  # the app only finishes its body after the filter returned
+                response.headers["X-Seen"] = "1"
+                return response
+
+        async def app(scope, receive, send):
+            await send({"type": "http.response.start", "status": 201, "headers": [(b"x-app", b"1")]})
+            await release.wait()
+            await send({"type": "http.response.body", "body": b"a", "more_body": True})
+            await send({"type": "http.response.body", "body": b"b", "more_body": False})
+
+        sent = await asyncio.wait_for(_run(WebFilterChainMiddleware(app, [InspectFilter()])), timeout=2)
+
+        assert isinstance(seen[0], StreamedResponse)
+        assert sent[0]["status"] == 201
+        assert dict(sent[0]["headers"]) == {b"x-app": b"1", b"x-seen": b"1"}
+        assert [m["body"] for m in sent[1:]] == [b"a", b"b"]
+
+    @pytest.mark.asyncio
+    async def test_body_filter_switches_chain_to_buffering(self):
+        mw = WebFilterChainMiddleware(_make_app(), [HeaderFilter(), BodyRewriteFilter()])
+        sent = await _run(mw, "/test")
+        assert sent[1]["body"] == b"OK".upper()
+        assert dict(sent[0]["headers"])[b"x-filter-a"] == b"applied"
+
+    @pytest.mark.asyncio
+    async def test_body_filter_only_buffers_paths_it_applies_to(self):
+        class ApiBodyFilter(BodyRewriteFilter):
+            url_patterns = ["/api/*"]
+
+        seen: list[object] = []
+
+        class InspectFilter(OncePerRequestFilter):
+            async def do_filter(self, request, call_next):
+                response = await call_next(request)
+                seen.append(response)
+                return response
+
+        mw = WebFilterChainMiddleware(_make_app(), [InspectFilter(), ApiBodyFilter()])
+        await _run(mw, "/test")
+        await _run(mw, "/api/data")
+
+        assert isinstance(seen[0], StreamedResponse)
+        assert not isinstance(seen[1], StreamedResponse)
+
+    @pytest.mark.asyncio
+    async def test_after_response_runs_once_body_is_sent(self):
+        events: list[str] = []
+        release = asyncio.Event()
+
+        class TeardownFilter(OncePerRequestFilter):
+            async def do_filter(self, request, call_next):
+                assert after_response(lambda: events.append("outer done"))
+                response = await call_next(request)
+                events.append("outer returned")
+                release.set()
+                return response
+
+        class InnerFilter(OncePerRequestFilter):
+            async def do_filter(self, request, call_next):
+                after_response(lambda: events.append("inner done"))
+                return await call_next(request)
+
+        async def app(scope, receive, send):
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await release.wait()
+            events.append("body")
+            await send({"type": "http.response.body", "body": b"x", "more_body": False})
+
+        await _run(WebFilterChainMiddleware(app, [TeardownFilter(), InnerFilter()]))
+        assert events == ["outer returned", "body", "inner done", "outer done"]
+
+    def test_after_response_outside_chain_is_refused(self):
+        assert after_response(lambda: None) is False
+
+    @pytest.mark.asyncio
+    async def test_error_before_start_propagates_through_filters(self):
+        errors: list[Exception] = []
+
+        class CatchFilter(OncePerRequestFilter):
+            async def do_filter(self, request, call_next):
+                try:
+                    return await call_next(request)
+                except ValueError as exc:
+                    errors.append(exc)
+                    return PlainTextResponse("handled", status_code=500)
+
+        async def app(scope, receive, send):
+            raise ValueError("boom")
+
+        sent = await _run(WebFilterChainMiddleware(app, [CatchFilter()]))
+        assert str(errors[0]) == "boom"
+        assert sent[0]["status"] == 500
+
+    @pytest.mark.asyncio
+    async def test_discarded_response_cancels_downstream_app(self):
+        cancelled = asyncio.Event()
+
+        class ReplaceFilter(OncePerRequestFilter):
+            async def do_filter(self, request, call_next):
+                await call_next(request)
+                return PlainTextResponse("replaced")
+
+        async def app(scope, receive, send):
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            try:
+                while True:
+                    await send({"type": "http.response.body", "body": b"x" * 1024, "more_body": True})
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        sent = await _run(WebFilterChainMiddleware(app, [ReplaceFilter()]))
+        await asyncio.wait_for(cancelled.wait(), timeout=2)
+        assert sent[1]["body"] == b"replaced"
+
+
 class TestFilterChainCustomDiscovery:
     @pytest.mark.asyncio
     async def test_custom_filter_auto_discovered_in_create_app(self):
@@ -222,3 +372,46 @@ class TestFilterChainCustomDiscovery:
         resp = client.get("/nonexistent", follow_redirects=False)
         # The filter chain still runs even for 404 routes
         assert resp.headers.get("X-Custom") == "hello"
+
+
+class TestFilterChainApplicabilityCache:
+    @pytest.mark.asyncio
+    async def test_path_patterns_evaluated_once_per_path(self):
+        calls: list[str] = []
+
+        class CountingApiFilter(ApiOnlyFilter):
+            def applies_to_path(self, path):
+                calls.append(path)
+                return super().applies_to_path(path)
+
+        mw = WebFilterChainMiddleware(_make_app(), [CountingApiFilter()])
+        for _ in range(3):
+            sent = await _run(mw, "/api/data")
+            assert dict(sent[0]["headers"])[b"x-api-filter"] == b"applied"
+        sent = await _run(mw, "/test")
+        assert b"x-api-filter" not in dict(sent[0]["headers"])
+
+        assert calls == ["/api/data", "/test"]
+
+    @pytest.mark.asyncio
+    async def test_paths_with_same_applicability_share_a_chain(self):
+        mw = WebFilterChainMiddleware(_make_app(), [ApiOnlyFilter(), HeaderFilter()])
+        await _run(mw, "/test")
+        await _run(mw, "/health")
+        await _run(mw, "/api/data")
+        assert len(mw._chain_by_path) == 3
+        assert len(mw._chains) == 2
+
+    @pytest.mark.asyncio
+    async def test_custom_should_not_filter_is_asked_every_request(self):
+        answers = iter([False, True])
+
+        class FlakyFilter(HeaderFilter):
+            def should_not_filter(self, request):
+                return next(answers)
+
+        mw = WebFilterChainMiddleware(_make_app(), [FlakyFilter()])
+        first = await _run(mw, "/test")
+        second = await _run(mw, "/test")
+        assert b"x-filter-a" in dict(first[0]["headers"])
+        assert b"x-filter-a" not in dict(second[0]["headers"])
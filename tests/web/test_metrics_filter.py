@@ -20,14 +20,34 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from prometheus_client import REGISTRY
-
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.routing import Mount, Route
+from starlette.testclient import TestClient
+
+from pyfly.container.stereotypes import rest_controller
+from pyfly.context.application_context import ApplicationContext
+from pyfly.core.config import Config
+from pyfly.web.adapters.starlette.app import create_app
+from pyfly.web.adapters.starlette.filter_chain import WebFilterChainMiddleware
 from pyfly.web.adapters.starlette.filters.metrics_filter import MetricsFilter
+from pyfly.web.mappings import get_mapping, request_mapping
+from pyfly.web.params import PathVar
+
+
+async def _ok(request: Request) -> PlainTextResponse:
+    return PlainTextResponse("ok")
 
 
-def _make_request(method: str = "GET", path: str = "/api/users") -> MagicMock:
+def _make_request(method: str = "GET", path: str = "/api/users", template: str | None = None) -> MagicMock:
+    """A request for an app whose only route is *template* (default *path*)."""
     req = MagicMock()
     req.method = method
     req.url.path = path
+    app = Starlette(routes=[Route(template or path, _ok, methods=[method])])
+    req.scope = {"type": "http", "method": method, "path": path, "root_path": "", "app": app}
     return req
 
 
@@ -105,3 +125,70 @@ class TestMetricsFilter:
         f = MetricsFilter()
         req = _make_request("GET", "/api/users")
         assert f.should_not_filter(req) is False
+
+    @pytest.mark.asyncio
+    async def test_labels_by_route_template(self) -> None:
+        f = MetricsFilter()
+        call_next = AsyncMock(return_value=_make_response(200))
+
+        await f.do_filter(_make_request("GET", "/orders/1", template="/orders/{id}"), call_next)
+        await f.do_filter(_make_request("GET", "/orders/2", template="/orders/{id}"), call_next)
+
+        assert list(f._children) == [("GET", "/orders/{id}", "200")]
+        assert f._children["GET", "/orders/{id}", "200"][0] is f._requests_total.labels(
+            method="GET", path="/orders/{id}", status="200"
+        )
+
+    @pytest.mark.asyncio
+    async def test_unmatched_paths_and_unknown_methods_share_one_bucket(self) -> None:
+        f = MetricsFilter()
+        call_next = AsyncMock(return_value=_make_response(404))
+
+        for i in range(3):
+            req = _make_request("GET" if i else "PROPFIND", f"/scan/{i}", template="/other")
+            await f.do_filter(req, call_next)
+
+        assert set(f._children) == {("GET", "UNMATCHED", "404"), ("OTHER", "UNMATCHED", "404")}
+
+    def test_route_template_through_filter_chain(self) -> None:
+        async def show(request: Request) -> PlainTextResponse:
+            return PlainTextResponse(str(request.path_params["id"]))
+
+        f = MetricsFilter()
+        app = Starlette(
+            routes=[Route("/orders/{id}", show), Mount("/v2", routes=[Route("/items/{id:int}", show)])],
+            middleware=[Middleware(WebFilterChainMiddleware, filters=[f])],
+        )
+        labels = [("/orders/{id}", "200"), ("/v2/items/{id:int}", "200"), ("UNMATCHED", "404")]
+        before = [f._requests_total.labels(method="GET", path=p, status=s)._value.get() for p, s in labels]
+
+        client = TestClient(app)
+        for path in ("/orders/1", "/orders/2", "/v2/items/7", "/nowhere"):
+            client.get(path)
+
+        after = [f._requests_total.labels(method="GET", path=p, status=s)._value.get() for p, s in labels]
+        assert [b - a for a, b in zip(before, after, strict=True)] == [2.0, 1.0, 1.0]
+
+    @pytest.mark.asyncio
+    async def test_route_template_through_create_app(self) -> None:
+        @rest_controller
+        @request_mapping("/orders")
+        class OrderController:
+            @get_mapping("/{id}")
+            async def show(self, id: PathVar[str]) -> dict[str, str]:
+                return {"id": id}
+
+        ctx = ApplicationContext(Config({}))
+        ctx.register_bean(OrderController)
+        await ctx.start()
+        # Auto-configured, and also registered as WebFilter: it must still run once
+        f = ctx.get_bean(MetricsFilter)
+        sample = f._requests_total.labels(method="GET", path="/orders/{id}", status="200")
+        before = sample._value.get()
+
+        client = TestClient(create_app(context=ctx))
+        assert client.get("/orders/1").status_code == 200
+        assert client.get("/orders/2").status_code == 200
+
+        assert sample._value.get() - before == 2.0
+        assert f._templates == {("GET", "/orders/1"): "/orders/{id}", ("GET", "/orders/2"): "/orders/{id}"}
@@ -0,0 +1,154 @@
+# Copyright 2026 Firefly Software Solutions Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for RequestCoalescingFilter and @coalesce_requests."""
+
+import asyncio
+from typing import Any
+
+import httpx
+import pytest
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.responses import Response
+
+from pyfly.container.stereotypes import rest_controller
+from pyfly.context.application_context import ApplicationContext
+from pyfly.core.config import Config
+from pyfly.kernel.exceptions import ResourceNotFoundException
+from pyfly.web import coalesce_requests
+from pyfly.web.adapters.starlette.controller import ControllerRegistrar
+from pyfly.web.adapters.starlette.filter_chain import WebFilterChainMiddleware
+from pyfly.web.adapters.starlette.filters import RequestCoalescingFilter
+from pyfly.web.mappings import get_mapping, request_mapping
+from pyfly.web.params import PathVar
+
+
+@rest_controller
+@request_mapping("/products")
+class ProductController:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.gate = asyncio.Event()
+
+    @get_mapping("/{id}")
+    @coalesce_requests()
+    async def get_product(self, id: PathVar[str]) -> dict[str, Any]:
+        self.calls += 1
+        await self.gate.wait()
+        return {"id": id, "call": self.calls}
+
+    @get_mapping("/{id}/live")
+    async def live(self, id: PathVar[str]) -> dict[str, Any]:
+        self.calls += 1
+        await self.gate.wait()
+        return {"call": self.calls}
+
+    @get_mapping("/{id}/session")
+    @coalesce_requests()
+    async def session(self, id: PathVar[str]) -> Response:
+        self.calls += 1
+        await self.gate.wait()
+        response = Response(str(self.calls))
+        response.set_cookie("sid", str(self.calls))
+        return response
+
+    @get_mapping("/{id}/missing")
+    @coalesce_requests()
+    async def missing(self, id: PathVar[str]) -> dict[str, Any]:
+        self.calls += 1
+        await self.gate.wait()
+        raise ResourceNotFoundException(f"no product {id}")
+
+
+async def _client() -> tuple[httpx.AsyncClient, ProductController, RequestCoalescingFilter]:
+    ctx = ApplicationContext(Config({}))
+    ctx.register_bean(ProductController)
+    await ctx.start()
+    coalescing_filter = RequestCoalescingFilter()
+    app = Starlette(
+        routes=ControllerRegistrar().collect_routes(ctx),
+        middleware=[Middleware(WebFilterChainMiddleware, filters=[coalescing_filter])],
+    )
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    return (
+        httpx.AsyncClient(transport=transport, base_url="http://test"),
+        ctx.get_bean(ProductController),
+        coalescing_filter,
+    )
+
+
+async def _concurrently(client: httpx.AsyncClient, controller: ProductController, *requests: Any) -> list[Any]:
+    tasks = [asyncio.create_task(client.get(path, headers=headers or {})) for path, headers in requests]
+    for _ in range(20):
+        await asyncio.sleep(0)
+    controller.gate.set()
+    return await asyncio.gather(*tasks)
+
+
+class TestRequestCoalescingFilter:
+    @pytest.mark.asyncio
+    async def test_concurrent_duplicates_share_one_execution(self):
+        client, controller, coalescing_filter = await _client()
+        responses = await _concurrently(client, controller, *[("/products/1", None)] * 5)
+
+        assert controller.calls == 1
+        assert [r.json() for r in responses] == [{"id": "1", "call": 1}] * 5
+        assert coalescing_filter.get_stats() == {"executions": 1, "coalesced": 4, "in_flight": 0}
+
+    @pytest.mark.asyncio
+    async def test_sequential_requests_are_not_coalesced(self):
+        client, controller, _ = await _client()
+        controller.gate.set()
+        await client.get("/products/1")
+        await client.get("/products/1")
+        assert controller.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_key_includes_query_and_credentials(self):
+        client, controller, _ = await _client()
+        await _concurrently(
+            client,
+            controller,
+            ("/products/1", None),
+            ("/products/1", None),
+            ("/products/1?expand=true", None),
+            ("/products/2", None),
+            ("/products/1", {"Authorization": "Bearer other"}),
+        )
+        assert controller.calls == 4
+
+    @pytest.mark.asyncio
+    async def test_undecorated_routes_are_not_coalesced(self):
+        client, controller, _ = await _client()
+        await _concurrently(client, controller, ("/products/1/live", None), ("/products/1/live", None))
+        assert controller.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_responses_setting_cookies_are_not_shared(self):
+        client, controller, _ = await _client()
+        responses = await _concurrently(
+            client, controller, ("/products/1/session", None), ("/products/1/session", None)
+        )
+        assert controller.calls == 2
+        assert {r.cookies["sid"] for r in responses} == {"1", "2"}
+
+    @pytest.mark.asyncio
+    async def test_exception_is_shared_with_waiting_requests(self):
+        client, controller, coalescing_filter = await _client()
+        responses = await _concurrently(
+            client, controller, ("/products/1/missing", None), ("/products/1/missing", None)
+        )
+        assert controller.calls == 1
+        assert [r.status_code for r in responses] == [500, 500]
+        assert coalescing_filter.get_stats()["in_flight"] == 0
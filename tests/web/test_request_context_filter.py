@@ -4,10 +4,13 @@ import pytest
 from starlette.applications import Starlette
 from starlette.middleware import Middleware
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, StreamingResponse
 from starlette.routing import Route
 from starlette.testclient import TestClient
 
+from pyfly.container.container import Container
+from pyfly.container.types import Scope
+from pyfly.context.lifecycle import pre_destroy
 from pyfly.context.request_context import RequestContext
 from pyfly.web.adapters.starlette.filter_chain import WebFilterChainMiddleware
 from pyfly.web.adapters.starlette.filters.request_context_filter import (
@@ -65,3 +68,60 @@ class TestRequestContextFilter:
     def test_context_cleared_after_request(self, client):
         client.get("/test")
         assert RequestContext.current() is None
+
+    def test_request_scoped_beans_destroyed_at_request_end(self):
+        closed: list[str] = []
+
+        class RequestCache:
+            @pre_destroy
+            def close(self) -> None:
+                closed.append(RequestContext.current().request_id)
+
+        container = Container()
+        container.register(RequestCache, scope=Scope.REQUEST)
+
+        async def uses_bean(request: Request) -> JSONResponse:
+            container.resolve(RequestCache)
+            return JSONResponse({"closed": list(closed)})
+
+        app = Starlette(
+            routes=[Route("/bean", uses_bean)],
+            middleware=[Middleware(WebFilterChainMiddleware, filters=[RequestContextFilter()])],
+        )
+        client = TestClient(app)
+
+        response = client.get("/bean", headers={"X-Request-Id": "req-1"})
+        assert response.json() == {"closed": []}
+        assert closed == ["req-1"]
+
+    def test_request_scoped_beans_outlive_streaming_body(self):
+        events: list[str] = []
+
+        class RequestCache:
+            @pre_destroy
+            def close(self) -> None:
+                events.append("destroyed")
+
+        container = Container()
+        container.register(RequestCache, scope=Scope.REQUEST)
+
+        async def streams(request: Request) -> StreamingResponse:
+            async def body():
+                for chunk in ("a", "b"):
+                    cache = container.resolve(RequestCache)
+                    events.append(f"chunk {chunk} {RequestContext.current() is not None} {id(cache)}")
+                    yield chunk
+
+            return StreamingResponse(body())
+
+        app = Starlette(
+            routes=[Route("/stream", streams)],
+            middleware=[Middleware(WebFilterChainMiddleware, filters=[RequestContextFilter()])],
+        )
+
+        assert TestClient(app).get("/stream").text == "ab"
+        assert events[0].startswith("chunk a True")
+        assert events[1].startswith("chunk b True")
+        assert events[0].split()[-1] == events[1].split()[-1]  # same request instance
+        assert events[2:] == ["destroyed"]
+        assert RequestContext.current() is None
@@ -13,11 +13,16 @@
 # limitations under the License.
 """Tests for ParameterResolver — auto-binding from Starlette Request."""
 
+import enum
 import json
+import uuid
+from datetime import date, datetime
 
 import pytest
 from pydantic import BaseModel
+from starlette.requests import Request
 
+from pyfly.kernel.exceptions import InvalidRequestException
 from pyfly.web.adapters.starlette.resolver import ParameterResolver
 from pyfly.web.params import Body, Cookie, Header, PathVar, QueryParam
 
@@ -235,3 +240,90 @@ class TestParameterResolverResolve:
         request = Request(scope)
         kwargs = await resolver.resolve(request)
         assert kwargs == {"session_id": "abc-session"}
+
+
+class Color(enum.Enum):
+    RED = "red"
+    GREEN = "green"
+
+
+def _request(query: bytes = b"", headers: list[tuple[bytes, bytes]] | None = None, **path_params: str) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/",
+            "path_params": path_params,
+            "query_string": query,
+            "headers": headers or [],
+        }
+    )
+
+
+class TestParameterResolverCoercion:
+    async def test_list_query_param_collects_repeated_keys(self):
+        async def handler(self, ids: QueryParam[list[int]]):
+            pass
+
+        kwargs = await ParameterResolver(handler).resolve(_request(b"ids=1&ids=2&ids=3"))
+        assert kwargs == {"ids": [1, 2, 3]}
+
+    async def test_missing_list_uses_default(self):
+        async def handler(self, tags: QueryParam[list[str]] = None):
+            pass
+
+        assert await ParameterResolver(handler).resolve(_request()) == {"tags": None}
+
+    async def test_list_path_var_is_comma_separated(self):
+        async def handler(self, ids: PathVar[list[int]]):
+            pass
+
+        assert await ParameterResolver(handler).resolve(_request(ids="4,5")) == {"ids": [4, 5]}
+
+    async def test_enum_by_value_or_name(self):
+        async def handler(self, color: QueryParam[Color], other: QueryParam[Color]):
+            pass
+
+        kwargs = await ParameterResolver(handler).resolve(_request(b"color=red&other=GREEN"))
+        assert kwargs == {"color": Color.RED, "other": Color.GREEN}
+
+    async def test_uuid_datetime_and_date(self):
+        async def handler(self, item_id: PathVar[uuid.UUID], since: QueryParam[datetime], day: Header[date]):
+            pass
+
+        item_id = uuid.uuid4()
+        kwargs = await ParameterResolver(handler).resolve(
+            _request(b"since=2026-01-02T03:04:05", [(b"day", b"2026-05-06")], item_id=str(item_id))
+        )
+        assert kwargs == {"item_id": item_id, "since": datetime(2026, 1, 2, 3, 4, 5), "day": date(2026, 5, 6)}
+
+    async def test_optional_inner_type_is_unwrapped(self):
+        async def handler(self, page: QueryParam[int | None] = None):
+            pass
+
+        assert await ParameterResolver(handler).resolve(_request(b"page=3")) == {"page": 3}
+
+    async def test_conversion_failure_is_invalid_request(self):
+        async def handler(self, color: QueryParam[Color]):
+            pass
+
+        with pytest.raises(InvalidRequestException, match="Cannot convert 'blue' to Color"):
+            await ParameterResolver(handler).resolve(_request(b"color=blue"))
+
+    async def test_missing_path_var_raises(self):
+        async def handler(self, item_id: PathVar[int]):
+            pass
+
+        with pytest.raises(ValueError, match="Missing path variable: item_id"):
+            await ParameterResolver(handler).resolve(_request())
+
+    async def test_non_model_body_is_parsed_as_json(self):
+        async def handler(self, body: Body[dict[str, int]]):
+            pass
+
+        async def receive():
+            return {"type": "http.request", "body": b'{"a": 1}'}
+
+        scope = {"type": "http", "method": "POST", "path": "/", "query_string": b"", "headers": []}
+        kwargs = await ParameterResolver(handler).resolve(Request(scope, receive))
+        assert kwargs == {"body": {"a": 1}}
@@ -13,10 +13,21 @@
 # limitations under the License.
 """Tests for return value handler."""
 
-from pydantic import BaseModel
-from starlette.responses import HTMLResponse, JSONResponse
+import json
+import uuid
+from datetime import datetime
 
-from pyfly.web.adapters.starlette.response import handle_return_value
+from pydantic import BaseModel, Field
+from starlette.responses import HTMLResponse, JSONResponse, StreamingResponse
+
+from pyfly.web.adapters.starlette.response import (
+    XML_STREAM_THRESHOLD,
+    XMLResponse,
+    encode_json,
+    handle_return_value,
+    json_encoder_for,
+)
+from pyfly.web.converters import dict_to_xml, xml_to_dict
 
 
 class ItemResponse(BaseModel):
@@ -24,6 +35,14 @@ class ItemResponse(BaseModel):
     name: str
 
 
+class DetailedItem(ItemResponse):
+    price: float = 1.5
+
+
+class AliasedUser(BaseModel):
+    user_name: str = Field(alias="userName")
+
+
 class TestHandleReturnValue:
     def test_pydantic_model(self):
         item = ItemResponse(id="1", name="Widget")
@@ -61,3 +80,98 @@ class TestHandleReturnValue:
     def test_string(self):
         response = handle_return_value("hello")
         assert isinstance(response, JSONResponse)
+
+    def test_model_body(self):
+        response = handle_return_value(ItemResponse(id="1", name="Widget"))
+        assert json.loads(response.body) == {"id": "1", "name": "Widget"}
+        assert response.headers["content-type"] == "application/json"
+
+    def test_dict_with_nested_models_and_rich_types(self):
+        uid = uuid.UUID(int=1)
+        result = {"item": ItemResponse(id="1", name="W"), "at": datetime(2026, 1, 2), "ref": uid, 3: None}
+        body = json.loads(handle_return_value(result).body)
+        assert body == {"item": {"id": "1", "name": "W"}, "at": "2026-01-02T00:00:00", "ref": str(uid), "3": None}
+
+    def test_non_ascii_and_nan(self):
+        assert json.loads(handle_return_value({"name": "café", "score": float("nan")}).body) == {
+            "name": "café",
+            "score": None,
+        }
+
+    def test_aliased_model_uses_field_names(self):
+        user = AliasedUser(userName="ada")
+        assert json.loads(handle_return_value(user).body) == {"user_name": "ada"}
+        assert json.loads(handle_return_value({"user": user}).body) == {"user": {"user_name": "ada"}}
+
+        def handler() -> list[AliasedUser]: ...
+
+        assert json.loads(json_encoder_for(handler)([user])) == [{"user_name": "ada"}]
+
+    def test_custom_encoder(self):
+        response = handle_return_value({"a": 1}, encoder=lambda _: b"[]")
+        assert response.body == b"[]"
+
+
+class TestXmlResponses:
+    def test_xml_when_accepted(self):
+        response = handle_return_value({"id": "1", "tags": ["a", "b"]}, accept="application/xml")
+        assert isinstance(response, XMLResponse)
+        assert response.body.decode() == dict_to_xml({"id": "1", "tags": ["a", "b"]})
+
+    def test_large_list_is_streamed(self):
+        items = [{"id": str(i)} for i in range(XML_STREAM_THRESHOLD + 1)]
+        response = handle_return_value(items, status_code=201, accept="application/xml")
+        assert isinstance(response, StreamingResponse)
+        assert response.status_code == 201
+        assert response.media_type == "application/xml"
+
+    async def test_streamed_body_matches_document(self):
+        items = [{"id": str(i)} for i in range(XML_STREAM_THRESHOLD + 1)]
+        response = handle_return_value(items, accept="application/xml")
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        assert body.decode() == dict_to_xml(items)
+        assert len(xml_to_dict(body)["response"]["item"]) == len(items)
+
+
+class TestJsonEncoderFor:
+    def test_list_of_models_uses_typed_adapter(self):
+        async def handler() -> list[ItemResponse]: ...
+
+        encoder = json_encoder_for(handler)
+        assert encoder is not encode_json
+        items = [ItemResponse(id=str(i), name="W") for i in range(3)]
+        assert json.loads(encoder(items)) == [{"id": str(i), "name": "W"} for i in range(3)]
+
+    def test_encoder_is_cached_per_annotation(self):
+        async def first() -> list[ItemResponse] | None: ...
+
+        async def second() -> list[ItemResponse]: ...
+
+        assert json_encoder_for(first) is json_encoder_for(second)
+
+    def test_subclass_items_keep_their_fields(self):
+        async def handler() -> list[ItemResponse]: ...
+
+        body = json.loads(json_encoder_for(handler)([ItemResponse(id="1", name="A"), DetailedItem(id="2", name="B")]))
+        assert body[1] == {"id": "2", "name": "B", "price": 1.5}
+
+    def test_mismatched_value_falls_back(self):
+        async def handler() -> list[ItemResponse]: ...
+
+        assert json.loads(json_encoder_for(handler)([{"id": "1"}])) == [{"id": "1"}]
+
+    def test_other_annotations_use_generic_encoder(self):
+        async def as_dict() -> dict[str, int]: ...
+
+        async def as_model() -> ItemResponse: ...
+
+        async def unannotated(): ...
+
+        assert json_encoder_for(as_dict) is encode_json
+        assert json_encoder_for(as_model) is encode_json
+        assert json_encoder_for(unannotated) is encode_json
+
+    def test_unresolvable_annotation(self):
+        async def handler() -> "MissingModel": ...  # noqa: F821
+
+        assert json_encoder_for(handler) is encode_json
@@ -0,0 +1,213 @@
+# Copyright 2026 Firefly Software Solutions Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for ResponseCacheFilter and @cache_response."""
+
+from datetime import timedelta
+from typing import Any
+
+import pytest
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.responses import Response
+from starlette.testclient import TestClient
+
+from pyfly.cache import CacheManager
+from pyfly.cache.adapters.memory import InMemoryCache
+from pyfly.container.stereotypes import rest_controller
+from pyfly.context.application_context import ApplicationContext
+from pyfly.core.config import Config
+from pyfly.web import cache_response
+from pyfly.web.adapters.starlette.controller import ControllerRegistrar
+from pyfly.web.adapters.starlette.filter_chain import WebFilterChainMiddleware
+from pyfly.web.adapters.starlette.filters import ResponseCacheFilter
+from pyfly.web.mappings import get_mapping, post_mapping, request_mapping
+from pyfly.web.params import PathVar
+
+
+@rest_controller
+@request_mapping("/products")
+class ProductController:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    @get_mapping("/{id}")
+    @cache_response(ttl=timedelta(minutes=1), vary=["Accept-Language"])
+    async def get_product(self, id: PathVar[str]) -> dict[str, Any]:
+        self.calls += 1
+        return {"id": id, "call": self.calls}
+
+    @post_mapping("/{id}")
+    async def update_product(self, id: PathVar[str]) -> dict[str, Any]:
+        return {"id": id}
+
+    @get_mapping("/{id}/live")
+    async def live(self, id: PathVar[str]) -> dict[str, Any]:
+        self.calls += 1
+        return {"call": self.calls}
+
+    @get_mapping("/{id}/profile")
+    @cache_response()
+    async def profile(self, id: PathVar[str]) -> dict[str, Any]:
+        self.calls += 1
+        return {"call": self.calls}
+
+    @get_mapping("/{id}/public")
+    @cache_response(vary=())
+    async def public(self, id: PathVar[str]) -> Response:
+        self.calls += 1
+        return Response(str(self.calls), headers={"cache-control": "max-age=60"})
+
+    @get_mapping("/{id}/private")
+    @cache_response()
+    async def private(self, id: PathVar[str]) -> Response:
+        self.calls += 1
+        return Response(str(self.calls), headers={"cache-control": "private"})
+
+
+class BrokenCache(InMemoryCache):
+    async def get(self, key: str) -> Any:
+        raise ConnectionError("cache down")
+
+    async def put(self, key: str, value: Any, ttl: timedelta | None = None) -> None:
+        raise ConnectionError("cache down")
+
+
+async def _client(cache: Any) -> tuple[TestClient, ProductController, ResponseCacheFilter]:
+    ctx = ApplicationContext(Config({}))
+    ctx.register_bean(ProductController)
+    await ctx.start()
+    cache_filter = ResponseCacheFilter(cache)
+    app = Starlette(
+        routes=ControllerRegistrar().collect_routes(ctx),
+        middleware=[Middleware(WebFilterChainMiddleware, filters=[cache_filter])],
+    )
+    return TestClient(app), ctx.get_bean(ProductController), cache_filter
+
+
+class TestResponseCacheFilter:
+    @pytest.mark.asyncio
+    async def test_second_request_is_served_from_cache(self):
+        client, controller, cache_filter = await _client(InMemoryCache())
+        first = client.get("/products/1")
+        second = client.get("/products/1")
+
+        assert first.json() == second.json() == {"id": "1", "call": 1}
+        assert controller.calls == 1
+        assert first.headers["etag"] == second.headers["etag"]
+        assert first.headers["etag"].startswith('"')
+        assert second.headers["vary"] == "accept-language"
+        assert cache_filter.get_stats() == {"hits": 1, "misses": 1, "not_modified": 0, "stores": 1, "hit_ratio": 0.5}
+
+    @pytest.mark.asyncio
+    async def test_if_none_match_returns_304_without_calling_handler(self):
+        client, controller, cache_filter = await _client(InMemoryCache())
+        etag = client.get("/products/1").headers["etag"]
+
+        response = client.get("/products/1", headers={"If-None-Match": f'W/"other", {etag}'})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+        assert controller.calls == 1
+        assert cache_filter.get_stats()["not_modified"] == 1
+
+    @pytest.mark.asyncio
+    async def test_key_includes_query_and_vary_headers(self):
+        client, controller, _ = await _client(InMemoryCache())
+        client.get("/products/1")
+        client.get("/products/1?expand=true")
+        client.get("/products/1", headers={"Accept-Language": "de"})
+        client.get("/products/2")
+        assert controller.calls == 4
+
+    @pytest.mark.asyncio
+    async def test_credentials_select_separate_entries_by_default(self):
+        client, controller, _ = await _client(InMemoryCache())
+        alice = client.get("/products/1/profile", headers={"Authorization": "Bearer alice"})
+        bob = client.get("/products/1/profile", headers={"Authorization": "Bearer bob"})
+        again = client.get("/products/1/profile", headers={"Authorization": "Bearer alice"})
+
+        assert (alice.json(), bob.json(), again.json()) == ({"call": 1}, {"call": 2}, {"call": 1})
+        assert alice.headers["vary"] == "authorization, cookie"
+        assert controller.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_keys_hash_credentials_and_query(self):
+        cache = InMemoryCache()
+        client, _, _ = await _client(cache)
+        client.get("/products/1/profile?q=secret-query", headers={"Authorization": "Bearer s3cr3t-token"})
+
+        (key,) = cache.get_keys()
+        assert key.startswith("pyfly:response:GET:/products/1/profile#")
+        assert "s3cr3t-token" not in key
+        assert "secret-query" not in key
+
+    @pytest.mark.asyncio
+    async def test_304_repeats_stored_cache_headers(self):
+        client, _, _ = await _client(InMemoryCache())
+        etag = client.get("/products/1/public").headers["etag"]
+
+        response = client.get("/products/1/public", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["cache-control"] == "max-age=60"
+        assert response.headers["etag"] == etag
+
+    @pytest.mark.asyncio
+    async def test_head_hit_has_no_body(self):
+        client, controller, _ = await _client(InMemoryCache())
+        client.get("/products/1/public")
+
+        response = client.head("/products/1/public")
+        assert response.status_code == 200
+        assert response.content == b""
+        assert response.headers["content-length"] == "1"
+        assert controller.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_undecorated_and_non_get_requests_pass_through(self):
+        client, controller, cache_filter = await _client(InMemoryCache())
+        client.get("/products/1/live")
+        client.get("/products/1/live")
+        assert client.post("/products/1").json() == {"id": "1"}
+        assert controller.calls == 2
+        assert cache_filter.get_stats()["misses"] == 0
+
+    @pytest.mark.asyncio
+    async def test_private_responses_are_not_stored(self):
+        client, controller, cache_filter = await _client(InMemoryCache())
+        assert client.get("/products/1/private").text == "1"
+        assert client.get("/products/1/private").text == "2"
+        assert cache_filter.get_stats()["stores"] == 0
+
+    @pytest.mark.asyncio
+    async def test_evict(self):
+        client, controller, cache_filter = await _client(InMemoryCache())
+        client.get("/products/1")
+        assert await cache_filter.evict("GET", "/products/1", vary_values=("",))
+        client.get("/products/1")
+        assert controller.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_manager_failover(self):
+        fallback = InMemoryCache()
+        client, controller, _ = await _client(CacheManager(primary=BrokenCache(), fallback=fallback))
+        client.get("/products/1")
+        assert client.get("/products/1").json()["call"] == 1
+        assert fallback.get_keys()
+
+    @pytest.mark.asyncio
+    async def test_cache_errors_degrade_to_handler(self):
+        client, controller, cache_filter = await _client(BrokenCache())
+        assert client.get("/products/1").json()["call"] == 1
+        assert client.get("/products/1").json()["call"] == 2
+        assert cache_filter.get_stats()["stores"] == 0
@@ -0,0 +1,73 @@
+# Copyright 2026 Firefly Software Solutions Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the route policy lookup shared by the caching and coalescing filters."""
+
+from __future__ import annotations
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from pyfly.web.adapters.starlette import route_policy
+from pyfly.web.adapters.starlette.route_policy import RoutePolicies, request_key_digest
+
+
+async def _cached(request: Request) -> PlainTextResponse:
+    return PlainTextResponse("ok")
+
+
+_cached.__pyfly_test_policy__ = "cached"  # type: ignore[attr-defined]
+
+
+async def _plain(request: Request) -> PlainTextResponse:
+    return PlainTextResponse("ok")
+
+
+_APP = Starlette(routes=[Route("/cached/{id}", _cached), Route("/plain", _plain, methods=["POST"])])
+
+
+def _request(path: str, method: str = "GET") -> Request:
+    return Request({"type": "http", "method": method, "path": path, "query_string": b"", "headers": [], "app": _APP})
+
+
+class TestRoutePolicies:
+    def test_reads_the_policy_of_the_matching_route(self) -> None:
+        policies: RoutePolicies[str] = RoutePolicies("__pyfly_test_policy__")
+        assert policies.get(_request("/cached/1")) == "cached"
+        assert policies.get(_request("/plain", method="POST")) is None
+        assert policies.get(_request("/missing")) is None
+
+    def test_method_override(self) -> None:
+        assert RoutePolicies("__pyfly_test_policy__").get(_request("/cached/1", method="POST")) is None
+        policies: RoutePolicies[str] = RoutePolicies("__pyfly_test_policy__", method="GET")
+        assert policies.get(_request("/cached/1", method="HEAD")) == "cached"
+
+    def test_cache_is_bounded(self, monkeypatch) -> None:
+        monkeypatch.setattr(route_policy, "MAX_CACHED_PATHS", 2)
+        policies: RoutePolicies[str] = RoutePolicies("__pyfly_test_policy__")
+        for i in range(5):
+            policies.get(_request(f"/cached/{i}"))
+        assert len(policies._policies) <= 2
+
+
+class TestRequestKeyDigest:
+    def test_hides_values_and_has_fixed_length(self) -> None:
+        digest = request_key_digest("q=secret", ("Bearer token-123",))
+        assert "secret" not in digest and "token" not in digest
+        assert len(digest) == len(request_key_digest("x" * 10_000, ()))
+
+    def test_parts_are_delimited(self) -> None:
+        assert request_key_digest("a", ("b",)) != request_key_digest("ab", ("",))
+        assert request_key_digest("", ("a", "b")) != request_key_digest("", ("ab",))
@@ -0,0 +1,156 @@
+# Copyright 2026 Firefly Software Solutions Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the radix-tree router."""
+
+import uuid
+
+import pytest
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, PlainTextResponse
+from starlette.routing import Match, Mount, Route, Router, WebSocketRoute
+from starlette.testclient import TestClient
+from starlette.websockets import WebSocket
+
+from pyfly.context.application_context import ApplicationContext
+from pyfly.core.config import Config
+from pyfly.web.adapters.starlette.app import create_app
+from pyfly.web.adapters.starlette.routing import RadixRouter, match_route_path
+
+
+def endpoint(name: str):
+    async def handler(request: Request) -> JSONResponse:
+        return JSONResponse({"route": name, "params": {k: repr(v) for k, v in request.path_params.items()}})
+
+    return handler
+
+
+async def ws_echo(websocket: WebSocket) -> None:
+    await websocket.accept()
+    await websocket.send_text(websocket.path_params["room"])
+    await websocket.close()
+
+
+def make_client(routes: list) -> TestClient:
+    app = Starlette()
+    app.router = RadixRouter(routes)
+    return TestClient(app)
+
+
+def scope(path: str, method: str = "GET", type_: str = "http") -> dict:
+    return {"type": type_, "path": path, "method": method, "root_path": ""}
+
+
+class TestRadixRouterMatching:
+    def test_static_and_typed_params(self):
+        oid = uuid.uuid4()
+        client = make_client(
+            [
+                Route("/orders", endpoint("list")),
+                Route("/orders/{id:int}", endpoint("by-int")),
+                Route("/orders/{id:uuid}", endpoint("by-uuid")),
+                Route("/orders/{id:int}/lines/{line}", endpoint("line")),
+            ]
+        )
+        assert client.get("/orders").json()["route"] == "list"
+        assert client.get("/orders/42").json() == {"route": "by-int", "params": {"id": "42"}}
+        assert client.get(f"/orders/{oid}").json() == {"route": "by-uuid", "params": {"id": repr(oid)}}
+        assert client.get("/orders/7/lines/a").json()["params"] == {"id": "7", "line": "'a'"}
+        assert client.get("/orders/abc").status_code == 404
+
+    def test_declaration_order_wins(self):
+        router = RadixRouter([Route("/users/{name}", endpoint("param")), Route("/users/me", endpoint("static"))])
+        route, match, child = router.match(scope("/users/me"))
+        assert route is router.routes[0]
+        assert match is Match.FULL
+        assert child["path_params"] == {"name": "me"}
+
+    def test_wrong_method_is_partial(self):
+        client = make_client([Route("/items", endpoint("post"), methods=["POST"])])
+        response = client.get("/items")
+        assert response.status_code == 405
+
+    def test_same_path_different_methods(self):
+        client = make_client(
+            [
+                Route("/items", endpoint("get"), methods=["GET"]),
+                Route("/items", endpoint("post"), methods=["POST"]),
+            ]
+        )
+        assert client.post("/items").json()["route"] == "post"
+        assert client.get("/items").json()["route"] == "get"
+
+    def test_complex_patterns_fall_back_in_order(self):
+        router = RadixRouter(
+            [
+                Route("/files/{name}.{ext}", endpoint("split")),
+                Route("/files/{name}", endpoint("plain")),
+                Route("/static/{rest:path}", endpoint("path")),
+            ]
+        )
+        assert router.match(scope("/files/report.pdf"))[0] is router.routes[0]
+        assert router.match(scope("/files/report"))[0] is router.routes[1]
+        assert router.match(scope("/static/css/site.css"))[2]["path_params"] == {"rest": "css/site.css"}
+
+    def test_mount_and_trailing_slash_redirect(self):
+        inner = Route("/ping", lambda request: PlainTextResponse("pong"))
+        client = make_client([Route("/orders/", endpoint("slash")), Mount("/admin", routes=[inner])])
+        assert client.get("/admin/ping").text == "pong"
+        response = client.get("/orders", follow_redirects=False)
+        assert response.status_code == 307
+        assert response.headers["location"].endswith("/orders/")
+
+    def test_websocket_routes(self):
+        client = make_client([Route("/rooms/{room}", endpoint("http")), WebSocketRoute("/rooms/{room}", ws_echo)])
+        with client.websocket_connect("/rooms/lobby") as ws:
+            assert ws.receive_text() == "lobby"
+        assert client.get("/rooms/lobby").json()["route"] == "http"
+
+    def test_routes_added_later_are_indexed(self):
+        router = RadixRouter([Route("/a", endpoint("a"))])
+        assert router.match(scope("/b"))[0] is None
+        router.routes.append(Route("/b", endpoint("b")))
+        assert router.match(scope("/b"))[0] is router.routes[1]
+
+
+class TestMatchRoutePath:
+    @pytest.mark.parametrize("router_cls", [Router, RadixRouter])
+    def test_templates_with_mount_prefixes(self, router_cls):
+        router = router_cls(
+            [
+                Route("/orders/{id}", endpoint("order"), methods=["GET"]),
+                Mount("/v2", routes=[Route("/items/{id:int}", endpoint("item"))]),
+            ]
+        )
+        assert match_route_path(router, scope("/orders/1")) == "/orders/{id}"
+        assert match_route_path(router, scope("/orders/1", method="POST")) == "/orders/{id}"
+        assert match_route_path(router, scope("/v2/items/7")) == "/v2/items/{id:int}"
+        assert match_route_path(router, scope("/v2/items/x")) is None
+        assert match_route_path(router, scope("/nowhere")) is None
+
+
+class TestCreateAppRouter:
+    @pytest.mark.asyncio
+    async def test_radix_router_from_config(self):
+        ctx = ApplicationContext(Config({"pyfly": {"web": {"router": "radix"}}}))
+        await ctx.start()
+        app = create_app(context=ctx)
+        assert isinstance(app.router, RadixRouter)
+        assert TestClient(app).get("/openapi.json").status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_starlette_router_by_default(self):
+        ctx = ApplicationContext(Config({}))
+        await ctx.start()
+        assert not isinstance(create_app(context=ctx).router, RadixRouter)
@@ -0,0 +1,184 @@
+# Copyright 2026 Firefly Software Solutions Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for SseBroadcaster — shared-encoding SSE fan-out with replay."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import httpx
+import pytest
+from starlette.applications import Starlette
+from starlette.routing import Route
+
+from pyfly.web.params import Header
+from pyfly.web.sse import SseBroadcaster, sse_mapping
+from pyfly.web.sse.adapters.starlette import SSERegistrar
+
+
+async def _take(subscription, count: int) -> list[bytes]:
+    chunks: list[bytes] = []
+    iterator = aiter(subscription)
+    while sum(chunk.count(b"\n\n") for chunk in chunks) < count:
+        chunks.append(await asyncio.wait_for(anext(iterator), 1.0))
+    await iterator.aclose()
+    return chunks
+
+
+class TestPublish:
+    async def test_encodes_each_event_once(self):
+        broadcaster = SseBroadcaster()
+        subscriptions = [broadcaster.subscribe("prices") for _ in range(3)]
+
+        with patch("pyfly.web.sse.broadcast.format_sse_event", wraps=lambda *a, **kw: "data: x\n\n") as fmt:
+            assert broadcaster.publish("prices", {"price": 1}) == 3
+        assert fmt.call_count == 1
+
+        chunks = [await _take(s, 1) for s in subscriptions]
+        assert chunks[0] == chunks[1] == chunks[2] == [b"data: x\n\n"]
+        assert chunks[0][0] is chunks[1][0]
+
+    async def test_numbers_events_per_topic(self):
+        broadcaster = SseBroadcaster()
+        subscription = broadcaster.subscribe("prices")
+        broadcaster.publish("prices", {"price": 1}, event="tick")
+        broadcaster.publish("prices", "plain")
+        broadcaster.publish("other", "ignored")
+
+        (chunk,) = await _take(subscription, 2)
+        assert chunk == b'id: 1\nevent: tick\ndata: {"price": 1}\n\nid: 2\ndata: plain\n\n'
+
+    async def test_explicit_id(self):
+        broadcaster = SseBroadcaster()
+        subscription = broadcaster.subscribe("orders")
+        broadcaster.publish("orders", "created", id="order-7")
+        assert await _take(subscription, 1) == [b"id: order-7\ndata: created\n\n"]
+
+    async def test_publish_without_subscribers(self):
+        broadcaster = SseBroadcaster()
+        assert broadcaster.publish("prices", 1) == 0
+        assert broadcaster.get_stats()["published"] == 1
+
+
+class TestBackpressure:
+    async def test_drop_policy_skips_events_for_full_subscriber(self):
+        broadcaster = SseBroadcaster(queue_size=2)
+        slow = broadcaster.subscribe("prices")
+        for i in range(5):
+            broadcaster.publish("prices", i)
+
+        assert slow.dropped == 3
+        assert not slow.closed
+        (chunk,) = await _take(slow, 2)
+        assert chunk == b"id: 1\ndata: 0\n\nid: 2\ndata: 1\n\n"
+        assert broadcaster.get_stats()["dropped"] == 3
+
+    async def test_disconnect_policy_ends_slow_subscriber(self):
+        broadcaster = SseBroadcaster(queue_size=2, overflow="disconnect")
+        slow = broadcaster.subscribe("prices")
+        fast = broadcaster.subscribe("prices")
+        fast_reader = aiter(fast)
+        for i in range(3):
+            broadcaster.publish("prices", i)
+            await anext(fast_reader)
+
+        assert slow.closed
+        assert [chunk async for chunk in slow] == []
+        assert not fast.closed
+        assert broadcaster.subscriber_count("prices") == 1
+        assert broadcaster.get_stats()["disconnected"] == 1
+        await fast_reader.aclose()
+
+    def test_invalid_overflow_policy(self):
+        with pytest.raises(ValueError, match="overflow"):
+            SseBroadcaster(overflow="spill")
+
+
+class TestReplay:
+    async def test_replays_events_after_last_event_id(self):
+        broadcaster = SseBroadcaster()
+        for i in range(4):
+            broadcaster.publish("prices", i)
+
+        subscription = broadcaster.subscribe("prices", last_event_id="2")
+        broadcaster.publish("prices", 4)
+        (chunk,) = await _take(subscription, 3)
+        assert chunk == b"id: 3\ndata: 2\n\nid: 4\ndata: 3\n\nid: 5\ndata: 4\n\n"
+
+    async def test_unknown_id_replays_whole_buffer(self):
+        broadcaster = SseBroadcaster(buffer_size=2)
+        for i in range(4):
+            broadcaster.publish("prices", i)
+
+        subscription = broadcaster.subscribe("prices", last_event_id="1")
+        (chunk,) = await _take(subscription, 2)
+        assert chunk == b"id: 3\ndata: 2\n\nid: 4\ndata: 3\n\n"
+
+    async def test_no_replay_without_last_event_id(self):
+        broadcaster = SseBroadcaster()
+        broadcaster.publish("prices", 0)
+        subscription = broadcaster.subscribe("prices")
+        broadcaster.publish("prices", 1)
+        assert await _take(subscription, 1) == [b"id: 2\ndata: 1\n\n"]
+
+
+class TestLifecycle:
+    async def test_close_flushes_queued_events_then_ends(self):
+        broadcaster = SseBroadcaster()
+        subscription = broadcaster.subscribe("prices")
+        broadcaster.publish("prices", 1)
+        broadcaster.close("prices")
+
+        assert [chunk async for chunk in subscription] == [b"id: 1\ndata: 1\n\n"]
+        assert broadcaster.subscriber_count("prices") == 0
+
+    async def test_cancelled_reader_unsubscribes(self):
+        broadcaster = SseBroadcaster()
+        subscription = broadcaster.subscribe("prices")
+
+        async def _read() -> None:
+            async for _ in subscription:
+                pass
+
+        task = asyncio.create_task(_read())
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert broadcaster.subscriber_count("prices") == 0
+        assert broadcaster.publish("prices", 1) == 0
+
+
+class TestSseMappingIntegration:
+    async def test_handler_returning_subscription(self):
+        broadcaster = SseBroadcaster()
+        for i in range(3):
+            broadcaster.publish("prices", i)
+
+        class PriceController:
+            @sse_mapping("/prices")
+            async def prices(self, last_event_id: Header[str] = ""):
+                subscription = broadcaster.subscribe("prices", last_event_id=last_event_id or None)
+                broadcaster.close("prices")  # end the stream after the replay
+                return subscription
+
+        ctx = SimpleNamespace(get_bean=lambda cls: cls())
+        endpoint = SSERegistrar._make_lazy_handler(ctx, PriceController, "prices")
+        app = Starlette(routes=[Route("/prices", endpoint)])
+
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get("/prices", headers={"Last-Event-ID": "1"})
+
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert response.text == "id: 2\ndata: 1\n\nid: 3\ndata: 2\n\n"
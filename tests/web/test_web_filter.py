@@ -15,11 +15,12 @@
 
 from __future__ import annotations
 
+from fnmatch import fnmatch
 from unittest.mock import MagicMock
 
 import pytest
 
-from pyfly.web.filters import OncePerRequestFilter
+from pyfly.web.filters import OncePerRequestFilter, path_matcher
 from pyfly.web.ports.filter import WebFilter
 
 # ---------------------------------------------------------------------------
@@ -117,6 +118,16 @@ class TestOncePerRequestFilterMatching:
         assert f2.url_patterns == []
 
 
+class TestPathMatcher:
+    @pytest.mark.parametrize("path", ["/api/users", "/api/", "/apix", "/health", "/a?b", "/static/app.js"])
+    def test_agrees_with_fnmatch(self, path):
+        patterns = ["/api/*", "/health", "/static/*.js", "/a[?]b"]
+        assert path_matcher(patterns)(path) == any(fnmatch(path, p) for p in patterns)
+
+    def test_empty_patterns_match_nothing(self):
+        assert not path_matcher([])("/anything")
+
+
 class TestOncePerRequestFilterAbstract:
     def test_cannot_instantiate_without_do_filter(self):
         with pytest.raises(TypeError):
@@ -0,0 +1,263 @@
+# Copyright 2026 Firefly Software Solutions Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for RoomManager — WebSocket rooms with queued, shared-frame broadcast."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
+
+from pyfly.messaging.adapters.memory import InMemoryMessageBroker
+from pyfly.websocket import RoomManager, WebSocketSession
+
+
+class FakeWebSocket:
+    """Records what is sent; ``gate`` (when set) holds every send until released."""
+
+    def __init__(self, gate: asyncio.Event | None = None, fail: bool = False) -> None:
+        self.sent: list[Any] = []
+        self.closed: tuple[int, str | None] | None = None
+        self._gate = gate
+        self._fail = fail
+
+    async def _send(self, data: Any) -> None:
+        if self._gate is not None:
+            await self._gate.wait()
+        if self._fail:
+            raise RuntimeError("connection lost")
+        self.sent.append(data)
+
+    async def send_text(self, data: str) -> None:
+        await self._send(data)
+
+    async def send_bytes(self, data: bytes) -> None:
+        await self._send(data)
+
+    async def close(self, code: int = 1000, reason: str | None = None) -> None:
+        self.closed = (code, reason)
+
+
+def _session(**kwargs: Any) -> tuple[WebSocketSession, FakeWebSocket]:
+    raw = FakeWebSocket(**kwargs)
+    return WebSocketSession(raw), raw
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class Tick(BaseModel):
+    symbol: str
+    price: float
+
+
+class TestMembership:
+    async def test_join_and_leave(self) -> None:
+        rooms = RoomManager()
+        alice, _ = _session()
+        rooms.join("lobby", alice)
+        rooms.join("trading", alice)
+
+        assert rooms.members("lobby") == [alice]
+        assert rooms.rooms_of(alice) == {"lobby", "trading"}
+
+        rooms.leave("lobby", alice)
+        assert rooms.members("lobby") == []
+        assert rooms.rooms_of(alice) == {"trading"}
+
+        rooms.leave_all(alice)
+        assert rooms.get_stats()["connections"] == 0
+        assert rooms.get_stats()["rooms"] == 0
+
+    def test_invalid_overflow_policy(self) -> None:
+        with pytest.raises(ValueError, match="overflow"):
+            RoomManager(overflow="spill")
+
+
+class TestBroadcast:
+    async def test_shares_one_encoded_frame(self) -> None:
+        rooms = RoomManager()
+        sessions = [_session() for _ in range(3)]
+        for session, _ in sessions:
+            rooms.join("prices", session)
+
+        assert rooms.broadcast("prices", {"symbol": "AAPL", "price": 1.5}) == 3
+        await _settle()
+
+        frames = [raw.sent[0] for _, raw in sessions]
+        assert frames[0] == '{"symbol": "AAPL", "price": 1.5}'
+        assert frames[0] is frames[1] is frames[2]
+        await rooms.stop()
+
+    async def test_frame_types(self) -> None:
+        rooms = RoomManager()
+        session, raw = _session()
+        rooms.join("r", session)
+        rooms.broadcast("r", Tick(symbol="AAPL", price=2.0))
+        rooms.broadcast("r", "plain")
+        rooms.broadcast("r", b"\x00\x01")
+        await _settle()
+
+        assert raw.sent == ['{"symbol":"AAPL","price":2.0}', "plain", b"\x00\x01"]
+        await rooms.stop()
+
+    async def test_exclude_sender(self) -> None:
+        rooms = RoomManager()
+        alice, alice_raw = _session()
+        bob, bob_raw = _session()
+        rooms.join("chat", alice)
+        rooms.join("chat", bob)
+
+        assert rooms.broadcast("chat", "hi", exclude=alice) == 1
+        await _settle()
+        assert alice_raw.sent == []
+        assert bob_raw.sent == ["hi"]
+        await rooms.stop()
+
+    async def test_unknown_room(self) -> None:
+        assert RoomManager().broadcast("nobody", "hi") == 0
+
+
+class TestBackpressure:
+    async def test_slow_client_does_not_delay_others(self) -> None:
+        rooms = RoomManager(queue_size=2)
+        gate = asyncio.Event()
+        slow, slow_raw = _session(gate=gate)
+        fast, fast_raw = _session()
+        rooms.join("prices", slow)
+        rooms.join("prices", fast)
+
+        for i in range(5):
+            rooms.broadcast("prices", str(i))
+            await _settle()
+
+        assert fast_raw.sent == ["0", "1", "2", "3", "4"]
+        # The slow writer holds "0"; "1" and "2" fill its queue; "3" and "4" are dropped
+        stats = rooms.get_stats()
+        assert stats["dropped"] == 2
+        assert stats["max_queue_depth"] == 2
+
+        gate.set()
+        await _settle()
+        assert slow_raw.sent == ["0", "1", "2"]
+        assert rooms.get_stats()["queued"] == 0
+        await rooms.stop()
+
+    async def test_close_policy_disconnects_slow_client(self) -> None:
+        rooms = RoomManager(queue_size=1, overflow="close")
+        slow, slow_raw = _session(gate=asyncio.Event())
+        rooms.join("prices", slow)
+
+        for i in range(3):
+            rooms.broadcast("prices", str(i))
+            await _settle()
+
+        assert slow_raw.closed == (1013, "Client too slow")
+        assert rooms.members("prices") == []
+        assert rooms.get_stats()["slow_closed"] == 1
+        await rooms.stop()
+
+    async def test_coalesces_queued_updates(self) -> None:
+        rooms = RoomManager()
+        gate = asyncio.Event()
+        session, raw = _session(gate=gate)
+        rooms.join("prices", session)
+
+        rooms.broadcast("prices", "AAPL 1", coalesce_key="AAPL")
+        await _settle()  # writer is now sending "AAPL 1"
+        rooms.broadcast("prices", "AAPL 2", coalesce_key="AAPL")
+        rooms.broadcast("prices", "MSFT 1", coalesce_key="MSFT")
+        rooms.broadcast("prices", "AAPL 3", coalesce_key="AAPL")
+
+        gate.set()
+        await _settle()
+        assert raw.sent == ["AAPL 1", "AAPL 3", "MSFT 1"]
+        assert rooms.get_stats()["coalesced"] == 1
+        await rooms.stop()
+
+    async def test_failed_send_removes_session(self) -> None:
+        rooms = RoomManager()
+        session, _ = _session(fail=True)
+        rooms.join("prices", session)
+
+        rooms.broadcast("prices", "x")
+        await _settle()
+        assert rooms.rooms_of(session) == set()
+        assert rooms.get_stats()["connections"] == 0
+
+
+class TestQueueDepthGauge:
+    async def test_gauge_sums_queued_messages_of_every_manager(self) -> None:
+        prometheus_client = pytest.importorskip("prometheus_client")
+
+        def depth() -> float:
+            return prometheus_client.REGISTRY.get_sample_value("websocket_send_queue_depth") or 0.0
+
+        baseline = depth()
+        first, second = RoomManager(), RoomManager()
+        gate = asyncio.Event()
+        one, _ = _session(gate=gate)
+        two, _ = _session(gate=gate)
+        first.join("a", one)
+        second.join("b", two)
+
+        first.broadcast("a", "x")
+        await _settle()  # the writer holds "x"; the gauge counts queued messages only
+        first.broadcast("a", "y")
+        second.broadcast("b", "z")
+        assert depth() == baseline + 2
+
+        first.leave_all(one)
+        assert depth() == baseline + 1
+
+        gate.set()
+        await _settle()
+        assert depth() == baseline
+        await first.stop()
+        await second.stop()
+
+
+class TestBrokerBackend:
+    async def test_publish_reaches_every_worker(self) -> None:
+        broker = InMemoryMessageBroker()
+        workers = [RoomManager(broker=broker), RoomManager(broker=broker)]
+        raws = []
+        for rooms in workers:
+            await rooms.start()
+            session, raw = _session()
+            rooms.join("prices", session)
+            raws.append(raw)
+        await broker.start()
+
+        await workers[0].publish("prices", {"price": 1})
+        await workers[1].publish("prices", b"\x01")
+        await _settle()
+
+        for raw in raws:
+            assert raw.sent == ['{"price": 1}', b"\x01"]
+        for rooms in workers:
+            await rooms.stop()
+
+    async def test_publish_without_broker_is_local(self) -> None:
+        rooms = RoomManager()
+        session, raw = _session()
+        rooms.join("prices", session)
+        await rooms.publish("prices", "local")
+        await _settle()
+        assert raw.sent == ["local"]
+        await rooms.stop()